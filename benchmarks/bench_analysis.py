@@ -0,0 +1,146 @@
+"""
+Benchmarks of the classification and of the statistical analyses.
+"""
+
+import numpy as np
+import pandas as pd
+
+from gpsea.analysis.clf import prepare_hpo_terms_of_interest
+from gpsea.analysis.mtc_filter import IfHpoFilter
+from gpsea.analysis.pcats import apply_classifiers_on_individuals
+from gpsea.analysis.pcats.stats import FisherExactTest
+from gpsea.analysis.pscore import CountingPhenotypeScorer, PhenotypeScoreAnalysis
+from gpsea.analysis.pscore.stats import MannWhitneyStatistic
+from gpsea.analysis.temporal import SurvivalAnalysis
+from gpsea.analysis.temporal.endpoint import death, disease_onset, hpo_onset
+from gpsea.analysis.temporal.stats import LogRankTest
+
+from .common import (
+    CLASSIFICATION_SIZES,
+    COHORT_SIZES,
+    SEED,
+    get_cohort,
+    get_counts,
+    get_generator,
+    get_gt_clf,
+    get_pheno_clfs,
+    load_hpo,
+)
+
+
+class PrepareHpoTermsOfInterest:
+
+    params = COHORT_SIZES
+    param_names = ["n_individuals"]
+    timeout = 300
+
+    def setup(self, n_individuals: int):
+        self.hpo = load_hpo()
+        self.cohort = get_cohort(n_individuals)
+
+    def time_prepare_hpo_terms_of_interest(self, n_individuals: int):
+        prepare_hpo_terms_of_interest(self.cohort, self.hpo)
+
+
+class ApplyClassifiersOnIndividuals:
+
+    params = CLASSIFICATION_SIZES
+    param_names = ["n_individuals"]
+    timeout = 600
+
+    def setup(self, n_individuals: int):
+        self.individuals = get_cohort(n_individuals).all_patients
+        self.gt_clf = get_gt_clf()
+        self.pheno_clfs = get_pheno_clfs()
+
+    def time_apply_classifiers_on_individuals(self, n_individuals: int):
+        apply_classifiers_on_individuals(self.individuals, self.gt_clf, self.pheno_clfs)
+
+
+class IfHpoFilterFilter:
+
+    params = CLASSIFICATION_SIZES
+    param_names = ["n_individuals"]
+    timeout = 600
+
+    def setup(self, n_individuals: int):
+        self.cohort_size = len(get_cohort(n_individuals))
+        self.gt_clf = get_gt_clf()
+        self.pheno_clfs = get_pheno_clfs()
+        self.counts = get_counts(n_individuals)
+        self.mtc_filter = IfHpoFilter.default_filter(load_hpo())
+
+    def time_filter(self, n_individuals: int):
+        self.mtc_filter.filter(self.gt_clf, self.pheno_clfs, self.counts, self.cohort_size)
+
+
+class FisherExactTestComputePval:
+    """
+    Compute p values of 20 random contingency tables with the given shape and total count.
+    """
+
+    params = (
+        ["2x2", "2x3"],
+        [50, 200, 1_000],
+    )
+    param_names = ["shape", "total"]
+    timeout = 300
+
+    def setup(self, shape: str, total: int):
+        if shape == "2x3" and total > 200:
+            # The 2x3 test enumerates all tables with the given margins, too many to finish in time.
+            raise NotImplementedError
+        n_rows, n_cols = (int(val) for val in shape.split("x"))
+        rng = np.random.default_rng(SEED)
+        self.tables = [
+            pd.DataFrame(rng.multinomial(total, np.full(n_rows * n_cols, 1 / (n_rows * n_cols))).reshape(n_rows, n_cols))
+            for _ in range(20)
+        ]
+        self.statistic = FisherExactTest()
+
+    def time_compute_pval(self, shape: str, total: int):
+        for table in self.tables:
+            self.statistic.compute_pval(table)
+
+
+class PhenotypeScoreAnalysisCompare:
+
+    params = COHORT_SIZES
+    param_names = ["n_individuals"]
+    timeout = 300
+
+    def setup(self, n_individuals: int):
+        self.cohort = get_cohort(n_individuals)
+        self.gt_clf = get_gt_clf()
+        self.pheno_scorer = CountingPhenotypeScorer.from_query_curies(
+            hpo=load_hpo(),
+            query=get_generator().profile_terms[:5],
+        )
+        self.analysis = PhenotypeScoreAnalysis(score_statistic=MannWhitneyStatistic())
+
+    def time_compare_genotype_vs_phenotype_score(self, n_individuals: int):
+        self.analysis.compare_genotype_vs_phenotype_score(self.cohort, self.gt_clf, self.pheno_scorer)
+
+
+class SurvivalAnalysisCompare:
+
+    params = (
+        COHORT_SIZES,
+        ["death", "disease_onset", "hpo_onset"],
+    )
+    param_names = ["n_individuals", "endpoint"]
+    timeout = 300
+
+    def setup(self, n_individuals: int, endpoint: str):
+        self.cohort = get_cohort(n_individuals)
+        self.gt_clf = get_gt_clf()
+        if endpoint == "death":
+            self.endpoint = death()
+        elif endpoint == "disease_onset":
+            self.endpoint = disease_onset(disease_id="OMIM:999999")
+        else:
+            self.endpoint = hpo_onset(hpo=load_hpo(), term_id=get_generator().profile_terms[0])
+        self.analysis = SurvivalAnalysis(statistic=LogRankTest())
+
+    def time_compare_genotype_vs_survival(self, n_individuals: int, endpoint: str):
+        self.analysis.compare_genotype_vs_survival(self.cohort, self.gt_clf, self.endpoint)
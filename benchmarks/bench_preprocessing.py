@@ -0,0 +1,56 @@
+"""
+Benchmarks of loading the cohorts.
+"""
+
+import json
+
+from gpsea.io import GpseaJSONDecoder, GpseaJSONEncoder
+from gpsea.preprocessing import load_phenopackets
+
+from .common import COHORT_SIZES, configure_offline_cohort_creator, get_cohort, get_generator
+
+
+class LoadPhenopackets:
+    """
+    Validate the phenopackets and create the cohort with an offline functional annotator.
+    """
+
+    params = COHORT_SIZES
+    param_names = ["n_individuals"]
+    timeout = 600
+
+    def setup(self, n_individuals: int):
+        self.phenopackets = tuple(get_generator().generate_phenopackets(n_individuals))
+        self.cohort_creator = configure_offline_cohort_creator(get_cohort(n_individuals))
+
+        # Time only the loading of phenopackets that pass the validation.
+        _, qc = load_phenopackets(self.phenopackets, self.cohort_creator, validation_policy="lenient")
+        assert qc.is_ok()
+
+    def time_load_phenopackets(self, n_individuals: int):
+        load_phenopackets(self.phenopackets, self.cohort_creator)
+
+
+class CohortJsonRoundTrip:
+    """
+    Encode and decode the cohort with :mod:`gpsea.io`.
+    """
+
+    params = COHORT_SIZES
+    param_names = ["n_individuals"]
+    timeout = 300
+
+    def setup(self, n_individuals: int):
+        self.cohort = get_cohort(n_individuals)
+        self.payload = json.dumps(self.cohort, cls=GpseaJSONEncoder)
+
+    def time_encode(self, n_individuals: int):
+        json.dumps(self.cohort, cls=GpseaJSONEncoder)
+
+    def time_decode(self, n_individuals: int):
+        json.loads(self.payload, cls=GpseaJSONDecoder)
+
+    def track_payload_size(self, n_individuals: int) -> int:
+        return len(self.payload)
+
+    track_payload_size.unit = "bytes"
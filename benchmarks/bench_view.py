@@ -0,0 +1,73 @@
+"""
+Benchmarks of the reports.
+"""
+
+import matplotlib.pyplot as plt
+
+from gpsea.model import ProteinMetadata
+from gpsea.synthetic import SyntheticCohortGenerator
+from gpsea.view import CohortSummary, CohortVariantViewer, CohortViewer, DiseaseViewer, ProteinVisualizer
+
+from .common import COHORT_SIZES, SEED, TX_ID, get_cohort, load_hpo
+
+
+class CohortViewerProcess:
+
+    params = COHORT_SIZES
+    param_names = ["n_individuals"]
+    timeout = 300
+
+    def setup(self, n_individuals: int):
+        self.cohort = get_cohort(n_individuals)
+        self.viewer = CohortViewer(hpo=load_hpo())
+
+    def time_process(self, n_individuals: int):
+        self.viewer.process(self.cohort, transcript_id=TX_ID)
+
+
+class CohortReportsWithSharedSummary:
+
+    params = COHORT_SIZES
+    param_names = ["n_individuals"]
+    timeout = 300
+
+    def setup(self, n_individuals: int):
+        hpo = load_hpo()
+        self.cohort = get_cohort(n_individuals)
+        self.cohort_viewer = CohortViewer(hpo=hpo)
+        self.variant_viewer = CohortVariantViewer(tx_id=TX_ID)
+        self.disease_viewer = DiseaseViewer(hpo=hpo, transcript_id=TX_ID)
+
+    def time_process(self, n_individuals: int):
+        summary = CohortSummary.summarize(self.cohort)
+        self.cohort_viewer.process(self.cohort, transcript_id=TX_ID, summary=summary)
+        self.variant_viewer.process(self.cohort, summary=summary)
+        self.disease_viewer.process(self.cohort, summary=summary)
+
+
+class ProteinVisualizerDrawProtein:
+
+    params = (200, 2_000)
+    param_names = ["n_variants"]
+    timeout = 300
+
+    def setup(self, n_variants: int):
+        generator = SyntheticCohortGenerator(load_hpo(), seed=SEED, n_variants=n_variants, protein_length=3_000)
+        self.cohort = generator.generate_cohort(2_000)
+        self.protein_metadata = ProteinMetadata(
+            protein_id="NP_999999.1",
+            label="SYNT1",
+            protein_features=(),
+            protein_length=3_000,
+        )
+        self.visualizer = ProteinVisualizer()
+
+    def time_draw_protein(self, n_variants: int):
+        fig, ax = plt.subplots(figsize=(20, 20))
+        self.visualizer.draw_protein(
+            cohort=self.cohort,
+            protein_metadata=self.protein_metadata,
+            ax=ax,
+        )
+        fig.canvas.draw()
+        plt.close(fig)
@@ -0,0 +1,170 @@
+"""
+Shared data for the benchmarks.
+
+The benchmarks run on synthetic cohorts (see :class:`~gpsea.synthetic.SyntheticCohortGenerator`)
+to measure the performance on cohorts that are much larger than the real cohorts in the test data.
+The data are cached per process, so that setting up a benchmark does not redo the work of the previous one.
+"""
+
+import functools
+import os
+import typing
+
+import hpotk
+import pandas as pd
+
+from gpsea.analysis.clf import GenotypeClassifier, HpoClassifier, monoallelic_classifier
+from gpsea.analysis.pcats import apply_classifiers_on_individuals
+from gpsea.analysis.predicate import variant_effect
+from gpsea.model import Cohort, ImpreciseSvInfo, TranscriptAnnotation, VariantCoordinates, VariantEffect
+from gpsea.model.genome import GRCh38
+from gpsea.preprocessing import (
+    CachingValidationRunner,
+    CohortCreator,
+    FunctionalAnnotator,
+    ImpreciseSvFunctionalAnnotator,
+    PhenopacketPatientCreator,
+    VariantCoordinateFinder,
+)
+from gpsea.synthetic import SyntheticCohortGenerator
+
+FPATH_HPO = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), os.pardir, "tests", "test_data", "hp.v2024-04-26.json.gz"
+)
+SEED = 42
+TX_ID = "NM_999999.1"
+PHENOTYPIC_ABNORMALITY = hpotk.TermId.from_curie("HP:0000118")
+
+COHORT_SIZES = (100, 1_000, 10_000)
+"""
+Cohort sizes of the cheap benchmarks.
+"""
+
+CLASSIFICATION_SIZES = (100, 1_000)
+"""
+Cohort sizes of the benchmarks that test each individual with many phenotype classifiers.
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def load_hpo() -> hpotk.MinimalOntology:
+    return hpotk.load_minimal_ontology(FPATH_HPO)
+
+
+@functools.lru_cache(maxsize=None)
+def get_generator() -> SyntheticCohortGenerator:
+    return SyntheticCohortGenerator(load_hpo(), seed=SEED)
+
+
+@functools.lru_cache(maxsize=None)
+def get_cohort(
+    n_individuals: int,
+) -> Cohort:
+    return get_generator().generate_cohort(n_individuals)
+
+
+class FakeFunctionalAnnotator(FunctionalAnnotator):
+    """
+    `FakeFunctionalAnnotator` serves the transcript annotations of the synthetic variants
+    to load the synthetic phenopackets offline.
+    """
+
+    def __init__(
+        self,
+        cohort: Cohort,
+    ):
+        self._annotations: typing.Dict[tuple, typing.Sequence[TranscriptAnnotation]] = {}
+        for variant in cohort.all_variants():
+            self._annotations[FakeFunctionalAnnotator._key(variant.variant_info.variant_coordinates)] = (
+                variant.tx_annotations
+            )
+
+    def annotate(
+        self,
+        variant_coordinates: VariantCoordinates,
+    ) -> typing.Sequence[TranscriptAnnotation]:
+        return self._annotations.get(FakeFunctionalAnnotator._key(variant_coordinates), ())
+
+    @staticmethod
+    def _key(
+        vc: VariantCoordinates,
+    ) -> tuple:
+        return vc.chrom, vc.start, vc.end, vc.ref, vc.alt
+
+
+class _OfflineImpreciseSvFunctionalAnnotator(ImpreciseSvFunctionalAnnotator):
+
+    def annotate(
+        self,
+        item: ImpreciseSvInfo,
+    ) -> typing.Sequence[TranscriptAnnotation]:
+        raise ValueError("The synthetic cohorts include no imprecise structural variants")
+
+
+class _OfflineHgvsVariantCoordinateFinder(VariantCoordinateFinder[str]):
+
+    def find_coordinates(
+        self,
+        item: str,
+    ) -> typing.Optional[VariantCoordinates]:
+        raise ValueError("The synthetic variants include VCF records")
+
+
+def configure_offline_cohort_creator(
+    cohort: Cohort,
+) -> CohortCreator:
+    """
+    Configure a cohort creator for loading the phenopackets of the synthetic `cohort` without network access.
+    """
+    hpo = load_hpo()
+    return CohortCreator(
+        patient_creator=PhenopacketPatientCreator(
+            hpo=hpo,
+            validator=CachingValidationRunner(hpo),
+            build=GRCh38,
+            functional_annotator=FakeFunctionalAnnotator(cohort),
+            imprecise_sv_functional_annotator=_OfflineImpreciseSvFunctionalAnnotator(),
+            hgvs_coordinate_finder=_OfflineHgvsVariantCoordinateFinder(),
+        ),
+    )
+
+
+def get_gt_clf() -> GenotypeClassifier:
+    """
+    Get a genotype classifier that compares the carriers of missense and other variants.
+    """
+    is_missense = variant_effect(VariantEffect.MISSENSE_VARIANT, tx_id=TX_ID)
+    return monoallelic_classifier(
+        a_predicate=is_missense,
+        b_predicate=~is_missense,
+        a_label="Missense",
+        b_label="Other",
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_pheno_clfs() -> typing.Sequence[HpoClassifier]:
+    """
+    Get the phenotype classifiers for the disease profile terms and their ancestors,
+    the terms that are the most likely to be tested in a real analysis.
+    """
+    hpo = load_hpo()
+    # The profile terms are phenotypic abnormalities, hence all their ancestors,
+    # except for the top-level terms, are phenotypic abnormalities too.
+    top_level = {hpo.graph.root, PHENOTYPIC_ABNORMALITY}
+    term_ids = set()
+    for term_id in get_generator().profile_terms:
+        term_ids.add(term_id)
+        term_ids.update(anc for anc in hpo.graph.get_ancestors(term_id) if anc not in top_level)
+    return tuple(HpoClassifier(hpo, query=term_id) for term_id in sorted(term_ids, key=lambda t: t.value))
+
+
+@functools.lru_cache(maxsize=None)
+def get_counts(
+    n_individuals: int,
+) -> typing.Sequence[pd.DataFrame]:
+    """
+    Get the counts of the individuals classified by :func:`get_gt_clf` and :func:`get_pheno_clfs`.
+    """
+    _, counts = apply_classifiers_on_individuals(get_cohort(n_individuals).all_patients, get_gt_clf(), get_pheno_clfs())
+    return counts
@@ -0,0 +1,55 @@
+"""
+Support for loading the package members lazily, on first access (PEP 562),
+to keep the heavy dependencies (e.g. `scipy`, `statsmodels`, or `matplotlib`)
+out of the import of the packages that do not need them.
+"""
+
+import importlib
+import typing
+
+# NOT PART OF THE PUBLIC API
+
+
+def attach(
+    package: str,
+    members: typing.Mapping[str, typing.Iterable[str]],
+    submodules: typing.Iterable[str] = (),
+) -> typing.Tuple[
+    typing.Callable[[str], typing.Any],
+    typing.Callable[[], typing.List[str]],
+]:
+    """
+    Prepare the module `__getattr__` and `__dir__` functions to load the package members lazily.
+
+    Use in the package `__init__.py`, next to the imports for the type checkers::
+
+      if typing.TYPE_CHECKING:
+          from ._impl import Foo
+      else:
+          __getattr__, __dir__ = attach(__name__, {"._impl": ("Foo",)})
+
+    :param package: the name of the package (`__name__`).
+    :param members: a mapping from a relative module name (e.g. `._impl`) to the names of the members
+      to load from the module.
+    :param submodules: names of the subpackages to import on attribute access (e.g. `stats`).
+    """
+    member_to_module = {name: module for module, names in members.items() for name in names}
+    submodules = frozenset(submodules)
+    package_module = importlib.import_module(package)
+
+    def __getattr__(name: str) -> typing.Any:
+        if name in member_to_module:
+            module = importlib.import_module(member_to_module[name], package)
+            value = getattr(module, name)
+        elif name in submodules:
+            value = importlib.import_module(f"{package}.{name}")
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        # Cache the value so that `__getattr__` is not called again.
+        setattr(package_module, name, value)
+        return value
+
+    def __dir__() -> typing.List[str]:
+        return sorted(set(vars(package_module)) | set(member_to_module) | submodules)
+
+    return __getattr__, __dir__
@@ -1,13 +1,41 @@
-from ._base import (
-    AnalysisException,
-    AnalysisResult,
-    MonoPhenotypeAnalysisResult,
-    MultiPhenotypeAnalysisResult,
-    Statistic,
-    StatisticResult,
-)
-from ._partition import Partitioning, ContinuousPartitioning
-from ._util import Summarizable
+import typing
+
+from gpsea._lazy import attach
+
+if typing.TYPE_CHECKING:
+    from ._base import (
+        AnalysisException,
+        AnalysisResult,
+        MonoPhenotypeAnalysisResult,
+        MultiPhenotypeAnalysisResult,
+        Statistic,
+        StatisticResult,
+    )
+    from ._cache import AnalysisResultCache, configure_analysis_result_cache, fingerprint
+    from ._partition import Partitioning, ContinuousPartitioning
+    from ._util import Summarizable
+    from ._store import StoredAnalysisResult, open_analysis_result, write_analysis_result
+    from ._trace import StageStats, AnalysisTrace, AnalysisTracer, LoggingTracer, ProfilingTracer
+else:
+    __getattr__, __dir__ = attach(
+        __name__,
+        {
+            "._base": (
+                "AnalysisException",
+                "AnalysisResult",
+                "MonoPhenotypeAnalysisResult",
+                "MultiPhenotypeAnalysisResult",
+                "Statistic",
+                "StatisticResult",
+            ),
+            "._cache": ("AnalysisResultCache", "configure_analysis_result_cache", "fingerprint"),
+            "._partition": ("Partitioning", "ContinuousPartitioning"),
+            "._util": ("Summarizable",),
+            "._store": ("StoredAnalysisResult", "open_analysis_result", "write_analysis_result"),
+            "._trace": ("StageStats", "AnalysisTrace", "AnalysisTracer", "LoggingTracer", "ProfilingTracer"),
+        },
+        submodules=("clf", "mtc_filter", "pcats", "predicate", "pscore", "temporal"),
+    )
 
 __all__ = [
     "AnalysisException",
@@ -16,7 +44,18 @@ __all__ = [
     "MultiPhenotypeAnalysisResult",
     "Statistic",
     "StatisticResult",
+    "AnalysisResultCache",
+    "configure_analysis_result_cache",
+    "fingerprint",
     "Partitioning",
     "ContinuousPartitioning",
     "Summarizable",
+    "StoredAnalysisResult",
+    "open_analysis_result",
+    "write_analysis_result",
+    "StageStats",
+    "AnalysisTrace",
+    "AnalysisTracer",
+    "LoggingTracer",
+    "ProfilingTracer",
 ]
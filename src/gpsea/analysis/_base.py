@@ -8,6 +8,7 @@ import pandas as pd
 
 from .clf import GenotypeClassifier, PhenotypeClassifier, P
 from ._partition import Partitioning
+from ._trace import AnalysisTrace
 
 
 class StatisticResult:
@@ -140,6 +141,8 @@ class AnalysisResult(metaclass=abc.ABCMeta):
         assert isinstance(statistic, Statistic)
         self._statistic = statistic
 
+        self._trace: typing.Optional[AnalysisTrace] = None
+
     @property
     def gt_clf(self) -> GenotypeClassifier:
         """
@@ -147,6 +150,17 @@ class AnalysisResult(metaclass=abc.ABCMeta):
         """
         return self._gt_clf
 
+    @property
+    def trace(self) -> typing.Optional[AnalysisTrace]:
+        """
+        Get the :class:`~gpsea.analysis.AnalysisTrace` with the timings of the analysis stages
+        that produced this result or `None` if the result was not produced by an analysis
+        (e.g. it was loaded from a file).
+
+        The trace is not considered in the result equality.
+        """
+        return getattr(self, "_trace", None)
+
     @property
     def statistic(self) -> Statistic:
         """
@@ -0,0 +1,292 @@
+import dataclasses
+import enum
+import functools
+import hashlib
+import json
+import logging
+import os
+import pickle
+import types
+import typing
+
+import hpotk
+import numpy as np
+
+from gpsea.config import get_cache_dir_path
+from gpsea.model import Cohort, Patient
+
+from ._base import AnalysisResult
+
+
+def fingerprint(
+    *items: typing.Any,
+) -> str:
+    """
+    Compute a stable SHA-256 hex digest of the `items`.
+
+    The fingerprint is computed from the content of the items, and it is the same across Python sessions.
+    Therefore, the fingerprint of an analysis configuration (e.g. the analysis,
+    the genotype and phenotype classifiers) can be used as a key of a persistent cache.
+
+    The items are digested as follows:
+
+    * the primitive values, enums, and term IDs by their value
+    * ontologies by their version
+    * cohorts by their :attr:`~gpsea.model.Cohort.fingerprint` and patients by their JSON representation
+    * sequences, sets, and mappings by their elements (the order of set and mapping elements does not matter)
+    * functions and classes by their qualified name. The lambdas, local functions, closures,
+      and methods bound to an instance cannot be fingerprinted, since their qualified name does not identify them
+    * other objects by their type and attributes. The attributes whose name ends with `_cache` are skipped,
+      since they memoize the results of a computation and do not change the configuration.
+      The attributes whose name ends with `_tracer` are skipped too,
+      since the tracers (see :class:`~gpsea.analysis.AnalysisTracer`) only observe the analysis.
+
+    :param items: the items to fingerprint.
+    :raises ValueError: if an item cannot be fingerprinted,
+      e.g. an ontology with unknown version or an object without attributes.
+    """
+    return _Fingerprinter().digest(items).hex()
+
+
+class _Fingerprinter:
+    # NOT PART OF THE PUBLIC API
+
+    def __init__(self):
+        # IDs of the objects being digested, to detect reference cycles.
+        self._active: typing.Set[int] = set()
+        self.ontologies: typing.Dict[str, hpotk.MinimalOntology] = {}
+
+    def digest(
+        self,
+        obj: typing.Any,
+    ) -> bytes:
+        hasher = hashlib.sha256()
+        for part in self._describe(obj):
+            hasher.update(part)
+        return hasher.digest()
+
+    def _describe(
+        self,
+        obj: typing.Any,
+    ) -> typing.Iterator[bytes]:
+        if obj is None or isinstance(obj, (bool, int, float, str, bytes)):
+            yield f"{type(obj).__name__}:{obj!r}".encode()
+        elif isinstance(obj, enum.Enum):
+            yield f"enum:{_qualified_name(type(obj))}.{obj.name}".encode()
+        elif isinstance(obj, np.generic):
+            yield from self._describe(obj.item())
+        elif isinstance(obj, hpotk.TermId):
+            yield f"term_id:{obj.value}".encode()
+        elif isinstance(obj, hpotk.MinimalOntology):
+            if obj.version is None:
+                raise ValueError("Cannot fingerprint an ontology with unknown version")
+            self.ontologies[obj.version] = obj
+            yield f"ontology:{obj.version}".encode()
+        elif isinstance(obj, Cohort):
+            yield f"cohort:{obj.fingerprint}".encode()
+        elif isinstance(obj, Patient):
+            from gpsea.io import GpseaJSONEncoder
+
+            payload = json.dumps(obj, cls=GpseaJSONEncoder, sort_keys=True, separators=(",", ":"))
+            yield b"patient:" + hashlib.sha256(payload.encode("utf-8")).digest()
+        elif isinstance(obj, logging.Logger):
+            yield f"logger:{obj.name}".encode()
+        elif isinstance(obj, type):
+            yield f"callable:{_qualified_name(obj)}".encode()
+        elif callable(obj) and hasattr(obj, "__qualname__"):
+            yield f"callable:{_callable_name(obj)}".encode()
+        elif id(obj) in self._active:
+            yield b"cycle"
+        else:
+            self._active.add(id(obj))
+            try:
+                yield from self._describe_container(obj)
+            finally:
+                self._active.discard(id(obj))
+
+    def _describe_container(
+        self,
+        obj: typing.Any,
+    ) -> typing.Iterator[bytes]:
+        if isinstance(obj, np.ndarray):
+            yield f"ndarray:{obj.dtype.str}:{obj.shape}:".encode()
+            yield np.ascontiguousarray(obj).tobytes()
+        elif isinstance(obj, (list, tuple)):
+            yield f"sequence:{len(obj)}:".encode()
+            for item in obj:
+                yield self.digest(item)
+        elif isinstance(obj, (set, frozenset)):
+            yield f"set:{len(obj)}:".encode()
+            yield from sorted(self.digest(item) for item in obj)
+        elif isinstance(obj, typing.Mapping):
+            yield f"mapping:{len(obj)}:".encode()
+            yield from sorted(self.digest(key) + self.digest(value) for key, value in obj.items())
+        elif isinstance(obj, functools.partial):
+            yield b"partial:"
+            yield self.digest((obj.func, obj.args, obj.keywords))
+        else:
+            if dataclasses.is_dataclass(obj):
+                attributes = {field.name: getattr(obj, field.name) for field in dataclasses.fields(obj)}
+            elif hasattr(obj, "__dict__"):
+                attributes = dict(vars(obj))
+            else:
+                raise ValueError(f"Cannot fingerprint an instance of {_qualified_name(type(obj))}")
+
+            yield f"object:{_qualified_name(type(obj))}:".encode()
+            for name in sorted(attributes):
+                if not name.endswith(("_cache", "_tracer")):
+                    yield name.encode() + b"=" + self.digest(attributes[name])
+
+
+def _callable_name(
+    obj: typing.Callable,
+) -> str:
+    """
+    Get a name that identifies the behavior of the callable.
+
+    The lambdas and local functions share the qualified name with the other functions defined by the same code,
+    the closures depend on the captured variables, and the bound methods depend on their instance.
+    Therefore, they are rejected.
+    """
+    qualname = obj.__qualname__
+    if "<lambda>" in qualname or "<locals>" in qualname:
+        raise ValueError(f"Cannot fingerprint a lambda or a local function {qualname}")
+    if getattr(obj, "__closure__", None):
+        raise ValueError(f"Cannot fingerprint a closure {qualname}")
+    owner = getattr(obj, "__self__", None)
+    if owner is None or isinstance(owner, types.ModuleType):
+        return _qualified_name(obj)
+    elif isinstance(owner, type):
+        # A class method, possibly inherited by the `owner`.
+        return f"{_qualified_name(owner)}.{obj.__name__}"
+    else:
+        raise ValueError(f"Cannot fingerprint a bound method {qualname}")
+
+
+def _qualified_name(
+    obj: typing.Any,
+) -> str:
+    return f"{getattr(obj, '__module__', '')}.{getattr(obj, '__qualname__', repr(obj))}"
+
+
+class AnalysisResultCache:
+    """
+    `AnalysisResultCache` persists analysis results in a folder, keyed by a :func:`fingerprint`
+    of the analysis configuration and the cohort.
+
+    Rerunning an analysis with the same configuration on a cohort with the same content
+    loads the stored result instead of recomputing it.
+
+    The results are stored as pickle files. The ontologies (e.g. HPO) referenced by a result
+    are stored as references to their version, and they are resolved to the ontologies
+    of the analysis configuration when loading the result.
+    Therefore, only load the results from a trusted folder.
+
+    Use :func:`~gpsea.analysis.configure_analysis_result_cache` to create the cache
+    in the GPSEA cache directory.
+
+    :param cache_dir: path to an existing folder for storing the results.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+    ):
+        if not os.path.isdir(cache_dir):
+            raise ValueError(f"`cache_dir` {cache_dir} must be an existing directory")
+        self._logger = logging.getLogger(__name__)
+        self._cache_dir = cache_dir
+
+    @property
+    def cache_dir(self) -> str:
+        return self._cache_dir
+
+    def load_result(
+        self,
+        key: str,
+        ontologies: typing.Iterable[hpotk.MinimalOntology] = (),
+    ) -> typing.Optional[AnalysisResult]:
+        """
+        Load the result stored under the `key`.
+
+        :param key: the result key.
+        :param ontologies: the ontologies for resolving the ontology references of the result.
+        :returns: the result or `None` if no result is stored under the `key`,
+          the result cannot be read, or if it references an unknown ontology.
+        """
+        path = self._result_path(key)
+        if not os.path.isfile(path):
+            return None
+
+        versions = {ontology.version: ontology for ontology in ontologies}
+        try:
+            with open(path, "rb") as fh:
+                return _OntologyResolvingUnpickler(fh, versions).load()
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, KeyError, OSError) as e:
+            self._logger.warning("Ignoring unreadable analysis result at %s: %s", path, e)
+            return None
+
+    def store_result(
+        self,
+        key: str,
+        result: AnalysisResult,
+    ):
+        """
+        Store the `result` under the `key`.
+
+        The result is written into a temporary file first, and then moved into place.
+        """
+        path = self._result_path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as fh:
+            _OntologyReferencingPickler(fh).dump(result)
+        os.replace(tmp_path, path)
+
+    def _result_path(
+        self,
+        key: str,
+    ) -> str:
+        return os.path.join(self._cache_dir, f"{key}.pickle")
+
+
+class _OntologyReferencingPickler(pickle.Pickler):
+    # NOT PART OF THE PUBLIC API
+
+    def persistent_id(self, obj):
+        if isinstance(obj, hpotk.MinimalOntology) and obj.version is not None:
+            return ("ontology", obj.version)
+        return None
+
+
+class _OntologyResolvingUnpickler(pickle.Unpickler):
+    # NOT PART OF THE PUBLIC API
+
+    def __init__(
+        self,
+        fh: typing.BinaryIO,
+        ontologies: typing.Mapping[typing.Optional[str], hpotk.MinimalOntology],
+    ):
+        super().__init__(fh)
+        self._ontologies = ontologies
+
+    def persistent_load(self, pid):
+        kind, version = pid
+        if kind != "ontology" or version not in self._ontologies:
+            raise KeyError(f"Unknown ontology {version}")
+        return self._ontologies[version]
+
+
+def configure_analysis_result_cache(
+    cache_dir: typing.Optional[str] = None,
+) -> AnalysisResultCache:
+    """
+    Configure a cache of analysis results in the `analysis-results` subfolder of the cache directory.
+
+    :param cache_dir: path to the cache folder or `None`
+        if the results should be stored as described by :func:`~gpsea.config.get_cache_dir_path` function.
+        In any case, the directory will be created if it does not exist (including any non-existing parents).
+    """
+    results_dir = os.path.join(get_cache_dir_path(cache_dir), "analysis-results")
+    os.makedirs(results_dir, exist_ok=True)
+
+    return AnalysisResultCache(cache_dir=results_dir)
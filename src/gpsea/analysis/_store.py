@@ -0,0 +1,554 @@
+import json
+import math
+import typing
+
+import hpotk
+import numpy as np
+import pandas as pd
+
+import gpsea
+from gpsea.model import Patient
+
+from ._base import AnalysisResult, MonoPhenotypeAnalysisResult, MultiPhenotypeAnalysisResult
+from ._base import Statistic, StatisticResult
+from .clf import Categorization, GenotypeClassifier, PatientCategory
+from .clf import PhenotypeCategorization, PhenotypeClassifier
+from .mtc_filter import PhenotypeMtcResult
+from .pcats import HpoTermAnalysisResult
+from .pscore import PhenotypeScorer, PhenotypeScoreAnalysisResult
+from .temporal import Endpoint, Survival, SurvivalAnalysisResult, SurvivalArray
+
+
+STORE_FORMAT = 1
+"""
+The version of the stored result layout.
+"""
+
+
+def write_analysis_result(
+    result: AnalysisResult,
+    path: str,
+):
+    """
+    Write the analysis `result` into a columnar file at `path`.
+
+    The file is a NumPy `.npz` archive where the results are stored as arrays:
+
+    * the results of the multi-phenotype analyses (e.g. :class:`~gpsea.analysis.pcats.HpoTermAnalysisResult`)
+      store the contingency tables as one stacked integer array with shape `(n_phenotypes, n_rows, n_cols)`,
+      the nominal and corrected p values as float arrays,
+      and the MTC filter issues as an integer array with codes of the issue categories
+    * the results of :class:`~gpsea.analysis.pscore.PhenotypeScoreAnalysis`
+      and :class:`~gpsea.analysis.temporal.SurvivalAnalysis` store the patient IDs, genotype categories,
+      and the phenotype scores or survivals as arrays
+
+    The classifiers, the statistic, and the other configuration are stored as JSON metadata.
+    Use :func:`~gpsea.analysis.open_analysis_result` to read the result.
+
+    :param result: the analysis result.
+    :param path: path to the output file. NumPy adds the `.npz` suffix if the path does not end with it.
+    """
+    if isinstance(result, MultiPhenotypeAnalysisResult):
+        metadata, arrays = _dump_multi_phenotype_result(result)
+    elif isinstance(result, (PhenotypeScoreAnalysisResult, SurvivalAnalysisResult)):
+        metadata, arrays = _dump_mono_phenotype_result(result)
+    else:
+        raise ValueError(f"Cannot store a result of type {type(result).__name__}")
+
+    metadata.update(
+        {
+            "format": STORE_FORMAT,
+            "gpsea_version": gpsea.__version__,
+            "gt_clf": _describe_classifier(result.gt_clf),
+            "statistic": result.statistic.name,
+        }
+    )
+    arrays["metadata"] = _to_json_array(metadata)
+
+    np.savez(path, **arrays)
+
+
+def _dump_multi_phenotype_result(
+    result: MultiPhenotypeAnalysisResult,
+) -> typing.Tuple[typing.Dict[str, typing.Any], typing.Dict[str, np.ndarray]]:
+    n_phenotypes = len(result.pheno_clfs)
+    shapes = np.array([counts.shape for counts in result.all_counts], dtype=np.int64).reshape((n_phenotypes, 2))
+    n_rows, n_cols = shapes.max(axis=0) if n_phenotypes > 0 else (0, 0)
+    # Pad the tables to a common shape to store them as one array.
+    counts = np.zeros((n_phenotypes, n_rows, n_cols), dtype=np.int64)
+    for i, table in enumerate(result.all_counts):
+        counts[i, : table.shape[0], : table.shape[1]] = table.to_numpy()
+
+    arrays = {
+        "counts": counts,
+        "counts_shapes": shapes,
+        "n_usable": np.array(result.n_usable, dtype=np.int64),
+        "tested": np.array([r is not None for r in result.statistic_results], dtype=bool),
+        "pvals": np.array(result.pvals, dtype=np.float64),
+        "statistics": np.array(
+            [np.nan if r is None or r.statistic is None else r.statistic for r in result.statistic_results],
+            dtype=np.float64,
+        ),
+        "phenotypes": np.array([_phenotype_to_str(clf.phenotype) for clf in result.pheno_clfs], dtype=str),
+        "pheno_clfs": _to_json_array([_describe_phenotype_classifier(clf) for clf in result.pheno_clfs]),
+    }
+    if result.corrected_pvals is not None:
+        arrays["corrected_pvals"] = np.array(result.corrected_pvals, dtype=np.float64)
+
+    metadata: typing.Dict[str, typing.Any] = {
+        "n_phenotypes": n_phenotypes,
+        "mtc_correction": result.mtc_correction,
+    }
+    if isinstance(result, HpoTermAnalysisResult):
+        metadata["kind"] = "hpo_term_analysis"
+        metadata["mtc_filter_name"] = result.mtc_filter_name
+
+        # Store the MTC filter issues as categorical codes, `-1` for the phenotypes that passed the filter.
+        issues: typing.Dict[typing.Tuple[str, str, typing.Optional[str]], int] = {}
+        codes = np.full(n_phenotypes, -1, dtype=np.int32)
+        for i, mtc_result in enumerate(result.mtc_filter_results):
+            issue = mtc_result.mtc_issue
+            if issue is not None:
+                codes[i] = issues.setdefault((issue.code, issue.reason, issue.doclink), len(issues))
+        arrays["mtc_issues"] = codes
+        metadata["mtc_issue_categories"] = [
+            {"code": code, "reason": reason, "doclink": doclink} for code, reason, doclink in issues
+        ]
+    else:
+        metadata["kind"] = "multi_phenotype_analysis"
+
+    return metadata, arrays
+
+
+def _dump_mono_phenotype_result(
+    result: MonoPhenotypeAnalysisResult,
+) -> typing.Tuple[typing.Dict[str, typing.Any], typing.Dict[str, np.ndarray]]:
+    data = result.data
+    genotypes = data[MonoPhenotypeAnalysisResult.GT_COL]
+    arrays = {
+        "patient_ids": np.array(data.index, dtype=str),
+        "genotypes": np.array([-1 if _is_missing(gt) else int(gt) for gt in genotypes], dtype=np.int64),
+    }
+    phenotypes = data[MonoPhenotypeAnalysisResult.PH_COL]
+    if isinstance(result, SurvivalAnalysisResult):
+        kind = "survival_analysis"
+        arrays["survival_values"] = result.survivals.times
+        arrays["survival_censored"] = result.survivals.is_censored
+    else:
+        kind = "phenotype_score_analysis"
+        arrays["scores"] = np.array(
+            [np.nan if _is_missing(s) else s for s in phenotypes], dtype=np.float64
+        )
+
+    statistic_result = result.statistic_result()
+    metadata = {
+        "kind": kind,
+        "phenotype": _describe_partitioning(result.phenotype),
+        "pval": statistic_result.pval,
+        "statistic_value": statistic_result.statistic,
+    }
+    return metadata, arrays
+
+
+def open_analysis_result(
+    path: str,
+) -> "StoredAnalysisResult":
+    """
+    Open an analysis result written by :func:`~gpsea.analysis.write_analysis_result`.
+
+    Only the metadata is read when opening the result,
+    and the arrays are read on first access.
+
+    :param path: path to the result file.
+    :raises ValueError: if the file has an unsupported format.
+    """
+    return StoredAnalysisResult(path)
+
+
+class StoredAnalysisResult:
+    """
+    `StoredAnalysisResult` provides lazy access to an analysis result written
+    by :func:`~gpsea.analysis.write_analysis_result`.
+
+    The metadata (e.g. the analysis kind, the genotype classifier, or the number of phenotypes) is read eagerly,
+    and each array is read when accessed for the first time.
+    Use :meth:`load` to get the complete analysis result.
+
+    The classifiers of the loaded result are restored from their descriptions,
+    hence they report the same name, variable name, and categories,
+    but they cannot classify other individuals.
+
+    Use :func:`~gpsea.analysis.open_analysis_result` to open the result.
+    """
+
+    def __init__(
+        self,
+        path: str,
+    ):
+        self._path = path
+        self._arrays: typing.Dict[str, np.ndarray] = {}
+        with np.load(path, allow_pickle=False) as npz:
+            self._names = frozenset(npz.files)
+            self._metadata = _from_json_array(npz["metadata"])
+        if self._metadata.get("format") != STORE_FORMAT:
+            raise ValueError(f"Unsupported analysis result format {self._metadata.get('format')}")
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def kind(self) -> str:
+        """
+        Get the kind of the result, one of `hpo_term_analysis`, `multi_phenotype_analysis`,
+        `phenotype_score_analysis`, or `survival_analysis`.
+        """
+        return self._metadata["kind"]
+
+    @property
+    def metadata(self) -> typing.Mapping[str, typing.Any]:
+        """
+        Get the result metadata, including the descriptions of the genotype classifier and the statistic.
+        """
+        return self._metadata
+
+    def array(
+        self,
+        name: str,
+    ) -> np.ndarray:
+        """
+        Get an array of the result (e.g. `pvals`). The array is read on first access.
+
+        :param name: the name of the array.
+        :raises KeyError: if the result does not include the array.
+        """
+        array = self._arrays.get(name)
+        if array is None:
+            if name not in self._names or name == "metadata":
+                raise KeyError(f"The result does not include `{name}` array")
+            with np.load(self._path, allow_pickle=False) as npz:
+                array = npz[name]
+            self._arrays[name] = array
+        return array
+
+    @property
+    def phenotypes(self) -> np.ndarray:
+        """
+        Get an array with the tested phenotypes (e.g. the HPO term IDs) of a multi-phenotype result.
+        """
+        return self.array("phenotypes")
+
+    @property
+    def counts(self) -> np.ndarray:
+        """
+        Get an integer array with shape `(n_phenotypes, n_rows, n_cols)`
+        with the contingency tables of a multi-phenotype result.
+        """
+        return self.array("counts")
+
+    @property
+    def pvals(self) -> np.ndarray:
+        """
+        Get the nominal p values of a multi-phenotype result, with `NaN` for the untested phenotypes.
+        """
+        return self.array("pvals")
+
+    @property
+    def corrected_pvals(self) -> typing.Optional[np.ndarray]:
+        """
+        Get the corrected p values of a multi-phenotype result or `None` if no correction was applied.
+        """
+        return self.array("corrected_pvals") if "corrected_pvals" in self._names else None
+
+    def load(self) -> AnalysisResult:
+        """
+        Load the complete analysis result.
+        """
+        kind = self.kind
+        gt_clf = _StoredGenotypeClassifier(self._metadata["gt_clf"])
+        statistic = _StoredStatistic(self._metadata["statistic"])
+        if kind in ("hpo_term_analysis", "multi_phenotype_analysis"):
+            return self._load_multi_phenotype_result(gt_clf, statistic)
+        elif kind in ("phenotype_score_analysis", "survival_analysis"):
+            return self._load_mono_phenotype_result(gt_clf, statistic)
+        else:
+            raise ValueError(f"Unsupported analysis result kind {kind}")
+
+    def _load_multi_phenotype_result(
+        self,
+        gt_clf: GenotypeClassifier,
+        statistic: Statistic,
+    ) -> MultiPhenotypeAnalysisResult:
+        pheno_clfs = [_StoredPhenotypeClassifier(d) for d in _from_json_array(self.array("pheno_clfs"))]
+        gt_columns = pd.Index(
+            data=tuple(gt_clf.get_categories()),
+            name=gt_clf.variable_name,
+        )
+        all_counts = []
+        for clf, table, (n_rows, n_cols) in zip(pheno_clfs, self.counts, self.array("counts_shapes")):
+            all_counts.append(
+                pd.DataFrame(
+                    data=table[:n_rows, :n_cols],
+                    index=pd.Index(data=tuple(clf.get_categories()), name=clf.variable_name),
+                    columns=gt_columns[:n_cols],
+                )
+            )
+
+        statistic_results = [
+            StatisticResult(statistic=None if math.isnan(stat) else float(stat), pval=float(pval))
+            if tested
+            else None
+            for tested, pval, stat in zip(self.array("tested"), self.pvals, self.array("statistics"))
+        ]
+        corrected_pvals = self.corrected_pvals
+        kwargs = dict(
+            gt_clf=gt_clf,
+            pheno_clfs=pheno_clfs,
+            statistic=statistic,
+            n_usable=[int(n) for n in self.array("n_usable")],
+            all_counts=all_counts,
+            statistic_results=statistic_results,
+            corrected_pvals=None if corrected_pvals is None else corrected_pvals.tolist(),
+            mtc_correction=self._metadata["mtc_correction"],
+        )
+        if self.kind == "hpo_term_analysis":
+            categories = [
+                PhenotypeMtcResult.fail(code=c["code"], reason=c["reason"], doclink=c["doclink"])
+                for c in self._metadata["mtc_issue_categories"]
+            ]
+            return HpoTermAnalysisResult(
+                mtc_filter_name=self._metadata["mtc_filter_name"],
+                mtc_filter_results=[
+                    PhenotypeMtcResult.ok() if code < 0 else categories[code]
+                    for code in self.array("mtc_issues")
+                ],
+                **kwargs,
+            )
+        else:
+            return MultiPhenotypeAnalysisResult(**kwargs)
+
+    def _load_mono_phenotype_result(
+        self,
+        gt_clf: GenotypeClassifier,
+        statistic: Statistic,
+    ) -> MonoPhenotypeAnalysisResult:
+        data = pd.DataFrame(
+            None,
+            index=pd.Index(self.array("patient_ids").tolist(), name=MonoPhenotypeAnalysisResult.SAMPLE_ID),
+            columns=MonoPhenotypeAnalysisResult.DATA_COLUMNS,
+        )
+        data[MonoPhenotypeAnalysisResult.GT_COL] = pd.Series(
+            [None if gt < 0 else int(gt) for gt in self.array("genotypes")],
+            index=data.index,
+            dtype=object,
+        )
+        if self.kind == "survival_analysis":
+            survivals = SurvivalArray(
+                times=self.array("survival_values"),
+                is_censored=self.array("survival_censored"),
+            )
+            phenotypes = survivals.to_survivals()
+        else:
+            phenotypes = [float(score) for score in self.array("scores")]
+        data[MonoPhenotypeAnalysisResult.PH_COL] = pd.Series(phenotypes, index=data.index, dtype=object)
+
+        statistic_result = StatisticResult(
+            statistic=self._metadata["statistic_value"],
+            pval=float(self._metadata["pval"]),
+        )
+        if self.kind == "survival_analysis":
+            return SurvivalAnalysisResult(
+                gt_clf=gt_clf,
+                endpoint=_StoredEndpoint(self._metadata["phenotype"]),
+                statistic=statistic,  # type: ignore
+                data=data,
+                statistic_result=statistic_result,
+                survivals=survivals,
+            )
+        else:
+            return PhenotypeScoreAnalysisResult(
+                gt_clf=gt_clf,
+                phenotype=_StoredPhenotypeScorer(self._metadata["phenotype"]),
+                statistic=statistic,
+                data=data,
+                statistic_result=statistic_result,
+            )
+
+    def __repr__(self) -> str:
+        return f"StoredAnalysisResult(path={self._path}, kind={self.kind})"
+
+
+def _to_json_array(
+    item: typing.Any,
+) -> np.ndarray:
+    return np.frombuffer(json.dumps(item).encode("utf-8"), dtype=np.uint8)
+
+
+def _from_json_array(
+    array: np.ndarray,
+) -> typing.Any:
+    return json.loads(array.tobytes().decode("utf-8"))
+
+
+def _is_missing(
+    value: typing.Any,
+) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def _phenotype_to_str(
+    phenotype: typing.Any,
+) -> str:
+    return phenotype.value if isinstance(phenotype, hpotk.TermId) else str(phenotype)
+
+
+def _describe_partitioning(
+    partitioning,
+) -> typing.Dict[str, typing.Any]:
+    return {
+        "name": partitioning.name,
+        "description": partitioning.description,
+        "variable_name": partitioning.variable_name,
+    }
+
+
+def _describe_classifier(
+    clf,
+) -> typing.Dict[str, typing.Any]:
+    description = _describe_partitioning(clf)
+    description["categories"] = [
+        {"cat_id": cat.cat_id, "name": cat.name, "description": cat.description}
+        for cat in clf.get_categories()
+    ]
+    return description
+
+
+def _describe_phenotype_classifier(
+    clf: PhenotypeClassifier,
+) -> typing.Dict[str, typing.Any]:
+    description = _describe_classifier(clf)
+    description["phenotype"] = _phenotype_to_str(clf.phenotype)
+    description["is_term_id"] = isinstance(clf.phenotype, hpotk.TermId)
+    description["present_cat_id"] = clf.present_phenotype_category.cat_id
+    return description
+
+
+def _parse_categories(
+    description: typing.Mapping[str, typing.Any],
+) -> typing.Sequence[PatientCategory]:
+    return tuple(
+        PatientCategory(cat_id=c["cat_id"], name=c["name"], description=c["description"])
+        for c in description["categories"]
+    )
+
+
+class _StoredPartitioning:
+    # NOT PART OF THE PUBLIC API
+    # A mixin for restoring the name, description, and the variable name of a partitioning.
+
+    def _init_description(
+        self,
+        description: typing.Mapping[str, typing.Any],
+    ):
+        self._name = description["name"]
+        self._description = description["description"]
+        self._variable_name = description["variable_name"]
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def description(self) -> str:
+        return self._description
+
+    @property
+    def variable_name(self) -> str:
+        return self._variable_name
+
+    def _cannot_process(self, patient: Patient):
+        raise ValueError(f"{self._name} restored from a stored result cannot process the individuals")
+
+
+class _StoredGenotypeClassifier(_StoredPartitioning, GenotypeClassifier):
+    # NOT PART OF THE PUBLIC API
+
+    def __init__(
+        self,
+        description: typing.Mapping[str, typing.Any],
+    ):
+        self._init_description(description)
+        self._categorizations = tuple(Categorization(category=cat) for cat in _parse_categories(description))
+
+    def get_categorizations(self) -> typing.Sequence[Categorization]:
+        return self._categorizations
+
+    def test(self, individual: Patient) -> typing.Optional[Categorization]:
+        self._cannot_process(individual)
+
+
+class _StoredPhenotypeClassifier(_StoredPartitioning, PhenotypeClassifier):
+    # NOT PART OF THE PUBLIC API
+
+    def __init__(
+        self,
+        description: typing.Mapping[str, typing.Any],
+    ):
+        self._init_description(description)
+        phenotype = description["phenotype"]
+        self._phenotype = hpotk.TermId.from_curie(phenotype) if description["is_term_id"] else phenotype
+        self._categorizations = tuple(
+            PhenotypeCategorization(category=cat, phenotype=self._phenotype)
+            for cat in _parse_categories(description)
+        )
+        self._present = next(
+            c for c in self._categorizations if c.category.cat_id == description["present_cat_id"]
+        )
+
+    @property
+    def phenotype(self):
+        return self._phenotype
+
+    @property
+    def present_phenotype_categorization(self) -> PhenotypeCategorization:
+        return self._present
+
+    def get_categorizations(self) -> typing.Sequence[PhenotypeCategorization]:
+        return self._categorizations
+
+    def test(self, individual: Patient) -> typing.Optional[PhenotypeCategorization]:
+        self._cannot_process(individual)
+
+
+class _StoredPhenotypeScorer(_StoredPartitioning, PhenotypeScorer):
+    # NOT PART OF THE PUBLIC API
+
+    def __init__(
+        self,
+        description: typing.Mapping[str, typing.Any],
+    ):
+        self._init_description(description)
+
+    def score(self, patient: Patient) -> float:
+        self._cannot_process(patient)
+        return math.nan
+
+
+class _StoredEndpoint(_StoredPartitioning, Endpoint):
+    # NOT PART OF THE PUBLIC API
+
+    def __init__(
+        self,
+        description: typing.Mapping[str, typing.Any],
+    ):
+        self._init_description(description)
+
+    def compute_survival(self, patient: Patient) -> typing.Optional[Survival]:
+        self._cannot_process(patient)
+        return None
+
+
+class _StoredStatistic(Statistic):
+    # NOT PART OF THE PUBLIC API
+    # The statistics are equal if they have the same name.
+    pass
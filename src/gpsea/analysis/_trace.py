@@ -0,0 +1,373 @@
+import dataclasses
+import io
+import logging
+import time
+import typing
+
+from ._util import Summarizable
+
+
+@dataclasses.dataclass(frozen=True)
+class StageStats:
+    """
+    `StageStats` reports the execution of a single stage of an analysis.
+    """
+
+    name: str
+    """
+    Name of the stage, e.g. `classify` or `statistic`.
+    """
+
+    wall_time: float
+    """
+    Wall time of the stage execution in seconds.
+    """
+
+    n_items: typing.Optional[int] = None
+    """
+    The number of items (e.g. individuals or phenotypes) processed by the stage or `None` if not applicable.
+    """
+
+    cache_hits: typing.Optional[int] = None
+    """
+    The number of items served from a cache or `None` if the stage uses no cache.
+    """
+
+
+class AnalysisTrace(Summarizable):
+    """
+    `AnalysisTrace` summarizes the execution of an analysis into stages,
+    to find the stage to blame for a slow analysis.
+
+    The trace is available from the :attr:`~gpsea.analysis.AnalysisResult.trace` property of the analysis result.
+
+    :param analysis: name of the analysis.
+    :param stages: the stages in the order of execution.
+    :param profile: an optional report of the profiler (see :class:`ProfilingTracer`).
+    """
+
+    def __init__(
+        self,
+        analysis: str,
+        stages: typing.Iterable[StageStats],
+        profile: typing.Optional[str] = None,
+    ):
+        self._analysis = analysis
+        self._stages = tuple(stages)
+        self._profile = profile
+
+    @property
+    def analysis(self) -> str:
+        return self._analysis
+
+    @property
+    def stages(self) -> typing.Sequence[StageStats]:
+        return self._stages
+
+    @property
+    def total_time(self) -> float:
+        """
+        Get the total wall time of the stages in seconds.
+        """
+        return sum(stage.wall_time for stage in self._stages)
+
+    @property
+    def profile(self) -> typing.Optional[str]:
+        """
+        Get the report of the profiler or `None` if the analysis was not profiled.
+        """
+        return self._profile
+
+    def stage(
+        self,
+        name: str,
+    ) -> typing.Optional[StageStats]:
+        """
+        Get the stats of the stage with the `name` or `None` if the stage was not executed.
+        """
+        for stage in self._stages:
+            if stage.name == name:
+                return stage
+        return None
+
+    def summarize(
+        self,
+        out: typing.TextIO,
+    ):
+        out.write(f"{self._analysis} took {self.total_time:.3f}s\n")
+        total = self.total_time
+        for stage in self._stages:
+            share = 100.0 * stage.wall_time / total if total > 0.0 else 0.0
+            out.write(f"  {stage.name}: {stage.wall_time:.3f}s ({share:.1f}%)")
+            if stage.n_items is not None:
+                out.write(f", {stage.n_items} items")
+            if stage.cache_hits is not None:
+                out.write(f", {stage.cache_hits} cache hits")
+            out.write("\n")
+
+    def __eq__(self, value: object) -> bool:
+        return (
+            isinstance(value, AnalysisTrace)
+            and self._analysis == value._analysis
+            and self._stages == value._stages
+            and self._profile == value._profile
+        )
+
+    def __hash__(self) -> int:
+        return hash((self._analysis, self._stages, self._profile))
+
+    def __str__(self) -> str:
+        return self.summary()
+
+    def __repr__(self) -> str:
+        return f"AnalysisTrace(analysis={self._analysis!r}, stages={self._stages!r})"
+
+
+class AnalysisTracer:
+    """
+    `AnalysisTracer` is notified about the runs of an analysis and its stages,
+    e.g. to report the progress or to log the timings.
+
+    The methods do nothing by default, override the methods of interest in a subclass.
+
+    The analyses that compare several genotype classifiers in parallel (`n_workers > 1`)
+    call the tracer from several threads.
+    """
+
+    def on_run_start(
+        self,
+        analysis: str,
+    ):
+        """
+        Called when the `analysis` run starts.
+        """
+        pass
+
+    def on_stage_start(
+        self,
+        name: str,
+    ):
+        """
+        Called when the stage with `name` starts.
+        """
+        pass
+
+    def on_stage_end(
+        self,
+        stage: StageStats,
+    ):
+        """
+        Called when the `stage` ends.
+        """
+        pass
+
+    def on_run_end(
+        self,
+        trace: AnalysisTrace,
+    ):
+        """
+        Called when the analysis run ends, once for each result of the run
+        (e.g. for each genotype classifier of
+        :meth:`~gpsea.analysis.pcats.MultiPhenotypeAnalysis.compare_genotypes_vs_phenotypes`).
+        """
+        pass
+
+    def profile_report(self) -> typing.Optional[str]:
+        """
+        Get a report of the profiler for the last run, to include in the :class:`AnalysisTrace`,
+        or `None` if the tracer does not profile.
+        """
+        return None
+
+
+class LoggingTracer(AnalysisTracer):
+    """
+    `LoggingTracer` logs the stages of the analysis runs.
+
+    :param logger: the logger or `None` to use the logger of this module.
+    :param level: the logging level of the records.
+    """
+
+    def __init__(
+        self,
+        logger: typing.Optional[logging.Logger] = None,
+        level: int = logging.INFO,
+    ):
+        self._logger = logging.getLogger(__name__) if logger is None else logger
+        self._level = level
+
+    def on_stage_end(
+        self,
+        stage: StageStats,
+    ):
+        self._logger.log(
+            self._level,
+            "Stage %s took %.3fs (items=%s, cache hits=%s)",
+            stage.name,
+            stage.wall_time,
+            stage.n_items,
+            stage.cache_hits,
+        )
+
+    def on_run_end(
+        self,
+        trace: AnalysisTrace,
+    ):
+        self._logger.log(self._level, "%s took %.3fs", trace.analysis, trace.total_time)
+
+
+class ProfilingTracer(AnalysisTracer):
+    """
+    `ProfilingTracer` profiles the analysis runs and includes the profiler report
+    in the :attr:`~gpsea.analysis.AnalysisTrace.profile`.
+
+    The profiler is either the standard library :mod:`cProfile` (default)
+    or `pyinstrument <https://pyinstrument.readthedocs.io>`_, which must be installed separately.
+
+    The tracer must not be used to profile several runs at the same time (e.g. with `n_workers > 1`).
+
+    :param profiler: the profiler to use, one of `{'cprofile', 'pyinstrument'}`.
+    :param n_lines: the number of the most expensive functions to include in the `cprofile` report.
+    """
+
+    def __init__(
+        self,
+        profiler: typing.Literal["cprofile", "pyinstrument"] = "cprofile",
+        n_lines: int = 30,
+    ):
+        if profiler == "pyinstrument":
+            try:
+                import pyinstrument  # noqa: F401
+            except ImportError as e:
+                raise ValueError("The `pyinstrument` profiler requires the `pyinstrument` package") from e
+        elif profiler != "cprofile":
+            raise ValueError(f"`profiler` must be one of {{'cprofile', 'pyinstrument'}} but was {profiler}")
+        self._profiler_name = profiler
+        self._n_lines = n_lines
+        self._profiler = None
+        self._report: typing.Optional[str] = None
+
+    def on_run_start(
+        self,
+        analysis: str,
+    ):
+        if self._profiler_name == "cprofile":
+            import cProfile
+
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        else:
+            import pyinstrument
+
+            self._profiler = pyinstrument.Profiler()
+            self._profiler.start()
+        self._report = None
+
+    def profile_report(self) -> typing.Optional[str]:
+        if self._profiler is None:
+            return self._report
+
+        if self._profiler_name == "cprofile":
+            import pstats
+
+            self._profiler.disable()
+            buf = io.StringIO()
+            pstats.Stats(self._profiler, stream=buf).sort_stats("cumulative").print_stats(self._n_lines)
+            self._report = buf.getvalue()
+        else:
+            self._profiler.stop()
+            self._report = self._profiler.output_text()
+        self._profiler = None
+        return self._report
+
+
+class _StageTimer:
+    # NOT PART OF THE PUBLIC API
+
+    def __init__(
+        self,
+        recorder: "_TraceRecorder",
+        name: str,
+    ):
+        self._recorder = recorder
+        self._name = name
+        self._start = 0.0
+        self.n_items: typing.Optional[int] = None
+        self.cache_hits: typing.Optional[int] = None
+
+    def __enter__(self) -> "_StageTimer":
+        if self._recorder.tracer is not None:
+            self._recorder.tracer.on_stage_start(self._name)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        stage = StageStats(
+            name=self._name,
+            wall_time=time.perf_counter() - self._start,
+            n_items=self.n_items,
+            cache_hits=self.cache_hits,
+        )
+        self._recorder.stages.append(stage)
+        if self._recorder.tracer is not None:
+            self._recorder.tracer.on_stage_end(stage)
+
+
+class _TraceRecorder:
+    """
+    Record the stages of a single analysis run.
+
+    Use the recorder as a context manager around the run, to stop the tracer (e.g. the profiler)
+    if the run fails. Use :meth:`stage` as a context manager around each stage, and set the `n_items`
+    and `cache_hits` of the stage on the object returned by the context manager.
+    """
+    # NOT PART OF THE PUBLIC API
+
+    def __init__(
+        self,
+        analysis: str,
+        tracer: typing.Optional[AnalysisTracer],
+        stages: typing.Iterable[StageStats] = (),
+    ):
+        self.analysis = analysis
+        self.tracer = tracer
+        self.stages: typing.List[StageStats] = list(stages)
+
+    def start(self) -> "_TraceRecorder":
+        if self.tracer is not None:
+            self.tracer.on_run_start(self.analysis)
+        return self
+
+    def __enter__(self) -> "_TraceRecorder":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None and self.tracer is not None:
+            # The run will not be finished, hence we stop profiling here.
+            self.tracer.profile_report()
+
+    def stage(
+        self,
+        name: str,
+    ) -> _StageTimer:
+        return _StageTimer(self, name)
+
+    def fork(self) -> "_TraceRecorder":
+        """
+        Start recording a branch of the run that shares the stages recorded so far,
+        e.g. to compute several results from the same classification.
+        """
+        return _TraceRecorder(self.analysis, self.tracer, self.stages)
+
+    def finish(self) -> AnalysisTrace:
+        """
+        Finish the run (or a branch of the run) and prepare the trace.
+
+        Finish the branches only after all branches of the run are done,
+        because the tracer may stop profiling when the first branch is finished.
+        """
+        profile = None if self.tracer is None else self.tracer.profile_report()
+        trace = AnalysisTrace(analysis=self.analysis, stages=self.stages, profile=profile)
+        if self.tracer is not None:
+            self.tracer.on_run_end(trace)
+        return trace
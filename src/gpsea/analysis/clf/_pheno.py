@@ -168,9 +168,8 @@ class DiseasePresenceClassifier(PhenotypeClassifier[hpotk.TermId]):
     ) -> typing.Optional[PhenotypeCategorization[hpotk.TermId]]:
         self._check_patient(patient)
 
-        for dis in patient.diseases:
-            if dis.is_present and dis.identifier == self._query:
-                return self._diagnosis_present
+        if self._query in patient.present_disease_ids():
+            return self._diagnosis_present
 
         return self._diagnosis_excluded
 
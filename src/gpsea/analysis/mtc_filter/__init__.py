@@ -6,7 +6,7 @@ See :ref:`MTC filters <mtc-filters>` section for more info.
 """
 
 from ._impl import PhenotypeMtcFilter, PhenotypeMtcResult, PhenotypeMtcIssue
-from ._impl import UseAllTermsMtcFilter, SpecifiedTermsMtcFilter, IfHpoFilter
+from ._impl import UseAllTermsMtcFilter, SpecifiedTermsMtcFilter, IfHpoFilter, TaroneMtcFilter
 from ._impl import HpoMtcFilter
 
 __all__ = [
@@ -16,5 +16,6 @@ __all__ = [
     "UseAllTermsMtcFilter",
     "SpecifiedTermsMtcFilter",
     "IfHpoFilter",
+    "TaroneMtcFilter",
     "HpoMtcFilter",
 ]
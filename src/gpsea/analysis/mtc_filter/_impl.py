@@ -1,17 +1,20 @@
 import abc
 import dataclasses
 import typing
-
-from collections import deque
 import warnings
 
 import hpotk
+import numpy as np
 import pandas as pd
 
 from hpotk.constants.hpo.base import PHENOTYPIC_ABNORMALITY
 
 from ..clf import GenotypeClassifier, PhenotypeClassifier, P
 
+if typing.TYPE_CHECKING:
+    # Imported for type checking only, to prevent a circular import.
+    from ..pcats.stats import CountStatistic
+
 
 @dataclasses.dataclass(eq=True, frozen=True)
 class PhenotypeMtcIssue:
@@ -371,6 +374,8 @@ class IfHpoFilter(PhenotypeMtcFilter[hpotk.TermId]):
         self._hpo_annotation_frequency_threshold = annotation_frequency_threshold
 
         self._general_hpo_terms = set(general_hpo_terms)
+        # Derived from `hpo`, hence the `_cache` suffix keeps the set out of the analysis fingerprint.
+        self._phenotypic_abnormalities_cache = frozenset(hpo.graph.get_descendants(PHENOTYPIC_ABNORMALITY))
 
         self._below_annotation_frequency_threshold = PhenotypeMtcResult.fail(
             code="HMF09",
@@ -414,98 +419,144 @@ class IfHpoFilter(PhenotypeMtcFilter[hpotk.TermId]):
     ) -> typing.Sequence[PhenotypeMtcResult]:
         phenotypes = [p.phenotype for p in pheno_clfs]
         p_to_idx = {p: i for i, p in enumerate(phenotypes)}
+        n_terms = len(phenotypes)
+        if n_terms == 0:
+            return ()
 
         annotation_count_thr = self._hpo_annotation_frequency_threshold * cohort_size
 
-        results: typing.MutableSequence[typing.Optional[PhenotypeMtcResult]] = [
-            None for _ in range(len(phenotypes))
-        ]
-        for term_id in self._get_ordered_terms(phenotypes):
-            try:
-                idx = p_to_idx[term_id]
-            except KeyError:
-                # The procedure for getting the ordered terms produced a term
-                # that is not included in `phenotypes`.
-                # This is normal and we just move on.
-                continue
-
-            if term_id in self._general_hpo_terms:
-                results[idx] = IfHpoFilter.SKIPPING_GENERAL_TERM
-                continue
-
-            if not self._hpo.graph.is_ancestor_of(PHENOTYPIC_ABNORMALITY, term_id):
-                results[idx] = IfHpoFilter.SKIPPING_NON_PHENOTYPE_TERM
-                continue
-
-            contingency_matrix = counts[idx]
-
-            total_count = contingency_matrix.sum().sum()
-            if total_count < annotation_count_thr:
-                results[idx] = self._below_annotation_frequency_threshold
-                continue
-
-            if (
-                contingency_matrix.shape == (2, 2)
-                and total_count < self._min_observations_for_2_by_2
-            ):
-                results[idx] = self._not_powered_for_2_by_2
-                continue
-            elif (
-                contingency_matrix.shape == (2, 3)
-                and total_count < self._min_observations_for_2_by_3
-            ):
-                results[idx] = self._not_powered_for_2_by_3
-                continue
-
-            elif IfHpoFilter.one_genotype_has_zero_hpo_observations(
-                counts=contingency_matrix,
-                gt_clf=gt_clf,
-            ):
-                results[idx] = (
-                    IfHpoFilter.SKIPPING_SINCE_ONE_GENOTYPE_HAD_ZERO_OBSERVATIONS
-                )
-                continue
-
-            # Check if the term has exactly one child with a very similar number of individuals
-            # in the genotype and phenotype groups.
-            child_contingency_matrix = None
-            for child in self._hpo.graph.get_children(term_id):
-                if child in p_to_idx:
-                    child_idx = p_to_idx[child]
-                    if child_contingency_matrix is None:
-                        child_contingency_matrix = counts[child_idx]
-                    else:
-                        # Found 2nd child of this term.
-                        # We always want to test a term with
-                        # >1 children in the target set.
-                        child_contingency_matrix = None
-                        break
-
-            if child_contingency_matrix is not None:
-                if (contingency_matrix - child_contingency_matrix).abs().max(
-                    axis=None
-                ) < 1:
-                    # Do not test if the count is exactly the same to the counts in the only child term.
-                    results[idx] = IfHpoFilter.SAME_COUNT_AS_THE_ONLY_CHILD
-                    continue
-
-            # ##
-            # The term should be tested if we get here.
-            results[idx] = PhenotypeMtcFilter.OK
-
-        # There should be no `None` elements in `results` at this point.
-        if any(r is None for r in results):
-            missing = []
-            for i, result in enumerate(results):
-                if result is None:
-                    term_name = self._hpo.get_term_name(phenotypes[i])
-                    missing.append(term_name)
-
-            msg = "Missing results for {}".format(", ".join(missing))
-            raise ValueError(msg)
-
-        # Ignoring the type hint, because we checked the type match above.
-        return tuple(results)  # type: ignore
+        # The outcomes in the order of precedence.
+        # The first failing check decides the result of a phenotype.
+        outcomes = (
+            IfHpoFilter.SKIPPING_GENERAL_TERM,
+            IfHpoFilter.SKIPPING_NON_PHENOTYPE_TERM,
+            self._below_annotation_frequency_threshold,
+            self._not_powered_for_2_by_2,
+            self._not_powered_for_2_by_3,
+            IfHpoFilter.SKIPPING_SINCE_ONE_GENOTYPE_HAD_ZERO_OBSERVATIONS,
+            IfHpoFilter.SAME_COUNT_AS_THE_ONLY_CHILD,
+        )
+
+        is_general = np.fromiter(
+            (term_id in self._general_hpo_terms for term_id in phenotypes),
+            dtype=bool,
+            count=n_terms,
+        )
+        is_non_phenotype = ~is_general & np.fromiter(
+            (term_id not in self._phenotypic_abnormalities_cache for term_id in phenotypes),
+            dtype=bool,
+            count=n_terms,
+        )
+
+        # Stack the contingency matrices into `(n_terms, rows, cols)` arrays,
+        # one array per distinct layout of the matrices (usually just one).
+        layouts = _stack_contingency_matrices(counts)
+        layout_of = np.empty(n_terms, dtype=np.intp)
+        position_of = np.empty(n_terms, dtype=np.intp)
+        total_count = np.empty(n_terms, dtype=float)
+        not_powered_2_by_2 = np.zeros(n_terms, dtype=bool)
+        not_powered_2_by_3 = np.zeros(n_terms, dtype=bool)
+        zero_genotype = np.zeros(n_terms, dtype=bool)
+        for layout_idx, (indices, stack) in enumerate(layouts):
+            layout_of[indices] = layout_idx
+            position_of[indices] = np.arange(len(indices))
+
+            totals = stack.sum(axis=(1, 2))
+            total_count[indices] = totals
+
+            shape = stack.shape[1:]
+            if shape == (2, 2):
+                not_powered_2_by_2[indices] = totals < self._min_observations_for_2_by_2
+            elif shape == (2, 3):
+                not_powered_2_by_3[indices] = totals < self._min_observations_for_2_by_3
+
+            columns = counts[indices[0]].columns.get_indexer(gt_clf.get_categories())
+            if np.any(columns < 0):
+                # Let pandas complain about the missing genotype category.
+                zero_genotype[indices] = [
+                    IfHpoFilter.one_genotype_has_zero_hpo_observations(counts=counts[i], gt_clf=gt_clf)
+                    for i in indices
+                ]
+            else:
+                zero_genotype[indices] = np.any(stack[:, :, columns].sum(axis=1) == 0, axis=1)
+
+        below_threshold = total_count < annotation_count_thr
+
+        # Check if the term has exactly one child with a very similar number of individuals
+        # in the genotype and phenotype groups.
+        undecided = ~(
+            is_general
+            | is_non_phenotype
+            | below_threshold
+            | not_powered_2_by_2
+            | not_powered_2_by_3
+            | zero_genotype
+        )
+        only_child = self._find_only_children(phenotypes, p_to_idx, np.flatnonzero(undecided))
+        same_as_only_child = np.zeros(n_terms, dtype=bool)
+        has_only_child = only_child >= 0
+        parents = np.flatnonzero(has_only_child)
+        children = only_child[has_only_child]
+        same_layout = layout_of[parents] == layout_of[children]
+        for layout_idx, (_, stack) in enumerate(layouts):
+            in_layout = same_layout & (layout_of[parents] == layout_idx)
+            parent_counts = stack[position_of[parents[in_layout]]]
+            child_counts = stack[position_of[children[in_layout]]]
+            same_as_only_child[parents[in_layout]] = (
+                np.abs(parent_counts - child_counts).max(axis=(1, 2), initial=0) < 1
+            )
+        for parent, child in zip(parents[~same_layout], children[~same_layout]):
+            # The matrices do not share the layout, hence we must align them by labels.
+            same_as_only_child[parent] = (counts[parent] - counts[child]).abs().max(axis=None) < 1
+
+        decisions = np.select(
+            condlist=(
+                is_general,
+                is_non_phenotype,
+                below_threshold,
+                not_powered_2_by_2,
+                not_powered_2_by_3,
+                zero_genotype,
+                same_as_only_child,
+            ),
+            choicelist=np.arange(len(outcomes)),
+            default=-1,
+        )
+
+        return tuple(
+            PhenotypeMtcFilter.OK if decision < 0 else outcomes[decision]
+            for decision in decisions
+        )
+
+    def _find_only_children(
+        self,
+        phenotypes: typing.Sequence[hpotk.TermId],
+        p_to_idx: typing.Mapping[hpotk.TermId, int],
+        indices: typing.Iterable[int],
+    ) -> np.ndarray:
+        """
+        Find the index of the only child of the phenotypes at `indices` among the tested `phenotypes`.
+
+        The index is `-1` if the phenotype has no child or more than one child among the tested phenotypes.
+        """
+        # Index the children of the tested phenotypes in one pass over the parents of the tested phenotypes.
+        n_children = np.zeros(len(phenotypes), dtype=np.intp)
+        last_child = np.full(len(phenotypes), -1, dtype=np.intp)
+        for child, child_idx in p_to_idx.items():
+            for parent in self._hpo.graph.get_parents(child):
+                parent_idx = p_to_idx.get(parent)
+                if parent_idx is not None:
+                    n_children[parent_idx] += 1
+                    last_child[parent_idx] = child_idx
+
+        # We always want to test a term with >1 children in the target set.
+        indices = np.fromiter(indices, dtype=np.intp)
+        # The index of a repeated phenotype in `p_to_idx`.
+        term_indices = np.fromiter((p_to_idx[phenotypes[idx]] for idx in indices), dtype=np.intp, count=len(indices))
+        only_child = np.full(len(phenotypes), -1, dtype=np.intp)
+        only_child[indices] = np.where(n_children[term_indices] == 1, last_child[term_indices], -1)
+
+        return only_child
 
     def possible_results(self) -> typing.Collection[PhenotypeMtcResult]:
         return (
@@ -539,47 +590,128 @@ class IfHpoFilter(PhenotypeMtcFilter[hpotk.TermId]):
     ):
         return any(counts.loc[:, c].sum() == 0 for c in gt_clf.get_categories()) # type: ignore
 
-    def _get_ordered_terms(
+
+class TaroneMtcFilter(PhenotypeMtcFilter[typing.Any]):
+    """
+    `TaroneMtcFilter` skips the phenotypes that can never be significant after the multiple testing correction.
+
+    The margins (row and column totals) of a contingency table
+    limit the smallest p value which a count statistic can attain.
+    Following Tarone (1990), the filter finds the smallest number of tests :math:`K`
+    such that at most :math:`K` tables can attain a p value of :math:`\\alpha / K` or less,
+    and skips the other tables, since these cannot be significant even before including them
+    in the multiple testing burden.
+
+    The minimum attainable p values are cached by the table margins.
+
+    See :ref:`tarone-mt-filter` section for more info.
+
+    :param count_statistic: the statistic for testing the contingency tables.
+        The statistic should be the same as the one used in the analysis.
+    :param alpha: a `float` in range :math:`(0, 1]` with the significance threshold of the analysis.
+    """
+
+    UNTESTABLE_TERM = PhenotypeMtcResult.fail(
+        code="TMF01",
+        reason="Skipping terms that cannot attain a significant p value",
+        doclink="#tarone-mt-filter",
+    )
+    """
+    The MTC filtering result returned when the margins of a contingency table do not allow a significant p value.
+    """
+
+    def __init__(
         self,
-        term_ids: typing.Iterable[hpotk.TermId],
-    ) -> typing.Sequence[hpotk.TermId]:
+        count_statistic: "CountStatistic",
+        alpha: float = 0.05,
+    ):
+        self._count_statistic = count_statistic
+        assert (
+            isinstance(alpha, (int, float))
+            and 0.0 < alpha <= 1.0
+        ), "The alpha must be in the range (0, 1]"
+        self._alpha = float(alpha)
+
+        self._min_pval_cache: typing.Dict[typing.Tuple[typing.Tuple[int, ...], typing.Tuple[int, ...]], float] = {}
+
+    @property
+    def alpha(self) -> float:
+        return self._alpha
+
+    def min_attainable_pval(
+        self,
+        counts: pd.DataFrame,
+    ) -> float:
         """
-        We want to order the terms that were observed in a cohort from the most specific terms
-        ("leaves" in the graph of observed terms, but not necessarily leaves in the entire HPO graph)
-        to the most general terms.
+        Get the minimum p value attainable by a contingency table with the margins of `counts`.
         """
-        # A "leaf" refers to an annotated term none of whose children is annotated.
-        # May or may not be leaf in HPO graph
-        all_term_ids = set()
-        for term_id in term_ids:
-            all_term_ids.add(term_id)
-            all_term_ids.update(self._hpo.graph.get_ancestors(term_id))
-
-        # get all of the leaf terms
-        hpo_leaf_term_id_set = set()
-        for term_id in term_ids:
-            # get descendants not including original term
-            # TODO: would just children work here too?
-            # if no descendant is in the set of annotated terms, then the term must be a leaf term
-            if not any(
-                descendant in all_term_ids
-                for descendant in self._hpo.graph.get_descendants(term_id)
-            ):
-                hpo_leaf_term_id_set.add(term_id)
-
-        ordered_term_list = list()  # reset, if needed
-        queue = deque(hpo_leaf_term_id_set)
-        seen_terms = set()
-        while len(queue) > 0:
-            term_id = queue.popleft()
-            if term_id not in seen_terms:
-                seen_terms.add(term_id)
-
-                ordered_term_list.append(term_id)
-                queue.extend(self._hpo.graph.get_parents(term_id))
-
-        # now, ordered_term_list is ordered from leaves to root
-        return ordered_term_list
+        values = counts.to_numpy()
+        key = (
+            tuple(int(r) for r in values.sum(axis=1)),
+            tuple(int(c) for c in values.sum(axis=0)),
+        )
+        min_pval = self._min_pval_cache.get(key)
+        if min_pval is None:
+            min_pval = self._count_statistic.min_attainable_pval(*key)
+            self._min_pval_cache[key] = min_pval
+        return min_pval
+
+    def filter(
+        self,
+        gt_clf: GenotypeClassifier,
+        pheno_clfs: typing.Sequence[PhenotypeClassifier[P]],
+        counts: typing.Sequence[pd.DataFrame],
+        cohort_size: int,
+    ) -> typing.Sequence[PhenotypeMtcResult]:
+        n_tests = len(counts)
+        if n_tests == 0:
+            return ()
+
+        min_pvals = np.array([self.min_attainable_pval(c) for c in counts])
+
+        # The number of the tables that can attain p value of `alpha / k` or less, for `k` in `1, ..., n_tests`.
+        k = np.arange(1, n_tests + 1)
+        n_testable = np.searchsorted(np.sort(min_pvals), self._alpha / k, side="right")
+        # `n_testable[-1] <= n_tests`, hence there is always at least one `k` that satisfies the condition.
+        k_min = k[np.argmax(n_testable <= k)]
+
+        is_testable = min_pvals <= self._alpha / k_min
+        return tuple(
+            PhenotypeMtcFilter.OK if testable else TaroneMtcFilter.UNTESTABLE_TERM
+            for testable in is_testable
+        )
+
+    def possible_results(self) -> typing.Collection[PhenotypeMtcResult]:
+        return (
+            PhenotypeMtcFilter.OK,
+            TaroneMtcFilter.UNTESTABLE_TERM,
+        )
+
+    def filter_method_name(self) -> str:
+        return "Tarone MTC filter"
+
+
+def _stack_contingency_matrices(
+    counts: typing.Sequence[pd.DataFrame],
+) -> typing.Sequence[typing.Tuple[np.ndarray, np.ndarray]]:
+    """
+    Group the contingency matrices by their layout (shape and labels) and stack each group
+    into an `(n_terms, rows, cols)` array.
+
+    :returns: a sequence of tuples with the indices of the matrices in `counts` and the stacked array.
+    """
+    groups: typing.Dict[typing.Tuple[typing.Hashable, ...], typing.List[int]] = {}
+    for i, frame in enumerate(counts):
+        key = (frame.shape, tuple(frame.index), tuple(frame.columns))
+        groups.setdefault(key, []).append(i)
+
+    return tuple(
+        (
+            np.array(indices, dtype=np.intp),
+            np.stack([counts[i].to_numpy() for i in indices]),
+        )
+        for indices in groups.values()
+    )
 
 
 class HpoMtcFilter(IfHpoFilter):
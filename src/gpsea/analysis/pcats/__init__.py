@@ -21,11 +21,34 @@ for :class:`~gpsea.analysis.pcats.HpoTermAnalysis`).
 Use :func:`~gpsea.analysis.pcats.configure_hpo_term_analysis` to configure the HPO term analysis with the default parameters.
 """
 
-from ._impl import MultiPhenotypeAnalysis, MultiPhenotypeAnalysisResult
-from ._impl import DiseaseAnalysis
-from ._impl import HpoTermAnalysis, HpoTermAnalysisResult
-from ._impl import apply_classifiers_on_individuals
-from ._config import configure_hpo_term_analysis
+import typing
+
+from gpsea._lazy import attach
+
+if typing.TYPE_CHECKING:
+    from ._impl import MultiPhenotypeAnalysis, MultiPhenotypeAnalysisResult
+    from ._impl import DiseaseAnalysis
+    from ._impl import HpoTermAnalysis, HpoTermAnalysisResult, IncrementalHpoTermAnalysis
+    from ._impl import PhenotypeMatrix, apply_classifiers_on_individuals
+    from ._config import configure_hpo_term_analysis
+else:
+    __getattr__, __dir__ = attach(
+        __name__,
+        {
+            "._impl": (
+                "MultiPhenotypeAnalysis",
+                "MultiPhenotypeAnalysisResult",
+                "DiseaseAnalysis",
+                "HpoTermAnalysis",
+                "HpoTermAnalysisResult",
+                "IncrementalHpoTermAnalysis",
+                "PhenotypeMatrix",
+                "apply_classifiers_on_individuals",
+            ),
+            "._config": ("configure_hpo_term_analysis",),
+        },
+        submodules=("stats",),
+    )
 
 __all__ = [
     "MultiPhenotypeAnalysis",
@@ -33,6 +56,8 @@ __all__ = [
     "DiseaseAnalysis",
     "HpoTermAnalysis",
     "HpoTermAnalysisResult",
+    "IncrementalHpoTermAnalysis",
+    "PhenotypeMatrix",
     "apply_classifiers_on_individuals",
     "configure_hpo_term_analysis",
 ]
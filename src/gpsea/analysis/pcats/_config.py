@@ -2,6 +2,8 @@ import typing
 
 import hpotk
 
+from .._cache import AnalysisResultCache
+from .._trace import AnalysisTracer
 from ..mtc_filter import IfHpoFilter
 from ._impl import HpoTermAnalysis
 from .stats import CountStatistic, FisherExactTest
@@ -12,6 +14,8 @@ def configure_hpo_term_analysis(
     count_statistic: CountStatistic = FisherExactTest(),
     mtc_correction: typing.Optional[str] = "fdr_bh",
     mtc_alpha: float = 0.05,
+    result_cache: typing.Optional[AnalysisResultCache] = None,
+    tracer: typing.Optional[AnalysisTracer] = None,
 ) -> HpoTermAnalysis:
     """
     Configure HPO term analysis with default parameters.
@@ -20,10 +24,16 @@ def configure_hpo_term_analysis(
     then compute nominal p values using `count_statistic` (default Fisher exact test),
     and apply multiple testing correction (default Benjamini/Hochberg (`fdr_bh`))
     with target `mtc_alpha` (default `0.05`).
+
+    The results are stored in and reused from the `result_cache`, if provided
+    (see :func:`~gpsea.analysis.configure_analysis_result_cache`).
+    The analysis stages are reported to the `tracer`, if provided (see :class:`~gpsea.analysis.AnalysisTracer`).
     """
     return HpoTermAnalysis(
         mtc_filter=IfHpoFilter.default_filter(hpo),
         count_statistic=count_statistic,
         mtc_correction=mtc_correction,
         mtc_alpha=mtc_alpha,
+        result_cache=result_cache,
+        tracer=tracer,
     )
@@ -1,4 +1,6 @@
 import abc
+import concurrent.futures
+import logging
 import os
 import typing
 
@@ -8,9 +10,8 @@ import hpotk
 import numpy as np
 import pandas as pd
 
-from statsmodels.stats import multitest
-
-from gpsea.model import Patient
+import gpsea
+from gpsea.model import Cohort, Patient
 
 from ..clf import GenotypeClassifier
 from ..clf import P, PhenotypeClassifier
@@ -18,6 +19,8 @@ from ..mtc_filter import PhenotypeMtcFilter, PhenotypeMtcResult
 
 from .stats import CountStatistic
 from .._base import MultiPhenotypeAnalysisResult, StatisticResult
+from .._cache import AnalysisResultCache, _Fingerprinter
+from .._trace import AnalysisTracer, _TraceRecorder
 
 
 DEFAULT_MTC_PROCEDURE = "fdr_bh"
@@ -26,6 +29,153 @@ Use Benjamini-Hochberg as the default MTC procedure.
 """
 
 
+class PhenotypeMatrix(typing.Generic[P]):
+    """
+    `PhenotypeMatrix` keeps the phenotype categories assigned to the cohort members
+    by a sequence of phenotype classifiers.
+
+    The matrix is independent of the genotype, hence it can be computed once
+    and then counted with many genotype classifiers (see :meth:`count`).
+
+    Use :meth:`classify` to create the matrix.
+    """
+
+    @staticmethod
+    def classify(
+        individuals: typing.Iterable[Patient],
+        pheno_clfs: typing.Sequence[PhenotypeClassifier[P]],
+    ) -> "PhenotypeMatrix[P]":
+        """
+        Classify the individuals with the phenotype classifiers.
+
+        :param individuals: an iterable of individuals to classify.
+        :param pheno_clfs: a sequence of phenotype classifiers to apply.
+        """
+        individuals = tuple(individuals)
+        pheno_clfs = tuple(pheno_clfs)
+        codes = np.full((len(pheno_clfs), len(individuals)), -1, dtype=np.intp)
+        for i, ph_clf in enumerate(pheno_clfs):
+            cat_to_idx = {cat: j for j, cat in enumerate(ph_clf.get_categories())}
+            for j, patient in enumerate(individuals):
+                pheno_cat = ph_clf.test(patient)
+                if pheno_cat is not None:
+                    codes[i, j] = cat_to_idx[pheno_cat.category]
+
+        return PhenotypeMatrix(
+            individuals=individuals,
+            pheno_clfs=pheno_clfs,
+            codes=codes,
+        )
+
+    def __init__(
+        self,
+        individuals: typing.Sequence[Patient],
+        pheno_clfs: typing.Sequence[PhenotypeClassifier[P]],
+        codes: np.ndarray,
+    ):
+        self._individuals = tuple(individuals)
+        self._pheno_clfs = tuple(pheno_clfs)
+        assert isinstance(codes, np.ndarray) and codes.shape == (len(self._pheno_clfs), len(self._individuals))
+        self._codes = codes
+
+    @property
+    def individuals(self) -> typing.Sequence[Patient]:
+        """
+        Get the classified individuals.
+        """
+        return self._individuals
+
+    @property
+    def pheno_clfs(self) -> typing.Sequence[PhenotypeClassifier[P]]:
+        """
+        Get the phenotype classifiers that produced the matrix rows.
+        """
+        return self._pheno_clfs
+
+    @property
+    def codes(self) -> np.ndarray:
+        """
+        Get an array with shape `(n_pheno_clfs, n_individuals)`
+        with the index of the phenotype category assigned to an individual by a classifier,
+        or `-1` if the individual could not be classified.
+        """
+        return self._codes
+
+    def count(
+        self,
+        gt_clf: GenotypeClassifier,
+    ) -> typing.Tuple[
+        typing.Sequence[int],
+        typing.Sequence[pd.DataFrame],
+    ]:
+        """
+        Count the individuals in the genotype and phenotype categories.
+
+        See :func:`apply_classifiers_on_individuals` for the description of the results.
+
+        :param gt_clf: the classifier to assign a genotype category.
+        """
+        gt_categories = tuple(gt_clf.get_categories())
+        gt_codes = _classify_genotypes(self._individuals, gt_clf, gt_categories)
+
+        n_gt = len(gt_categories)
+        has_genotype = gt_codes >= 0
+
+        # The classifiers for the same phenotype share the counts.
+        count_arrays: typing.Dict[P, np.ndarray] = {}
+        n_usable_patient_counter = Counter()
+        for ph_clf, codes in zip(self._pheno_clfs, self._codes):
+            n_pheno = ph_clf.n_categorizations()
+            usable = has_genotype & (codes >= 0)
+            counts = np.bincount(
+                codes[usable] * n_gt + gt_codes[usable],
+                minlength=n_pheno * n_gt,
+            ).reshape((n_pheno, n_gt))
+
+            if ph_clf.phenotype in count_arrays:
+                count_arrays[ph_clf.phenotype] += counts
+            else:
+                count_arrays[ph_clf.phenotype] = counts
+            n_usable_patient_counter[ph_clf.phenotype] += int(usable.sum())
+
+        count_dict = {}
+        for ph_clf in self._pheno_clfs:
+            if ph_clf.phenotype not in count_dict:
+                count_dict[ph_clf.phenotype] = pd.DataFrame(
+                    data=count_arrays[ph_clf.phenotype].astype(np.int64),
+                    index=pd.Index(
+                        data=ph_clf.get_categories(),
+                        name=ph_clf.variable_name,
+                    ),
+                    columns=pd.Index(
+                        data=gt_categories,
+                        name=gt_clf.variable_name,
+                    ),
+                )
+
+        n_usable_patients = [
+            n_usable_patient_counter[ph_clf.phenotype] for ph_clf in self._pheno_clfs
+        ]
+        counts = [count_dict[ph_clf.phenotype] for ph_clf in self._pheno_clfs]
+
+        return n_usable_patients, counts
+
+
+def _classify_genotypes(
+    individuals: typing.Sequence[Patient],
+    gt_clf: GenotypeClassifier,
+    gt_categories: typing.Sequence,
+) -> np.ndarray:
+    # Get the index of the genotype category of each individual or `-1` if the individual is not classified.
+    gt_cat_to_idx = {cat: j for j, cat in enumerate(gt_categories)}
+    gt_codes = np.full(len(individuals), -1, dtype=np.intp)
+    for j, patient in enumerate(individuals):
+        geno_cat = gt_clf.test(patient)
+        if geno_cat is not None:
+            gt_codes[j] = gt_cat_to_idx[geno_cat.category]
+    return gt_codes
+
+
 def apply_classifiers_on_individuals(
     individuals: typing.Iterable[Patient],
     gt_clf: GenotypeClassifier,
@@ -53,43 +203,7 @@ def apply_classifiers_on_individuals(
         - a sequence with data frames with counts of patients in i-th phenotype category
           and j-th genotype category where i and j are rows and columns of the data frame.
     """
-    n_usable_patient_counter = Counter()
-
-    # Apply genotype and phenotype predicates
-    count_dict = {}
-    for ph_predicate in pheno_clfs:
-        if ph_predicate.phenotype not in count_dict:
-            # Make an empty frame for keeping track of the counts.
-            count_dict[ph_predicate.phenotype] = pd.DataFrame(
-                data=0,
-                index=pd.Index(
-                    data=ph_predicate.get_categories(),
-                    name=ph_predicate.variable_name,
-                ),
-                columns=pd.Index(
-                    data=gt_clf.get_categories(),
-                    name=gt_clf.variable_name,
-                ),
-            )
-
-        for patient in individuals:
-            pheno_cat = ph_predicate.test(patient)
-            geno_cat = gt_clf.test(patient)
-
-            if pheno_cat is not None and geno_cat is not None:
-                count_dict[pheno_cat.phenotype].loc[
-                    pheno_cat.category, geno_cat.category
-                ] += 1
-                n_usable_patient_counter[pheno_cat.phenotype] += 1
-
-    # Convert dicts to numpy arrays
-    n_usable_patients = [
-        n_usable_patient_counter[ph_predicate.phenotype] for ph_predicate in pheno_clfs
-    ]
-
-    counts = [count_dict[ph_predicate.phenotype] for ph_predicate in pheno_clfs]
-
-    return n_usable_patients, counts
+    return PhenotypeMatrix.classify(individuals, pheno_clfs).count(gt_clf)
 
 
 class MultiPhenotypeAnalysis(typing.Generic[P], metaclass=abc.ABCMeta):
@@ -98,6 +212,8 @@ class MultiPhenotypeAnalysis(typing.Generic[P], metaclass=abc.ABCMeta):
         count_statistic: CountStatistic,
         mtc_correction: typing.Optional[str] = DEFAULT_MTC_PROCEDURE,
         mtc_alpha: float = 0.05,
+        result_cache: typing.Optional[AnalysisResultCache] = None,
+        tracer: typing.Optional[AnalysisTracer] = None,
     ):
         """
         Create the analysis.
@@ -108,6 +224,11 @@ class MultiPhenotypeAnalysis(typing.Generic[P], metaclass=abc.ABCMeta):
         :param mtc_correction: a `str` with the MTC procedure code or `None` if no MTC should be performed.
         :param mtc_alpha: a `float` with the family-wise error rate for FWER controlling procedures
             (e.g. Bonferroni MTC) or false discovery rate for the FDR procedures (e.g. Benjamini-Hochberg).
+        :param result_cache: an optional cache for storing the results and reusing the results
+            of the analyses with the same configuration and cohort.
+        :param tracer: an optional tracer to notify about the analysis stages.
+            The stage timings are available from the result :attr:`~gpsea.analysis.AnalysisResult.trace`
+            regardless of the tracer.
         """
         assert isinstance(count_statistic, CountStatistic)
         assert (
@@ -117,6 +238,12 @@ class MultiPhenotypeAnalysis(typing.Generic[P], metaclass=abc.ABCMeta):
         self._mtc_correction = mtc_correction
         assert isinstance(mtc_alpha, float) and 0.0 <= mtc_alpha <= 1.0
         self._mtc_alpha = mtc_alpha
+        if result_cache is not None:
+            assert isinstance(result_cache, AnalysisResultCache)
+        self._result_cache = result_cache
+        if tracer is not None:
+            assert isinstance(tracer, AnalysisTracer)
+        self._tracer = tracer
 
     def compare_genotype_vs_phenotypes(
         self,
@@ -124,6 +251,133 @@ class MultiPhenotypeAnalysis(typing.Generic[P], metaclass=abc.ABCMeta):
         gt_clf: GenotypeClassifier,
         pheno_clfs: typing.Iterable[PhenotypeClassifier[P]],
     ) -> MultiPhenotypeAnalysisResult[P]:
+        return self.compare_genotypes_vs_phenotypes(
+            cohort=cohort,
+            gt_clfs=(gt_clf,),
+            pheno_clfs=pheno_clfs,
+        )[0]
+
+    def compare_genotypes_vs_phenotypes(
+        self,
+        cohort: typing.Iterable[Patient],
+        gt_clfs: typing.Iterable[GenotypeClassifier],
+        pheno_clfs: typing.Iterable[PhenotypeClassifier[P]],
+        n_workers: int = 1,
+    ) -> typing.Sequence[MultiPhenotypeAnalysisResult[P]]:
+        """
+        Compare several genotype classifiers against the same phenotypes.
+
+        The individuals are classified with the phenotype classifiers only once,
+        and the phenotype categories are reused for all genotype classifiers.
+        The results are the same as calling :meth:`compare_genotype_vs_phenotypes`
+        for each genotype classifier.
+
+        If the analysis has a result cache, the stored results are reused
+        and only the missing results are computed.
+
+        :param cohort: the cohort to analyze.
+        :param gt_clfs: an iterable with the genotype classifiers to compare.
+        :param pheno_clfs: an iterable with the phenotype classifiers.
+        :param n_workers: a positive `int` with the number of threads for running the comparisons.
+        :returns: a sequence with one result for each genotype classifier, in the order of `gt_clfs`.
+        """
+        gt_clfs = tuple(gt_clfs)
+        pheno_clfs = tuple(pheno_clfs)
+        if n_workers < 1:
+            raise ValueError(f"`n_workers` must be a positive `int` but was {n_workers}")
+        # Check all classifiers before doing any work.
+        for gt_clf in gt_clfs:
+            self._check_analysis(gt_clf, pheno_clfs)
+        if not isinstance(cohort, Cohort):
+            cohort = tuple(cohort)
+
+        with _TraceRecorder(type(self).__name__, self._tracer) as recorder:
+            if self._result_cache is None:
+                keys = [None] * len(gt_clfs)
+                results: typing.List[typing.Optional[MultiPhenotypeAnalysisResult[P]]] = [None] * len(gt_clfs)
+            else:
+                with recorder.stage("load_results") as stage:
+                    keys = [self._result_key(cohort, gt_clf, pheno_clfs) for gt_clf in gt_clfs]
+                    results = [self._load_result(key) for key in keys]
+                    stage.n_items = len(results)
+                    stage.cache_hits = sum(1 for result in results if result is not None)
+            missing = [i for i, result in enumerate(results) if result is None]
+
+            branches = {}
+            if len(missing) != 0:
+                with recorder.stage("classify") as stage:
+                    pheno_matrix = PhenotypeMatrix.classify(cohort, pheno_clfs)
+                    stage.n_items = len(pheno_matrix.individuals)
+
+                branches = {i: recorder.fork() for i in missing}
+                if n_workers == 1 or len(missing) < 2:
+                    computed = [
+                        self._compute_result(gt_clf=gt_clfs[i], pheno_matrix=pheno_matrix, recorder=branches[i])
+                        for i in missing
+                    ]
+                else:
+                    with concurrent.futures.ThreadPoolExecutor(max_workers=n_workers) as executor:
+                        computed = list(
+                            executor.map(
+                                lambda i: self._compute_result(
+                                    gt_clf=gt_clfs[i], pheno_matrix=pheno_matrix, recorder=branches[i],
+                                ),
+                                missing,
+                            )
+                        )
+
+                for i, result in zip(missing, computed):
+                    results[i] = result
+                    self._store_result(keys[i], result)
+
+            # The results loaded from the cache get the trace of the shared stages.
+            for i, result in enumerate(results):
+                result._trace = branches[i].finish() if i in branches else recorder.fork().finish()
+
+            return tuple(results)
+
+    def _result_key(
+        self,
+        cohort: typing.Union[Cohort, typing.Sequence[Patient]],
+        gt_clf: GenotypeClassifier,
+        pheno_clfs: typing.Sequence[PhenotypeClassifier[P]],
+    ) -> typing.Optional[typing.Tuple[str, typing.Collection[hpotk.MinimalOntology]]]:
+        if self._result_cache is None:
+            return None
+
+        fingerprinter = _Fingerprinter()
+        try:
+            key = fingerprinter.digest(
+                (gpsea.__version__, type(self), self, cohort, gt_clf, pheno_clfs),
+            ).hex()
+        except ValueError as e:
+            logging.getLogger(__name__).warning("Not caching the analysis result: %s", e)
+            return None
+
+        return key, tuple(fingerprinter.ontologies.values())
+
+    def _load_result(
+        self,
+        key: typing.Optional[typing.Tuple[str, typing.Collection[hpotk.MinimalOntology]]],
+    ) -> typing.Optional[MultiPhenotypeAnalysisResult[P]]:
+        if self._result_cache is None or key is None:
+            return None
+        result = self._result_cache.load_result(key[0], ontologies=key[1])
+        return result if isinstance(result, MultiPhenotypeAnalysisResult) else None
+
+    def _store_result(
+        self,
+        key: typing.Optional[typing.Tuple[str, typing.Collection[hpotk.MinimalOntology]]],
+        result: MultiPhenotypeAnalysisResult[P],
+    ):
+        if self._result_cache is not None and key is not None:
+            self._result_cache.store_result(key[0], result)
+
+    def _check_analysis(
+        self,
+        gt_clf: GenotypeClassifier,
+        pheno_clfs: typing.Sequence[PhenotypeClassifier[P]],
+    ):
         # Check compatibility between the count statistic and predicate.
         issues = MultiPhenotypeAnalysis._check_compatibility(
             count_statistic=self._count_statistic,
@@ -134,18 +388,12 @@ class MultiPhenotypeAnalysis(typing.Generic[P], metaclass=abc.ABCMeta):
             msg = os.linesep.join(issues)
             raise ValueError(f"Cannot execute the analysis: {msg}")
 
-        return self._compute_result(
-            cohort=cohort,
-            gt_clf=gt_clf,
-            pheno_clfs=pheno_clfs,
-        )
-
     @abc.abstractmethod
     def _compute_result(
         self,
-        cohort: typing.Iterable[Patient],
         gt_clf: GenotypeClassifier,
-        pheno_clfs: typing.Iterable[PhenotypeClassifier[P]],
+        pheno_matrix: PhenotypeMatrix[P],
+        recorder: _TraceRecorder,
     ) -> MultiPhenotypeAnalysisResult[P]:
         pass
 
@@ -220,6 +468,9 @@ class MultiPhenotypeAnalysis(typing.Generic[P], metaclass=abc.ABCMeta):
         self,
         stats: typing.Sequence[typing.Optional[StatisticResult]],
     ) -> typing.Sequence[float]:
+        # `statsmodels` takes long to import, hence we import it on first use.
+        from statsmodels.stats import multitest
+
         assert self._mtc_correction is not None
         pvals = tuple(s.pval for s in stats if s is not None)
         _, corrected_pvals, _, _ = multitest.multipletests(
@@ -235,29 +486,31 @@ class MultiPhenotypeAnalysis(typing.Generic[P], metaclass=abc.ABCMeta):
 class DiseaseAnalysis(MultiPhenotypeAnalysis[hpotk.TermId]):
     def _compute_result(
         self,
-        cohort: typing.Iterable[Patient],
         gt_clf: GenotypeClassifier,
-        pheno_clfs: typing.Iterable[PhenotypeClassifier[P]],
+        pheno_matrix: PhenotypeMatrix[hpotk.TermId],
+        recorder: _TraceRecorder,
     ) -> MultiPhenotypeAnalysisResult[hpotk.TermId]:
-        pheno_clfs = tuple(pheno_clfs)
+        pheno_clfs = pheno_matrix.pheno_clfs
         if len(pheno_clfs) == 0:
             raise ValueError("No phenotype predicates were provided")
 
         # 1 - Count the patients
-        n_usable, all_counts = apply_classifiers_on_individuals(
-            individuals=cohort,
-            gt_clf=gt_clf,
-            pheno_clfs=pheno_clfs,
-        )
+        with recorder.stage("count") as stage:
+            n_usable, all_counts = pheno_matrix.count(gt_clf)
+            stage.n_items = len(pheno_clfs)
 
         # 2 - Compute nominal p values
-        stats = self._compute_nominal_stats(n_usable=n_usable, all_counts=all_counts)
+        with recorder.stage("statistic") as stage:
+            stats = self._compute_nominal_stats(n_usable=n_usable, all_counts=all_counts)
+            stage.n_items = len(stats)
 
         # 3 - Apply Multiple Testing Correction
         if self._mtc_correction is None:
             corrected_pvals = None
         else:
-            corrected_pvals = self._apply_mtc(stats=stats)
+            with recorder.stage("mtc_correction") as stage:
+                corrected_pvals = self._apply_mtc(stats=stats)
+                stage.n_items = len(corrected_pvals)
 
         return MultiPhenotypeAnalysisResult(
             gt_clf=gt_clf,
@@ -378,41 +631,71 @@ class HpoTermAnalysis(MultiPhenotypeAnalysis[hpotk.TermId]):
         mtc_filter: PhenotypeMtcFilter,
         mtc_correction: typing.Optional[str] = DEFAULT_MTC_PROCEDURE,
         mtc_alpha: float = 0.05,
+        result_cache: typing.Optional[AnalysisResultCache] = None,
+        tracer: typing.Optional[AnalysisTracer] = None,
     ):
         super().__init__(
             count_statistic=count_statistic,
             mtc_correction=mtc_correction,
             mtc_alpha=mtc_alpha,
+            result_cache=result_cache,
+            tracer=tracer,
         )
         assert isinstance(mtc_filter, PhenotypeMtcFilter)
         self._mtc_filter = mtc_filter
 
     def _compute_result(
         self,
-        cohort: typing.Iterable[Patient],
         gt_clf: GenotypeClassifier,
-        pheno_clfs: typing.Iterable[PhenotypeClassifier[hpotk.TermId]],
+        pheno_matrix: PhenotypeMatrix[hpotk.TermId],
+        recorder: _TraceRecorder,
     ) -> HpoTermAnalysisResult:
-        pheno_clfs = tuple(pheno_clfs)
+        pheno_clfs = pheno_matrix.pheno_clfs
         if len(pheno_clfs) == 0:
             raise ValueError("No phenotype predicates were provided")
 
         # 1 - Count the patients
-        n_usable, all_counts = apply_classifiers_on_individuals(
-            cohort,
-            gt_clf,
-            pheno_clfs,
-        )
+        with recorder.stage("count") as stage:
+            n_usable, all_counts = pheno_matrix.count(gt_clf)
+            stage.n_items = len(pheno_clfs)
 
-        # 2 - Apply MTC filter and select p values to MTC
-        cohort_size = sum(1 for _ in cohort)
-        mtc_filter_results = self._mtc_filter.filter(
+        return self._analyze_counts(
             gt_clf=gt_clf,
             pheno_clfs=pheno_clfs,
-            counts=all_counts,
-            cohort_size=cohort_size,
+            n_usable=n_usable,
+            all_counts=all_counts,
+            cohort_size=len(pheno_matrix.individuals),
+            recorder=recorder,
         )
 
+    def _analyze_counts(
+        self,
+        gt_clf: GenotypeClassifier,
+        pheno_clfs: typing.Sequence[PhenotypeClassifier[hpotk.TermId]],
+        n_usable: typing.Sequence[int],
+        all_counts: typing.Sequence[pd.DataFrame],
+        cohort_size: int,
+        recorder: _TraceRecorder,
+        nominal_stats: typing.Optional[
+            typing.Callable[[np.ndarray], typing.Sequence[typing.Optional[StatisticResult]]]
+        ] = None,
+    ) -> HpoTermAnalysisResult:
+        """
+        Apply the MTC filter, the count statistic, and the MTC correction to the counts of the phenotypes.
+
+        :param nominal_stats: a function for getting the statistic results of the phenotypes at given indices
+          (e.g. from a memo) or `None` to compute the results with the count statistic.
+        """
+        # 2 - Apply MTC filter and select p values to MTC
+        with recorder.stage("mtc_filter") as stage:
+            mtc_filter_results = self._mtc_filter.filter(
+                gt_clf=gt_clf,
+                pheno_clfs=pheno_clfs,
+                counts=all_counts,
+                cohort_size=cohort_size,
+            )
+            stage.n_items = len(mtc_filter_results)
+
         results = np.full(shape=(len(n_usable),), fill_value=None)
         corrected_pvals = None
 
@@ -421,16 +704,25 @@ class HpoTermAnalysis(MultiPhenotypeAnalysis[hpotk.TermId]):
             # We have at least one HPO term to test.
 
             # 3 - Compute nominal p values
-            results[mtc_mask] = self._compute_nominal_stats(
-                n_usable=slice_list_in_numpy_style(n_usable, mtc_mask),
-                all_counts=slice_list_in_numpy_style(all_counts, mtc_mask),
-            )
+            with recorder.stage("statistic") as stage:
+                if nominal_stats is None:
+                    results[mtc_mask] = self._compute_nominal_stats(
+                        n_usable=slice_list_in_numpy_style(n_usable, mtc_mask),
+                        all_counts=slice_list_in_numpy_style(all_counts, mtc_mask),
+                    )
+                else:
+                    indices = np.flatnonzero(mtc_mask)
+                    for i, stat_result in zip(indices, nominal_stats(indices)):
+                        results[i] = stat_result
+                stage.n_items = int(mtc_mask.sum())
 
             # 4 - Apply Multiple Testing Correction
             if self._mtc_correction is not None:
-                corrected_pvals = np.full(shape=results.shape, fill_value=np.nan)
-                # Do not test the p values that have been filtered out.
-                corrected_pvals[mtc_mask] = self._apply_mtc(stats=results[mtc_mask])
+                with recorder.stage("mtc_correction") as stage:
+                    corrected_pvals = np.full(shape=results.shape, fill_value=np.nan)
+                    # Do not test the p values that have been filtered out.
+                    corrected_pvals[mtc_mask] = self._apply_mtc(stats=results[mtc_mask])
+                    stage.n_items = int(mtc_mask.sum())
 
         return HpoTermAnalysisResult(
             gt_clf=gt_clf,
@@ -446,6 +738,216 @@ class HpoTermAnalysis(MultiPhenotypeAnalysis[hpotk.TermId]):
         )
 
 
+class IncrementalHpoTermAnalysis:
+    """
+    `IncrementalHpoTermAnalysis` keeps the contingency tables of :class:`HpoTermAnalysis`
+    and updates them as the individuals are added to or removed from the cohort.
+
+    Only the individuals of a delta are classified, and only the tables that changed
+    are rebuilt and have their nominal p values recomputed.
+    The MTC filter and the multiple testing correction are applied to all phenotypes
+    when preparing the :meth:`result`, since their outcome depends on all tables.
+
+    The :meth:`result` is the same as the result of
+    :meth:`~gpsea.analysis.pcats.HpoTermAnalysis.compare_genotype_vs_phenotypes`
+    for the current individuals.
+
+    Example
+    ^^^^^^^
+
+    Start with the individuals of a cohort, and update the results after the cohort changes::
+
+      incremental = IncrementalHpoTermAnalysis(
+          analysis=analysis,
+          gt_clf=gt_clf,
+          pheno_clfs=pheno_clfs,
+          individuals=cohort,
+      )
+      result = incremental.result()
+
+      incremental.add_patients(new_patients)
+      incremental.remove_patients(retracted_patients)
+      result = incremental.result()
+
+    :param analysis: the HPO term analysis with the count statistic, MTC filter, and MTC procedure.
+    :param gt_clf: the genotype classifier.
+    :param pheno_clfs: the phenotype classifiers.
+    :param individuals: the initial individuals.
+    """
+
+    def __init__(
+        self,
+        analysis: HpoTermAnalysis,
+        gt_clf: GenotypeClassifier,
+        pheno_clfs: typing.Iterable[PhenotypeClassifier[hpotk.TermId]],
+        individuals: typing.Iterable[Patient] = (),
+    ):
+        assert isinstance(analysis, HpoTermAnalysis)
+        self._analysis = analysis
+        self._gt_clf = gt_clf
+        self._pheno_clfs = tuple(pheno_clfs)
+        if len(self._pheno_clfs) == 0:
+            raise ValueError("No phenotype predicates were provided")
+        analysis._check_analysis(gt_clf, self._pheno_clfs)
+
+        self._gt_categories = tuple(gt_clf.get_categories())
+        n_gt = len(self._gt_categories)
+
+        # The classifiers for the same phenotype share the counts, hence we keep one slot per phenotype.
+        pheno_to_slot: typing.Dict[hpotk.TermId, int] = {}
+        self._slot_clfs: typing.List[PhenotypeClassifier[hpotk.TermId]] = []
+        for ph_clf in self._pheno_clfs:
+            if ph_clf.phenotype not in pheno_to_slot:
+                pheno_to_slot[ph_clf.phenotype] = len(self._slot_clfs)
+                self._slot_clfs.append(ph_clf)
+        self._clf_slots = np.array([pheno_to_slot[ph_clf.phenotype] for ph_clf in self._pheno_clfs], dtype=np.intp)
+
+        # The tables of all slots are stored in a flat buffer, the table of a slot starts at its offset.
+        n_slots = len(self._slot_clfs)
+        self._offsets = np.zeros(n_slots, dtype=np.intp)
+        np.cumsum(
+            [ph_clf.n_categorizations() * n_gt for ph_clf in self._slot_clfs[:-1]],
+            out=self._offsets[1:],
+        )
+        self._counts = np.zeros(
+            int(self._offsets[-1]) + self._slot_clfs[-1].n_categorizations() * n_gt,
+            dtype=np.int64,
+        )
+        self._n_usable = np.zeros(n_slots, dtype=np.int64)
+
+        self._frames: typing.List[typing.Optional[pd.DataFrame]] = [None] * n_slots
+        self._stats: typing.Dict[int, typing.Optional[StatisticResult]] = {}
+        self._dirty = np.ones(n_slots, dtype=bool)
+
+        self._individuals: typing.Dict[str, Patient] = {}
+        self.add_patients(individuals)
+
+    @property
+    def individuals(self) -> typing.Collection[Patient]:
+        """
+        Get the individuals that are currently included in the analysis.
+        """
+        return self._individuals.values()
+
+    def add_patients(
+        self,
+        patients: typing.Iterable[Patient],
+    ):
+        """
+        Add the patients into the analysis.
+
+        :param patients: the patients to add.
+        :raises ValueError: if a patient with the same ID is already included.
+        """
+        patients = tuple(patients)
+        ids = set()
+        for patient in patients:
+            if patient.patient_id in self._individuals or patient.patient_id in ids:
+                raise ValueError(f"Patient {patient.patient_id} is already included")
+            ids.add(patient.patient_id)
+
+        self._update(patients, 1)
+        for patient in patients:
+            self._individuals[patient.patient_id] = patient
+
+    def remove_patients(
+        self,
+        patients: typing.Iterable[Patient],
+    ):
+        """
+        Remove the patients from the analysis.
+
+        The patients are matched by their ID, and the counts of the included patients are subtracted.
+
+        :param patients: the patients to remove.
+        :raises ValueError: if a patient is not included.
+        """
+        patient_ids = []
+        for patient in patients:
+            if patient.patient_id not in self._individuals or patient.patient_id in patient_ids:
+                raise ValueError(f"Patient {patient.patient_id} is not included")
+            patient_ids.append(patient.patient_id)
+
+        self._update([self._individuals[pid] for pid in patient_ids], -1)
+        for pid in patient_ids:
+            del self._individuals[pid]
+
+    def _update(
+        self,
+        patients: typing.Sequence[Patient],
+        sign: int,
+    ):
+        if len(patients) == 0:
+            return
+
+        pheno_codes = PhenotypeMatrix.classify(patients, self._pheno_clfs).codes
+        gt_codes = _classify_genotypes(patients, self._gt_clf, self._gt_categories)
+
+        clf_idx, patient_idx = np.nonzero((pheno_codes >= 0) & (gt_codes >= 0))
+        slots = self._clf_slots[clf_idx]
+        cells = (
+            self._offsets[slots]
+            + pheno_codes[clf_idx, patient_idx] * len(self._gt_categories)
+            + gt_codes[patient_idx]
+        )
+        np.add.at(self._counts, cells, sign)
+        np.add.at(self._n_usable, slots, sign)
+        self._dirty[slots] = True
+
+    def result(self) -> HpoTermAnalysisResult:
+        """
+        Get the analysis result for the current individuals.
+
+        The :attr:`~gpsea.analysis.AnalysisResult.trace` of the result includes the rebuilding
+        of the changed tables (`count`) and the stages of the analysis.
+        """
+        with _TraceRecorder(type(self).__name__, self._analysis._tracer) as recorder:
+            n_gt = len(self._gt_categories)
+            with recorder.stage("count") as stage:
+                dirty = np.flatnonzero(self._dirty)
+                for slot in dirty:
+                    ph_clf = self._slot_clfs[slot]
+                    start = self._offsets[slot]
+                    table = self._counts[start:start + ph_clf.n_categorizations() * n_gt]
+                    self._frames[slot] = pd.DataFrame(
+                        data=table.reshape((ph_clf.n_categorizations(), n_gt)).copy(),
+                        index=pd.Index(
+                            data=ph_clf.get_categories(),
+                            name=ph_clf.variable_name,
+                        ),
+                        columns=pd.Index(
+                            data=self._gt_categories,
+                            name=self._gt_clf.variable_name,
+                        ),
+                    )
+                    self._stats.pop(slot, None)
+                self._dirty[:] = False
+                stage.n_items = len(dirty)
+
+            result = self._analysis._analyze_counts(
+                gt_clf=self._gt_clf,
+                pheno_clfs=self._pheno_clfs,
+                n_usable=[int(self._n_usable[slot]) for slot in self._clf_slots],
+                all_counts=[self._frames[slot] for slot in self._clf_slots],
+                cohort_size=len(self._individuals),
+                recorder=recorder,
+                nominal_stats=lambda indices: [self._get_statistic_result(self._clf_slots[i]) for i in indices],
+            )
+            result._trace = recorder.finish()
+            return result
+
+    def _get_statistic_result(
+        self,
+        slot: int,
+    ) -> typing.Optional[StatisticResult]:
+        if slot not in self._stats:
+            if self._n_usable[slot] == 0:
+                self._stats[slot] = None
+            else:
+                self._stats[slot] = self._analysis._count_statistic.compute_pval(self._frames[slot])
+        return self._stats[slot]
+
+
 WHATEVER = typing.TypeVar("WHATEVER")
 
 
@@ -1,4 +1,5 @@
 import abc
+import itertools
 import math
 import typing
 
@@ -8,8 +9,6 @@ from decimal import Decimal
 import numpy as np
 import pandas as pd
 
-from scipy.stats import fisher_exact
-
 from ..._base import Statistic, StatisticResult
 
 
@@ -67,6 +66,29 @@ class CountStatistic(Statistic, metaclass=abc.ABCMeta):
     ) -> StatisticResult:
         pass
 
+    def min_attainable_pval(
+        self,
+        row_sums: typing.Sequence[int],
+        col_sums: typing.Sequence[int],
+    ) -> float:
+        """
+        Get the smallest p value the statistic can attain for a contingency table with given margins.
+
+        The default implementation computes the p value of each table with the margins.
+        Subclasses are encouraged to override the method with a faster computation.
+
+        :param row_sums: a sequence with the row totals of the table.
+        :param col_sums: a sequence with the column totals of the table.
+        :returns: a `float` with the minimum attainable p value.
+        """
+        min_pval = 1.0
+        for table in enumerate_tables(row_sums, col_sums):
+            pval = self.compute_pval(pd.DataFrame(table)).pval
+            if pval < min_pval:
+                min_pval = pval
+
+        return min_pval
+
     def __eq__(self, value: object) -> bool:
         return super().__eq__(value)
     
@@ -100,6 +122,8 @@ class FisherExactTest(CountStatistic):
         counts: pd.DataFrame,
     ) -> StatisticResult:
         if counts.shape == (2, 2):
+            from scipy.stats import fisher_exact
+
             result = fisher_exact(counts.values, alternative="two-sided")
             return StatisticResult(
                 statistic=result.statistic,
@@ -114,6 +138,31 @@ class FisherExactTest(CountStatistic):
         else:
             raise ValueError(f'Unsupported counts shape {counts.shape}')
 
+    def min_attainable_pval(
+        self,
+        row_sums: typing.Sequence[int],
+        col_sums: typing.Sequence[int],
+    ) -> float:
+        # The two-sided p value of a table is the sum of the probabilities of the tables
+        # that are at most as likely as the table itself.
+        # Therefore, the minimum is attained by the least likely table(s).
+        # The log probability is strictly concave in the table cells,
+        # hence the least likely tables are vertices of the polytope of the tables with the margins.
+        from scipy.special import gammaln
+
+        tables = enumerate_vertex_tables(row_sums, col_sums)
+        log_probs = (
+            gammaln(np.add(row_sums, 1)).sum()
+            + gammaln(np.add(col_sums, 1)).sum()
+            - gammaln(np.sum(row_sums) + 1)
+            - gammaln(tables + 1).sum(axis=(1, 2))
+        )
+        probs = np.exp(log_probs)
+        # Use a tolerance that is smaller than that of `compute_pval`
+        # to never report a larger p value than the one attainable in practice.
+        min_pval = probs[probs <= probs.min() * (1 + 1e-9)].sum()
+        return float(min(min_pval, 1.0))
+
     def _fisher_exact(
         self,
         table: np.ndarray,
@@ -229,3 +278,106 @@ class FisherExactTest(CountStatistic):
     
     def __hash__(self) -> int:
         return 17
+
+
+def enumerate_tables(
+    row_sums: typing.Sequence[int],
+    col_sums: typing.Sequence[int],
+) -> np.ndarray:
+    """
+    Enumerate all contingency tables with given row and column totals.
+
+    :returns: an array with shape `(n_tables, n_rows, n_cols)`.
+    """
+    row_sums = tuple(int(r) for r in row_sums)
+    col_sums = tuple(int(c) for c in col_sums)
+    if sum(row_sums) != sum(col_sums):
+        raise ValueError(f"Row sums {row_sums} and column sums {col_sums} must have the same total")
+
+    tables = []
+    _fill_rows([], row_sums, col_sums, tables)
+    return np.array(tables, dtype=np.int64).reshape((len(tables), len(row_sums), len(col_sums)))
+
+
+def enumerate_vertex_tables(
+    row_sums: typing.Sequence[int],
+    col_sums: typing.Sequence[int],
+) -> np.ndarray:
+    """
+    Enumerate the distinct vertices of the polytope of the contingency tables with given row and column totals.
+
+    The vertices are the north-west corner fills of the tables for all orderings of the rows and the columns,
+    e.g. at most 12 tables for a `2x3` table.
+
+    :returns: an array with shape `(n_tables, n_rows, n_cols)`.
+    """
+    row_sums = tuple(int(r) for r in row_sums)
+    col_sums = tuple(int(c) for c in col_sums)
+    if sum(row_sums) != sum(col_sums):
+        raise ValueError(f"Row sums {row_sums} and column sums {col_sums} must have the same total")
+
+    tables = {}
+    for row_order in itertools.permutations(range(len(row_sums))):
+        for col_order in itertools.permutations(range(len(col_sums))):
+            table = _fill_north_west_corner(row_sums, col_sums, row_order, col_order)
+            tables[table.tobytes()] = table
+
+    return np.array(list(tables.values()), dtype=np.int64).reshape((len(tables), len(row_sums), len(col_sums)))
+
+
+def _fill_north_west_corner(
+    row_sums: typing.Sequence[int],
+    col_sums: typing.Sequence[int],
+    row_order: typing.Sequence[int],
+    col_order: typing.Sequence[int],
+) -> np.ndarray:
+    # Fill the cells greedily, starting from the top left cell of the reordered table.
+    table = np.zeros((len(row_sums), len(col_sums)), dtype=np.int64)
+    rows_left = list(row_sums)
+    cols_left = list(col_sums)
+    i = j = 0
+    while i < len(row_order) and j < len(col_order):
+        r, c = row_order[i], col_order[j]
+        x = min(rows_left[r], cols_left[c])
+        table[r, c] = x
+        rows_left[r] -= x
+        cols_left[c] -= x
+        if rows_left[r] == 0:
+            i += 1
+        else:
+            j += 1
+
+    return table
+
+
+def _fill_rows(
+    rows: typing.List[typing.Sequence[int]],
+    row_sums: typing.Sequence[int],
+    col_sums: typing.Sequence[int],
+    tables: typing.List[typing.Sequence[typing.Sequence[int]]],
+):
+    if len(rows) == len(row_sums) - 1:
+        # The last row is given by the remaining column totals.
+        tables.append(rows + [col_sums])
+        return
+
+    for row in _compositions(row_sums[len(rows)], col_sums):
+        remaining = tuple(c - x for c, x in zip(col_sums, row))
+        _fill_rows(rows + [row], row_sums, remaining, tables)
+
+
+def _compositions(
+    total: int,
+    bounds: typing.Sequence[int],
+) -> typing.Iterator[typing.Sequence[int]]:
+    # Yield the ways to split `total` into `len(bounds)` non-negative parts,
+    # where the i-th part is at most `bounds[i]`.
+    if len(bounds) == 1:
+        if total <= bounds[0]:
+            yield (total,)
+        return
+
+    rest = sum(bounds[1:])
+    for x in range(max(0, total - rest), min(total, bounds[0]) + 1):
+        for tail in _compositions(total - x, bounds[1:]):
+            yield (x,) + tail
@@ -2,7 +2,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from ._stats import FisherExactTest
+from ._stats import FisherExactTest, enumerate_tables, enumerate_vertex_tables
 
 
 class TestPythonMultiFisherExact:
@@ -30,3 +30,65 @@ class TestPythonMultiFisherExact:
 
         final_pval = fisher_exact.compute_pval(contingency_matrix)
         assert final_pval.pval == pytest.approx(expected)
+
+
+class TestMinAttainablePval:
+
+    @pytest.fixture
+    def fisher_exact(self) -> FisherExactTest:
+        return FisherExactTest()
+
+    @pytest.mark.parametrize(
+        "row_sums, col_sums",
+        (
+            [(3, 3), (3, 3)],
+            [(10, 2), (5, 7)],
+            [(0, 6), (2, 4)],
+            [(3, 5), (2, 1, 5)],
+            [(4, 4), (3, 3, 2)],
+        ),
+    )
+    def test_fisher_matches_enumeration(
+        self,
+        row_sums,
+        col_sums,
+        fisher_exact: FisherExactTest,
+    ):
+        expected = min(
+            fisher_exact.compute_pval(pd.DataFrame(table)).pval
+            for table in enumerate_tables(row_sums, col_sums)
+        )
+
+        assert fisher_exact.min_attainable_pval(row_sums, col_sums) == pytest.approx(expected)
+
+    def test_enumerate_tables(self):
+        tables = enumerate_tables((2, 1), (1, 2))
+
+        assert tables.shape == (2, 2, 2)
+        assert np.all(tables.sum(axis=2) == (2, 1))
+        assert np.all(tables.sum(axis=1) == (1, 2))
+
+    @pytest.mark.parametrize(
+        "row_sums, col_sums",
+        (
+            [(3, 3), (3, 3)],
+            [(3, 5), (2, 1, 5)],
+            [(4, 4), (3, 3, 2)],
+        ),
+    )
+    def test_enumerate_vertex_tables(
+        self,
+        row_sums,
+        col_sums,
+    ):
+        tables = enumerate_vertex_tables(row_sums, col_sums)
+        all_tables = {table.tobytes() for table in enumerate_tables(row_sums, col_sums)}
+
+        assert 1 <= len(tables) <= 12
+        assert np.all(tables.sum(axis=2) == row_sums)
+        assert np.all(tables.sum(axis=1) == col_sums)
+        assert all(table.tobytes() in all_tables for table in tables)
+
+    def test_enumerate_tables_checks_totals(self):
+        with pytest.raises(ValueError):
+            enumerate_tables((2, 1), (1, 1))
@@ -663,8 +663,8 @@ class ProteinFeatureTypePredicate(VariantPredicate):
                 location = tx_ann.protein_effect_location
                 if location is not None:
                     return any(
-                        self._feature_type == feature.feature_type and location.overlaps_with(feature.info.region)
-                        for feature in self._protein_metadata.protein_features
+                        self._feature_type == feature.feature_type
+                        for feature in self._protein_metadata.feature_index.overlapping(location)
                     )
                 
         return False
@@ -726,8 +726,8 @@ class ProteinFeaturePredicate(VariantPredicate):
                 location = tx_ann.protein_effect_location
                 if location is not None:
                     return any(
-                        self._feature_id == feature.info.name and location.overlaps_with(feature.info.region)
-                        for feature in self._protein_metadata.protein_features
+                        self._feature_id == feature.info.name
+                        for feature in self._protein_metadata.feature_index.overlapping(location)
                     )
         
         return False
@@ -1,6 +1,21 @@
-from ._api import PhenotypeScorer, PhenotypeScoreAnalysis, PhenotypeScoreAnalysisResult
-from ._hpo import CountingPhenotypeScorer, DeVriesPhenotypeScorer
-from ._measurement import MeasurementPhenotypeScorer
+import typing
+
+from gpsea._lazy import attach
+
+if typing.TYPE_CHECKING:
+    from ._api import PhenotypeScorer, PhenotypeScoreAnalysis, PhenotypeScoreAnalysisResult
+    from ._hpo import CountingPhenotypeScorer, DeVriesPhenotypeScorer
+    from ._measurement import MeasurementPhenotypeScorer
+else:
+    __getattr__, __dir__ = attach(
+        __name__,
+        {
+            "._api": ("PhenotypeScorer", "PhenotypeScoreAnalysis", "PhenotypeScoreAnalysisResult"),
+            "._hpo": ("CountingPhenotypeScorer", "DeVriesPhenotypeScorer"),
+            "._measurement": ("MeasurementPhenotypeScorer",),
+        },
+        submodules=("stats",),
+    )
 
 __all__ = [
     "PhenotypeScorer", "PhenotypeScoreAnalysis", "PhenotypeScoreAnalysisResult",
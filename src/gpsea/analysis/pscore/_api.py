@@ -12,6 +12,7 @@ from .stats import PhenotypeScoreStatistic
 
 from .._base import MonoPhenotypeAnalysisResult, Statistic, StatisticResult
 from .._partition import ContinuousPartitioning
+from .._trace import AnalysisTracer, _TraceRecorder
 
 
 class PhenotypeScorer(ContinuousPartitioning, metaclass=abc.ABCMeta):
@@ -316,14 +317,21 @@ class PhenotypeScoreAnalysis:
 
     The association is tested with a :class:`~gpsea.analysis.pscore.stats.PhenotypeScoreStatistic`
     and the results are reported as a :class:`PhenotypeScoreAnalysisResult`.
+
+    :param score_statistic: the statistic for testing the association.
+    :param tracer: an optional tracer to notify about the analysis stages.
     """
 
     def __init__(
         self,
         score_statistic: PhenotypeScoreStatistic,
+        tracer: typing.Optional[AnalysisTracer] = None,
     ):
         assert isinstance(score_statistic, PhenotypeScoreStatistic)
         self._statistic = score_statistic
+        if tracer is not None:
+            assert isinstance(tracer, AnalysisTracer)
+        self._tracer = tracer
 
     def compare_genotype_vs_phenotype_score(
         self,
@@ -342,52 +350,58 @@ class PhenotypeScoreAnalysis:
             gt_clf.n_categorizations() == 2
         ), "We only support 2 genotype categories at this point"
         assert isinstance(pheno_scorer, PhenotypeScorer)
+        with _TraceRecorder(type(self).__name__, self._tracer) as recorder:
+            idx = pd.Index((patient.patient_id for patient in cohort), name="patient_id")
+            data = pd.DataFrame(
+                None,
+                index=idx,
+                columns=MonoPhenotypeAnalysisResult.DATA_COLUMNS,
+            )
 
-        idx = pd.Index((patient.patient_id for patient in cohort), name="patient_id")
-        data = pd.DataFrame(
-            None,
-            index=idx,
-            columns=MonoPhenotypeAnalysisResult.DATA_COLUMNS,
-        )
-
-        # Apply the classifier and scorer on the individuals
-        for individual in cohort:
-            gt_cat = gt_clf.test(individual)
-            if gt_cat is None:
-                data.loc[
-                    individual.patient_id,
-                    MonoPhenotypeAnalysisResult.GT_COL
-                ] = None
-            else:
-                data.loc[
-                    individual.patient_id, 
-                    MonoPhenotypeAnalysisResult.GT_COL
-                ] = gt_cat.category.cat_id
-
-            data.loc[
-                individual.patient_id,
-                MonoPhenotypeAnalysisResult.PH_COL
-            ] = pheno_scorer.score(individual)
-
-        # Sort by PatientCategory.cat_id and unpack.
-        # For now, we only allow to have up to 2 groups.
-        x_key, y_key = sorted(
-            data[MonoPhenotypeAnalysisResult.GT_COL].dropna().unique()
-        )
-        x = data.loc[
-            data[MonoPhenotypeAnalysisResult.GT_COL] == x_key,
-            MonoPhenotypeAnalysisResult.PH_COL,
-        ].to_numpy(dtype=float)  # type: ignore
-        y = data.loc[
-            data[MonoPhenotypeAnalysisResult.GT_COL] == y_key,
-            MonoPhenotypeAnalysisResult.PH_COL,
-        ].to_numpy(dtype=float)  # type: ignore
-        result = self._statistic.compute_pval(scores=(x, y))
-
-        return PhenotypeScoreAnalysisResult(
-            gt_clf=gt_clf,
-            phenotype=pheno_scorer,
-            statistic=self._statistic,
-            data=data,
-            statistic_result=result,
-        )
+            # Apply the classifier and scorer on the individuals
+            with recorder.stage("classify") as stage:
+                for individual in cohort:
+                    gt_cat = gt_clf.test(individual)
+                    if gt_cat is None:
+                        data.loc[
+                            individual.patient_id,
+                            MonoPhenotypeAnalysisResult.GT_COL
+                        ] = None
+                    else:
+                        data.loc[
+                            individual.patient_id,
+                            MonoPhenotypeAnalysisResult.GT_COL
+                        ] = gt_cat.category.cat_id
+
+                    data.loc[
+                        individual.patient_id,
+                        MonoPhenotypeAnalysisResult.PH_COL
+                    ] = pheno_scorer.score(individual)
+                stage.n_items = len(data)
+
+            # Sort by PatientCategory.cat_id and unpack.
+            # For now, we only allow to have up to 2 groups.
+            x_key, y_key = sorted(
+                data[MonoPhenotypeAnalysisResult.GT_COL].dropna().unique()
+            )
+            x = data.loc[
+                data[MonoPhenotypeAnalysisResult.GT_COL] == x_key,
+                MonoPhenotypeAnalysisResult.PH_COL,
+            ].to_numpy(dtype=float)  # type: ignore
+            y = data.loc[
+                data[MonoPhenotypeAnalysisResult.GT_COL] == y_key,
+                MonoPhenotypeAnalysisResult.PH_COL,
+            ].to_numpy(dtype=float)  # type: ignore
+            with recorder.stage("statistic") as stage:
+                result = self._statistic.compute_pval(scores=(x, y))
+                stage.n_items = len(x) + len(y)
+
+            analysis_result = PhenotypeScoreAnalysisResult(
+                gt_clf=gt_clf,
+                phenotype=pheno_scorer,
+                statistic=self._statistic,
+                data=data,
+                statistic_result=result,
+            )
+            analysis_result._trace = recorder.finish()
+            return analysis_result
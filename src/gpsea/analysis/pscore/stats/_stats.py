@@ -2,8 +2,6 @@ import abc
 import math
 import typing
 
-from scipy.stats import mannwhitneyu, ttest_ind
-
 from ..._base import Statistic, StatisticResult
 
 
@@ -53,6 +51,8 @@ class MannWhitneyStatistic(PhenotypeScoreStatistic):
         x, y = scores
         x = MannWhitneyStatistic._remove_nans(x)
         y = MannWhitneyStatistic._remove_nans(y)
+        from scipy.stats import mannwhitneyu
+
         statistic, pval = mannwhitneyu(
             x=x,
             y=y,
@@ -104,6 +104,8 @@ class TTestStatistic(PhenotypeScoreStatistic):
         assert len(scores) == 2, 'T test only supports 2 categories at this time'
 
         x, y = scores
+        from scipy.stats import ttest_ind
+
         res = ttest_ind(
             a=x, b=y,
             alternative='two-sided',
@@ -5,12 +5,35 @@ between genotype groups.
 See :ref:`survival` for an example.
 """
 
-from ._base import Survival
-from ._api import SurvivalAnalysis, SurvivalAnalysisResult, Endpoint
+import typing
+
+from gpsea._lazy import attach
+
+if typing.TYPE_CHECKING:
+    from ._base import Survival, SurvivalArray
+    from ._api import SurvivalAnalysis, SurvivalAnalysisResult, Endpoint
+    from ._bootstrap import KaplanMeierBand, KaplanMeierBootstrap
+    from ._multi import MultiEndpointSurvivalAnalysis, MultiEndpointSurvivalAnalysisResult
+else:
+    __getattr__, __dir__ = attach(
+        __name__,
+        {
+            "._base": ("Survival", "SurvivalArray"),
+            "._api": ("SurvivalAnalysis", "SurvivalAnalysisResult", "Endpoint"),
+            "._bootstrap": ("KaplanMeierBand", "KaplanMeierBootstrap"),
+            "._multi": ("MultiEndpointSurvivalAnalysis", "MultiEndpointSurvivalAnalysisResult"),
+        },
+        submodules=("endpoint", "stats"),
+    )
 
 __all__ = [
     "Endpoint",
     "SurvivalAnalysis",
     "SurvivalAnalysisResult",
+    "MultiEndpointSurvivalAnalysis",
+    "MultiEndpointSurvivalAnalysisResult",
     "Survival",
+    "SurvivalArray",
+    "KaplanMeierBand",
+    "KaplanMeierBootstrap",
 ]
@@ -2,21 +2,20 @@ import abc
 import math
 import typing
 
-from collections import defaultdict
-
+import numpy as np
 import pandas as pd
-import scipy.stats
 
 from gpsea.config import PALETTE_DATA
 from gpsea.model import Patient
 
-from ._base import Survival
-from ._util import prepare_censored_data
+from ._base import Survival, SurvivalArray
+from ._bootstrap import KaplanMeierBand, KaplanMeierBootstrap
 from .stats import SurvivalStatistic
 
 from ..clf import GenotypeClassifier
 from .._base import MonoPhenotypeAnalysisResult, StatisticResult, AnalysisException
 from .._partition import ContinuousPartitioning
+from .._trace import AnalysisTracer, _TraceRecorder
 
 
 class Endpoint(ContinuousPartitioning, metaclass=abc.ABCMeta):
@@ -39,6 +38,18 @@ class Endpoint(ContinuousPartitioning, metaclass=abc.ABCMeta):
         """
         pass
 
+    def compute_survivals(
+        self,
+        patients: typing.Iterable[Patient],
+    ) -> SurvivalArray:
+        """
+        Compute survivals for all `patients` at once.
+
+        The survivals are aligned with the order of the `patients`
+        and a missing survival is represented by a `NaN` time.
+        """
+        return SurvivalArray.from_survivals(self.compute_survival(patient) for patient in patients)
+
 
 class SurvivalAnalysisResult(MonoPhenotypeAnalysisResult):
     """
@@ -63,6 +74,9 @@ class SurvivalAnalysisResult(MonoPhenotypeAnalysisResult):
     A `genotype` value may be missing (`None`) if the individual cannot be assigned
     into a genotype category.
     Similarly, a `survival` is `None` if computing the survival for an individual is impossible.
+
+    The survivals are also available as a :class:`~gpsea.analysis.temporal.SurvivalArray`
+    aligned with the `data` index. If `survivals` are not provided, the array is created from the `data`.
     """
 
     def __init__(
@@ -72,6 +86,7 @@ class SurvivalAnalysisResult(MonoPhenotypeAnalysisResult):
         statistic: SurvivalStatistic,
         data: pd.DataFrame,
         statistic_result: StatisticResult,
+        survivals: typing.Optional[SurvivalArray] = None,
     ):
         super().__init__(
             gt_clf=gt_clf,
@@ -81,6 +96,11 @@ class SurvivalAnalysisResult(MonoPhenotypeAnalysisResult):
             statistic_result=statistic_result,
         )
         assert isinstance(endpoint, Endpoint)
+        if survivals is None:
+            survivals = SurvivalArray.from_survivals(data[MonoPhenotypeAnalysisResult.PH_COL])
+        else:
+            assert isinstance(survivals, SurvivalArray) and len(survivals) == len(data)
+        self._survivals = survivals
 
     @property
     def endpoint(self) -> Endpoint:
@@ -92,10 +112,36 @@ class SurvivalAnalysisResult(MonoPhenotypeAnalysisResult):
         # being a subclass of `Partitioning`.
         return self._phenotype  # type: ignore
 
+    @property
+    def survivals(self) -> SurvivalArray:
+        """
+        Get the survivals of the individuals, aligned with the index of the :attr:`data`.
+        """
+        return self._survivals
+
+    def compute_kaplan_meier_bands(
+        self,
+        bootstrap: KaplanMeierBootstrap,
+    ) -> typing.Mapping[int, KaplanMeierBand]:
+        """
+        Compute confidence bands of the Kaplan-Meier curves of the genotype groups.
+
+        :param bootstrap: the bootstrap to compute the bands.
+        :returns: a mapping from the genotype group id (:attr:`~gpsea.analysis.clf.PatientCategory.cat_id`)
+          to the band. The groups with no survival are omitted.
+        """
+        bands = {}
+        for pat_cat in self._gt_clf.get_categories():
+            survivals = self._group_survivals(pat_cat.cat_id)
+            if len(survivals) > 0:
+                bands[pat_cat.cat_id] = bootstrap.compute_band(survivals)
+        return bands
+
     def plot_kaplan_meier_curves(
         self,
         ax,
         colors: typing.Sequence[str] = PALETTE_DATA,
+        bands: typing.Optional[typing.Mapping[int, KaplanMeierBand]] = None,
         **plot_kwargs,
     ):
         """
@@ -105,6 +151,9 @@ class SurvivalAnalysisResult(MonoPhenotypeAnalysisResult):
         for a genotype group, the group name will be missing from the legend.
 
         :param ax: a Matplotlib `Axes` to draw on.
+        :param colors: the colors of the genotype groups.
+        :param bands: an optional mapping from the genotype group id to the confidence band
+            to draw under the group's curve, e.g. from :meth:`compute_kaplan_meier_bands`.
         :param plot_kwargs: keyword arguments passed directly to :func:`matplotlib.axes.Axes.step`.
             Unless overridden, ``where='post'``.
         """
@@ -113,15 +162,14 @@ class SurvivalAnalysisResult(MonoPhenotypeAnalysisResult):
         )
 
         for pat_cat, color_idx in zip(self._gt_clf.get_categories(), col_idxs):
-            survivals = self._data.loc[
-                self._data[MonoPhenotypeAnalysisResult.GT_COL] == pat_cat.cat_id,
-                MonoPhenotypeAnalysisResult.PH_COL,
-            ]
-            non_na = survivals[survivals.notna()]
-            if len(non_na) > 0:
-                censored_data = prepare_censored_data(survivals=non_na)
-                data = scipy.stats.ecdf(censored_data)
+            survivals = self._group_survivals(pat_cat.cat_id)
+            if len(survivals) > 0:
+                import scipy.stats
+
+                data = scipy.stats.ecdf(survivals.to_censored_data())
                 color = colors[color_idx]
+                if bands is not None and pat_cat.cat_id in bands:
+                    bands[pat_cat.cat_id].plot(ax, color=color)
                 data.sf.plot(
                     ax,
                     label=pat_cat.name,
@@ -131,6 +179,13 @@ class SurvivalAnalysisResult(MonoPhenotypeAnalysisResult):
 
         ax.legend()
 
+    def _group_survivals(
+        self,
+        cat_id: int,
+    ) -> SurvivalArray:
+        genotypes = self._data[MonoPhenotypeAnalysisResult.GT_COL].to_numpy()
+        return self._survivals.take(genotypes == cat_id).available()
+
     def __eq__(self, value: object) -> bool:
         return isinstance(value, SurvivalAnalysisResult) and super(
             MonoPhenotypeAnalysisResult, self
@@ -164,14 +219,21 @@ class SurvivalAnalysis:
 
     The analysis may raise an :class:`~gpsea.analysis.AnalysisException` if issues are encountered.
     The exception includes the reason(s) in `args` as well as any partial data, to help with troubleshooting.
+
+    :param statistic: the statistic for comparing the survivals.
+    :param tracer: an optional tracer to notify about the analysis stages.
     """
 
     def __init__(
         self,
         statistic: SurvivalStatistic,
+        tracer: typing.Optional[AnalysisTracer] = None,
     ):
         assert isinstance(statistic, SurvivalStatistic)
         self._statistic = statistic
+        if tracer is not None:
+            assert isinstance(tracer, AnalysisTracer)
+        self._tracer = tracer
 
     def compare_genotype_vs_survival(
         self,
@@ -182,51 +244,62 @@ class SurvivalAnalysis:
         """
         Execute the survival analysis on a given `cohort`.
         """
+        with _TraceRecorder(type(self).__name__, self._tracer) as recorder:
+            patients = tuple(cohort)
+            gt_cats = gt_clf.get_categorizations()
+            cat_to_idx = {gt_cat: i for i, gt_cat in enumerate(gt_cats)}
+            # Apply the predicate and the survival metric on the cohort
+            with recorder.stage("classify") as stage:
+                genotypes = []
+                gt_idxs = np.full(len(patients), -1, dtype=np.intp)
+                for i, patient in enumerate(patients):
+                    gt_cat = gt_clf.test(patient)
+                    if gt_cat is None:
+                        genotypes.append(None)
+                    else:
+                        genotypes.append(gt_cat.category.cat_id)
+                        gt_idxs[i] = cat_to_idx[gt_cat]
+
+                survivals = endpoint.compute_survivals(patients)
+                stage.n_items = len(patients)
+
+            idx = pd.Index(
+                (patient.patient_id for patient in patients),
+                name=MonoPhenotypeAnalysisResult.SAMPLE_ID,
+            )
+            data = pd.DataFrame(
+                {
+                    MonoPhenotypeAnalysisResult.GT_COL: pd.Series(genotypes, index=idx, dtype=object),
+                    MonoPhenotypeAnalysisResult.PH_COL: pd.Series(survivals.to_survivals(), index=idx, dtype=object),
+                },
+                index=idx,
+                columns=MonoPhenotypeAnalysisResult.DATA_COLUMNS,
+            )
 
-        idx = pd.Index(
-            (patient.patient_id for patient in cohort),
-            name=MonoPhenotypeAnalysisResult.SAMPLE_ID,
-        )
-        data = pd.DataFrame(
-            None,
-            index=idx,
-            columns=MonoPhenotypeAnalysisResult.DATA_COLUMNS,
-        )
-        survivals = defaultdict(list)
-        # Apply the predicate and the survival metric on the cohort
-        for patient in cohort:
-            gt_cat = gt_clf.test(patient)
-            if gt_cat is None:
-                data.loc[patient.patient_id, MonoPhenotypeAnalysisResult.GT_COL] = None
-            else:
-                data.loc[patient.patient_id, MonoPhenotypeAnalysisResult.GT_COL] = (
-                    gt_cat.category.cat_id
+            is_available = survivals.is_available
+            vals = tuple(survivals.take(is_available & (gt_idxs == i)) for i in range(len(gt_cats)))
+            with recorder.stage("statistic") as stage:
+                result = self._statistic.compute_pval(vals)
+                stage.n_items = sum(len(v) for v in vals)
+            if math.isnan(result.pval):
+                partial = {
+                    MonoPhenotypeAnalysisResult.SAMPLE_ID: tuple(data.index),
+                    "genotype": tuple(data[MonoPhenotypeAnalysisResult.GT_COL]),
+                    "survival": tuple(data[MonoPhenotypeAnalysisResult.PH_COL]),
+                }
+
+                raise AnalysisException(
+                    partial,
+                    "The survival values did not meet the expectation of the statistical test!",
                 )
 
-            survival = endpoint.compute_survival(patient)
-            data.loc[patient.patient_id, MonoPhenotypeAnalysisResult.PH_COL] = survival  # type: ignore
-
-            if gt_cat is not None and survival is not None:
-                survivals[gt_cat].append(survival)
-
-        vals = tuple(survivals[gt_cat] for gt_cat in gt_clf.get_categorizations())
-        result = self._statistic.compute_pval(vals)
-        if math.isnan(result.pval):
-            partial = {
-                MonoPhenotypeAnalysisResult.SAMPLE_ID: tuple(data.index),
-                "genotype": tuple(data[MonoPhenotypeAnalysisResult.GT_COL]),
-                "survival": tuple(data[MonoPhenotypeAnalysisResult.PH_COL]),
-            }
-
-            raise AnalysisException(
-                partial,
-                "The survival values did not meet the expectation of the statistical test!",
+            analysis_result = SurvivalAnalysisResult(
+                gt_clf=gt_clf,
+                endpoint=endpoint,
+                statistic=self._statistic,
+                data=data,
+                statistic_result=result,
+                survivals=survivals,
             )
-
-        return SurvivalAnalysisResult(
-            gt_clf=gt_clf,
-            endpoint=endpoint,
-            statistic=self._statistic,
-            data=data,
-            statistic_result=result,
-        )
+            analysis_result._trace = recorder.finish()
+            return analysis_result
@@ -1,7 +1,13 @@
 import math
+import typing
 
 from dataclasses import dataclass
 
+import numpy as np
+
+if typing.TYPE_CHECKING:
+    from scipy.stats import CensoredData
+
 
 @dataclass(frozen=True)
 class Survival:
@@ -25,3 +31,135 @@ class Survival:
         assert math.isfinite(
             self.value
         ), f"`value` must be finite and non-NaN, but was {self.value}"
+
+
+class SurvivalArray:
+    """
+    `SurvivalArray` stores survivals of a group of individuals in two aligned arrays,
+    the survival times and the censoring mask.
+
+    The array is aligned with the order of the individuals and a missing survival
+    (e.g. if the survival cannot be computed for an individual) is represented by a `NaN` time.
+    The arrays are read-only, hence the `SurvivalArray` can be subset
+    (e.g. for permutation or bootstrap) without copying the survivals into Python objects.
+
+    :param times: a 1D array-like with the survival times as `float` values (`NaN` if missing).
+    :param is_censored: a 1D array-like with `True` if the survival has been censored and `False` otherwise.
+    """
+
+    @staticmethod
+    def from_survivals(
+        survivals: typing.Iterable[typing.Optional[Survival]],
+    ) -> "SurvivalArray":
+        """
+        Create `SurvivalArray` from an iterable of :class:`Survival` objects or `None` for the missing survivals.
+        """
+        times = []
+        is_censored = []
+        for survival in survivals:
+            if survival is None:
+                times.append(math.nan)
+                is_censored.append(False)
+            else:
+                times.append(survival.value)
+                is_censored.append(survival.is_censored)
+
+        return SurvivalArray(times=times, is_censored=is_censored)
+
+    def __init__(
+        self,
+        times: typing.Union[np.ndarray, typing.Sequence[float]],
+        is_censored: typing.Union[np.ndarray, typing.Sequence[bool]],
+    ):
+        times = np.array(times, dtype=np.float64)
+        is_censored = np.array(is_censored, dtype=bool)
+        if times.ndim != 1 or times.shape != is_censored.shape:
+            raise ValueError(
+                f"`times` and `is_censored` must be 1D arrays of the same length but the shapes were {times.shape} and {is_censored.shape}"
+            )
+        assert not np.isinf(times).any(), "`times` must be finite or NaN"
+
+        times.flags.writeable = False
+        is_censored.flags.writeable = False
+        self._times = times
+        self._is_censored = is_censored
+
+    @property
+    def times(self) -> np.ndarray:
+        """
+        Get a read-only `float64` array with the survival times or `NaN` for the missing survivals.
+        """
+        return self._times
+
+    @property
+    def is_censored(self) -> np.ndarray:
+        """
+        Get a read-only `bool` array with `True` if the survival has been censored.
+        The value is `False` for the missing survivals.
+        """
+        return self._is_censored
+
+    @property
+    def is_available(self) -> np.ndarray:
+        """
+        Get a `bool` array with `True` if the survival is available and `False` if it is missing.
+        """
+        return ~np.isnan(self._times)
+
+    def take(
+        self,
+        indices: np.ndarray,
+    ) -> "SurvivalArray":
+        """
+        Get a `SurvivalArray` with the survivals at given `indices`.
+
+        :param indices: an array with the integer indices or a `bool` mask of the selected survivals.
+          The same index can be chosen multiple times, e.g. to draw a bootstrap sample.
+        """
+        return SurvivalArray(times=self._times[indices], is_censored=self._is_censored[indices])
+
+    def available(self) -> "SurvivalArray":
+        """
+        Get a `SurvivalArray` with the available survivals only.
+        """
+        return self.take(self.is_available)
+
+    def to_survivals(self) -> typing.Sequence[typing.Optional[Survival]]:
+        """
+        Get the survivals as :class:`Survival` objects or `None` for the missing survivals.
+        """
+        return tuple(
+            None if math.isnan(time) else Survival(value=time, is_censored=censored)
+            for time, censored in zip(self._times.tolist(), self._is_censored.tolist())
+        )
+
+    def to_censored_data(self) -> "CensoredData":
+        """
+        Get the available survivals as :class:`scipy.stats.CensoredData`.
+        """
+        from scipy.stats import CensoredData
+
+        available = self.is_available
+        return CensoredData(
+            uncensored=self._times[available & ~self._is_censored],
+            right=self._times[available & self._is_censored],
+        )
+
+    def __len__(self) -> int:
+        return len(self._times)
+
+    def __eq__(self, value: object) -> bool:
+        return (
+            isinstance(value, SurvivalArray)
+            and np.array_equal(self._times, value._times, equal_nan=True)
+            and np.array_equal(self._is_censored, value._is_censored)
+        )
+
+    def __hash__(self) -> int:
+        return hash((self._times.tobytes(), self._is_censored.tobytes()))
+
+    def __str__(self) -> str:
+        return f"SurvivalArray(times={self._times}, is_censored={self._is_censored})"
+
+    def __repr__(self) -> str:
+        return str(self)
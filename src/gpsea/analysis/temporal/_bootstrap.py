@@ -0,0 +1,248 @@
+import concurrent.futures
+import math
+import typing
+
+import numpy as np
+
+from ._base import SurvivalArray
+
+
+class KaplanMeierBand:
+    """
+    `KaplanMeierBand` is a pointwise confidence band of a Kaplan-Meier survival function,
+    evaluated on a grid of time points.
+
+    The band is usually computed by :class:`~gpsea.analysis.temporal.KaplanMeierBootstrap`.
+
+    :param times: a sorted 1D array with the time points.
+    :param estimate: the Kaplan-Meier estimate of the survival function at the `times`.
+    :param lower: the lower bound of the band at the `times`.
+    :param upper: the upper bound of the band at the `times`.
+    :param confidence_level: a `float` in range :math:`(0, 1)` with the confidence level of the band.
+    """
+
+    def __init__(
+        self,
+        times: np.ndarray,
+        estimate: np.ndarray,
+        lower: np.ndarray,
+        upper: np.ndarray,
+        confidence_level: float,
+    ):
+        self._times = np.asarray(times, dtype=np.float64)
+        self._estimate = np.asarray(estimate, dtype=np.float64)
+        self._lower = np.asarray(lower, dtype=np.float64)
+        self._upper = np.asarray(upper, dtype=np.float64)
+        if not (self._times.shape == self._estimate.shape == self._lower.shape == self._upper.shape):
+            raise ValueError("`times`, `estimate`, `lower`, and `upper` must have the same shape")
+        assert 0.0 < confidence_level < 1.0
+        self._confidence_level = confidence_level
+
+    @property
+    def times(self) -> np.ndarray:
+        """
+        Get the time points of the band.
+        """
+        return self._times
+
+    @property
+    def estimate(self) -> np.ndarray:
+        """
+        Get the Kaplan-Meier estimate of the survival function at the time points.
+        """
+        return self._estimate
+
+    @property
+    def lower(self) -> np.ndarray:
+        """
+        Get the lower bound of the band at the time points.
+        """
+        return self._lower
+
+    @property
+    def upper(self) -> np.ndarray:
+        """
+        Get the upper bound of the band at the time points.
+        """
+        return self._upper
+
+    @property
+    def confidence_level(self) -> float:
+        """
+        Get the confidence level of the band.
+        """
+        return self._confidence_level
+
+    def plot(
+        self,
+        ax,
+        **fill_kwargs,
+    ):
+        """
+        Draw the band as a shaded step area on the provided axes.
+
+        :param ax: a Matplotlib `Axes` to draw on.
+        :param fill_kwargs: keyword arguments passed directly to :func:`matplotlib.axes.Axes.fill_between`.
+            Unless overridden, ``step='post'``, ``alpha=0.2``, and ``linewidth=0``.
+        """
+        fill_kwargs.setdefault("step", "post")
+        fill_kwargs.setdefault("alpha", 0.2)
+        fill_kwargs.setdefault("linewidth", 0)
+        ax.fill_between(self._times, self._lower, self._upper, **fill_kwargs)
+
+    def __str__(self) -> str:
+        return (
+            "KaplanMeierBand("
+            f"n_times={len(self._times)}, "
+            f"confidence_level={self._confidence_level})"
+        )
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class KaplanMeierBootstrap:
+    """
+    `KaplanMeierBootstrap` computes pointwise confidence bands of Kaplan-Meier survival functions
+    with the percentile bootstrap.
+
+    The survivals are resampled in blocks of `block_size` resamples at once,
+    and the survival functions of all resamples of a block are evaluated on a shared time grid
+    without running the Kaplan-Meier estimator for each resample.
+    The blocks can be spread across `n_workers` processes.
+    The band does not depend on `n_workers` if `seed` is set.
+
+    :param n_resamples: a positive `int` with the number of bootstrap resamples.
+    :param confidence_level: a `float` in range :math:`(0, 1)` with the confidence level of the bands.
+    :param block_size: a positive `int` with the number of resamples processed at once.
+    :param n_workers: a positive `int` with the number of worker processes.
+      The blocks are processed in the current process if `n_workers` is `1`.
+    :param seed: an optional `int` to seed the random number generator.
+    """
+
+    def __init__(
+        self,
+        n_resamples: int = 1000,
+        confidence_level: float = 0.95,
+        block_size: int = 100,
+        n_workers: int = 1,
+        seed: typing.Optional[int] = None,
+    ):
+        if n_resamples < 1:
+            raise ValueError(f"`n_resamples` must be a positive `int` but was {n_resamples}")
+        self._n_resamples = n_resamples
+        if not 0.0 < confidence_level < 1.0:
+            raise ValueError(f"`confidence_level` must be in range (0, 1) but was {confidence_level}")
+        self._confidence_level = confidence_level
+        if block_size < 1:
+            raise ValueError(f"`block_size` must be a positive `int` but was {block_size}")
+        self._block_size = block_size
+        if n_workers < 1:
+            raise ValueError(f"`n_workers` must be a positive `int` but was {n_workers}")
+        self._n_workers = n_workers
+        self._seed = seed
+
+    def compute_band(
+        self,
+        survivals: SurvivalArray,
+        times: typing.Optional[np.ndarray] = None,
+    ) -> KaplanMeierBand:
+        """
+        Compute the confidence band of the Kaplan-Meier survival function of the `survivals`.
+
+        :param survivals: the survivals of a group of individuals. The missing survivals are ignored.
+        :param times: the time points to evaluate the survival function at
+          or `None` to use the distinct times of the `survivals`.
+        """
+        survivals = survivals.available()
+        if len(survivals) == 0:
+            raise ValueError("Cannot compute the Kaplan-Meier band without survivals")
+
+        # The resamples include only the distinct times of the survivals,
+        # hence we can count the survivals and events of each resample per distinct time.
+        unique_times, unique_idx = np.unique(survivals.times, return_inverse=True)
+        is_event = ~survivals.is_censored
+        if times is None:
+            times = unique_times
+        else:
+            times = np.sort(np.asarray(times, dtype=np.float64))
+        # The survival function is right-continuous, with value 1 before the first distinct time.
+        grid_idx = np.searchsorted(unique_times, times, side="right") - 1
+
+        estimate = _evaluate_kaplan_meier(
+            unique_idx[np.newaxis, :], is_event[np.newaxis, :], len(unique_times), grid_idx,
+        )[0]
+
+        # Each block has its own seed, hence the resamples do not depend on the number of workers.
+        seeds = np.random.SeedSequence(self._seed).spawn(math.ceil(self._n_resamples / self._block_size))
+        block_sizes = [self._block_size] * (len(seeds) - 1)
+        block_sizes.append(self._n_resamples - sum(block_sizes))
+        args = [
+            (unique_idx, is_event, len(unique_times), grid_idx, block_size, seed)
+            for block_size, seed in zip(block_sizes, seeds)
+        ]
+        if self._n_workers == 1 or len(args) == 1:
+            blocks = [_bootstrap_block(*arg) for arg in args]
+        else:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=min(self._n_workers, len(args)),
+            ) as executor:
+                futures = [executor.submit(_bootstrap_block, *arg) for arg in args]
+                blocks = [future.result() for future in futures]
+
+        resampled = np.concatenate(blocks, axis=0)
+        alpha = 1.0 - self._confidence_level
+        lower, upper = np.quantile(resampled, [alpha / 2, 1.0 - alpha / 2], axis=0)
+
+        return KaplanMeierBand(
+            times=times,
+            estimate=estimate,
+            lower=lower,
+            upper=upper,
+            confidence_level=self._confidence_level,
+        )
+
+
+def _bootstrap_block(
+    unique_idx: np.ndarray,
+    is_event: np.ndarray,
+    n_unique: int,
+    grid_idx: np.ndarray,
+    n_resamples: int,
+    seed: np.random.SeedSequence,
+) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    draws = rng.integers(0, len(unique_idx), size=(n_resamples, len(unique_idx)))
+    return _evaluate_kaplan_meier(unique_idx[draws], is_event[draws], n_unique, grid_idx)
+
+
+def _evaluate_kaplan_meier(
+    sample_idx: np.ndarray,
+    sample_is_event: np.ndarray,
+    n_unique: int,
+    grid_idx: np.ndarray,
+) -> np.ndarray:
+    """
+    Evaluate the Kaplan-Meier survival functions of many samples at once.
+
+    :param sample_idx: an `(n_samples, n)` array with the index of the distinct time of each survival.
+    :param sample_is_event: an `(n_samples, n)` bool array with `True` if the survival is not censored.
+    :param n_unique: the number of the distinct times.
+    :param grid_idx: the index of the last distinct time at or before each grid point or `-1` if none.
+    :returns: an `(n_samples, len(grid_idx))` array with the survival function values at the grid points.
+    """
+    n_samples = sample_idx.shape[0]
+    # Count the survivals and the events of each sample at each distinct time.
+    flat = (sample_idx + (np.arange(n_samples) * n_unique)[:, np.newaxis]).ravel()
+    counts = np.bincount(flat, minlength=n_samples * n_unique).reshape(n_samples, n_unique)
+    events = np.bincount(
+        flat, weights=sample_is_event.ravel().astype(np.float64), minlength=n_samples * n_unique,
+    ).reshape(n_samples, n_unique)
+
+    # The survivals at risk at a time are the survivals that last at least that long.
+    at_risk = np.cumsum(counts[:, ::-1], axis=1)[:, ::-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        hazard = np.where(at_risk > 0, events / at_risk, 0.0)
+    sf = np.cumprod(1.0 - hazard, axis=1)
+
+    return np.where(grid_idx >= 0, sf[:, np.maximum(grid_idx, 0)], 1.0)
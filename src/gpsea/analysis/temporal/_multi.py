@@ -0,0 +1,377 @@
+import itertools
+import math
+import typing
+
+import hpotk
+import numpy as np
+
+from gpsea.model import Patient
+
+from ._api import Endpoint
+from .endpoint import hpo_onset
+from .endpoint._impl import _decode_timeline, _validate_term_id
+from .stats import LogRankTest
+from .stats._impl import logrank_per_group
+
+from ..clf import GenotypeClassifier
+from .._base import AnalysisResult, StatisticResult
+from .._trace import AnalysisTracer, _TraceRecorder
+
+
+class MultiEndpointSurvivalAnalysisResult(AnalysisResult):
+    """
+    `MultiEndpointSurvivalAnalysisResult` includes the results of a
+    :class:`~gpsea.analysis.temporal.MultiEndpointSurvivalAnalysis`.
+
+    The results are reported for each tested endpoint, in the order of the :attr:`endpoints`.
+    """
+
+    def __init__(
+        self,
+        gt_clf: GenotypeClassifier,
+        endpoints: typing.Iterable[Endpoint],
+        statistic: LogRankTest,
+        n_usable: typing.Sequence[int],
+        statistic_results: typing.Sequence[typing.Optional[StatisticResult]],
+        corrected_pvals: typing.Optional[typing.Sequence[float]],
+        mtc_correction: typing.Optional[str],
+    ):
+        super().__init__(
+            gt_clf=gt_clf,
+            statistic=statistic,
+        )
+        self._endpoints = tuple(endpoints)
+        assert all(isinstance(endpoint, Endpoint) for endpoint in self._endpoints)
+        self._n_usable = tuple(int(n) for n in n_usable)
+        self._statistic_results = tuple(statistic_results)
+        self._corrected_pvals = None if corrected_pvals is None else tuple(float(p) for p in corrected_pvals)
+        for seq, name in (
+            (self._n_usable, "n_usable"),
+            (self._statistic_results, "statistic_results"),
+            (self._corrected_pvals, "corrected_pvals"),
+        ):
+            if seq is not None and len(seq) != len(self._endpoints):
+                raise ValueError(
+                    f"`len(endpoints)` must be the same as `len({name})` but {len(self._endpoints)}!={len(seq)}"
+                )
+        if mtc_correction is not None:
+            assert isinstance(mtc_correction, str)
+        self._mtc_correction = mtc_correction
+
+    @property
+    def endpoints(self) -> typing.Sequence[Endpoint]:
+        """
+        Get the endpoints used to compute the survivals of the individuals.
+        """
+        return self._endpoints
+
+    @property
+    def n_usable(self) -> typing.Sequence[int]:
+        """
+        Get a sequence with the number of individuals with a genotype group and a survival for each endpoint.
+        """
+        return self._n_usable
+
+    @property
+    def statistic_results(self) -> typing.Sequence[typing.Optional[StatisticResult]]:
+        """
+        Get a sequence of :class:`~gpsea.analysis.StatisticResult` items with nominal p values
+        and the associated statistic values for each tested endpoint or `None` for the untested endpoints.
+        """
+        return self._statistic_results
+
+    @property
+    def pvals(self) -> typing.Sequence[float]:
+        """
+        Get a sequence of nominal p values for each endpoint.
+        The sequence includes a `NaN` value for each endpoint that was *not* tested.
+        """
+        return tuple(float("nan") if r is None else r.pval for r in self._statistic_results)
+
+    @property
+    def corrected_pvals(self) -> typing.Optional[typing.Sequence[float]]:
+        """
+        Get a sequence with p values for each endpoint after multiple testing correction
+        or `None` if the correction was not applied.
+        The sequence includes a `NaN` value for each endpoint that was *not* tested.
+        """
+        return self._corrected_pvals
+
+    @property
+    def mtc_correction(self) -> typing.Optional[str]:
+        """
+        Get name/code of the used multiple testing correction
+        (e.g. `fdr_bh` for Benjamini-Hochberg) or `None` if no correction was applied.
+        """
+        return self._mtc_correction
+
+    @property
+    def total_tests(self) -> int:
+        """
+        Get total count of the endpoints that were tested in this analysis.
+        """
+        return sum(1 for result in self._statistic_results if result is not None)
+
+    def n_significant_for_alpha(
+        self,
+        alpha: float = 0.05,
+    ) -> typing.Optional[int]:
+        """
+        Get the count of the corrected p values with the value being less than or equal to `alpha`.
+
+        :param alpha: a `float` with significance level.
+        """
+        if self._corrected_pvals is None:
+            return None
+        else:
+            return sum(p_val <= alpha for p_val in self._corrected_pvals)
+
+    def significant_endpoint_indices(
+        self,
+        alpha: float = 0.05,
+        pval_kind: typing.Literal["corrected", "nominal"] = "corrected",
+    ) -> typing.Optional[typing.Sequence[int]]:
+        """
+        Get the indices of the endpoints that attain significance for provided `alpha`,
+        sorted by the p value.
+        """
+        if pval_kind == "corrected":
+            if self._corrected_pvals is None:
+                return None
+            vals = np.array(self._corrected_pvals)
+        elif pval_kind == "nominal":
+            vals = np.array(self.pvals)
+        else:
+            raise ValueError(f"Unsupported `pval_kind` value {pval_kind}")
+
+        selected = ~np.isnan(vals) & (vals <= alpha)
+        return tuple(int(idx) for idx in np.argsort(vals) if selected[idx])
+
+    def __eq__(self, value: object) -> bool:
+        return (
+            isinstance(value, MultiEndpointSurvivalAnalysisResult)
+            and super().__eq__(value)
+            and self._endpoints == value._endpoints
+            and self._n_usable == value._n_usable
+            and self._statistic_results == value._statistic_results
+            and self._corrected_pvals == value._corrected_pvals
+            and self._mtc_correction == value._mtc_correction
+        )
+
+    def __hash__(self) -> int:
+        return hash(
+            (
+                super().__hash__(),
+                self._endpoints,
+                self._n_usable,
+                self._statistic_results,
+                self._corrected_pvals,
+                self._mtc_correction,
+            )
+        )
+
+    def __str__(self) -> str:
+        return (
+            "MultiEndpointSurvivalAnalysisResult("
+            f"gt_clf={self._gt_clf}, "
+            f"endpoints={self._endpoints}, "
+            f"statistic={self._statistic}, "
+            f"n_usable={self._n_usable}, "
+            f"statistic_results={self._statistic_results}, "
+            f"corrected_pvals={self._corrected_pvals}, "
+            f"mtc_correction={self._mtc_correction})"
+        )
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class MultiEndpointSurvivalAnalysis:
+    """
+    `MultiEndpointSurvivalAnalysis` compares the time until onset of many HPO terms
+    between two genotype groups.
+
+    The survivals of all endpoints are computed in a single pass over the cohort
+    and the same way as by the :func:`~gpsea.analysis.temporal.endpoint.hpo_onset` endpoints.
+    The differences are tested with the log-rank test, computed for all endpoints at once,
+    and the multiple testing correction is applied to the p values of the tested endpoints.
+    An endpoint is not tested if the log-rank test is not defined for its survivals
+    (e.g. if no individual of one genotype group has a survival).
+
+    :param mtc_correction: a `str` with the multiple testing correction method
+      supported by :func:`statsmodels.stats.multitest.multipletests` (e.g. `fdr_bh` for Benjamini-Hochberg)
+      or `None` if no correction should be applied.
+    :param mtc_alpha: a `float` in range :math:`(0, 1]` with the family-wise error rate for the correction.
+    :param tracer: an optional tracer to notify about the analysis stages.
+    """
+
+    def __init__(
+        self,
+        mtc_correction: typing.Optional[str] = "fdr_bh",
+        mtc_alpha: float = 0.05,
+        tracer: typing.Optional[AnalysisTracer] = None,
+    ):
+        self._statistic = LogRankTest()
+        if mtc_correction is not None:
+            assert isinstance(mtc_correction, str)
+        self._mtc_correction = mtc_correction
+        assert isinstance(mtc_alpha, float) and 0.0 < mtc_alpha <= 1.0
+        self._mtc_alpha = mtc_alpha
+        if tracer is not None:
+            assert isinstance(tracer, AnalysisTracer)
+        self._tracer = tracer
+
+    def compare_genotype_vs_onsets(
+        self,
+        cohort: typing.Iterable[Patient],
+        gt_clf: GenotypeClassifier,
+        hpo: hpotk.MinimalOntology,
+        term_ids: typing.Optional[typing.Iterable[typing.Union[str, hpotk.TermId]]] = None,
+        timeline: typing.Literal["gestational", "postnatal"] = "postnatal",
+    ) -> MultiEndpointSurvivalAnalysisResult:
+        """
+        Compare the time until onset of the HPO terms between the genotype groups.
+
+        :param cohort: the individuals to analyze.
+        :param gt_clf: the genotype classifier with two categories.
+        :param hpo: HPO data.
+        :param term_ids: the HPO terms to test or `None` if all present terms with an onset
+          on the `timeline` should be tested.
+        :param timeline: the timeline of the onsets.
+        """
+        if gt_clf.n_categorizations() != 2:
+            raise ValueError(
+                f"The genotype classifier must produce 2 categories but it produces {gt_clf.n_categorizations()}"
+            )
+        age_timeline = _decode_timeline(timeline)
+        patients = tuple(cohort)
+        if term_ids is None:
+            term_ids = sorted(
+                {
+                    phenotype.identifier
+                    for patient in patients
+                    for phenotype in patient.present_phenotypes()
+                    if phenotype.onset is not None and phenotype.onset.timeline == age_timeline
+                },
+                key=lambda term_id: term_id.value,
+            )
+        else:
+            term_ids = [_validate_term_id(term_id) for term_id in term_ids]
+        endpoints = tuple(hpo_onset(hpo=hpo, term_id=term_id, timeline=timeline) for term_id in term_ids)
+
+        with _TraceRecorder(type(self).__name__, self._tracer) as recorder:
+            with recorder.stage("classify") as stage:
+                times, is_censored, gt_idxs = _compute_onset_survivals(
+                    patients, gt_clf, hpo, term_ids, age_timeline,
+                )
+                stage.n_items = len(patients)
+
+            # Only the individuals with a genotype group and a survival are usable.
+            usable = ~np.isnan(times) & (gt_idxs >= 0)[:, np.newaxis]
+            n_usable = usable.sum(axis=0)
+
+            with recorder.stage("statistic") as stage:
+                patient_idxs, endpoint_idxs = np.nonzero(usable)
+                statistics, pvals = logrank_per_group(
+                    group_ids=endpoint_idxs,
+                    times=times[usable],
+                    is_censored=is_censored[usable],
+                    in_x=gt_idxs[patient_idxs] == 0,
+                    n_groups=len(endpoints),
+                )
+                stage.n_items = len(endpoints)
+
+            statistic_results = tuple(
+                None if math.isnan(pval) else StatisticResult(statistic=float(statistic), pval=float(pval))
+                for statistic, pval in zip(statistics, pvals)
+            )
+
+            corrected_pvals = None
+            if self._mtc_correction is not None:
+                with recorder.stage("mtc_correction") as stage:
+                    corrected_pvals = np.full(shape=pvals.shape, fill_value=np.nan)
+                    tested = ~np.isnan(pvals)
+                    if tested.any():
+                        # Do not correct the p values of the endpoints that were not tested.
+                        corrected_pvals[tested] = self._apply_mtc(pvals[tested])
+                    stage.n_items = int(tested.sum())
+
+            result = MultiEndpointSurvivalAnalysisResult(
+                gt_clf=gt_clf,
+                endpoints=endpoints,
+                statistic=self._statistic,
+                n_usable=n_usable,
+                statistic_results=statistic_results,
+                corrected_pvals=corrected_pvals,
+                mtc_correction=self._mtc_correction,
+            )
+            result._trace = recorder.finish()
+            return result
+
+    def _apply_mtc(
+        self,
+        pvals: np.ndarray,
+    ) -> np.ndarray:
+        # `statsmodels` takes long to import, hence we import it on first use.
+        from statsmodels.stats import multitest
+
+        _, corrected_pvals, _, _ = multitest.multipletests(
+            pvals=pvals,
+            alpha=self._mtc_alpha,
+            method=self._mtc_correction,
+            is_sorted=False,
+            returnsorted=False,
+        )
+        return corrected_pvals
+
+
+def _compute_onset_survivals(
+    patients: typing.Sequence[Patient],
+    gt_clf: GenotypeClassifier,
+    hpo: hpotk.MinimalOntology,
+    term_ids: typing.Sequence[hpotk.TermId],
+    timeline,
+) -> typing.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute the onset survivals of all `term_ids` in a single pass over the `patients`.
+
+    :returns: a tuple with an `(n_patients, n_terms)` array with the survival times (`NaN` if unknown),
+      an `(n_patients, n_terms)` bool array with `True` for the censored survivals,
+      and an `(n_patients,)` array with the index of the genotype category of each patient or `-1` if none.
+    """
+    term_to_idx = {term_id: j for j, term_id in enumerate(term_ids)}
+    cat_to_idx = {cat: i for i, cat in enumerate(gt_clf.get_categorizations())}
+
+    onsets = np.full((len(patients), len(term_ids)), np.nan)
+    ages = np.full(len(patients), np.nan)
+    gt_idxs = np.full(len(patients), -1, dtype=np.intp)
+    # The indices of the tested terms that are the term or its ancestor, computed once per term.
+    targets: typing.Dict[hpotk.TermId, typing.List[int]] = {}
+    for i, patient in enumerate(patients):
+        gt_cat = gt_clf.test(patient)
+        if gt_cat is not None:
+            gt_idxs[i] = cat_to_idx[gt_cat]
+
+        if patient.age is not None and patient.age.timeline == timeline:
+            ages[i] = patient.age.days
+
+        for phenotype in patient.present_phenotypes():
+            if phenotype.onset is None or phenotype.onset.timeline != timeline:
+                continue
+            term_id = phenotype.identifier
+            idxs = targets.get(term_id)
+            if idxs is None:
+                idxs = [
+                    term_to_idx[t]
+                    for t in itertools.chain((term_id,), hpo.graph.get_ancestors(term_id))
+                    if t in term_to_idx
+                ]
+                targets[term_id] = idxs
+            if len(idxs) != 0:
+                # Choose the earliest onset of the term and its descendants.
+                onsets[i, idxs] = np.fmin(onsets[i, idxs], phenotype.onset.days)
+
+    # The individuals without the phenotype are right-censored at their age.
+    is_censored = np.isnan(onsets)
+    times = np.where(is_censored, ages[:, np.newaxis], onsets)
+    return times, is_censored, gt_idxs
@@ -1,21 +1,21 @@
 import typing
 
-from scipy.stats import CensoredData
+from ._base import Survival, SurvivalArray
 
-from ._api import Survival
+if typing.TYPE_CHECKING:
+    from scipy.stats import CensoredData
 
 
 def prepare_censored_data(
     survivals: typing.Iterable[Survival],
-) -> CensoredData:
-    uncensored = []
-    right_censored = []
-    for survival in survivals:
-        if survival.is_censored:
-            right_censored.append(survival.value)
-        else:
-            uncensored.append(survival.value)
-    return CensoredData(
-        uncensored=uncensored,
-        right=right_censored,
-    )
+) -> "CensoredData":
+    return SurvivalArray.from_survivals(survivals).to_censored_data()
+
+
+def as_survival_array(
+    survivals: typing.Union[SurvivalArray, typing.Iterable[typing.Optional[Survival]]],
+) -> SurvivalArray:
+    if isinstance(survivals, SurvivalArray):
+        return survivals
+    else:
+        return SurvivalArray.from_survivals(survivals)
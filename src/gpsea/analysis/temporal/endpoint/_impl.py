@@ -1,11 +1,12 @@
 import abc
+import math
 import typing
 
 import hpotk
 
 from gpsea.model import Patient, Age, Timeline
 from .._api import Endpoint
-from .._base import Survival
+from .._base import Survival, SurvivalArray
 
 
 class EndpointBase(Endpoint, metaclass=abc.ABCMeta):
@@ -16,6 +17,45 @@ class EndpointBase(Endpoint, metaclass=abc.ABCMeta):
     ):
         self._timeline = timeline
 
+    def compute_survival(
+        self,
+        patient: Patient,
+    ) -> typing.Optional[Survival]:
+        age, is_censored = self._find_age(patient)
+        return self._compute_survival(
+            age=age,
+            is_censored=is_censored,
+        )
+
+    def compute_survivals(
+        self,
+        patients: typing.Iterable[Patient],
+    ) -> SurvivalArray:
+        # Fill the arrays directly, without creating a `Survival` for each patient.
+        times = []
+        censored = []
+        for patient in patients:
+            age, is_censored = self._find_age(patient)
+            if age is None or age.timeline != self._timeline:
+                times.append(math.nan)
+                censored.append(False)
+            else:
+                times.append(age.days)
+                censored.append(is_censored)
+
+        return SurvivalArray(times=times, is_censored=censored)
+
+    @abc.abstractmethod
+    def _find_age(
+        self,
+        patient: Patient,
+    ) -> typing.Tuple[typing.Optional[Age], bool]:
+        """
+        Find the age of the event or of the last encounter of the `patient` (or `None` if unknown),
+        and `True` if the survival is censored.
+        """
+        pass
+
     def _compute_survival(
         self,
         age: typing.Optional[Age],
@@ -44,28 +84,22 @@ class Death(EndpointBase):
     def variable_name(self) -> str:
         return "Age of death"
 
-    def compute_survival(
+    def _find_age(
         self,
         patient: Patient,
-    ) -> typing.Optional[Survival]:
+    ) -> typing.Tuple[typing.Optional[Age], bool]:
         # If the patient is alive we use the current age as `value` and `censored=True`
         # If the patient is deceased, we use the age at death as a `value` and `censored=False`
         if patient.vital_status is None:
             # Absence of the vital status prevents reasoning about death.
-            return None
+            return None, False
 
         if patient.vital_status.is_deceased:
-            return self._compute_survival(
-                age=patient.vital_status.age_of_death,
-                is_censored=False,
-            )
+            return patient.vital_status.age_of_death, False
         else:
             # In absence of an explicit information regarding death,
             # we assume the individual was alive at the reported age.
-            return self._compute_survival(
-                age=patient.age,
-                is_censored=True,
-            )
+            return patient.age, True
         
     def question_base(self) -> str:
         return f"time until {self._timeline.name.lower()} death"
@@ -101,6 +135,8 @@ class PhenotypicFeatureOnset(EndpointBase):
 
         assert term_id in hpo, f"`term_id` {term_id.value} is not in HPO {hpo.version}"
 
+        self._is_target_cache: typing.Dict[hpotk.TermId, bool] = {}
+
     @property
     def name(self) -> str:
         return f"Onset of {self._hpo.get_term_name(self._term_id)}"
@@ -113,10 +149,10 @@ class PhenotypicFeatureOnset(EndpointBase):
     def variable_name(self) -> str:
         return f"Onset of {self._term_id.value}"
 
-    def compute_survival(
+    def _find_age(
         self,
         patient: Patient,
-    ) -> typing.Optional[Survival]:
+    ) -> typing.Tuple[typing.Optional[Age], bool]:
         # Search the present phenotypes. If the individual is annotated with multiple present descendants
         # (e.g. Focal seizure, Clonic seizure) of the target term (e.g. Seizure) then choose
         # the earliest onset, because the onset of the ancestor should be observable
@@ -127,10 +163,7 @@ class PhenotypicFeatureOnset(EndpointBase):
             # Check if the onset is available ...
             if present.onset is not None and present.onset.timeline == self._timeline:
                 # ... and if the individual is annotated with the target HPO or its descendant.
-                if present.identifier == self._term_id or any(
-                    anc == self._term_id
-                    for anc in self._hpo.graph.get_ancestors(present)
-                ):
+                if self._is_target_or_descendant(present.identifier):
                     if earliest_onset is None:
                         earliest_onset = present.onset
                     else:
@@ -138,16 +171,23 @@ class PhenotypicFeatureOnset(EndpointBase):
 
         if earliest_onset is None:
             # Phenotype was not found, use the age of the individual and right-censor
-            return self._compute_survival(
-                age=patient.age,
-                is_censored=True,
-            )
+            return patient.age, True
         else:
             # Phenotype was found, use the earliest onset.
-            return self._compute_survival(
-                age=earliest_onset,
-                is_censored=False,
+            return earliest_onset, False
+
+    def _is_target_or_descendant(
+        self,
+        term_id: hpotk.TermId,
+    ) -> bool:
+        # The ancestors of each term are checked only once.
+        is_target = self._is_target_cache.get(term_id)
+        if is_target is None:
+            is_target = term_id == self._term_id or any(
+                anc == self._term_id for anc in self._hpo.graph.get_ancestors(term_id)
             )
+            self._is_target_cache[term_id] = is_target
+        return is_target
 
     def __eq__(self, value: object) -> bool:
         return (
@@ -196,21 +236,15 @@ class DiseaseOnset(EndpointBase):
     def variable_name(self) -> str:
         return f"Onset of {self._disease_id.value}"
 
-    def compute_survival(
+    def _find_age(
         self,
         patient: Patient,
-    ) -> typing.Optional[Survival]:
+    ) -> typing.Tuple[typing.Optional[Age], bool]:
         for disease in patient.present_diseases():
             if disease.identifier == self._disease_id:
-                return self._compute_survival(
-                    age=disease.onset,
-                    is_censored=False,
-                )
+                return disease.onset, False
 
-        return self._compute_survival(
-            age=patient.age,
-            is_censored=True,
-        )
+        return patient.age, True
         
     def question_base(self) -> str:
         return f"time until {self._timeline.name.lower()} diagnosis of {self._disease_id.value}"
@@ -2,7 +2,7 @@ import abc
 import typing
 
 from ..._base import Statistic, StatisticResult
-from .._base import Survival
+from .._base import Survival, SurvivalArray
 
 
 class SurvivalStatistic(Statistic, metaclass=abc.ABCMeta):
@@ -18,12 +18,15 @@ class SurvivalStatistic(Statistic, metaclass=abc.ABCMeta):
     @abc.abstractmethod
     def compute_pval(
         self,
-        scores: typing.Collection[typing.Sequence[Survival]],
+        scores: typing.Collection[typing.Union[SurvivalArray, typing.Sequence[Survival]]],
     ) -> StatisticResult:
         """
         Compute p value for the collection of survivals being sampled from
         the same source distribution.
 
+        Each survival group is either a :class:`~gpsea.analysis.temporal.SurvivalArray`
+        or a sequence of :class:`~gpsea.analysis.temporal.Survival` objects.
+
         Raises an error 
         """
         pass
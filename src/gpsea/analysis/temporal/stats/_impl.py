@@ -1,10 +1,10 @@
 import typing
 
-from scipy import stats
+import numpy as np
 
 from ..._base import StatisticResult
-from .._base import Survival
-from .._util import prepare_censored_data
+from .._base import Survival, SurvivalArray
+from .._util import as_survival_array
 from ._api import SurvivalStatistic
 
 
@@ -23,22 +23,23 @@ class LogRankTest(SurvivalStatistic):
 
     def compute_pval(
         self,
-        scores: typing.Collection[typing.Iterable[Survival]],
+        scores: typing.Collection[typing.Union[SurvivalArray, typing.Iterable[Survival]]],
     ) -> StatisticResult:
         """
         Compute p value for survivals being sourced from the same distribution.
 
-        :param scores: a pair of survival groups
+        :param scores: a pair of survival groups, each group either
+          a :class:`~gpsea.analysis.temporal.SurvivalArray` or an iterable of survivals.
+          The missing survivals of a `SurvivalArray` are ignored.
         """
         assert len(scores) == 2, "Logrank test only supports 2 groups at this time"
-        x, y = tuple(scores)
+        x, y = (as_survival_array(survivals) for survivals in scores)
 
-        xc = prepare_censored_data(x)
-        yc = prepare_censored_data(y)
+        from scipy import stats
 
         result = stats.logrank(
-            x=xc,
-            y=yc,
+            x=x.to_censored_data(),
+            y=y.to_censored_data(),
             alternative="two-sided",
         )
 
@@ -52,3 +53,76 @@ class LogRankTest(SurvivalStatistic):
     
     def __hash__(self) -> int:
         return 37
+
+
+def logrank_per_group(
+    group_ids: np.ndarray,
+    times: np.ndarray,
+    is_censored: np.ndarray,
+    in_x: np.ndarray,
+    n_groups: int,
+) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the two-sided log-rank test of survivals `x` vs. `y`
+    for many independent groups of survivals (e.g. one group per endpoint) at once.
+
+    The statistic and p value of each group are the same as those of :func:`scipy.stats.logrank`
+    for the survivals of the group.
+
+    :param group_ids: an `(n,)` array with the index of the group of each survival, in range `[0, n_groups)`.
+    :param times: an `(n,)` array with the survival times.
+    :param is_censored: an `(n,)` bool array with `True` if the survival is right-censored.
+    :param in_x: an `(n,)` bool array with `True` if the survival belongs to `x` and `False` if to `y`.
+    :param n_groups: the number of groups.
+    :returns: a tuple with `(n_groups,)` arrays of the statistics and of the p values.
+      The statistic and the p value are `NaN` if the test is not defined for the group
+      (e.g. if all survivals of the group belong to one of `x` or `y`).
+    """
+    group_ids = np.asarray(group_ids, dtype=np.intp)
+    if group_ids.size == 0:
+        return np.full(n_groups, np.nan), np.full(n_groups, np.nan)
+
+    # Sort the survivals by group and time.
+    order = np.lexsort((times, group_ids))
+    g = group_ids[order]
+    t = np.asarray(times, dtype=float)[order]
+    event = ~np.asarray(is_censored, dtype=bool)[order]
+    x = np.asarray(in_x, dtype=bool)[order]
+
+    # Find the distinct (group, time) pairs ...
+    is_new_pair = np.empty(t.shape, dtype=bool)
+    is_new_pair[0] = True
+    is_new_pair[1:] = (g[1:] != g[:-1]) | (t[1:] != t[:-1])
+    pair_starts = np.flatnonzero(is_new_pair)
+    pair_group = g[pair_starts]
+
+    # ... and count the survivals and the events at each pair.
+    count = np.diff(np.append(pair_starts, t.size)).astype(float)
+    count_x = np.add.reduceat(x.astype(float), pair_starts)
+    deaths = np.add.reduceat(event.astype(float), pair_starts)
+
+    # The survivals at risk at time `t` are the survivals of the group that last at least `t`.
+    group_size = np.bincount(g, minlength=n_groups).astype(float)
+    group_size_x = np.bincount(g, weights=x.astype(float), minlength=n_groups)
+    before = np.cumsum(count) - count - (np.cumsum(group_size) - group_size)[pair_group]
+    before_x = np.cumsum(count_x) - count_x - (np.cumsum(group_size_x) - group_size_x)[pair_group]
+    at_risk = group_size[pair_group] - before
+    at_risk_x = group_size_x[pair_group] - before_x
+
+    expected_x = np.bincount(pair_group, weights=at_risk_x * deaths / at_risk, minlength=n_groups)
+    variance_terms = np.zeros_like(at_risk)
+    valid = at_risk > 1
+    variance_terms[valid] = (
+        at_risk_x * (at_risk - at_risk_x) * deaths * (at_risk - deaths)
+    )[valid] / (at_risk**2 * (at_risk - 1))[valid]
+    variance = np.bincount(pair_group, weights=variance_terms, minlength=n_groups)
+    observed_x = np.bincount(g, weights=(event & x).astype(float), minlength=n_groups)
+
+    from scipy.stats import norm
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        statistic = (observed_x - expected_x) / np.sqrt(variance)
+    statistic[variance == 0] = np.nan
+    pval = 2 * norm.sf(np.abs(statistic))
+
+    return statistic, pval
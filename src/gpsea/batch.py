@@ -0,0 +1,359 @@
+"""
+The `gpsea.batch` module runs GPSEA tasks for many cohorts, e.g. for the gene cohorts of Phenopacket Store.
+
+The cohorts and the tasks are described by a manifest (see :func:`load_batch_manifest`)
+and executed by :class:`BatchRunner` in a pool of worker processes.
+"""
+
+import concurrent.futures
+import dataclasses
+import functools
+import importlib
+import json
+import logging
+import os
+import pickle
+import traceback
+import typing
+
+import hpotk
+
+from .io import GpseaJSONDecoder
+from .model import Cohort
+
+
+@dataclasses.dataclass(frozen=True)
+class BatchJob:
+    """
+    `BatchJob` describes a task to run for a cohort.
+
+    The cohort is either loaded from a folder with phenopacket JSON files (`phenopackets`)
+    or from a JSON file with a cohort serialized by :class:`~gpsea.io.GpseaJSONEncoder` (`cohort`).
+
+    The task is a function identified by a `module:function` path (e.g. `mypackage.tasks:run_hpo_analysis`).
+    The function is called with keyword arguments `cohort` (:class:`~gpsea.model.Cohort`)
+    and `hpo` (:class:`~hpotk.MinimalOntology`), and the entries of `params` are passed as extra keyword arguments.
+    For instance, a job with ``params={"mtc_alpha": 0.01}`` calls ``task(cohort=cohort, hpo=hpo, mtc_alpha=0.01)``.
+    The function must return a picklable result.
+    """
+
+    name: str
+    """
+    A unique name of the job, used as the name of the output file.
+    """
+
+    task: str
+    """
+    A `module:function` path to the task function.
+    """
+
+    phenopackets: typing.Optional[str] = None
+    """
+    Path to a folder with phenopacket JSON files or `None` if the job uses a serialized `cohort`.
+    """
+
+    cohort: typing.Optional[str] = None
+    """
+    Path to a JSON file with a serialized cohort or `None` if the job uses `phenopackets`.
+    """
+
+    params: typing.Mapping[str, typing.Any] = dataclasses.field(default_factory=dict)
+    """
+    Extra keyword arguments for the task function.
+    """
+
+    def __post_init__(self):
+        if not self.name or os.sep in self.name or (os.altsep is not None and os.altsep in self.name):
+            raise ValueError(f"Job name must be a non-empty file name but was `{self.name}`")
+        if ":" not in self.task:
+            raise ValueError(f"Task must be a `module:function` path but was `{self.task}`")
+        if (self.phenopackets is None) == (self.cohort is None):
+            raise ValueError(f"Job `{self.name}` must have either `phenopackets` or `cohort`")
+
+
+@dataclasses.dataclass(frozen=True)
+class BatchJobOutcome:
+    """
+    `BatchJobOutcome` reports the outcome of a :class:`BatchJob`.
+    """
+
+    name: str
+    """
+    The name of the job.
+    """
+
+    status: typing.Literal["completed", "skipped", "failed"]
+    """
+    `completed` if the job was run, `skipped` if the job result was available from a previous run,
+    or `failed` if the job raised an error.
+    """
+
+    output_path: str
+    """
+    Path to the pickle file with the job result. The file does not exist if the job failed.
+    """
+
+    error: typing.Optional[str] = None
+    """
+    The formatted error of a failed job or `None` if the job did not fail.
+    """
+
+
+def load_batch_manifest(
+    path: str,
+) -> typing.Sequence[BatchJob]:
+    """
+    Load the batch jobs from a JSON manifest.
+
+    The manifest is a JSON object with a list of `jobs`, where each job includes the :class:`BatchJob` fields:
+
+    .. code-block:: json
+
+      {
+        "jobs": [
+          {
+            "name": "SUOX",
+            "phenopackets": "phenopackets/SUOX",
+            "task": "mypackage.tasks:run_hpo_analysis",
+            "params": {"tx_id": "NM_001032386.2"}
+          }
+        ]
+      }
+
+    The relative `phenopackets` and `cohort` paths are resolved against the folder of the manifest.
+
+    :param path: path to the manifest file.
+    """
+    with open(path) as fh:
+        manifest = json.load(fh)
+
+    base_dir = os.path.dirname(os.path.abspath(path))
+    jobs = []
+    for entry in manifest["jobs"]:
+        entry = dict(entry)
+        for field in ("phenopackets", "cohort"):
+            if entry.get(field) is not None:
+                entry[field] = os.path.join(base_dir, entry[field])
+        jobs.append(BatchJob(**entry))
+
+    return jobs
+
+
+class BatchRunner:
+    """
+    `BatchRunner` runs :class:`BatchJob`\\ s in a pool of worker processes.
+
+    Each worker loads HPO once, from a snapshot prepared by :class:`~gpsea.preprocessing.HpoSnapshotStore`,
+    and shares it (and the cohort creator) across all jobs the worker runs.
+    The result of a job is written into `output_dir` atomically, and the completed jobs
+    are skipped when the runner is restarted.
+
+    :param output_dir: path to the folder for the job results.
+    :param release: a `str` with the HPO release (e.g. `v2024-04-26`) or `None` for the latest release.
+    :param fpath_hpo: an optional path to the HPO JSON file of the `release`.
+    :param n_workers: a positive `int` with the number of worker processes.
+    :param memory_limit_mb: an optional limit of the address space of a worker process in MiB.
+      A job that exceeds the limit fails with a :class:`MemoryError`. The limit is not supported on Windows.
+    :param cache_dir: path to the GPSEA cache folder or `None` for the default cache folder.
+    :param cohort_creator_factory: a picklable function for creating the cohort creator from HPO,
+      or `None` for :func:`~gpsea.preprocessing.configure_caching_cohort_creator`.
+    :param validation_policy: the validation policy for loading phenopackets.
+      A job fails if its phenopackets do not pass the validation.
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        release: typing.Optional[str] = None,
+        fpath_hpo: typing.Optional[str] = None,
+        n_workers: int = 1,
+        memory_limit_mb: typing.Optional[int] = None,
+        cache_dir: typing.Optional[str] = None,
+        cohort_creator_factory: typing.Optional[typing.Callable[[hpotk.MinimalOntology], typing.Any]] = None,
+        validation_policy: typing.Literal["permissive", "lenient", "strict"] = "permissive",
+    ):
+        from .preprocessing import configure_caching_cohort_creator
+
+        self._logger = logging.getLogger(__name__)
+        self._output_dir = output_dir
+        self._release = release
+        self._fpath_hpo = fpath_hpo
+        if n_workers < 1:
+            raise ValueError(f"`n_workers` must be a positive `int` but was {n_workers}")
+        self._n_workers = n_workers
+        if memory_limit_mb is not None:
+            if memory_limit_mb <= 0:
+                raise ValueError(f"`memory_limit_mb` must be a positive `int` but was {memory_limit_mb}")
+            try:
+                import resource  # noqa: F401
+            except ImportError:
+                raise ValueError("`memory_limit_mb` is not supported on this platform")
+        self._memory_limit_mb = memory_limit_mb
+        self._cache_dir = cache_dir
+        if cohort_creator_factory is None:
+            cohort_creator_factory = functools.partial(configure_caching_cohort_creator, cache_dir=cache_dir)
+        self._cohort_creator_factory = cohort_creator_factory
+        self._validation_policy = validation_policy
+
+    @property
+    def output_dir(self) -> str:
+        return self._output_dir
+
+    def output_path(
+        self,
+        job: BatchJob,
+    ) -> str:
+        """
+        Get path to the pickle file with the result of the `job`.
+        """
+        return os.path.join(self._output_dir, f"{job.name}.pickle")
+
+    def run(
+        self,
+        jobs: typing.Iterable[BatchJob],
+    ) -> typing.Sequence[BatchJobOutcome]:
+        """
+        Run the jobs that have no result yet.
+
+        :param jobs: the jobs to run.
+        :returns: a sequence with the outcomes of the `jobs`, in the order of the `jobs`.
+        """
+        jobs = tuple(jobs)
+        names = [job.name for job in jobs]
+        if len(set(names)) != len(names):
+            raise ValueError("Job names must be unique")
+        os.makedirs(self._output_dir, exist_ok=True)
+
+        outcomes: typing.Dict[str, BatchJobOutcome] = {}
+        pending = []
+        for job in jobs:
+            output_path = self.output_path(job)
+            if os.path.isfile(output_path):
+                outcomes[job.name] = BatchJobOutcome(name=job.name, status="skipped", output_path=output_path)
+            else:
+                pending.append(job)
+        self._logger.info("Skipping %d completed job(s), running %d job(s)", len(outcomes), len(pending))
+
+        if len(pending) > 0:
+            release = self._prepare_hpo_snapshot()
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=min(self._n_workers, len(pending)),
+                initializer=_init_worker,
+                initargs=(
+                    release,
+                    self._cache_dir,
+                    self._memory_limit_mb,
+                    self._cohort_creator_factory,
+                ),
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        _run_job,
+                        job,
+                        self.output_path(job),
+                        self._validation_policy,
+                    ): job
+                    for job in pending
+                }
+                for future in concurrent.futures.as_completed(futures):
+                    job = futures[future]
+                    try:
+                        output_path = future.result()
+                        outcome = BatchJobOutcome(name=job.name, status="completed", output_path=output_path)
+                        self._logger.info("Completed job %s", job.name)
+                    except Exception as e:
+                        outcome = BatchJobOutcome(
+                            name=job.name,
+                            status="failed",
+                            output_path=self.output_path(job),
+                            error="".join(traceback.format_exception(type(e), e, e.__traceback__)),
+                        )
+                        self._logger.warning("Job %s failed: %s", job.name, e)
+                    outcomes[job.name] = outcome
+
+        return tuple(outcomes[job.name] for job in jobs)
+
+    def _prepare_hpo_snapshot(self) -> str:
+        # Prepare the snapshot in the main process, to prevent the workers from racing to build it.
+        from .preprocessing import configure_hpo_snapshot_store
+
+        store = configure_hpo_snapshot_store(cache_dir=self._cache_dir)
+        if self._release is not None and os.path.isfile(store.snapshot_path(self._release)):
+            return self._release
+
+        hpo = store.load_minimal_hpo(release=self._release, fpath_hpo=self._fpath_hpo)
+        if hpo.version is None:
+            raise ValueError("Cannot run the batch with HPO of an unknown version")
+        return hpo.version
+
+
+# The state shared by the jobs of a worker process.
+_WORKER_STATE: typing.Dict[str, typing.Any] = {}
+
+
+def _init_worker(
+    release: str,
+    cache_dir: typing.Optional[str],
+    memory_limit_mb: typing.Optional[int],
+    cohort_creator_factory: typing.Callable[[hpotk.MinimalOntology], typing.Any],
+):
+    from .preprocessing import configure_hpo_snapshot_store
+
+    if memory_limit_mb is not None:
+        import resource
+
+        limit = memory_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    store = configure_hpo_snapshot_store(cache_dir=cache_dir)
+    _WORKER_STATE.clear()
+    _WORKER_STATE["hpo"] = store.load_minimal_hpo(release=release)
+    _WORKER_STATE["cohort_creator_factory"] = cohort_creator_factory
+
+
+def _get_cohort_creator():
+    # The cohort creator is only needed for the jobs with phenopackets, hence we create it lazily.
+    cohort_creator = _WORKER_STATE.get("cohort_creator")
+    if cohort_creator is None:
+        cohort_creator = _WORKER_STATE["cohort_creator_factory"](_WORKER_STATE["hpo"])
+        _WORKER_STATE["cohort_creator"] = cohort_creator
+    return cohort_creator
+
+
+def _run_job(
+    job: BatchJob,
+    output_path: str,
+    validation_policy: str,
+) -> str:
+    from .preprocessing import load_phenopacket_folder
+
+    hpo = _WORKER_STATE["hpo"]
+    if job.cohort is not None:
+        with open(job.cohort) as fh:
+            cohort = json.load(fh, cls=GpseaJSONDecoder)
+        if not isinstance(cohort, Cohort):
+            raise ValueError(f"`{job.cohort}` does not contain a cohort")
+    else:
+        cohort, validation_result = load_phenopacket_folder(
+            pp_directory=typing.cast(str, job.phenopackets),
+            cohort_creator=_get_cohort_creator(),
+            validation_policy=validation_policy,  # type: ignore
+        )
+        if not validation_result.is_ok():
+            raise ValueError(f"Phenopackets of job `{job.name}` did not pass the {validation_policy} validation")
+
+    module_name, function_name = job.task.split(":", maxsplit=1)
+    task = getattr(importlib.import_module(module_name), function_name)
+    result = task(cohort=cohort, hpo=hpo, **job.params)
+
+    # Write the result into a temporary file first, and then move it into place.
+    tmp_path = f"{output_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as fh:
+            pickle.dump(result, fh)
+        os.replace(tmp_path, output_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    return output_path
@@ -9,7 +9,7 @@ from ._base import SampleLabels, Sex
 from ._cohort import Cohort, Patient, VitalStatus, Status
 from ._gt import Genotype, Genotypes, Genotyped
 from ._phenotype import Phenotype, Disease, Measurement, OnsetAware
-from ._protein import FeatureInfo, FeatureType, ProteinFeature, ProteinMetadata
+from ._protein import FeatureInfo, FeatureType, ProteinFeature, ProteinFeatureIndex, ProteinMetadata
 from ._temporal import Age, Timeline
 from ._tx import TranscriptCoordinates
 from ._variant import VariantCoordinates, ImpreciseSvInfo, VariantInfo, VariantInfoAware, VariantClass, Variant
@@ -24,5 +24,5 @@ __all__ = [
     'Genotype', 'Genotypes', 'Genotyped',
     'TranscriptAnnotation', 'VariantEffect', 'TranscriptInfoAware',
     'FunctionalAnnotationAware', 'TranscriptCoordinates',
-    'ProteinMetadata', 'ProteinFeature', 'FeatureInfo', 'FeatureType',
+    'ProteinMetadata', 'ProteinFeature', 'ProteinFeatureIndex', 'FeatureInfo', 'FeatureType',
 ]
@@ -1,5 +1,7 @@
 import enum
+import hashlib
 import itertools
+import json
 import typing
 
 from collections import Counter, defaultdict
@@ -75,6 +77,12 @@ class Patient:
         instead of `__init__`.
     """
 
+    _INDEXES = (
+        "_phenotype_index", "_measurement_index", "_disease_index",
+        "_present_phenotypes", "_excluded_phenotypes",
+        "_present_phenotype_ids", "_excluded_phenotype_ids", "_present_disease_ids",
+    )
+
     @staticmethod
     def from_raw_parts(
         labels: typing.Union[str, SampleLabels],
@@ -136,6 +144,10 @@ class Patient:
         self._diseases = tuple(diseases)
         self._variants = tuple(variants)
 
+        # The hash is computed on demand. We do not persist it, since the hashes of `str`s differ between the runs.
+        self._hash: typing.Optional[int] = None
+        self._clear_indexes()
+
     @property
     def patient_id(self) -> str:
         """
@@ -186,7 +198,9 @@ class Patient:
         Get a phenotype with an identifier or `None` if the individual has no such phenotype.
         """
         term_id = Patient._check_id(term_id)
-        return Patient._find_first_by_id(term_id, self.phenotypes)
+        if self._phenotype_index is None:
+            self._phenotype_index = Patient._index_by_id(self._phenotypes)
+        return self._phenotype_index.get(term_id)
     
     def count_unique_phenotypes(self) -> int:
         """
@@ -213,7 +227,9 @@ class Patient:
         :returns: the corresponding :class:`Measurement` or `None` if not found in the patient.
         """
         term_id = Patient._check_id(term_id)
-        return Patient._find_first_by_id(term_id, self.measurements)
+        if self._measurement_index is None:
+            self._measurement_index = Patient._index_by_id(self._measurements)
+        return self._measurement_index.get(term_id)
 
     def count_unique_measurements(self) -> int:
         """
@@ -236,7 +252,9 @@ class Patient:
         Get a disease with an identifier or `None` if the individual has no such disease.
         """
         term_id = Patient._check_id(term_id)
-        return Patient._find_first_by_id(term_id, self.diseases)
+        if self._disease_index is None:
+            self._disease_index = Patient._index_by_id(self._diseases)
+        return self._disease_index.get(term_id)
 
     def count_unique_diseases(self) -> int:
         """
@@ -255,13 +273,33 @@ class Patient:
         """
         Get an iterator over the *present* phenotypes of the patient.
         """
-        return filter(lambda p: p.is_present, self._phenotypes)
+        if self._present_phenotypes is None:
+            self._present_phenotypes = tuple(p for p in self._phenotypes if p.is_present)
+        return iter(self._present_phenotypes)
 
     def excluded_phenotypes(self) -> typing.Iterator[Phenotype]:
         """
         Get an iterator over the *excluded* phenotypes of the patient.
         """
-        return filter(lambda p: p.is_excluded, self._phenotypes)
+        if self._excluded_phenotypes is None:
+            self._excluded_phenotypes = tuple(p for p in self._phenotypes if p.is_excluded)
+        return iter(self._excluded_phenotypes)
+
+    def present_phenotype_ids(self) -> typing.AbstractSet[hpotk.TermId]:
+        """
+        Get a set with the term IDs of the *present* phenotypes of the patient.
+        """
+        if self._present_phenotype_ids is None:
+            self._present_phenotype_ids = frozenset(p.identifier for p in self.present_phenotypes())
+        return self._present_phenotype_ids
+
+    def excluded_phenotype_ids(self) -> typing.AbstractSet[hpotk.TermId]:
+        """
+        Get a set with the term IDs of the *excluded* phenotypes of the patient.
+        """
+        if self._excluded_phenotype_ids is None:
+            self._excluded_phenotype_ids = frozenset(p.identifier for p in self.excluded_phenotypes())
+        return self._excluded_phenotype_ids
 
     def present_diseases(self) -> typing.Iterator[Disease]:
         """
@@ -269,6 +307,14 @@ class Patient:
         """
         return filter(lambda d: d.is_present, self._diseases)
 
+    def present_disease_ids(self) -> typing.AbstractSet[hpotk.TermId]:
+        """
+        Get a set with the identifiers of the diseases the patient was diagnosed with.
+        """
+        if self._present_disease_ids is None:
+            self._present_disease_ids = frozenset(d.identifier for d in self.present_diseases())
+        return self._present_disease_ids
+
     def excluded_diseases(self) -> typing.Iterator[Disease]:
         """
         Get an iterator with diseases whose presence was excluded in the patient.
@@ -287,15 +333,26 @@ class Patient:
             raise ValueError(f'`term_id` must be a `str` or `hpotk.TermId` but was {type(term_id)}')
         
     @staticmethod
-    def _find_first_by_id(
-        term_id: hpotk.TermId,
+    def _index_by_id(
         items: typing.Iterable[IDENTIFIED],
-    ) -> typing.Optional[IDENTIFIED]:
-        for m in items:
-            if m.identifier == term_id:
-                return m
-
-        return None
+    ) -> typing.Mapping[hpotk.TermId, IDENTIFIED]:
+        # Keep the first item if there are several items with the same identifier.
+        index = {}
+        for item in items:
+            index.setdefault(item.identifier, item)
+
+        return index
+
+    def _clear_indexes(self):
+        # The indexes are built on demand, on the first lookup. Keep in sync with `_INDEXES`.
+        self._phenotype_index: typing.Optional[typing.Mapping[hpotk.TermId, Phenotype]] = None
+        self._measurement_index: typing.Optional[typing.Mapping[hpotk.TermId, Measurement]] = None
+        self._disease_index: typing.Optional[typing.Mapping[hpotk.TermId, Disease]] = None
+        self._present_phenotypes: typing.Optional[typing.Tuple[Phenotype, ...]] = None
+        self._excluded_phenotypes: typing.Optional[typing.Tuple[Phenotype, ...]] = None
+        self._present_phenotype_ids: typing.Optional[typing.FrozenSet[hpotk.TermId]] = None
+        self._excluded_phenotype_ids: typing.Optional[typing.FrozenSet[hpotk.TermId]] = None
+        self._present_disease_ids: typing.Optional[typing.FrozenSet[hpotk.TermId]] = None
     
     @staticmethod
     def _unique_identifiers_of_identified(
@@ -335,12 +392,28 @@ class Patient:
                 and self._diseases == other._diseases)
 
     def __hash__(self) -> int:
-        return hash((
-            self._labels, self._sex, self._age,
-            self._vital_status,
-            self._variants, self._phenotypes,
-            self._measurements, self._diseases,
-        ))
+        if self._hash is None:
+            self._hash = hash((
+                self._labels, self._sex, self._age,
+                self._vital_status,
+                self._variants, self._phenotypes,
+                self._measurements, self._diseases,
+            ))
+        return self._hash
+
+    def __getstate__(self) -> typing.Dict[str, typing.Any]:
+        # Do not persist the indexes, they are cheap to rebuild.
+        state = {
+            key: value for key, value in self.__dict__.items()
+            if key not in Patient._INDEXES
+        }
+        state["_hash"] = None
+        return state
+
+    def __setstate__(self, state: typing.Dict[str, typing.Any]):
+        self.__dict__.update(state)
+        self._hash = None
+        self._clear_indexes()
 
 
 class Cohort(typing.Sized, typing.Iterable[Patient]):
@@ -383,6 +456,28 @@ class Cohort(typing.Sized, typing.Iterable[Patient]):
     ):
         self._members = tuple(members)
         self._excluded_count = excluded_member_count
+        self._fingerprint: typing.Optional[str] = None
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Get a SHA-256 hex digest of the cohort content.
+
+        The fingerprint is stable across Python sessions and it is the same for cohorts with equal content,
+        e.g. a cohort and its copy loaded from JSON. The fingerprint is computed once per cohort instance.
+        """
+        if self._fingerprint is None:
+            # Imported here to prevent circular import, `gpsea.io` depends on the model.
+            from gpsea.io import GpseaJSONEncoder
+
+            payload = json.dumps(self, cls=GpseaJSONEncoder, sort_keys=True, separators=(",", ":"))
+            self._fingerprint = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return self._fingerprint
+
+    def __setstate__(self, state: typing.Dict[str, typing.Any]):
+        # Support the cohorts pickled before the fingerprint was introduced.
+        self.__dict__.update(state)
+        self.__dict__.setdefault("_fingerprint", None)
 
     @property
     def all_patients(self) -> typing.Collection[Patient]:
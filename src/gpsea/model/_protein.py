@@ -1,16 +1,19 @@
 import abc
+import bisect
 import enum
 import io
+import itertools
 import json
 import typing
 import warnings
 
-import pandas as pd
-
 from gpsea.util import open_text_io_handle_for_reading
 
 from .genome import Region
 
+if typing.TYPE_CHECKING:
+    import pandas as pd
+
 
 class FeatureInfo:
     """
@@ -266,6 +269,87 @@ class SimpleProteinFeature(ProteinFeature):
         return hash((self._type, self._info))
 
 
+class ProteinFeatureIndex:
+    """
+    `ProteinFeatureIndex` is a sorted interval index of protein features
+    for finding the features that overlap with protein regions.
+
+    The features are sorted by start coordinate and the index keeps the running maximum of the end coordinates,
+    hence a query needs two binary searches and checks only the features that start before the end of the region
+    and are not followed by a feature that reaches past the start of the region.
+
+    The index is usually obtained from :attr:`ProteinMetadata.feature_index`.
+
+    :param features: the protein features to index.
+    """
+
+    def __init__(
+        self,
+        features: typing.Iterable[ProteinFeature],
+    ):
+        self._features = tuple(features)
+        self._order = sorted(range(len(self._features)), key=lambda i: self._features[i].info.start)
+        self._starts = [self._features[i].info.start for i in self._order]
+        self._ends = [self._features[i].info.end for i in self._order]
+        self._max_ends = list(itertools.accumulate(self._ends, max))
+
+    @property
+    def features(self) -> typing.Sequence[ProteinFeature]:
+        """
+        Get the indexed features in the original order.
+        """
+        return self._features
+
+    def overlapping(
+        self,
+        region: Region,
+    ) -> typing.Sequence[ProteinFeature]:
+        """
+        Get the features that overlap with the `region`, in the original order of the features.
+
+        The overlap is decided by :meth:`~gpsea.model.genome.Region.overlaps_with`.
+        """
+        return tuple(self._features[i] for i in self._find_overlapping(region))
+
+    def overlapping_each(
+        self,
+        regions: typing.Iterable[Region],
+    ) -> typing.Sequence[typing.Sequence[ProteinFeature]]:
+        """
+        Get the features that overlap with each of the `regions`.
+
+        :returns: a sequence with the overlapping features of each region, in the order of the `regions`.
+        """
+        return tuple(self.overlapping(region) for region in regions)
+
+    def _find_overlapping(
+        self,
+        region: Region,
+    ) -> typing.Sequence[int]:
+        # The features that end before the region start are skipped,
+        # since the maximum end is non-decreasing. An empty region can overlap with an empty feature
+        # that starts at the region end, hence the features that start at the region end must be checked too.
+        lo = bisect.bisect_left(self._max_ends, region.start)
+        if region.start == region.end:
+            hi = bisect.bisect_right(self._starts, region.end)
+        else:
+            hi = bisect.bisect_left(self._starts, region.end)
+        return sorted(
+            self._order[i]
+            for i in range(lo, hi)
+            if self._features[self._order[i]].info.region.overlaps_with(region)
+        )
+
+    def __len__(self) -> int:
+        return len(self._features)
+
+    def __str__(self) -> str:
+        return f"ProteinFeatureIndex(n_features={len(self._features)})"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
 class ProteinMetadata:
     """
     An info regarding a protein sequence, including an ID, a label,
@@ -327,7 +411,7 @@ class ProteinMetadata:
     def from_feature_frame(
         protein_id: str,
         label: str,
-        features: pd.DataFrame,
+        features: "pd.DataFrame",
         protein_length: int,
     ) -> "ProteinMetadata":
         """
@@ -447,6 +531,9 @@ class ProteinMetadata:
         assert isinstance(protein_length, int) and protein_length > 0
         self._protein_length = protein_length
 
+        # The index is built on demand.
+        self._feature_index_cache: typing.Optional[ProteinFeatureIndex] = None
+
     @property
     def protein_id(self) -> str:
         """
@@ -475,6 +562,17 @@ class ProteinMetadata:
         """
         return self._protein_length
 
+    @property
+    def feature_index(self) -> ProteinFeatureIndex:
+        """
+        Get the interval index of the protein features.
+
+        The index is built on the first access.
+        """
+        if self._feature_index_cache is None:
+            self._feature_index_cache = ProteinFeatureIndex(self._features)
+        return self._feature_index_cache
+
     def domains(self) -> typing.Iterable[ProteinFeature]:
         """
         Returns:
@@ -523,11 +621,7 @@ class ProteinMetadata:
         Returns:
             Collection[ProteinFeature]: a collection of overlapping protein features.
         """
-        return tuple(
-            feature
-            for feature in self._features
-            if feature.info.region.overlaps_with(region)
-        )
+        return self.feature_index.overlapping(region)
 
     def __str__(self) -> str:
         return (
@@ -547,5 +641,16 @@ class ProteinMetadata:
     def __hash__(self) -> int:
         return hash((self.protein_id, self.label, self._features))
 
+    def __getstate__(self) -> typing.Dict[str, typing.Any]:
+        # Do not persist the index, it is cheap to rebuild.
+        state = dict(self.__dict__)
+        state["_feature_index_cache"] = None
+        return state
+
+    def __setstate__(self, state: typing.Dict[str, typing.Any]):
+        self.__dict__.update(state)
+        # Support the metadata pickled before the index was introduced.
+        self._feature_index_cache = None
+
     def __repr__(self) -> str:
         return str(self)
@@ -1,16 +1,73 @@
-from ._api import PreprocessingValidationResult
-from ._api import TranscriptCoordinateService, GeneCoordinateService
-from ._api import VariantCoordinateFinder, FunctionalAnnotator, ImpreciseSvFunctionalAnnotator, ProteinMetadataService
-from ._config import load_phenopacket_folder, load_phenopacket_files, load_phenopackets
-from ._config import configure_caching_cohort_creator, configure_cohort_creator
-from ._config import configure_default_tx_coordinate_service, configure_default_functional_annotator
-from ._config import configure_default_protein_metadata_service, configure_protein_metadata_service
-from ._generic import DefaultImpreciseSvFunctionalAnnotator
-from ._patient import PatientCreator, CohortCreator
-from ._phenopacket import PhenopacketVariantCoordinateFinder, PhenopacketPatientCreator, PhenopacketOntologyTermOnsetParser
-from ._uniprot import UniprotProteinMetadataService
-from ._vep import VepFunctionalAnnotator
-from ._vv import VVHgvsVariantCoordinateFinder, VVMultiCoordinateService, VariantValidatorDecodeException
+import typing
+
+from gpsea._lazy import attach
+
+if typing.TYPE_CHECKING:
+    from ._api import PreprocessingValidationResult
+    from ._api import TranscriptCoordinateService, GeneCoordinateService
+    from ._api import VariantCoordinateFinder, FunctionalAnnotator, ImpreciseSvFunctionalAnnotator, ProteinMetadataService
+    from ._archive import iter_phenopacket_store_archive
+    from ._config import load_phenopacket_folder, load_phenopacket_files, load_phenopackets
+    from ._config import load_phenopacket_folder_incrementally, load_phenopacket_store_archive
+    from ._config import configure_caching_cohort_creator, configure_cohort_creator, configure_hpo_snapshot_store
+    from ._config import configure_default_tx_coordinate_service, configure_default_functional_annotator
+    from ._config import configure_default_protein_metadata_service, configure_protein_metadata_service
+    from ._generic import DefaultImpreciseSvFunctionalAnnotator
+    from ._hpo import HpoSnapshotStore
+    from ._incremental import IncrementalPatientCreator, PhenopacketFileManifest
+    from ._patient import PatientCreator, CohortCreator
+    from ._phenopacket import PhenopacketVariantCoordinateFinder, PhenopacketPatientCreator, PhenopacketOntologyTermOnsetParser
+    from ._uniprot import UniprotProteinMetadataService
+    from ._validation import CachingValidationRunner
+    from ._vep import VepFunctionalAnnotator
+    from ._vv import VVHgvsVariantCoordinateFinder, VVMultiCoordinateService, VariantValidatorDecodeException
+else:
+    __getattr__, __dir__ = attach(
+        __name__,
+        {
+            "._api": (
+                "PreprocessingValidationResult",
+                "TranscriptCoordinateService",
+                "GeneCoordinateService",
+                "VariantCoordinateFinder",
+                "FunctionalAnnotator",
+                "ImpreciseSvFunctionalAnnotator",
+                "ProteinMetadataService",
+            ),
+            "._archive": ("iter_phenopacket_store_archive",),
+            "._config": (
+                "load_phenopacket_folder",
+                "load_phenopacket_files",
+                "load_phenopackets",
+                "load_phenopacket_folder_incrementally",
+                "load_phenopacket_store_archive",
+                "configure_caching_cohort_creator",
+                "configure_cohort_creator",
+                "configure_hpo_snapshot_store",
+                "configure_default_tx_coordinate_service",
+                "configure_default_functional_annotator",
+                "configure_default_protein_metadata_service",
+                "configure_protein_metadata_service",
+            ),
+            "._generic": ("DefaultImpreciseSvFunctionalAnnotator",),
+            "._hpo": ("HpoSnapshotStore",),
+            "._incremental": ("IncrementalPatientCreator", "PhenopacketFileManifest"),
+            "._patient": ("PatientCreator", "CohortCreator"),
+            "._phenopacket": (
+                "PhenopacketVariantCoordinateFinder",
+                "PhenopacketPatientCreator",
+                "PhenopacketOntologyTermOnsetParser",
+            ),
+            "._uniprot": ("UniprotProteinMetadataService",),
+            "._validation": ("CachingValidationRunner",),
+            "._vep": ("VepFunctionalAnnotator",),
+            "._vv": (
+                "VVHgvsVariantCoordinateFinder",
+                "VVMultiCoordinateService",
+                "VariantValidatorDecodeException",
+            ),
+        },
+    )
 
 __all__ = [
     'configure_caching_cohort_creator', 'configure_cohort_creator',
@@ -20,9 +77,13 @@ __all__ = [
     'PatientCreator', 'CohortCreator',
     'PhenopacketVariantCoordinateFinder', 'PhenopacketPatientCreator', 'PhenopacketOntologyTermOnsetParser',
     'load_phenopacket_folder', 'load_phenopacket_files', 'load_phenopackets',
+    'load_phenopacket_folder_incrementally', 'IncrementalPatientCreator', 'PhenopacketFileManifest',
+    'load_phenopacket_store_archive', 'iter_phenopacket_store_archive',
     'PreprocessingValidationResult',
     'TranscriptCoordinateService', 'GeneCoordinateService',
     'UniprotProteinMetadataService',
+    'CachingValidationRunner',
+    'configure_hpo_snapshot_store', 'HpoSnapshotStore',
     'VepFunctionalAnnotator',
     'VVHgvsVariantCoordinateFinder', 'VVMultiCoordinateService', 'VariantValidatorDecodeException',
     'DefaultImpreciseSvFunctionalAnnotator',
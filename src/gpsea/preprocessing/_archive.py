@@ -0,0 +1,93 @@
+import collections
+import concurrent.futures
+import os
+import pathlib
+import posixpath
+import typing
+import zipfile
+
+# pyright: reportGeneralTypeIssues=false
+from phenopackets import Phenopacket
+
+from ._pp_json import parse_phenopacket
+
+
+def iter_phenopacket_store_archive(
+    archive: typing.Union[str, pathlib.Path],
+    cohorts: typing.Optional[typing.Iterable[str]] = None,
+    n_workers: int = 2,
+    prefetch: int = 64,
+) -> typing.Iterator[Phenopacket]:
+    """
+    Stream phenopackets out of a Phenopacket Store release ZIP archive without extracting the archive.
+
+    The archive is expected to have the layout of the Phenopacket Store releases,
+    where the phenopacket JSON files of a cohort (e.g. `SUOX`) are stored in a folder named after the cohort.
+
+    The phenopackets are decompressed and parsed by a pool of `n_workers` worker threads,
+    up to `prefetch` phenopackets ahead of the consumer. The phenopackets are yielded
+    in the order of the archive entries.
+
+    :param archive: path to the release ZIP archive.
+      Use :meth:`ppktstore.registry.PhenopacketStoreRegistry.resolve_registry_path`
+      to find the path of a release managed by Phenopacket Store registry.
+    :param cohorts: an iterable with names of the cohorts to include (e.g. `{'SUOX', 'RERE'}`)
+      or `None` if all phenopackets should be included.
+    :param n_workers: a positive `int` with the number of worker threads.
+    :param prefetch: a positive `int` with the maximum number of phenopackets to decompress and parse
+      ahead of the consumer.
+    """
+    if not os.path.isfile(archive):
+        raise ValueError(f"`{archive}` does not point to a file")
+    if n_workers < 1:
+        raise ValueError(f"`n_workers` must be a positive `int` but was {n_workers}")
+    if prefetch < 1:
+        raise ValueError(f"`prefetch` must be a positive `int` but was {prefetch}")
+    included = None if cohorts is None else frozenset(cohorts)
+
+    with zipfile.ZipFile(archive) as zf:
+        entries = [
+            entry
+            for entry in zf.infolist()
+            if _is_phenopacket_entry(entry, included)
+        ]
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=n_workers) as executor:
+            pending: typing.Deque[concurrent.futures.Future] = collections.deque()
+            remaining = iter(entries)
+            try:
+                for entry in remaining:
+                    pending.append(executor.submit(_read_phenopacket, zf, entry))
+                    if len(pending) >= prefetch:
+                        break
+
+                while pending:
+                    pp = pending.popleft().result()
+                    entry = next(remaining, None)
+                    if entry is not None:
+                        pending.append(executor.submit(_read_phenopacket, zf, entry))
+                    yield pp
+            finally:
+                # The consumer may stop early. Drop the work that has not started yet.
+                for future in pending:
+                    future.cancel()
+
+
+def _is_phenopacket_entry(
+    entry: zipfile.ZipInfo,
+    cohorts: typing.Optional[typing.Collection[str]],
+) -> bool:
+    if entry.is_dir() or not entry.filename.endswith(".json"):
+        return False
+    if cohorts is None:
+        return True
+    cohort = posixpath.basename(posixpath.dirname(entry.filename))
+    return cohort in cohorts
+
+
+def _read_phenopacket(
+    zf: zipfile.ZipFile,
+    entry: zipfile.ZipInfo,
+) -> Phenopacket:
+    # The shared parser compiles its plans under a lock, hence the workers can parse the first phenopackets at once.
+    return parse_phenopacket(zf.read(entry))
@@ -0,0 +1,337 @@
+import json
+import logging
+import os
+import typing
+import zipfile
+
+import hpotk
+import numpy as np
+
+from hpotk.graph import IndexedOntologyGraph
+from hpotk.ontology import create_minimal_ontology
+
+
+SNAPSHOT_FORMAT = 1
+"""
+The version of the snapshot layout. The snapshots with a different format are rebuilt.
+"""
+
+
+class CsrAdjacency:
+    """
+    An immutable compressed sparse row (CSR) array of node indices.
+
+    The indices of the `row`-th node are stored in `data[indptr[row]:indptr[row + 1]]`.
+    """
+
+    # NOT PART OF THE PUBLIC API
+
+    def __init__(
+        self,
+        indptr: np.ndarray,
+        data: np.ndarray,
+    ):
+        self._indptr = indptr
+        self._data = data
+
+    @staticmethod
+    def from_rows(
+        rows: typing.Sequence[typing.Sequence[int]],
+    ) -> "CsrAdjacency":
+        indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum([len(row) for row in rows], out=indptr[1:])
+        data = np.fromiter(
+            (idx for row in rows for idx in row),
+            dtype=np.int32,
+            count=int(indptr[-1]),
+        )
+        return CsrAdjacency(indptr, data)
+
+    @property
+    def indptr(self) -> np.ndarray:
+        return self._indptr
+
+    @property
+    def data(self) -> np.ndarray:
+        return self._data
+
+    def row(self, idx: int) -> np.ndarray:
+        return self._data[self._indptr[idx]:self._indptr[idx + 1]]
+
+
+class SnapshotOntologyGraph(IndexedOntologyGraph[hpotk.TermId]):
+    """
+    `SnapshotOntologyGraph` is an ontology graph backed by the CSR arrays of a HPO snapshot.
+
+    Besides the parent and child adjacency, the graph stores the precomputed ancestor and descendant closures,
+    hence the ancestors and descendants of a term are looked up instead of traversing the graph.
+    The closures list the nodes in the same order as the graph traversal of hpo-toolkit.
+    """
+
+    def __init__(
+        self,
+        root: int,
+        nodes: typing.Sequence[hpotk.TermId],
+        parents: CsrAdjacency,
+        children: CsrAdjacency,
+        ancestors: CsrAdjacency,
+        descendants: CsrAdjacency,
+    ):
+        assert isinstance(root, int)
+        self._root = root
+        self._nodes = tuple(nodes)
+        self._node_to_idx = {node: i for i, node in enumerate(self._nodes)}
+        self._parents = parents
+        self._children = children
+        self._ancestors = ancestors
+        self._descendants = descendants
+
+    @property
+    def root_idx(self) -> int:
+        return self._root
+
+    def get_children_idx(self, source: int) -> typing.Sequence[int]:
+        return self._children.row(source)
+
+    def get_descendant_idx(self, source: int) -> typing.Iterator[int]:
+        return iter(self._descendants.row(source))
+
+    def get_parents_idx(self, source: int) -> typing.Sequence[int]:
+        return self._parents.row(source)
+
+    def get_ancestor_idx(self, source: int) -> typing.Iterator[int]:
+        return iter(self._ancestors.row(source))
+
+    def is_ancestor_of_idx(self, sub: int, obj: int) -> bool:
+        return bool(np.any(self._ancestors.row(obj) == sub))
+
+    def is_descendant_of_idx(self, sub: int, obj: int) -> bool:
+        return bool(np.any(self._ancestors.row(sub) == obj))
+
+    def idx_to_node(self, idx: int) -> hpotk.TermId:
+        return self._nodes[idx]
+
+    def node_to_idx(self, node: hpotk.TermId) -> typing.Optional[int]:
+        return self._node_to_idx.get(node)
+
+    def __iter__(self) -> typing.Iterator[hpotk.TermId]:
+        return iter(self._nodes)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __repr__(self) -> str:
+        return f"SnapshotOntologyGraph(root={self.root.value}, n_nodes={len(self._nodes)})"
+
+
+def write_snapshot(
+    hpo: hpotk.MinimalOntology,
+    fh: typing.BinaryIO,
+):
+    """
+    Write a compact snapshot of the `hpo` into a binary file handle.
+
+    The snapshot consists of a term table with the primary and the alternate term IDs, the names,
+    and the version, and of CSR arrays with the parents, children, ancestors, and descendants of the graph nodes.
+    """
+    terms = list(hpo.terms)
+    term_to_idx = {term.identifier: i for i, term in enumerate(terms)}
+    table = {
+        "format": SNAPSHOT_FORMAT,
+        "version": hpo.version,
+        "curies": [term.identifier.value for term in terms],
+        "names": [term.name for term in terms],
+        "alt_term_ids": {
+            str(i): [alt.value for alt in term.alt_term_ids]
+            for i, term in enumerate(terms)
+            if len(term.alt_term_ids) > 0
+        },
+    }
+
+    graph = hpo.graph
+    nodes = list(graph)
+    node_to_idx = {node: i for i, node in enumerate(nodes)}
+    parents = [[node_to_idx[p] for p in graph.get_parents(node)] for node in nodes]
+    children = [[node_to_idx[c] for c in graph.get_children(node)] for node in nodes]
+
+    arrays = {
+        "terms": np.frombuffer(json.dumps(table).encode("utf-8"), dtype=np.uint8),
+        "nodes": np.array([term_to_idx[node] for node in nodes], dtype=np.int32),
+        "root": np.array([node_to_idx[graph.root]], dtype=np.int32),
+    }
+    for name, rows in (
+        ("parents", parents),
+        ("children", children),
+        ("ancestors", [_traverse(i, parents) for i in range(len(nodes))]),
+        ("descendants", [_traverse(i, children) for i in range(len(nodes))]),
+    ):
+        csr = CsrAdjacency.from_rows(rows)
+        arrays[f"{name}_indptr"] = csr.indptr
+        arrays[f"{name}_data"] = csr.data
+
+    np.savez(fh, **arrays)
+
+
+def read_snapshot(
+    fh: typing.BinaryIO,
+) -> hpotk.MinimalOntology:
+    """
+    Read the HPO snapshot written by :func:`write_snapshot`.
+
+    :raises ValueError: if the snapshot has an unsupported format.
+    """
+    with np.load(fh, allow_pickle=False) as npz:
+        table = json.loads(npz["terms"].tobytes().decode("utf-8"))
+        if table.get("format") != SNAPSHOT_FORMAT:
+            raise ValueError(f"Unsupported HPO snapshot format {table.get('format')}")
+
+        alt_term_ids = table["alt_term_ids"]
+        terms = []
+        for i, (curie, name) in enumerate(zip(table["curies"], table["names"])):
+            alts = alt_term_ids.get(str(i), ())
+            terms.append(
+                hpotk.MinimalTerm.create_minimal_term(
+                    term_id=hpotk.TermId.from_curie(curie),
+                    name=name,
+                    alt_term_ids=[hpotk.TermId.from_curie(alt) for alt in alts],
+                    is_obsolete=False,
+                )
+            )
+
+        graph = SnapshotOntologyGraph(
+            root=int(npz["root"][0]),
+            nodes=[terms[i].identifier for i in npz["nodes"]],
+            parents=CsrAdjacency(npz["parents_indptr"], npz["parents_data"]),
+            children=CsrAdjacency(npz["children_indptr"], npz["children_data"]),
+            ancestors=CsrAdjacency(npz["ancestors_indptr"], npz["ancestors_data"]),
+            descendants=CsrAdjacency(npz["descendants_indptr"], npz["descendants_data"]),
+        )
+
+    return create_minimal_ontology(graph, terms, table["version"])
+
+
+def _traverse(
+    source: int,
+    adjacency: typing.Sequence[typing.Sequence[int]],
+) -> typing.Sequence[int]:
+    # Mirrors the depth-first traversal of hpo-toolkit's CSR graph
+    # to keep the order of ancestors and descendants.
+    seen = set(adjacency[source])
+    buffer = list(adjacency[source])
+    visited = []
+    while buffer:
+        current = buffer.pop()
+        for idx in adjacency[current]:
+            if idx not in seen:
+                seen.add(idx)
+                buffer.append(idx)
+        visited.append(current)
+
+    return visited
+
+
+class HpoSnapshotStore:
+    """
+    `HpoSnapshotStore` persists preprocessed snapshots of HPO releases in a cache folder.
+
+    Loading HPO from a snapshot skips parsing of the Obographs JSON file and building of the ontology graph,
+    and it is several times faster than loading the `hp.json` file.
+    The snapshots are keyed by the HPO version (e.g. `2024-04-26`). A leading `v` of the release tag is ignored,
+    so `v2024-04-26` and `2024-04-26` point to the same snapshot.
+
+    Use :func:`~gpsea.preprocessing.configure_hpo_snapshot_store` to create the store
+    in the GPSEA cache directory.
+
+    :param store_dir: path to the folder for storing the snapshots.
+    :param ontology_store: hpo-toolkit's :class:`~hpotk.store.OntologyStore` for fetching the HPO releases
+      that have no snapshot yet.
+    """
+
+    def __init__(
+        self,
+        store_dir: str,
+        ontology_store: hpotk.store.OntologyStore,
+    ):
+        self._logger = logging.getLogger(__name__)
+        self._store_dir = store_dir
+        assert isinstance(ontology_store, hpotk.store.OntologyStore)
+        self._ontology_store = ontology_store
+
+    @property
+    def store_dir(self) -> str:
+        return self._store_dir
+
+    def snapshot_path(
+        self,
+        release: str,
+    ) -> str:
+        """
+        Get path to the snapshot of the HPO `release`. The snapshot does not need to exist.
+        """
+        version = release[1:] if release.startswith("v") else release
+        return os.path.join(self._store_dir, f"hp.{version}.npz")
+
+    def load_minimal_hpo(
+        self,
+        release: typing.Optional[str] = None,
+        fpath_hpo: typing.Optional[str] = None,
+    ) -> hpotk.MinimalOntology:
+        """
+        Load HPO `release` from the snapshot, or prepare the snapshot if the release has been not seen yet.
+
+        If the snapshot does not exist, the HPO is loaded from `fpath_hpo`, if provided,
+        or fetched by the ontology store. Then, the snapshot is stored under the HPO version.
+
+        :param release: a `str` with the HPO release (e.g. `v2024-04-26`) or `None` for the latest release.
+          The latest release is always loaded by the ontology store, since its version is not known in advance.
+        :param fpath_hpo: an optional path to the Obographs JSON file with the HPO `release`.
+        """
+        if release is not None:
+            hpo = self._read(self.snapshot_path(release))
+            if hpo is not None:
+                return hpo
+
+        if fpath_hpo is None:
+            hpo = self._ontology_store.load_minimal_hpo(release=release)
+        else:
+            hpo = hpotk.load_minimal_ontology(fpath_hpo)
+
+        if hpo.version is None:
+            self._logger.warning("Skipping the snapshot of HPO with an unknown version")
+        else:
+            self.save(hpo)
+
+        return hpo
+
+    def save(
+        self,
+        hpo: hpotk.MinimalOntology,
+    ):
+        """
+        Store a snapshot of the `hpo` under its version.
+
+        The snapshot is written into a temporary file first, and then moved into place.
+        """
+        if hpo.version is None:
+            raise ValueError("Cannot store a snapshot of HPO with an unknown version")
+
+        os.makedirs(self._store_dir, exist_ok=True)
+        path = self.snapshot_path(hpo.version)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as fh:
+            write_snapshot(hpo, fh)
+        os.replace(tmp_path, path)
+
+    def _read(
+        self,
+        path: str,
+    ) -> typing.Optional[hpotk.MinimalOntology]:
+        if not os.path.isfile(path):
+            return None
+
+        try:
+            with open(path, "rb") as fh:
+                return read_snapshot(fh)
+        except (ValueError, KeyError, OSError, zipfile.BadZipFile) as e:
+            self._logger.warning("Ignoring unreadable HPO snapshot at %s: %s", path, e)
+            return None
@@ -0,0 +1,247 @@
+import hashlib
+import json
+import logging
+import os
+import typing
+
+from stairval import Level
+from stairval.notepad import Notepad, create_notepad
+
+# pyright: reportGeneralTypeIssues=false
+from phenopackets import Phenopacket
+
+import gpsea
+from gpsea.model import Patient
+
+from ._caching import Cache
+from ._patient import PatientCreator
+from ._phenopacket import PhenopacketPatientCreator
+from ._pp_json import parse_phenopacket
+
+
+class PhenopacketFileManifest:
+    """
+    `PhenopacketFileManifest` keeps track of the content digests of phenopacket files.
+
+    The digest of a file is reused as long as the file size and the modification time do not change,
+    to prevent reading and hashing the unchanged files in the subsequent runs.
+
+    :param path: path to the JSON file with the manifest. The file does not need to exist.
+    """
+
+    def __init__(
+        self,
+        path: str,
+    ):
+        self._path = path
+        self._entries: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
+        if os.path.isfile(path):
+            with open(path) as fh:
+                self._entries.update(json.load(fh)["files"])
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def digest(
+        self,
+        pp_path: str,
+        payload: typing.Optional[bytes] = None,
+    ) -> str:
+        """
+        Get the SHA-256 digest of the file content.
+
+        :param pp_path: path to the phenopacket file.
+        :param payload: the file content or `None` if the content has not been read yet.
+        """
+        key = os.path.abspath(pp_path)
+        stat = os.stat(pp_path)
+        entry = self._entries.get(key)
+        if (
+            entry is not None
+            and entry["size"] == stat.st_size
+            and entry["mtime_ns"] == stat.st_mtime_ns
+        ):
+            return entry["digest"]
+
+        if payload is None:
+            with open(pp_path, "rb") as fh:
+                payload = fh.read()
+        digest = hashlib.sha256(payload).hexdigest()
+        self._entries[key] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "digest": digest,
+        }
+        return digest
+
+    def save(self):
+        """
+        Write the manifest to the file system.
+
+        The manifest is written into a temporary file first, and then moved into place.
+        """
+        tmp_path = f"{self._path}.tmp"
+        with open(tmp_path, "w") as fh:
+            json.dump({"files": self._entries}, fh, indent=2, sort_keys=True)
+        os.replace(tmp_path, self._path)
+
+
+class IncrementalPatientCreator(PatientCreator[str]):
+    """
+    `IncrementalPatientCreator` creates a :class:`~gpsea.model.Patient` from a path to phenopacket JSON file
+    and caches the patient along with the Q/C issues.
+
+    The cache entry is keyed by the phenopacket content digest and by the configuration of the patient creator
+    (HPO version, genome build, validators, etc.). Therefore, only the new or the changed phenopackets
+    are processed by the `patient_creator`. The issues are replayed into the notepad for the cached patients,
+    to report the same Q/C results as the fresh run.
+
+    :param patient_creator: the patient creator for processing the new or changed phenopackets.
+    :param cache: the cache for storing the patients and their issues.
+    :param manifest: the manifest for tracking the file digests.
+    """
+
+    def __init__(
+        self,
+        patient_creator: PatientCreator[Phenopacket],
+        cache: Cache[typing.Mapping[str, typing.Any]],
+        manifest: PhenopacketFileManifest,
+    ):
+        self._logger = logging.getLogger(__name__)
+        assert isinstance(patient_creator, PatientCreator)
+        self._pc = patient_creator
+        assert isinstance(cache, Cache)
+        self._cache = cache
+        assert isinstance(manifest, PhenopacketFileManifest)
+        self._manifest = manifest
+        self._configuration_digest = hashlib.sha256(
+            summarize_patient_creator(patient_creator).encode()
+        ).hexdigest()
+
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def manifest(self) -> PhenopacketFileManifest:
+        return self._manifest
+
+    @property
+    def hits(self) -> int:
+        """
+        Get the number of the patients loaded from the cache.
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """
+        Get the number of the patients created by the underlying patient creator.
+        """
+        return self._misses
+
+    def process(
+        self,
+        item: str,
+        notepad: Notepad,
+    ) -> typing.Optional[Patient]:
+        digest = self._manifest.digest(item)
+        key = hashlib.sha256(
+            f"{self._configuration_digest}:{digest}".encode()
+        ).hexdigest()
+
+        entry = self._cache.load_item(key)
+        if entry is None:
+            self._misses += 1
+            with open(item, "rb") as fh:
+                pp = parse_phenopacket(fh.read())
+
+            # Process into a detached notepad to record the issues of the patient.
+            scratch = create_notepad(label=notepad.label)
+            patient = self._pc.process(pp, scratch)
+            entry = {
+                "patient": patient,
+                "sections": dump_notepad_sections(scratch),
+            }
+            self._cache.store_item(key, entry)
+        else:
+            self._hits += 1
+
+        replay_notepad_sections(entry["sections"], notepad)
+
+        return entry["patient"]
+
+
+def summarize_patient_creator(
+    patient_creator: PatientCreator,
+) -> str:
+    """
+    Summarize the configuration of the patient creator into a `str`.
+
+    The summary includes GPSEA version, since the patient model can change between the releases.
+    """
+    parts = [
+        f"gpsea={gpsea.__version__}",
+        f"creator={type(patient_creator).__module__}.{type(patient_creator).__qualname__}",
+    ]
+    if isinstance(patient_creator, PhenopacketPatientCreator):
+        hpo = patient_creator._phenotype_creator._hpo
+        parts.append(f"hpo={hpo.version}")
+        parts.append(f"build={patient_creator._coord_finder._build.identifier}")
+        parts.append(
+            "validators=" + ",".join(
+                type(v).__qualname__ for v in getattr(patient_creator._validator, "_validators", ())
+            )
+        )
+        parts.append(f"term_onset_parser={patient_creator._term_onset_parser is not None}")
+        parts.append(f"functional_annotator={type(patient_creator._functional_annotator).__qualname__}")
+        parts.append(
+            f"imprecise_sv_functional_annotator={type(patient_creator._imprecise_sv_functional_annotator).__qualname__}"
+        )
+
+    return ";".join(parts)
+
+
+def dump_notepad_sections(
+    notepad: Notepad,
+) -> typing.Sequence[typing.Mapping[str, typing.Any]]:
+    """
+    Dump the notepad subsections and their issues into a JSON-friendly form.
+
+    The sections are listed in the depth-first order, each with a path of labels relative to `notepad`.
+    """
+    sections = []
+    stack: typing.List[typing.Tuple[typing.Tuple[typing.Union[str, int], ...], Notepad]] = [((), notepad)]
+    while stack:
+        path, node = stack.pop()
+        sections.append(
+            {
+                "path": list(path),
+                "issues": [
+                    {
+                        "level": issue.level.name,
+                        "message": issue.message,
+                        "solution": issue.solution,
+                    }
+                    for issue in node.issues
+                ],
+            }
+        )
+        for sub in reversed(node.get_subsections()):
+            stack.append((path + (sub.label,), sub))
+
+    return sections
+
+
+def replay_notepad_sections(
+    sections: typing.Iterable[typing.Mapping[str, typing.Any]],
+    notepad: Notepad,
+):
+    """
+    Recreate the sections and issues dumped by :func:`dump_notepad_sections` in the `notepad`.
+    """
+    for section in sections:
+        path = section["path"]
+        node = notepad.add_subsections(*path)[-1] if len(path) > 0 else notepad
+        for issue in section["issues"]:
+            node.add_issue(Level[issue["level"]], issue["message"], issue["solution"])
@@ -43,6 +43,13 @@ class CohortCreator(typing.Generic[T]):
         assert isinstance(patient_creator, PatientCreator)
         self._pc = patient_creator
 
+    @property
+    def patient_creator(self) -> PatientCreator[T]:
+        """
+        Get the patient creator used to process the cohort members.
+        """
+        return self._pc
+
     def process(
         self,
         inputs: typing.Iterable[T],
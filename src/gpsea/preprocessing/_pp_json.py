@@ -0,0 +1,309 @@
+import base64
+import json
+import threading
+import typing
+
+from google.protobuf.descriptor import Descriptor, FieldDescriptor
+from google.protobuf.json_format import ParseDict, ParseError
+from google.protobuf.message import Message
+from google.protobuf import symbol_database
+
+# pyright: reportGeneralTypeIssues=false
+from phenopackets import Phenopacket
+
+M = typing.TypeVar("M", bound=Message)
+
+_INT_TYPES = frozenset(
+    (
+        FieldDescriptor.TYPE_INT32,
+        FieldDescriptor.TYPE_INT64,
+        FieldDescriptor.TYPE_UINT32,
+        FieldDescriptor.TYPE_UINT64,
+        FieldDescriptor.TYPE_SINT32,
+        FieldDescriptor.TYPE_SINT64,
+        FieldDescriptor.TYPE_FIXED32,
+        FieldDescriptor.TYPE_FIXED64,
+        FieldDescriptor.TYPE_SFIXED32,
+        FieldDescriptor.TYPE_SFIXED64,
+    )
+)
+_FLOAT_TYPES = frozenset((FieldDescriptor.TYPE_FLOAT, FieldDescriptor.TYPE_DOUBLE))
+
+
+class ProtobufJsonParser(typing.Generic[M]):
+    """
+    `ProtobufJsonParser` decodes JSON into a protobuf message of a given type
+    without the reflection overhead of :func:`google.protobuf.json_format.Parse`.
+
+    The parser compiles a conversion plan for each message descriptor on first use.
+    The plan maps both the JSON (`camelCase`) and the proto (`snake_case`) field names
+    to a converter which turns the JSON value into a constructor argument.
+    The message is then built with a single constructor call.
+
+    Well-known types (e.g. `Timestamp`) are delegated to :func:`google.protobuf.json_format.ParseDict`.
+
+    The parser can be shared by several threads. A plan is compiled under a lock
+    and made visible to the other threads only when it is complete.
+
+    The parser produces the same messages as :func:`google.protobuf.json_format.Parse`
+    and raises :class:`google.protobuf.json_format.ParseError` for unknown fields or malformed values.
+
+    :param message_type: the type of the top-level message, e.g. `Phenopacket`.
+    """
+
+    def __init__(
+        self,
+        message_type: typing.Type[M],
+    ):
+        assert issubclass(message_type, Message)
+        self._message_type = message_type
+        self._plans: typing.Dict[str, "_MessagePlan"] = {}
+        self._lock = threading.RLock()
+
+    def parse(
+        self,
+        payload: typing.Union[str, bytes],
+    ) -> M:
+        """
+        Parse a JSON document into a message.
+
+        :param payload: a `str` or `bytes` with the JSON document.
+        """
+        try:
+            js = json.loads(payload)
+        except ValueError as e:
+            raise ParseError(f"Failed to load JSON: {e}") from e
+        return self.parse_dict(js)
+
+    def parse_dict(
+        self,
+        js: typing.Mapping[str, typing.Any],
+    ) -> M:
+        """
+        Build a message from a JSON object that has already been decoded into a `dict`.
+        """
+        plan = self._get_plan(self._message_type.DESCRIPTOR)
+        kwargs = plan.convert(js, path=self._message_type.DESCRIPTOR.name)
+        try:
+            return self._message_type(**kwargs)
+        except (TypeError, ValueError) as e:
+            raise ParseError(str(e)) from e
+
+    def _get_plan(self, descriptor: Descriptor) -> "_MessagePlan":
+        plan = self._plans.get(descriptor.full_name)
+        if plan is None:
+            with self._lock:
+                plan = self._plans.get(descriptor.full_name)
+                if plan is None:
+                    # The plans of the message fields are looked up when converting the first value,
+                    # hence compiling a recursive message does not need its own plan.
+                    plan = _MessagePlan(descriptor)
+                    plan.compile(self)
+                    # The other threads read the plans without the lock,
+                    # hence we publish the plan only after it is compiled.
+                    self._plans[descriptor.full_name] = plan
+        return plan
+
+
+class _MessagePlan:
+    # NOT PART OF THE PUBLIC API
+
+    def __init__(
+        self,
+        descriptor: Descriptor,
+    ):
+        self._descriptor = descriptor
+        self._fields: typing.Dict[
+            str,
+            typing.Tuple[str, typing.Optional[str], typing.Callable[[typing.Any, str], typing.Any]],
+        ] = {}
+
+    def compile(
+        self,
+        parser: ProtobufJsonParser,
+    ):
+        for field in self._descriptor.fields:
+            oneof = None if field.containing_oneof is None else field.containing_oneof.name
+            entry = (field.name, oneof, _make_field_converter(field, parser))
+            self._fields[field.name] = entry
+            self._fields[field.json_name] = entry
+
+    def convert(
+        self,
+        js: typing.Any,
+        path: str,
+    ) -> typing.Dict[str, typing.Any]:
+        if not isinstance(js, dict):
+            raise ParseError(f"Message type \"{self._descriptor.full_name}\" must be a JSON object at {path}")
+
+        kwargs = {}
+        oneofs = None
+        for key, value in js.items():
+            entry = self._fields.get(key)
+            if entry is None:
+                raise ParseError(
+                    f"Message type \"{self._descriptor.full_name}\" has no field named \"{key}\" at \"{path}\"."
+                )
+            name, oneof, converter = entry
+            if value is None:
+                # `null` leaves the field at its default value.
+                continue
+            if oneof is not None:
+                if oneofs is None:
+                    oneofs = set()
+                elif oneof in oneofs:
+                    raise ParseError(
+                        f"Message type \"{self._descriptor.full_name}\" should not have multiple \"{oneof}\" oneof fields at \"{path}\"."
+                    )
+                oneofs.add(oneof)
+            kwargs[name] = converter(value, f"{path}.{key}")
+
+        return kwargs
+
+
+def _make_field_converter(
+    field: FieldDescriptor,
+    parser: ProtobufJsonParser,
+) -> typing.Callable[[typing.Any, str], typing.Any]:
+    if field.message_type is not None and field.message_type.GetOptions().map_entry:
+        key_converter = _make_single_converter(field.message_type.fields_by_name["key"], parser)
+        value_converter = _make_single_converter(field.message_type.fields_by_name["value"], parser)
+
+        def convert_map(value: typing.Any, path: str) -> typing.Any:
+            if not isinstance(value, dict):
+                raise ParseError(f"Map field must be a JSON object at {path}")
+            return {
+                key_converter(k, path): value_converter(v, f"{path}[{k}]")
+                for k, v in value.items()
+            }
+
+        return convert_map
+
+    converter = _make_single_converter(field, parser)
+    if _is_repeated(field):
+
+        def convert_repeated(value: typing.Any, path: str) -> typing.Any:
+            if not isinstance(value, list):
+                raise ParseError(f"Repeated field must be a JSON array at {path}")
+            return [converter(item, f"{path}[{i}]") for i, item in enumerate(value)]
+
+        return convert_repeated
+
+    return converter
+
+
+def _is_repeated(field: FieldDescriptor) -> bool:
+    # `FieldDescriptor.label` is deprecated in the recent protobuf releases.
+    is_repeated = getattr(field, "is_repeated", None)
+    if is_repeated is None:
+        return field.label == FieldDescriptor.LABEL_REPEATED
+    return is_repeated
+
+
+def _make_single_converter(
+    field: FieldDescriptor,
+    parser: ProtobufJsonParser,
+) -> typing.Callable[[typing.Any, str], typing.Any]:
+    if field.type == FieldDescriptor.TYPE_MESSAGE:
+        message_type = field.message_type
+        if message_type.full_name.startswith("google.protobuf."):
+            # Well-known types have special JSON mappings that `ParseDict` knows about.
+            message_class = symbol_database.Default().GetSymbol(message_type.full_name)
+
+            def convert_wkt(value: typing.Any, path: str) -> typing.Any:
+                return ParseDict(value, message_class())
+
+            return convert_wkt
+
+        plan = None
+
+        def convert_message(value: typing.Any, path: str) -> typing.Any:
+            nonlocal plan
+            if plan is None:
+                plan = parser._get_plan(message_type)
+            return plan.convert(value, path)
+
+        return convert_message
+    elif field.type == FieldDescriptor.TYPE_ENUM:
+        values_by_name = {v.name: v.number for v in field.enum_type.values}
+        numbers = frozenset(values_by_name.values())
+
+        def convert_enum(value: typing.Any, path: str) -> typing.Any:
+            if isinstance(value, str):
+                number = values_by_name.get(value)
+                if number is None:
+                    raise ParseError(f"Invalid enum value {value} for enum type {field.enum_type.full_name} at {path}")
+                return number
+            elif isinstance(value, int) and not isinstance(value, bool):
+                if value not in numbers:
+                    raise ParseError(f"Invalid enum value {value} for enum type {field.enum_type.full_name} at {path}")
+                return value
+            raise ParseError(f"Invalid enum value {value} for enum type {field.enum_type.full_name} at {path}")
+
+        return convert_enum
+    elif field.type in _INT_TYPES:
+        return _convert_int
+    elif field.type in _FLOAT_TYPES:
+        return _convert_float
+    elif field.type == FieldDescriptor.TYPE_BOOL:
+        return _convert_bool
+    elif field.type == FieldDescriptor.TYPE_STRING:
+        return _convert_str
+    elif field.type == FieldDescriptor.TYPE_BYTES:
+        return _convert_bytes
+    else:
+        raise ValueError(f"Unsupported field type {field.type} of {field.full_name}")
+
+
+def _convert_int(value: typing.Any, path: str) -> int:
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        # 64-bit integers are encoded as strings in JSON.
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    elif isinstance(value, float) and value.is_integer():
+        return int(value)
+    raise ParseError(f"Couldn't parse integer: {value} at {path}")
+
+
+def _convert_float(value: typing.Any, path: str) -> float:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if value in ("NaN", "Infinity", "-Infinity"):
+        return float(value)
+    raise ParseError(f"Couldn't parse float: {value} at {path}")
+
+
+def _convert_bool(value: typing.Any, path: str) -> bool:
+    if isinstance(value, bool):
+        return value
+    raise ParseError(f"Expected true or false without quotes at {path}")
+
+
+def _convert_str(value: typing.Any, path: str) -> str:
+    if isinstance(value, str):
+        return value
+    raise ParseError(f"Invalid string value {value} at {path}")
+
+
+def _convert_bytes(value: typing.Any, path: str) -> bytes:
+    if isinstance(value, str):
+        # Accept both the standard and the URL-safe alphabets, with or without the padding.
+        value = value.replace("-", "+").replace("_", "/")
+        return base64.b64decode(value + "=" * (-len(value) % 4))
+    raise ParseError(f"Invalid bytes value {value} at {path}")
+
+
+_PHENOPACKET_PARSER = ProtobufJsonParser(Phenopacket)
+
+
+def parse_phenopacket(
+    payload: typing.Union[str, bytes],
+) -> Phenopacket:
+    """
+    Parse a phenopacket JSON document using a shared :class:`ProtobufJsonParser`.
+    """
+    return _PHENOPACKET_PARSER.parse(payload)
@@ -0,0 +1,170 @@
+import typing
+
+import hpotk
+
+from hpotk.constants.hpo.base import PHENOTYPIC_ABNORMALITY
+from hpotk.validate import (
+    ValidationRunner,
+    ValidationLevel,
+    ValidationResult,
+    ValidationResults,
+    ObsoleteTermIdsValidator,
+    AnnotationPropagationValidator,
+    PhenotypicAbnormalityValidator,
+)
+
+
+class CachingValidationRunner(ValidationRunner):
+    """
+    `CachingValidationRunner` checks HPO terms of a patient for obsolete term IDs, violation of the annotation
+    propagation rule, and for terms that are not descendants of Phenotypic abnormality [HP:0000118].
+
+    The runner reports the same issues as hpo-toolkit's :class:`~hpotk.validate.ValidationRunner`
+    configured with :class:`~hpotk.validate.ObsoleteTermIdsValidator`,
+    :class:`~hpotk.validate.AnnotationPropagationValidator`,
+    and :class:`~hpotk.validate.PhenotypicAbnormalityValidator`.
+    However, the mapping from obsolete to primary term IDs and the set of phenotypic abnormalities
+    are precomputed when creating the runner, the term ancestors are computed once per term,
+    and the results are memoized for each distinct combination of the term IDs and their presence/exclusion status.
+    In result, the validation of a large cohort is paid once per distinct annotation pattern.
+
+    :param hpo: HPO as :class:`~hpotk.MinimalOntology`.
+    """
+
+    def __init__(
+        self,
+        hpo: hpotk.MinimalOntology,
+    ):
+        # We keep the validators around for introspection,
+        # but the validation is done by the runner itself.
+        super().__init__(
+            (
+                ObsoleteTermIdsValidator(hpo),
+                AnnotationPropagationValidator(hpo),
+                PhenotypicAbnormalityValidator(hpo),
+            )
+        )
+        self._hpo = hpo
+
+        self._primary_term_ids: typing.Dict[hpotk.TermId, hpotk.TermId] = {}
+        for term in hpo.terms:
+            self._primary_term_ids[term.identifier] = term.identifier
+            for alt_id in term.alt_term_ids:
+                self._primary_term_ids[alt_id] = term.identifier
+
+        self._phenotypic_abnormalities = frozenset(
+            hpo.graph.get_descendants(PHENOTYPIC_ABNORMALITY)
+        )
+        self._ancestors: typing.Dict[hpotk.TermId, typing.Sequence[hpotk.TermId]] = {}
+        self._cache: typing.Dict[
+            typing.Tuple[typing.Tuple[hpotk.TermId, bool], ...],
+            ValidationResults,
+        ] = {}
+
+    @property
+    def cache_size(self) -> int:
+        """
+        Get the number of the distinct annotation patterns seen by the runner.
+        """
+        return len(self._cache)
+
+    def validate_all(
+        self,
+        items: typing.Sequence[typing.Union[hpotk.model.Identified, hpotk.TermId]],
+    ) -> ValidationResults:
+        key = tuple(_to_stateful_feature(item) for item in items)
+        results = self._cache.get(key)
+        if results is None:
+            results = ValidationResults(self._validate(key))
+            self._cache[key] = results
+
+        return results
+
+    def _validate(
+        self,
+        features: typing.Sequence[typing.Tuple[hpotk.TermId, bool]],
+    ) -> typing.Sequence[ValidationResult]:
+        results = []
+        primary = []
+        for term_id, is_present in features:
+            primary_id = self._primary_term_ids.get(term_id)
+            if primary_id is None:
+                # Not in HPO. Handling unknown term IDs is not the responsibility of the runner.
+                continue
+            if primary_id != term_id:
+                results.append(
+                    ValidationResult(
+                        level=ValidationLevel.WARNING,
+                        category="obsolete_term_id_is_used",
+                        message=f"Using the obsolete {term_id.value} instead of {primary_id.value} "
+                        f"for {self._term_name(primary_id)}",
+                    )
+                )
+            primary.append((primary_id, is_present))
+
+        present = {term_id for term_id, is_present in primary if is_present}
+        excluded = {term_id for term_id, is_present in primary if not is_present}
+        annotated = present | excluded
+        for term_id, is_present in primary:
+            # A present feature cannot coexist with a present or excluded ancestor,
+            # and an excluded feature cannot coexist with an excluded ancestor.
+            violating = annotated if is_present else excluded
+            status = "present" if is_present else "excluded"
+            for anc in self._get_ancestors(term_id):
+                if anc in violating:
+                    results.append(
+                        ValidationResult(
+                            level=ValidationLevel.ERROR,
+                            category="annotation_propagation",
+                            message=f"Terms should not contain both {status} "
+                            f"{self._term_name(term_id)} [{term_id.value}] "
+                            f"and its present or excluded ancestor "
+                            f"{self._term_name(anc)} [{anc.value}]",
+                        )
+                    )
+
+        for term_id, _ in primary:
+            if term_id not in self._phenotypic_abnormalities:
+                results.append(
+                    ValidationResult(
+                        level=ValidationLevel.WARNING,
+                        category="phenotypic_abnormality_descendant",
+                        message=f"{self._term_name(term_id)} [{term_id.value}] "
+                        f"is not a descendant of Phenotypic abnormality [{PHENOTYPIC_ABNORMALITY.value}]",
+                    )
+                )
+
+        return results
+
+    def _get_ancestors(
+        self,
+        term_id: hpotk.TermId,
+    ) -> typing.Sequence[hpotk.TermId]:
+        ancestors = self._ancestors.get(term_id)
+        if ancestors is None:
+            ancestors = tuple(self._hpo.graph.get_ancestors(term_id))
+            self._ancestors[term_id] = ancestors
+        return ancestors
+
+    def _term_name(
+        self,
+        term_id: hpotk.TermId,
+    ) -> str:
+        term = self._hpo.get_term(term_id)
+        return "" if term is None else term.name
+
+
+def _to_stateful_feature(
+    item: typing.Union[hpotk.model.Identified, hpotk.TermId],
+) -> typing.Tuple[hpotk.TermId, bool]:
+    if isinstance(item, hpotk.TermId):
+        return item, True
+    elif isinstance(item, hpotk.model.Identified):
+        is_present = getattr(item, "is_present", True)
+        if callable(is_present):
+            is_present = is_present()
+        if not isinstance(is_present, bool):
+            raise ValueError(f"`is_present` of {item} must be a `bool` but was {type(is_present)}")
+        return item.identifier, is_present
+    else:
+        raise ValueError(f"Item {item} must implement `TermId` or `Identified`")
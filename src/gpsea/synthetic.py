@@ -0,0 +1,598 @@
+"""
+The `gpsea.synthetic` module generates synthetic cohorts for scale and performance testing.
+
+The cohorts mimic the cohorts of real rare disease studies, such as the cohorts of Phenopacket Store,
+but they can be much larger. The individuals are available as a :class:`~gpsea.model.Cohort`
+or as a stream of phenopackets. See :class:`SyntheticCohortGenerator` for more info.
+"""
+
+import typing
+
+import hpotk
+import numpy as np
+
+from phenopackets.schema.v2.phenopackets_pb2 import Phenopacket
+import phenopackets.schema.v2.core.base_pb2 as ppb
+import phenopackets.schema.v2.core.disease_pb2 as ppd
+import phenopackets.schema.v2.core.individual_pb2 as ppi
+import phenopackets.schema.v2.core.interpretation_pb2 as ppint
+import phenopackets.schema.v2.core.meta_data_pb2 as ppm
+import phenopackets.schema.v2.core.phenotypic_feature_pb2 as pppf
+import phenopackets.vrsatile.v1.vrsatile_pb2 as ppv
+
+from .model import Cohort, Patient, SampleLabels, Sex, Age, VitalStatus, Status
+from .model import Phenotype, Disease
+from .model import Variant, VariantInfo, VariantCoordinates, TranscriptAnnotation, VariantEffect
+from .model import Genotype, Genotypes
+from .model.genome import GRCh38, Region
+
+_PHENOTYPIC_ABNORMALITY = hpotk.TermId.from_curie("HP:0000118")
+
+_BASES = ("A", "C", "G", "T")
+_AMINO_ACIDS = (
+    "Ala", "Arg", "Asn", "Asp", "Cys", "Gln", "Glu", "Gly", "His", "Ile",
+    "Leu", "Lys", "Met", "Phe", "Pro", "Ser", "Thr", "Trp", "Tyr", "Val",
+)
+
+# The variant kinds and their relative frequency.
+_VARIANT_KINDS = (
+    ("missense", 0.55),
+    ("stop_gained", 0.15),
+    ("frameshift", 0.15),
+    ("inframe_deletion", 0.07),
+    ("splice_donor", 0.08),
+)
+_TRUNCATING_KINDS = frozenset(("stop_gained", "frameshift", "splice_donor"))
+
+_PP_SEX = {
+    Sex.FEMALE: ppi.Sex.FEMALE,
+    Sex.MALE: ppi.Sex.MALE,
+}
+_PP_VITAL_STATUS = {
+    Status.UNKNOWN: ppi.VitalStatus.UNKNOWN_STATUS,
+    Status.ALIVE: ppi.VitalStatus.ALIVE,
+    Status.DECEASED: ppi.VitalStatus.DECEASED,
+}
+_PP_ALLELIC_STATE = {
+    Genotype.HETEROZYGOUS: ("GENO:0000135", "heterozygous"),
+    Genotype.HOMOZYGOUS_ALTERNATE: ("GENO:0000136", "homozygous"),
+}
+
+
+class SyntheticCohortGenerator:
+    """
+    `SyntheticCohortGenerator` generates cohorts of synthetic individuals
+    with a monogenic disease caused by variants in a synthetic gene.
+
+    The generator first draws a disease profile from the `hpo`:
+
+    * `n_profile_terms` terms from the :math:`Phenotypic abnormality` subhierarchy,
+      each with a frequency of being present in an individual.
+      For a fraction of the terms (`association_rate`), the frequency differs between the carriers
+      of truncating (e.g. stop gain or frameshift) and non-truncating (e.g. missense) variants
+    * a pool of `n_variants` variants with transcript annotations, with a few recurrent variants
+      and a long tail of rare variants
+
+    Then, each individual is assigned:
+
+    * sex
+    * one variant (heterozygous) or, with probability `biallelic_rate`, two variants
+      (homozygous or compound heterozygous)
+    * the present profile terms. A present term is annotated with one of its parents
+      with probability `generalization_rate`, to mimic the annotations of varying specificity
+    * the excluded profile terms. The absent terms are annotated as excluded with probability `excluded_rate`
+    * a number of additional present terms, drawn from a pool of `n_background_terms` terms
+      outside of the disease profile, with mean `mean_extra_terms`
+    * age of the last encounter, and onsets of the present terms (with probability `onset_rate`).
+      The phenotypes of truncating variant carriers tend to manifest earlier
+    * vital status, with probability `deceased_rate` of being deceased
+    * the disease diagnosis with the onset of the earliest phenotype
+
+    The terms follow the annotation propagation rule: a term is not annotated together with its present
+    descendant, and an excluded term is not annotated together with its excluded ancestor.
+
+    The generator is deterministic: the same `seed` and the same `hpo` produce the same cohorts.
+
+    Example
+    ^^^^^^^
+
+    Generate a cohort with 10,000 individuals::
+
+        from gpsea.synthetic import SyntheticCohortGenerator
+
+        generator = SyntheticCohortGenerator(hpo, seed=42)
+        cohort = generator.generate_cohort(n_individuals=10_000)
+
+    :param hpo: HPO to draw the phenotypic features from.
+    :param seed: a non-negative `int` to seed the random number generator.
+    :param n_profile_terms: a positive `int` with the number of terms of the disease profile.
+    :param association_rate: a `float` in :math:`[0, 1]` with the fraction of the profile terms
+      whose frequency depends on the variant type.
+    :param generalization_rate: a `float` in :math:`[0, 1]` with the probability of annotating a present term
+      with its parent.
+    :param excluded_rate: a `float` in :math:`[0, 1]` with the probability of annotating an absent term
+      as excluded.
+    :param n_background_terms: a non-negative `int` with the number of terms outside of the disease profile
+      that can be present in an individual.
+    :param mean_extra_terms: a non-negative `float` with the mean count of the present terms
+      outside of the disease profile.
+    :param onset_rate: a `float` in :math:`[0, 1]` with the probability of knowing the onset of a present term.
+    :param deceased_rate: a `float` in :math:`[0, 1]` with the probability of an individual being deceased.
+    :param biallelic_rate: a `float` in :math:`[0, 1]` with the probability of an individual
+      having two alleles affected.
+    :param n_variants: a positive `int` with the number of distinct variants.
+    :param protein_length: length of the protein encoded by the synthetic gene (in aminoacids).
+    :param n_exons: the number of exons of the synthetic transcript.
+    """
+
+    def __init__(
+        self,
+        hpo: hpotk.MinimalOntology,
+        seed: int = 0,
+        n_profile_terms: int = 30,
+        association_rate: float = 0.5,
+        generalization_rate: float = 0.2,
+        excluded_rate: float = 0.3,
+        n_background_terms: int = 200,
+        mean_extra_terms: float = 1.0,
+        onset_rate: float = 0.5,
+        deceased_rate: float = 0.05,
+        biallelic_rate: float = 0.2,
+        n_variants: int = 200,
+        protein_length: int = 600,
+        n_exons: int = 12,
+        gene_symbol: str = "SYNT1",
+        tx_id: str = "NM_999999.1",
+        protein_id: str = "NP_999999.1",
+        disease_id: str = "OMIM:999999",
+        disease_name: str = "Synthetic syndrome",
+    ):
+        assert isinstance(hpo, hpotk.MinimalOntology)
+        self._hpo = hpo
+        if not isinstance(seed, int) or seed < 0:
+            raise ValueError(f"`seed` must be a non-negative `int` but was {seed}")
+        self._seed = seed
+        for name, value in (
+            ("association_rate", association_rate),
+            ("generalization_rate", generalization_rate),
+            ("excluded_rate", excluded_rate),
+            ("onset_rate", onset_rate),
+            ("deceased_rate", deceased_rate),
+            ("biallelic_rate", biallelic_rate),
+        ):
+            if not isinstance(value, (int, float)) or not 0.0 <= value <= 1.0:
+                raise ValueError(f"`{name}` must be a `float` in [0, 1] but was {value}")
+        if not isinstance(n_background_terms, int) or n_background_terms < 0:
+            raise ValueError(f"`n_background_terms` must be a non-negative `int` but was {n_background_terms}")
+        if not isinstance(mean_extra_terms, (int, float)) or mean_extra_terms < 0.0:
+            raise ValueError(f"`mean_extra_terms` must be a non-negative `float` but was {mean_extra_terms}")
+        for name, value in (
+            ("n_profile_terms", n_profile_terms),
+            ("n_variants", n_variants),
+            ("n_exons", n_exons),
+        ):
+            if not isinstance(value, int) or value <= 0:
+                raise ValueError(f"`{name}` must be a positive `int` but was {value}")
+        if not isinstance(protein_length, int) or protein_length < 2 * n_exons:
+            raise ValueError(
+                f"`protein_length` must be an `int` of at least two aminoacids per exon but was {protein_length}"
+            )
+
+        self._generalization_rate = generalization_rate
+        self._excluded_rate = excluded_rate
+        self._mean_extra_terms = mean_extra_terms
+        self._onset_rate = onset_rate
+        self._deceased_rate = deceased_rate
+        self._biallelic_rate = biallelic_rate
+        self._gene_symbol = gene_symbol
+        self._tx_id = tx_id
+        self._protein_id = protein_id
+        self._disease_id = hpotk.TermId.from_curie(disease_id)
+        self._disease_name = disease_name
+
+        # Sort the terms to get the same profile regardless of the iteration order of the ontology graph.
+        term_pool = tuple(
+            sorted(hpo.graph.get_descendants(_PHENOTYPIC_ABNORMALITY), key=lambda term_id: term_id.value)
+        )
+        if len(term_pool) < n_profile_terms + n_background_terms:
+            raise ValueError(
+                f"`n_profile_terms` {n_profile_terms} and `n_background_terms` {n_background_terms} "
+                "exceed the number of phenotypic abnormalities in HPO"
+            )
+        self._ancestors: typing.Dict[hpotk.TermId, typing.FrozenSet[hpotk.TermId]] = {}
+        self._phenotypes: typing.Dict[typing.Tuple[hpotk.TermId, bool], Phenotype] = {}
+
+        rng = np.random.default_rng([seed, 0])
+        chosen = [
+            term_pool[i]
+            for i in rng.choice(len(term_pool), size=n_profile_terms + n_background_terms, replace=False)
+        ]
+        self._profile_terms = tuple(chosen[:n_profile_terms])
+        self._background_terms = tuple(chosen[n_profile_terms:])
+        self._profile_parents = tuple(
+            tuple(
+                sorted(
+                    (
+                        parent for parent in hpo.graph.get_parents(term_id)
+                        if parent != _PHENOTYPIC_ABNORMALITY
+                        and hpo.graph.is_descendant_of(parent, _PHENOTYPIC_ABNORMALITY)
+                    ),
+                    key=lambda term_id: term_id.value,
+                )
+            )
+            for term_id in self._profile_terms
+        )
+
+        # Frequencies of the profile terms in the carriers of non-truncating (row 0)
+        # and truncating (row 1) variants.
+        base = rng.beta(1.5, 4.0, size=n_profile_terms)
+        shift = rng.normal(0.0, 0.25, size=n_profile_terms)
+        shift[rng.random(n_profile_terms) >= association_rate] = 0.0
+        self._frequencies = np.vstack((base, np.clip(base + shift, 0.02, 0.98)))
+
+        self._variants, self._truncating = self._draw_variant_pool(rng, n_variants, protein_length, n_exons)
+        # Zipf-like weights: a few recurrent variants and a long tail of rare variants.
+        weights = 1.0 / np.arange(1, n_variants + 1) ** 1.1
+        self._variant_weights = weights / weights.sum()
+
+    @property
+    def seed(self) -> int:
+        return self._seed
+
+    @property
+    def profile_terms(self) -> typing.Sequence[hpotk.TermId]:
+        """
+        Get the terms of the disease profile.
+        """
+        return self._profile_terms
+
+    def generate_patients(
+        self,
+        n_individuals: int,
+    ) -> typing.Iterator[Patient]:
+        """
+        Generate a stream of `n_individuals` synthetic individuals.
+
+        The first :math:`k` individuals are the same regardless of the value of `n_individuals`.
+
+        :param n_individuals: a non-negative `int` with the number of individuals to generate.
+        """
+        if not isinstance(n_individuals, int) or n_individuals < 0:
+            raise ValueError(f"`n_individuals` must be a non-negative `int` but was {n_individuals}")
+
+        rng = np.random.default_rng([self._seed, 1])
+        width = max(6, len(str(n_individuals)))
+        for i in range(n_individuals):
+            yield self._generate_patient(rng, SampleLabels(label=f"synthetic-{i:0{width}d}"))
+
+    def generate_cohort(
+        self,
+        n_individuals: int,
+    ) -> Cohort:
+        """
+        Generate a cohort of `n_individuals` synthetic individuals.
+
+        :param n_individuals: a non-negative `int` with the number of individuals to generate.
+        """
+        return Cohort.from_patients(tuple(self.generate_patients(n_individuals)))
+
+    def generate_phenopackets(
+        self,
+        n_individuals: int,
+    ) -> typing.Iterator[Phenopacket]:
+        """
+        Generate a stream of phenopackets of `n_individuals` synthetic individuals.
+
+        The phenopackets describe the same individuals as :func:`generate_patients`.
+        The variants are described by VCF records on *GRCh38* and by HGVS expressions,
+        and they need to be annotated by a functional annotator when loading the phenopackets.
+
+        :param n_individuals: a non-negative `int` with the number of individuals to generate.
+        """
+        for patient in self.generate_patients(n_individuals):
+            yield self._to_phenopacket(patient)
+
+    def _generate_patient(
+        self,
+        rng: np.random.Generator,
+        labels: SampleLabels,
+    ) -> Patient:
+        sex = Sex.FEMALE if rng.random() < 0.5 else Sex.MALE
+
+        # Genotype
+        first = rng.choice(len(self._variants), p=self._variant_weights)
+        if rng.random() < self._biallelic_rate:
+            second = rng.choice(len(self._variants), p=self._variant_weights)
+        else:
+            second = None
+        if second is None:
+            alleles = ((first, Genotype.HETEROZYGOUS),)
+        elif first == second:
+            alleles = ((first, Genotype.HOMOZYGOUS_ALTERNATE),)
+        else:
+            alleles = ((first, Genotype.HETEROZYGOUS), (second, Genotype.HETEROZYGOUS))
+        variants = []
+        for idx, gt in alleles:
+            variant_info, tx_anno = self._variants[idx]
+            variants.append(Variant(variant_info, (tx_anno,), Genotypes.single(labels, gt)))
+        truncating = any(self._truncating[idx] for idx, _ in alleles)
+
+        # Age and vital status
+        age_days = float(round(rng.gamma(shape=2.0, scale=6.0) * Age.DAYS_IN_YEAR))
+        age = Age.postnatal_days(age_days)
+        if rng.random() < self._deceased_rate:
+            vital_status = VitalStatus(status=Status.DECEASED, age_of_death=age)
+        else:
+            vital_status = VitalStatus(status=Status.ALIVE, age_of_death=None)
+
+        # Phenotypes
+        is_present = rng.random(len(self._profile_terms)) < self._frequencies[int(truncating)]
+        present = []
+        excluded = []
+        for i in np.flatnonzero(is_present):
+            parents = self._profile_parents[i]
+            if parents and rng.random() < self._generalization_rate:
+                present.append(parents[rng.integers(len(parents))])
+            else:
+                present.append(self._profile_terms[i])
+        if self._background_terms:
+            for _ in range(rng.poisson(self._mean_extra_terms)):
+                present.append(self._background_terms[rng.integers(len(self._background_terms))])
+
+        # Do not annotate a term whose descendant is present (the annotation propagation rule).
+        present = list(dict.fromkeys(present))
+        implied = set()
+        for term_id in present:
+            implied.update(self._get_ancestors(term_id))
+        present = [term_id for term_id in present if term_id not in implied]
+
+        # Do not exclude a term whose descendant is present.
+        present_ancestors = set()
+        for term_id in present:
+            present_ancestors.update(self._get_ancestors(term_id))
+            present_ancestors.add(term_id)
+        for i in np.flatnonzero(~is_present):
+            term_id = self._profile_terms[i]
+            if term_id not in present_ancestors and rng.random() < self._excluded_rate:
+                excluded.append(term_id)
+        # Do not exclude a term whose ancestor is excluded.
+        excluded_set = set(excluded)
+        excluded = [
+            term_id for term_id in excluded
+            if excluded_set.isdisjoint(self._get_ancestors(term_id))
+        ]
+
+        phenotypes = []
+        onsets = []
+        onset_shape = (1.0, 3.0) if truncating else (2.0, 2.0)
+        for term_id in present:
+            if rng.random() < self._onset_rate:
+                onset = Age.postnatal_days(float(round(age_days * rng.beta(*onset_shape))))
+                onsets.append(onset)
+                phenotypes.append(Phenotype(term_id, is_observed=True, onset=onset))
+            else:
+                phenotypes.append(self._get_phenotype(term_id, True))
+        phenotypes.extend(self._get_phenotype(term_id, False) for term_id in excluded)
+
+        disease = Disease(
+            term_id=self._disease_id,
+            name=self._disease_name,
+            is_observed=True,
+            onset=min(onsets) if onsets else None,
+        )
+
+        return Patient(
+            labels=labels,
+            sex=sex,
+            age=age,
+            vital_status=vital_status,
+            phenotypes=phenotypes,
+            measurements=(),
+            diseases=(disease,),
+            variants=variants,
+        )
+
+    def _to_phenopacket(
+        self,
+        patient: Patient,
+    ) -> Phenopacket:
+        pp = Phenopacket(id=patient.patient_id)
+        pp.subject.id = patient.patient_id
+        pp.subject.sex = _PP_SEX.get(patient.sex, ppi.Sex.UNKNOWN_SEX)
+        if patient.age is not None:
+            pp.subject.time_at_last_encounter.CopyFrom(_to_time_element(patient.age))
+        if patient.vital_status is not None:
+            pp.subject.vital_status.status = _PP_VITAL_STATUS[patient.vital_status.status]
+            if patient.vital_status.age_of_death is not None:
+                pp.subject.vital_status.time_of_death.CopyFrom(_to_time_element(patient.vital_status.age_of_death))
+
+        for phenotype in patient.phenotypes:
+            label = self._hpo.get_term_name(phenotype.identifier)
+            pf = pppf.PhenotypicFeature(
+                type=ppb.OntologyClass(id=phenotype.identifier.value, label=label or ""),
+                excluded=phenotype.is_excluded,
+            )
+            if phenotype.onset is not None:
+                pf.onset.CopyFrom(_to_time_element(phenotype.onset))
+            pp.phenotypic_features.append(pf)
+
+        for disease in patient.diseases:
+            term = ppb.OntologyClass(id=disease.identifier.value, label=disease.name)
+            dis = ppd.Disease(term=term, excluded=disease.is_excluded)
+            if disease.onset is not None:
+                dis.onset.CopyFrom(_to_time_element(disease.onset))
+            pp.diseases.append(dis)
+
+            interpretation = ppint.Interpretation(
+                id=f"{patient.patient_id}-interpretation",
+                progress_status=ppint.Interpretation.ProgressStatus.SOLVED,
+            )
+            interpretation.diagnosis.disease.CopyFrom(term)
+            for variant in patient.variants:
+                interpretation.diagnosis.genomic_interpretations.append(
+                    self._to_genomic_interpretation(patient, variant),
+                )
+            pp.interpretations.append(interpretation)
+
+        pp.meta_data.created_by = "gpsea.synthetic"
+        pp.meta_data.phenopacket_schema_version = "2.0"
+        pp.meta_data.resources.append(
+            ppm.Resource(
+                id="hp",
+                name="human phenotype ontology",
+                namespace_prefix="HP",
+                url="http://purl.obolibrary.org/obo/hp.owl",
+                version=self._hpo.version or "",
+                iri_prefix="http://purl.obolibrary.org/obo/HP_",
+            )
+        )
+        return pp
+
+    def _to_genomic_interpretation(
+        self,
+        patient: Patient,
+        variant: Variant,
+    ) -> ppint.GenomicInterpretation:
+        vc = variant.variant_info.variant_coordinates
+        assert vc is not None
+        tx_anno = variant.tx_annotations[0]
+        geno_id, geno_label = _PP_ALLELIC_STATE[variant.genotype_for_sample(patient.labels)]
+
+        descriptor = ppv.VariationDescriptor(
+            id=vc.variant_key,
+            gene_context=ppv.GeneDescriptor(value_id=self._gene_symbol, symbol=self._gene_symbol),
+            vcf_record=ppv.VcfRecord(
+                genome_assembly="GRCh38",
+                chrom=vc.chrom,
+                pos=vc.start + 1,
+                ref=vc.ref,
+                alt=vc.alt,
+            ),
+            allelic_state=ppb.OntologyClass(id=geno_id, label=geno_label),
+        )
+        descriptor.expressions.append(ppv.Expression(syntax="hgvs.c", value=tx_anno.hgvs_cdna))
+
+        gi = ppint.GenomicInterpretation(
+            subject_or_biosample_id=patient.patient_id,
+            interpretation_status=ppint.GenomicInterpretation.InterpretationStatus.CAUSATIVE,
+        )
+        gi.variant_interpretation.variation_descriptor.CopyFrom(descriptor)
+        return gi
+
+    def _draw_variant_pool(
+        self,
+        rng: np.random.Generator,
+        n_variants: int,
+        protein_length: int,
+        n_exons: int,
+    ) -> typing.Tuple[typing.Sequence[typing.Tuple[VariantInfo, TranscriptAnnotation]], typing.Sequence[bool]]:
+        contig = GRCh38.contig_by_name("1")
+        assert contig is not None
+        gene_start = 1_000_000
+        intron_length = 1_000
+        # The last CDS position of each exon.
+        cds_length = 3 * protein_length
+        exon_ends = np.linspace(0, cds_length, n_exons + 1, dtype=int)[1:]
+
+        kinds = tuple(kind for kind, _ in _VARIANT_KINDS)
+        kind_weights = np.array([weight for _, weight in _VARIANT_KINDS])
+        kind_weights /= kind_weights.sum()
+
+        variants = []
+        truncating = []
+        seen = set()
+        while len(variants) < n_variants:
+            kind = kinds[rng.choice(len(kinds), p=kind_weights)]
+            # 1-based CDS position, leaving room for the inframe deletion before the stop codon.
+            cds_pos = int(rng.integers(1, cds_length - 3))
+            exon_idx = int(np.searchsorted(exon_ends, cds_pos))
+            if kind == "splice_donor":
+                cds_pos = int(exon_ends[min(exon_idx, n_exons - 2)])
+                exon_idx = int(np.searchsorted(exon_ends, cds_pos))
+            if (kind, cds_pos) in seen:
+                continue
+            seen.add((kind, cds_pos))
+
+            pos = gene_start + exon_idx * intron_length + cds_pos
+            aa_pos = (cds_pos - 1) // 3 + 1
+            aa = _AMINO_ACIDS[rng.integers(len(_AMINO_ACIDS))]
+            ref = _BASES[rng.integers(4)]
+            alt = _BASES[(_BASES.index(ref) + rng.integers(1, 4)) % 4]
+            protein_region = Region(aa_pos - 1, aa_pos)
+
+            if kind == "missense":
+                alt_aa = _AMINO_ACIDS[(_AMINO_ACIDS.index(aa) + rng.integers(1, len(_AMINO_ACIDS))) % len(_AMINO_ACIDS)]
+                effect = VariantEffect.MISSENSE_VARIANT
+                hgvs_cdna = f"c.{cds_pos}{ref}>{alt}"
+                hgvsp = f"p.{aa}{aa_pos}{alt_aa}"
+            elif kind == "stop_gained":
+                effect = VariantEffect.STOP_GAINED
+                hgvs_cdna = f"c.{cds_pos}{ref}>{alt}"
+                hgvsp = f"p.{aa}{aa_pos}Ter"
+            elif kind == "frameshift":
+                # Deletion of the base following `ref`.
+                effect = VariantEffect.FRAMESHIFT_VARIANT
+                hgvs_cdna = f"c.{cds_pos + 1}del"
+                hgvsp = f"p.{aa}{aa_pos}fs"
+                alt, ref = ref, ref + alt
+            elif kind == "inframe_deletion":
+                effect = VariantEffect.INFRAME_DELETION
+                deleted = "".join(_BASES[i] for i in rng.integers(4, size=3))
+                hgvs_cdna = f"c.{cds_pos + 1}_{cds_pos + 3}del"
+                hgvsp = f"p.{aa}{aa_pos}del"
+                alt, ref = ref, ref + deleted
+            else:
+                effect = VariantEffect.SPLICE_DONOR_VARIANT
+                pos += 1
+                ref, alt = "G", ("A", "C", "T")[rng.integers(3)]
+                hgvs_cdna = f"c.{cds_pos}+1G>{alt}"
+                hgvsp = None
+                protein_region = None
+
+            variant_info = VariantInfo(
+                variant_coordinates=VariantCoordinates.from_vcf_literal(contig, pos=pos, ref=ref, alt=alt),
+            )
+            tx_anno = TranscriptAnnotation(
+                gene_id=self._gene_symbol,
+                tx_id=self._tx_id,
+                hgvs_cdna=f"{self._tx_id}:{hgvs_cdna}",
+                is_preferred=True,
+                variant_effects=(effect,),
+                affected_exons=(exon_idx + 1,),
+                protein_id=self._protein_id,
+                hgvsp=None if hgvsp is None else f"{self._protein_id}:{hgvsp}",
+                protein_effect_coordinates=protein_region,
+            )
+            variants.append((variant_info, tx_anno))
+            truncating.append(kind in _TRUNCATING_KINDS)
+
+        return tuple(variants), tuple(truncating)
+
+    def _get_ancestors(
+        self,
+        term_id: hpotk.TermId,
+    ) -> typing.FrozenSet[hpotk.TermId]:
+        ancestors = self._ancestors.get(term_id)
+        if ancestors is None:
+            ancestors = frozenset(self._hpo.graph.get_ancestors(term_id))
+            self._ancestors[term_id] = ancestors
+        return ancestors
+
+    def _get_phenotype(
+        self,
+        term_id: hpotk.TermId,
+        is_observed: bool,
+    ) -> Phenotype:
+        # The phenotypes without onset are shared by the individuals to save memory.
+        key = (term_id, is_observed)
+        phenotype = self._phenotypes.get(key)
+        if phenotype is None:
+            phenotype = Phenotype(term_id, is_observed=is_observed, onset=None)
+            self._phenotypes[key] = phenotype
+        return phenotype
+
+
+def _to_time_element(
+    age: Age,
+) -> ppb.TimeElement:
+    return ppb.TimeElement(age=ppb.Age(iso8601duration=f"P{int(age.days)}D"))
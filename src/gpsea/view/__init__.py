@@ -1,22 +1,53 @@
-from ._base import GpseaReport, BaseViewer, BaseProteinVisualizer, CohortArtist
-from ._config import configure_default_protein_visualizer, configure_default_cohort_artist
-from ._formatter import Formatter, VariantFormatter
-from ._phenotype_analysis import summarize_hpo_analysis
-from ._protein_visualizable import ProteinVisualizable
-from ._protein_visualizer import ProteinVisualizer
-from ._txp import VariantTranscriptVisualizer
-from ._viewers import (
-    CohortVariantViewer,
-    CohortViewer,
-    DiseaseViewer,
-    MtcStatsViewer,
-    ProteinVariantViewer,
-)
+import typing
+
+from gpsea._lazy import attach
+
+if typing.TYPE_CHECKING:
+    from ._base import GpseaReport, BaseViewer, BaseProteinVisualizer, CohortArtist
+    from ._config import configure_default_protein_visualizer, configure_default_cohort_artist
+    from ._formatter import Formatter, VariantFormatter
+    from ._phenotype_analysis import summarize_hpo_analysis
+    from ._protein_visualizable import ProteinVisualizable
+    from ._protein_visualizer import ProteinVisualizer
+    from ._report_batch import HtmlReportBatch
+    from ._summary import CohortSummary
+    from ._txp import VariantTranscriptVisualizer
+    from ._viewers import (
+        CohortVariantViewer,
+        CohortViewer,
+        DiseaseViewer,
+        MtcStatsViewer,
+        ProteinVariantViewer,
+    )
+else:
+    __getattr__, __dir__ = attach(
+        __name__,
+        {
+            "._base": ("GpseaReport", "BaseViewer", "BaseProteinVisualizer", "CohortArtist"),
+            "._config": ("configure_default_protein_visualizer", "configure_default_cohort_artist"),
+            "._formatter": ("Formatter", "VariantFormatter"),
+            "._phenotype_analysis": ("summarize_hpo_analysis",),
+            "._protein_visualizable": ("ProteinVisualizable",),
+            "._protein_visualizer": ("ProteinVisualizer",),
+            "._report_batch": ("HtmlReportBatch",),
+            "._summary": ("CohortSummary",),
+            "._txp": ("VariantTranscriptVisualizer",),
+            "._viewers": (
+                "CohortVariantViewer",
+                "CohortViewer",
+                "DiseaseViewer",
+                "MtcStatsViewer",
+                "ProteinVariantViewer",
+            ),
+        },
+    )
 
 __all__ = [
     "GpseaReport",
+    "HtmlReportBatch",
     "CohortVariantViewer",
     "CohortViewer",
+    "CohortSummary",
     "BaseProteinVisualizer",
     "configure_default_protein_visualizer",
     "CohortArtist",
@@ -1,5 +1,6 @@
 import abc
 import io
+import os
 import typing
 
 from gpsea.model import Cohort, ProteinMetadata
@@ -7,7 +8,7 @@ from gpsea.preprocessing import ProteinMetadataService
 from gpsea.util import open_text_io_handle_for_writing
 
 
-from jinja2 import Environment, PackageLoader
+from jinja2 import Environment, FileSystemBytecodeCache, PackageLoader
 
 
 def pluralize(count: int, stem: str) -> str:
@@ -33,11 +34,56 @@ def was_were(count: int) -> str:
         raise ValueError(f"{count} must be an `int`!")
 
 
+# The template environments shared by the viewers of a process, keyed by the bytecode cache folder.
+_ENVIRONMENTS: typing.Dict[typing.Optional[str], Environment] = {}
+
+
+def get_template_environment(
+    bytecode_cache_dir: typing.Optional[str] = None,
+) -> Environment:
+    """
+    Get the Jinja2 environment with the GPSEA report templates.
+
+    The environment is created once per process and shared by all viewers,
+    hence each template is parsed and compiled only once.
+
+    :param bytecode_cache_dir: path to a folder for caching the compiled templates across processes
+      or `None` if the compiled templates should only be kept in memory.
+      The folder is created if it does not exist.
+    """
+    environment = _ENVIRONMENTS.get(bytecode_cache_dir)
+    if environment is None:
+        bytecode_cache = None
+        if bytecode_cache_dir is not None:
+            os.makedirs(bytecode_cache_dir, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(directory=bytecode_cache_dir)
+        environment = Environment(
+            loader=PackageLoader("gpsea.view", "templates"),
+            bytecode_cache=bytecode_cache,
+            auto_reload=False,
+        )
+        environment.filters["pluralize"] = pluralize
+        environment.filters["was_were"] = was_were
+        _ENVIRONMENTS[bytecode_cache_dir] = environment
+    return environment
+
+
 class BaseViewer(metaclass=abc.ABCMeta):
     def __init__(self):
-        self._environment = Environment(loader=PackageLoader("gpsea.view", "templates"))
-        self._environment.filters["pluralize"] = pluralize
-        self._environment.filters["was_were"] = was_were
+        self._environment = get_template_environment()
+
+    def _prepare_report(
+        self,
+        *args,
+        **kwargs,
+    ) -> typing.Tuple[str, typing.Mapping[str, typing.Any]]:
+        """
+        Get the name of the report template and the context for rendering the template,
+        for the same arguments as the `process` method of the viewer.
+
+        The context must be picklable, to be rendered by :class:`~gpsea.view.HtmlReportBatch`.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support batch rendering")
 
 
 class GpseaReport(metaclass=abc.ABCMeta):
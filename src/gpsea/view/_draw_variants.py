@@ -5,6 +5,8 @@ from itertools import cycle
 import numpy as np
 import matplotlib.pyplot as plt
 
+from matplotlib.collections import LineCollection, PatchCollection
+
 from gpsea.model import Cohort, ProteinMetadata, TranscriptAnnotation, TranscriptCoordinates, VariantEffect, Variant
 
 
@@ -35,31 +37,22 @@ def _calc_aa_based_pos(pos_bases, tx_coordinates):
     :param cds_start: start position of the coding sequence
     :param exons: exon positions
     """
-    print(f'{pos_bases=}')
     exons, _cds_start, _cds_end = tx_coordinates.exons, tx_coordinates.cds_start, tx_coordinates.cds_end
 
     num_nt = 0
 
     for exon in exons:
         if exon.end > tx_coordinates.cds_start and exon.start < tx_coordinates.cds_end:  # exon in coding seq
-            print(exon)
             if exon.start < exon.end < pos_bases:
                 # case 1: exon prior to pos: exon.start to exon.end
                 num_nt += exon.end - max(exon.start, tx_coordinates.cds_start)
-                print(
-                    f'adding {exon.end=} - {max(exon.start, tx_coordinates.cds_start)} = {exon.end - max(exon.start, tx_coordinates.cds_start)}')
             elif exon.start <= pos_bases <= exon.end:
                 # case 2: exon in which pos sits: exon.start to pos
                 num_nt += pos_bases - max(exon.start, tx_coordinates.cds_start)
-                print(
-                    f'adding {pos_bases=} - {max(exon.start, tx_coordinates.cds_start)=} = {pos_bases - max(exon.start, tx_coordinates.cds_start)}')
             else:
                 break
 
-    # print(f'{num_nt=}')
-
     pos_aa = np.ceil(num_nt / 3).astype(int)
-    # print(f'{pos_aa=}')
     return pos_aa
 
 def get_tx_anns(
@@ -134,11 +127,22 @@ class ProteinVariantVisualizer:
         self.exon_outline_color = 'black'
         self.axis_color = 'black'
 
-    def _draw_marker(self, x_start, x_end, min_y, max_y, circle_radius, color):
-        x = (
-                    x_start + x_end) / 2  # TODO @ielis, currently putting marker in the middle of start and end, can change this later
-        draw_line(x, min_y, x, max_y - circle_radius, line_color=self.protein_track_color, line_width=0.5)
-        draw_circle(x, max_y, circle_radius, line_color=self.protein_track_color, fill_color=color, line_width=0.5)
+    def _draw_markers(self, ax, x_starts, x_ends, min_y, max_ys, circle_radii, colors):
+        # TODO @ielis, currently putting marker in the middle of start and end, can change this later
+        x = (x_starts + x_ends) / 2
+        # Draw the stems and the heads of all markers as two collections.
+        stems = np.stack(
+            (
+                np.column_stack((x, np.full_like(x, min_y))),
+                np.column_stack((x, max_ys - circle_radii)),
+            ),
+            axis=1,
+        )
+        ax.add_collection(LineCollection(stems, colors=self.protein_track_color, linewidths=0.5, zorder=2))
+        heads = [plt.Circle((cx, cy), r) for cx, cy, r in zip(x, max_ys, circle_radii)]
+        ax.add_collection(
+            PatchCollection(heads, facecolors=colors, edgecolors=self.protein_track_color, linewidths=0.5)
+        )
 
     def _marker_dim(self, marker_count, protein_track_y_max, marker_length=0.02, marker_radius=0.0025):
         radius = marker_radius + np.sqrt(marker_count - 1) * marker_radius
@@ -171,11 +175,9 @@ class ProteinVariantVisualizer:
         variant_effects = [ann.variant_effects[0] for ann in tx_anns]
         # count marker occurrences and remove duplicates
         variant_locations_counted_absolute, marker_counts = np.unique(variant_locations, axis=0, return_counts=True)
-        variant_effect_colors = []
-        for vl in variant_locations_counted_absolute:
-            i = np.where(variant_locations == vl)[0][0]  # find index of unique variant loc in all locs to find effect
-            effect = variant_effects[i]
-            variant_effect_colors.append(self.marker_colors[effect])
+        # find index of the first occurrence of each unique variant loc to find its effect
+        _, first_indices = np.unique(variant_locations, axis=0, return_index=True)
+        variant_effect_colors = [self.marker_colors[variant_effects[i]] for i in first_indices]
 
         protein_track_x_min, protein_track_x_max = 0.15, 0.85
         protein_track_y_min, protein_track_y_max = 0.492, 0.508
@@ -195,7 +197,6 @@ class ProteinVariantVisualizer:
         min_x_absolute = min(np.min(feature_limits), np.min(exon_limits), np.min(variant_locations))
         max_x_absolute = max(np.max(exon_limits), np.max(variant_locations))
         tick_step_size, base = round_to_nearest_power_ten((max_x_absolute - min_x_absolute) / apprx_n_x_ticks)
-        print(base)
         x_ticks = np.array(list(filter(
             lambda x: x < max_x_absolute,
             [min_x_absolute + i * tick_step_size for i in range(1, apprx_n_x_ticks + 1)]
@@ -254,20 +255,30 @@ class ProteinVariantVisualizer:
                     va='center', rotation=90)  # x axis label
 
         # draw variants
+        ax = plt.gca()
         marker_y_min = protein_track_y_max
-        for marker, marker_color in zip(variant_locations_relative, variant_effect_colors):
-            marker_count = marker_counts[np.where(variant_locations_relative == marker)[0][0]]
-            cur_radius, cur_length = self._marker_dim(marker_count, protein_track_y_max)
-            x_start, x_end = marker[0], marker[1]
-            self._draw_marker(x_start, x_end, marker_y_min, cur_length, cur_radius, marker_color)
+        radii, lengths = self._marker_dim(marker_counts, protein_track_y_max)
+        self._draw_markers(
+            ax,
+            variant_locations_relative[:, 0], variant_locations_relative[:, 1],
+            marker_y_min, lengths, radii, variant_effect_colors,
+        )
 
         # draw the features (protein track)
         feature_y_min, feature_y_max = 0.485, 0.515
-        for feature_x, feature_color, feature_name in zip(feature_limits_relative, feature_colors, feature_names):
+        ax.add_collection(
+            PatchCollection(
+                [
+                    plt.Rectangle((feature_x_min, feature_y_min), feature_x_max - feature_x_min, feature_y_max - feature_y_min)
+                    for feature_x_min, feature_x_max in feature_limits_relative
+                ],
+                facecolors=feature_colors,
+                edgecolors=self.feature_outline_color,
+                linewidths=1.0,
+            )
+        )
+        for feature_x, feature_name in zip(feature_limits_relative, feature_names):
             feature_x_min, feature_x_max = feature_x
-            draw_rectangle(feature_x_min, feature_y_min, feature_x_max, feature_y_max,
-                           line_color=self.feature_outline_color,
-                           fill_color=feature_color, line_width=1.0)
             if (feature_x_max - feature_x_min) <= 0.03:  # too small to dsplay name
                 draw_string(feature_name,
                             0.05 * (feature_x_max - feature_x_min) + feature_x_min,
@@ -1,4 +1,7 @@
+import typing
+
 import hpotk
+import numpy as np
 import pandas as pd
 
 from gpsea.analysis.pcats import HpoTermAnalysisResult
@@ -7,67 +10,121 @@ from gpsea.analysis.pcats import HpoTermAnalysisResult
 def summarize_hpo_analysis(
     hpo: hpotk.MinimalOntology,
     result: HpoTermAnalysisResult,
+    numeric: bool = False,
 ) -> pd.DataFrame:
     """
     Create a dataframe with counts, frequencies, and p values for the tested HPO terms.
 
     The HPO terms that were not tested will *not* be included in the frame.
 
+    By default, the counts of each genotype group are formatted as `<count>/<total> (<percent>%)`.
+    Use `numeric=True` to get the counts as numbers, e.g. for further processing.
+    The columns of the numeric frame are indexed by the genotype group name
+    and by `count` or `total`, followed by the columns with the p values.
+
     :param hpo: HPO data.
     :param result: the HPO term analysis results to show.
+    :param numeric: `True` if the counts should be reported as numbers rather than formatted as `str`.
     """
     assert isinstance(result, HpoTermAnalysisResult)
 
-    # Row index: a list of tested HPO terms
-    pheno_idx = pd.Index(result.phenotypes)
-    # Column index: a summary of the counts and percentages for all genotype predicate groups
     cat_names = list(cat.name for cat in result.gt_clf.get_categories())
-    gt_idx = pd.Index(
-        data=cat_names,
-        name=result.gt_clf.variable_name,
-    )
+    present, totals = _stack_present_counts(result)
 
-    # We'll fill this frame with data
-    df = pd.DataFrame(index=pheno_idx, columns=gt_idx)
-
-    for ph_clf, count in zip(result.pheno_clfs, result.all_counts):
-        # Sum across the phenotype categories (collapse the rows).
-        gt_totals = count.sum()
-
-        for gt_cat in count.columns:
-            cnt = count.loc[ph_clf.present_phenotype_category, gt_cat]
-            total = gt_totals[gt_cat]
-            pct = 0 if total == 0 else round(cnt * 100 / total)
-            df.loc[ph_clf.phenotype, gt_cat.name] = f"{cnt}/{total} ({pct}%)"
+    # Format the index values: `HP:0001250` -> `Seizure [HP:0001250]` if the index members are HPO terms
+    # or just use the term ID CURIE otherwise (e.g. `OMIM:123000`).
+    pheno_idx = pd.Index(format_term_ids(hpo, result.phenotypes))
 
-    # Add columns with p values and corrected p values (if present)
     p_val_col_name = "p values"
     corrected_p_val_col_name = "Corrected p values"
+    pvals = {}
     if result.corrected_pvals is not None:
-        df.insert(df.shape[1], corrected_p_val_col_name, result.corrected_pvals)
-    df.insert(df.shape[1], p_val_col_name, result.pvals)
-
-    # Format the index values: `HP:0001250` -> `Seizure [HP:0001250]` if the index members are HPO terms
-    # or just use the term ID CURIE otherwise (e.g. `OMIM:123000`).
-    labeled_idx = df.index.map(lambda term_id: format_term_id(hpo, term_id))
+        pvals[corrected_p_val_col_name] = np.asarray(result.corrected_pvals, dtype=float)
+    pvals[p_val_col_name] = np.asarray(result.pvals, dtype=float)
+
+    if numeric:
+        data = {}
+        for i, name in enumerate(cat_names):
+            data[(name, "count")] = present[:, i]
+            data[(name, "total")] = totals[:, i]
+        for col_name, values in pvals.items():
+            data[(col_name, "")] = values
+        df = pd.DataFrame(data, index=pheno_idx)
+        df.columns = df.columns.set_names([result.gt_clf.variable_name, None])
+        count_columns = [(name, "count") for name in cat_names]
+        sort_columns = [(col_name, "") for col_name in pvals] + count_columns
+        p_val_col = (p_val_col_name, "")
+    else:
+        # Format the counts column-wise: `<count>/<total> (<percent>%)`.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pcts = np.where(totals == 0, 0, np.round(present * 100 / totals)).astype(int)
+        present_str = present.astype(str).astype(object)
+        totals_str = totals.astype(str).astype(object)
+        pcts_str = pcts.astype(str).astype(object)
+        df = pd.DataFrame(
+            present_str + "/" + totals_str + " (" + pcts_str + "%)",
+            index=pheno_idx,
+            columns=cat_names,
+        )
+        df.columns = df.columns.set_names(result.gt_clf.variable_name)
+        for col_name, values in pvals.items():
+            df.insert(df.shape[1], col_name, values)
+        sort_columns = list(pvals) + cat_names
+        p_val_col = p_val_col_name
 
     # Last, sort by corrected p value or just p value
-    df = df.set_index(labeled_idx)
     # and only report the tested HPO terms
-    with_p_value = df[p_val_col_name].notna()
-
-    sort_columns = []
-    if result.corrected_pvals is not None:
-        sort_columns.append(corrected_p_val_col_name)
-        sort_columns.append(p_val_col_name)
-        sort_columns.extend(cat_names)
-    else:
-        sort_columns.append(p_val_col_name)
-        sort_columns.extend(cat_names)
+    with_p_value = df[p_val_col].notna()
 
     return df.sort_values(by=sort_columns).loc[with_p_value]
 
 
+def _stack_present_counts(
+    result: HpoTermAnalysisResult,
+) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """
+    Get the counts of the individuals with the phenotype and the total counts of the individuals
+    as two `(n_phenotypes, n_genotype_categories)` arrays, with columns in the order of the genotype categories.
+    """
+    gt_cats = list(result.gt_clf.get_categories())
+    n_phenotypes = len(result.phenotypes)
+    present = np.zeros((n_phenotypes, len(gt_cats)), dtype=np.int64)
+    totals = np.zeros((n_phenotypes, len(gt_cats)), dtype=np.int64)
+    if n_phenotypes == 0:
+        return present, totals
+
+    # Stack the frames with the same layout and index all stacks at once.
+    groups: typing.Dict[typing.Tuple[typing.Hashable, ...], typing.List[int]] = {}
+    for i, count in enumerate(result.all_counts):
+        groups.setdefault((tuple(count.index), tuple(count.columns)), []).append(i)
+
+    for (rows, columns), indices in groups.items():
+        stacked = np.stack([result.all_counts[i].to_numpy() for i in indices])
+        present_rows = np.array(
+            [rows.index(result.pheno_clfs[i].present_phenotype_category) for i in indices],
+            dtype=np.intp,
+        )
+        col_positions = [gt_cats.index(col) for col in columns]
+        idx = np.array(indices, dtype=np.intp)
+        present[np.ix_(idx, col_positions)] = stacked[np.arange(len(indices)), present_rows, :]
+        # Sum across the phenotype categories (collapse the rows).
+        totals[np.ix_(idx, col_positions)] = stacked.sum(axis=1)
+
+    return present, totals
+
+
+def format_term_ids(
+    hpo: hpotk.MinimalOntology,
+    term_ids: typing.Iterable[hpotk.TermId],
+) -> typing.Sequence[str]:
+    """
+    Format the `term_ids` as in :func:`format_term_id`, looking up the name of each distinct HPO term only once.
+    """
+    term_ids = list(term_ids)
+    labels = {term_id: format_term_id(hpo, term_id) for term_id in set(term_ids)}
+    return [labels[term_id] for term_id in term_ids]
+
+
 def format_term_id(
     hpo: hpotk.MinimalOntology,
     term_id: hpotk.TermId,
@@ -10,6 +10,8 @@ import matplotlib.pyplot as plt
 import matplotlib.colors as mcolors
 import numpy as np
 
+from matplotlib.collections import LineCollection, PatchCollection
+
 from gpsea.model import Cohort, ProteinMetadata, TranscriptCoordinates, Variant, VariantEffect
 
 from ._base import BaseProteinVisualizer
@@ -116,19 +118,21 @@ class ProteinVisualizer(BaseProteinVisualizer):
         y_ticks = generate_ticks(apprx_n_ticks=5, min=0, max=variant_handler.max_marker_count)
 
         # normalize into [0, 1], leaving some space on the sides
-        for f in feature_handler.features:
-            cur_limits = f.min_pos_abs, f.max_pos_abs
-            f.min_pos_plotting, f.max_pos_plotting = translate_to_ax_coordinates(
-                np.array(cur_limits), min_absolute=1, max_absolute=protein_metadata.protein_length,
-                min_relative=self.protein_track_x_min, max_relative=self.protein_track_x_max
-            )
+        feature_limits = translate_to_ax_coordinates(
+            np.array([(f.min_pos_abs, f.max_pos_abs) for f in feature_handler.features], dtype=float),
+            min_absolute=1, max_absolute=protein_metadata.protein_length,
+            min_relative=self.protein_track_x_min, max_relative=self.protein_track_x_max
+        )
+        for f, (min_pos_plotting, max_pos_plotting) in zip(feature_handler.features, feature_limits):
+            f.min_pos_plotting, f.max_pos_plotting = min_pos_plotting, max_pos_plotting
 
-        for v in variant_handler.variants:
-            pos_abs = v.pos_abs
-            v.pos_plotting = translate_to_ax_coordinates(
-                np.array([pos_abs]), min_absolute=1, max_absolute=protein_metadata.protein_length,
-                min_relative=self.protein_track_x_min,
-                max_relative=self.protein_track_x_max, clip=True)
+        variant_positions = translate_to_ax_coordinates(
+            np.array([v.pos_abs for v in variant_handler.variants], dtype=float),
+            min_absolute=1, max_absolute=protein_metadata.protein_length,
+            min_relative=self.protein_track_x_min,
+            max_relative=self.protein_track_x_max, clip=True)
+        for v, pos_plotting in zip(variant_handler.variants, variant_positions):
+            v.pos_plotting = pos_plotting
 
         x_ticks_relative = translate_to_ax_coordinates(x_ticks, min_absolute=1,
                                                        max_absolute=protein_metadata.protein_length,
@@ -257,14 +261,12 @@ class DrawableProteinFeature:
 
     __slots__ = ['name', 'min_pos_abs', 'max_pos_abs', 'label', 'color', 'min_pos_plotting', 'max_pos_plotting', 'track']
 
-    def draw(self, ax: plt.Axes, features_y_max: float, feature_height: float, feature_outline_color: str):
+    def y_limits(self, features_y_max: float, feature_height: float) -> typing.Tuple[float, float]:
         feature_y_max = features_y_max - self.track * feature_height
-        feature_y_min = feature_y_max - feature_height
-        draw_rectangle(
-            ax,
-            self.min_pos_plotting, feature_y_min, self.max_pos_plotting, feature_y_max,
-            line_color=feature_outline_color, fill_color=self.color, line_width=1.0,
-        )
+        return feature_y_max - feature_height, feature_y_max
+
+    def draw_label(self, ax: plt.Axes, features_y_max: float, feature_height: float):
+        feature_y_min, feature_y_max = self.y_limits(features_y_max, feature_height)
         # too small to display horizontally, so display vertically
         if (self.max_pos_plotting - self.min_pos_plotting) <= 0.03:
             draw_string(
@@ -343,8 +345,27 @@ class DrawableProteinFeatureHandler:
         ]
 
     def draw_features(self, ax: plt.Axes, features_y_max: float, feature_height: float, feature_outline_color: str):
+        # Draw all feature boxes as a single collection.
+        boxes = []
+        for f in self.features:
+            feature_y_min, feature_y_max = f.y_limits(features_y_max, feature_height)
+            boxes.append(
+                plt.Rectangle(
+                    (f.min_pos_plotting, feature_y_min),
+                    f.max_pos_plotting - f.min_pos_plotting, feature_y_max - feature_y_min,
+                )
+            )
+        if len(boxes) > 0:
+            ax.add_collection(
+                PatchCollection(
+                    boxes,
+                    facecolors=[f.color for f in self.features],
+                    edgecolors=feature_outline_color,
+                    linewidths=1.0,
+                )
+            )
         for f in self.features:
-            f.draw(ax, features_y_max, feature_height, feature_outline_color)
+            f.draw_label(ax, features_y_max, feature_height)
 
     def _assign_track_numbers(self):
         track_numbers = resolve_overlap([(f.min_pos_abs, f.max_pos_abs) for f in self.features])
@@ -362,15 +383,6 @@ class DrawableProteinVariant:
 
     __slots__ = ['effect', 'pos_abs', 'color', 'pos_plotting', 'count']
 
-    def draw(self, ax: plt.Axes, y_max: float, stem_color: str):
-        """
-        Draw a lollipop representing a variant and the number of counts for the variant effect type
-        currently putting marker in the middle of start and end, can change this later
-        """
-        radius, stem_length = marker_dim(self.count, y_max)
-        draw_line(ax, self.pos_plotting, y_max, self.pos_plotting, stem_length - radius, line_color=stem_color, line_width=0.5)
-        draw_circle(ax, self.pos_plotting, stem_length, radius, line_color=stem_color, fill_color=self.color, line_width=0.5)
-
     @property
     def name(self):
         return str(self.effect)
@@ -438,8 +450,9 @@ class DrawableProteinVariantHandler:
 
     def _generate_variant_markers(self):
         variants = list()
-        for j, vl in enumerate(self._pvis.variant_locations_counted_absolute):
-            i = np.where(self._pvis.variant_locations == vl)[0][0]
+        # The index of the first variant at each of the (sorted) distinct locations.
+        _, first_indices = np.unique(self._pvis.variant_locations, return_index=True)
+        for j, (vl, i) in enumerate(zip(self._pvis.variant_locations_counted_absolute, first_indices)):
             effect = self._pvis.variant_effects[i]
             v = DrawableProteinVariant(effect=effect,
                                        pos_abs=vl,
@@ -451,8 +464,35 @@ class DrawableProteinVariantHandler:
         return variants
 
     def draw_variants(self, ax: plt.Axes, y_max: float, stem_color: str):
-        for v in self.variants:
-            v.draw(ax, y_max, stem_color)
+        """
+        Draw lollipops representing the variants and the number of counts for the variant effect type.
+
+        The stems and the heads are drawn as two collections, to render in about the same time
+        regardless of the number of variants.
+        """
+        if len(self.variants) == 0:
+            return
+        x = np.array([v.pos_plotting for v in self.variants], dtype=float)
+        radii, stem_lengths = marker_dim(np.array([v.count for v in self.variants]), y_max)
+
+        stems = np.stack(
+            (
+                np.column_stack((x, np.full_like(x, y_max))),
+                np.column_stack((x, stem_lengths - radii)),
+            ),
+            axis=1,
+        )
+        ax.add_collection(LineCollection(stems, colors=stem_color, linewidths=0.5, zorder=2))
+
+        heads = [plt.Circle((cx, cy), r) for cx, cy, r in zip(x, stem_lengths, radii)]
+        ax.add_collection(
+            PatchCollection(
+                heads,
+                facecolors=[v.color for v in self.variants],
+                edgecolors=stem_color,
+                linewidths=0.5,
+            )
+        )
 
     def variant_effect_colors(self):
         colors = dict()
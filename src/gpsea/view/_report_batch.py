@@ -0,0 +1,110 @@
+import concurrent.futures
+import os
+import typing
+
+from gpsea.config import get_cache_dir_path
+from gpsea.util import open_text_io_handle_for_writing
+
+from ._base import BaseViewer, get_template_environment
+
+
+class HtmlReportBatch:
+    """
+    `HtmlReportBatch` renders HTML reports of many cohorts or analysis results and writes them into files.
+
+    The viewer contexts are prepared in the current process when the reports are added,
+    and the templates are rendered in a pool of worker processes.
+    All reports of a process share one template environment,
+    and the compiled templates are cached in `cache_dir` to be reused by the other workers and by the next runs.
+    The HTML is streamed into the output files without building the whole document in memory.
+
+    Example
+    ^^^^^^^
+
+    .. code-block:: python
+
+      batch = HtmlReportBatch(n_workers=4)
+      viewer = CohortViewer(hpo=hpo)
+      for gene, (cohort, tx_id) in cohorts.items():
+          batch.add(viewer, f"{gene}.cohort.html", cohort, transcript_id=tx_id)
+      paths = batch.write()
+
+    :param n_workers: a positive `int` with the number of worker processes.
+      The reports are rendered in the current process if `n_workers` is `1`.
+    :param cache_dir: path to the GPSEA cache folder or `None` for the default cache folder
+      (see :func:`~gpsea.config.get_cache_dir_path`). The compiled templates are stored in the `templates` subfolder.
+    """
+
+    def __init__(
+        self,
+        n_workers: int = 1,
+        cache_dir: typing.Optional[str] = None,
+    ):
+        if n_workers < 1:
+            raise ValueError(f"`n_workers` must be a positive `int` but was {n_workers}")
+        self._n_workers = n_workers
+        self._bytecode_cache_dir = str(get_cache_dir_path(cache_dir) / "templates")
+        self._reports: typing.List[typing.Tuple[str, typing.Mapping[str, typing.Any], str]] = []
+
+    def add(
+        self,
+        viewer: BaseViewer,
+        path: str,
+        *args,
+        **kwargs,
+    ):
+        """
+        Prepare a report of the `viewer` to be written into `path`.
+
+        The remaining arguments are the arguments of the viewer's `process` method
+        (e.g. `cohort` and `transcript_id` of :meth:`~gpsea.view.CohortViewer.process`).
+
+        :param viewer: the viewer to prepare the report.
+        :param path: path to the output HTML file.
+        """
+        assert isinstance(viewer, BaseViewer)
+        template_name, context = viewer._prepare_report(*args, **kwargs)
+        self._reports.append((template_name, context, path))
+
+    def __len__(self) -> int:
+        return len(self._reports)
+
+    def write(self) -> typing.Sequence[str]:
+        """
+        Render and write all added reports, and clear the batch.
+
+        :returns: a sequence with the paths of the written reports, in the order of addition.
+        """
+        reports, self._reports = self._reports, []
+        if self._n_workers == 1 or len(reports) <= 1:
+            return tuple(_write_report(*report, self._bytecode_cache_dir) for report in reports)
+
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(self._n_workers, len(reports)),
+        ) as executor:
+            futures = [executor.submit(_write_report, *report, self._bytecode_cache_dir) for report in reports]
+            return tuple(future.result() for future in futures)
+
+
+def _write_report(
+    template_name: str,
+    context: typing.Mapping[str, typing.Any],
+    path: str,
+    bytecode_cache_dir: str,
+) -> str:
+    # The environment is shared by all reports written by the process.
+    environment = get_template_environment(bytecode_cache_dir)
+    template = environment.get_template(template_name)
+
+    # Write the report into a temporary file first, and then move it into place.
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open_text_io_handle_for_writing(tmp_path) as fh:
+            for chunk in template.generate(context):
+                fh.write(chunk)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    return path
@@ -0,0 +1,289 @@
+import typing
+
+from collections import Counter, defaultdict
+
+from gpsea.model import Cohort, Patient, Sex, Variant
+
+
+class CohortSummary:
+    """
+    `CohortSummary` gathers the counts shown by the cohort reports in a single pass over the cohort members
+    and their variants.
+
+    The summary does not depend on the transcript or on the viewer settings,
+    hence it can be computed once and shared among
+    :class:`~gpsea.view.CohortViewer`, :class:`~gpsea.view.CohortVariantViewer`,
+    and :class:`~gpsea.view.DiseaseViewer`::
+
+      summary = CohortSummary.summarize(cohort)
+      cohort_report = CohortViewer(hpo).process(cohort, tx_id, summary=summary)
+      variant_report = CohortVariantViewer(tx_id).process(cohort, summary=summary)
+
+    The counting methods mirror the methods of :class:`~gpsea.model.Cohort` with the same name.
+    Use :meth:`summarize` to create the summary or :meth:`add_patient` to accumulate the patients one by one.
+    """
+
+    @staticmethod
+    def summarize(
+        cohort: Cohort,
+    ) -> "CohortSummary":
+        """
+        Summarize the members of the `cohort`.
+
+        :param cohort: the cohort to summarize.
+        """
+        summary = CohortSummary(excluded_count=cohort.get_excluded_count())
+        for patient in cohort:
+            summary.add_patient(patient)
+        return summary
+
+    def __init__(
+        self,
+        excluded_count: int = 0,
+    ):
+        assert isinstance(excluded_count, int) and excluded_count >= 0
+        self._excluded_count = excluded_count
+        self._n_individuals = 0
+        self._sex_counts = Counter()
+        self._n_alive = 0
+        self._n_deceased = 0
+        self._n_unknown_vital_status = 0
+        self._n_with_age_of_last_encounter = 0
+        self._n_with_disease_onset = 0
+
+        self._present_phenotype_counts = Counter()
+        self._hpo_term_ids = set()
+        self._measurement_counts = Counter()
+        self._measurement_names: typing.Dict[str, str] = {}
+        self._disease_counts = Counter()
+        self._disease_names: typing.Dict[str, str] = {}
+
+        self._variant_counts = Counter()
+        self._variants: typing.Dict[str, Variant] = {}
+        self._distinct_variant_counts = Counter()
+        self._effect_counts_by_tx: typing.DefaultDict[str, Counter] = defaultdict(Counter)
+
+        self._disease_variant_counts: typing.DefaultDict[str, Counter] = defaultdict(Counter)
+        self._disease_effect_counts: typing.DefaultDict[str, Counter] = defaultdict(Counter)
+
+    def add_patient(
+        self,
+        patient: Patient,
+    ):
+        """
+        Add the `patient` into the summary.
+        """
+        self._n_individuals += 1
+        self._sex_counts[patient.sex] += 1
+        vital_status = patient.vital_status
+        if vital_status is None or vital_status.is_unknown:
+            self._n_unknown_vital_status += 1
+        if vital_status is not None:
+            if vital_status.is_alive:
+                self._n_alive += 1
+            elif vital_status.is_deceased:
+                self._n_deceased += 1
+            if vital_status.age_of_death is not None:
+                self._n_with_age_of_last_encounter += 1
+
+        for phenotype in patient.phenotypes:
+            term_id = phenotype.identifier.value
+            self._hpo_term_ids.add(term_id)
+            if phenotype.is_present:
+                self._present_phenotype_counts[term_id] += 1
+
+        for measurement in patient.measurements:
+            measurement_id = measurement.identifier.value
+            self._measurement_counts[measurement_id] += 1
+            self._measurement_names.setdefault(measurement_id, measurement.name)
+
+        # Effects of the patient variants, keyed by transcript ID and effect name.
+        patient_effects = Counter()
+        variant_keys = []
+        for i, variant in enumerate(patient.variants):
+            variant_key = variant.variant_info.variant_key
+            variant_keys.append(variant_key)
+            self._variant_counts[variant_key] += 1
+            self._variants.setdefault(variant_key, variant)
+            # The variants include the genotypes of the individual, hence only the variants
+            # of the same individual can be equal. We avoid hashing the variants for speed.
+            is_new = not any(
+                other.variant_info.variant_key == variant_key and other == variant
+                for other in patient.variants[:i]
+            )
+            if is_new:
+                self._distinct_variant_counts[variant_key] += 1
+            for txa in variant.tx_annotations:
+                for effect in txa.variant_effects:
+                    patient_effects[(txa.transcript_id, effect.name)] += 1
+                    if is_new:
+                        self._effect_counts_by_tx[txa.transcript_id][effect.name] += 1
+
+        has_disease_onset = False
+        for disease in patient.diseases:
+            disease_id = disease.identifier.value
+            self._disease_counts[disease_id] += 1
+            self._disease_names.setdefault(disease_id, disease.name)
+            self._disease_variant_counts[disease_id].update(variant_keys)
+            self._disease_effect_counts[disease_id].update(patient_effects)
+            has_disease_onset = has_disease_onset or disease.onset is not None
+        if has_disease_onset:
+            self._n_with_disease_onset += 1
+
+    def count_males(self) -> int:
+        return self._sex_counts[Sex.MALE]
+
+    def count_females(self) -> int:
+        return self._sex_counts[Sex.FEMALE]
+
+    def count_unknown_sex(self) -> int:
+        return self._sex_counts[Sex.UNKNOWN_SEX]
+
+    def count_alive(self) -> int:
+        return self._n_alive
+
+    def count_deceased(self) -> int:
+        return self._n_deceased
+
+    def count_unknown_vital_status(self) -> int:
+        return self._n_unknown_vital_status
+
+    def count_with_age_of_last_encounter(self) -> int:
+        return self._n_with_age_of_last_encounter
+
+    def count_with_disease_onset(self) -> int:
+        return self._n_with_disease_onset
+
+    def get_excluded_count(self) -> int:
+        return self._excluded_count
+
+    def count_distinct_hpo_terms(self) -> int:
+        """
+        Get count of distinct HPO terms (either in present or excluded state) seen in the cohort members.
+        """
+        return len(self._hpo_term_ids)
+
+    def count_distinct_measurements(self) -> int:
+        return len(self._measurement_counts)
+
+    def count_distinct_diseases(self) -> int:
+        return len(self._disease_counts)
+
+    def count_distinct_variants(self) -> int:
+        """
+        Get the count of distinct variants (variant keys) observed in the cohort members.
+        """
+        return len(self._variant_counts)
+
+    def list_present_phenotypes(
+        self,
+        top: typing.Optional[int] = None,
+    ) -> typing.Sequence[typing.Tuple[str, int]]:
+        """
+        Get a sequence with (HPO term CURIE, count) tuples of the present phenotypes, starting with the most common.
+
+        :param top: the number of the most common phenotypes to list or `None` to list all phenotypes.
+        """
+        return self._present_phenotype_counts.most_common(top)
+
+    def list_measurements(
+        self,
+        top: typing.Optional[int] = None,
+    ) -> typing.Sequence[typing.Tuple[str, int]]:
+        """
+        Get a sequence with (measurement ID, count) tuples, starting with the most common.
+
+        :param top: the number of the most common measurements to list or `None` to list all measurements.
+        """
+        return self._measurement_counts.most_common(top)
+
+    def list_all_diseases(
+        self,
+        top: typing.Optional[int] = None,
+    ) -> typing.Sequence[typing.Tuple[str, int]]:
+        """
+        Get a sequence with (disease ID, count) tuples, starting with the most common.
+
+        :param top: the number of the most common diseases to list or `None` to list all diseases.
+        """
+        return self._disease_counts.most_common(top)
+
+    def list_all_variants(
+        self,
+        top: typing.Optional[int] = None,
+    ) -> typing.Sequence[typing.Tuple[str, int]]:
+        """
+        Get a sequence with (variant key, count) tuples, where count is the number of individuals
+        with the variant, starting with the most common.
+
+        :param top: the number of the most common variants to list or `None` to list all variants.
+        """
+        return self._variant_counts.most_common(top)
+
+    def list_distinct_variants(self) -> typing.Sequence[typing.Tuple[str, int]]:
+        """
+        Get a sequence with (variant key, count) tuples, where count is the number of distinct
+        :class:`~gpsea.model.Variant` objects with the key (see :meth:`~gpsea.model.Cohort.all_variants`),
+        starting with the most common.
+        """
+        return self._distinct_variant_counts.most_common()
+
+    def get_measurement_name(
+        self,
+        measurement_id: str,
+    ) -> typing.Optional[str]:
+        return self._measurement_names.get(measurement_id)
+
+    def get_disease_name(
+        self,
+        disease_id: str,
+    ) -> typing.Optional[str]:
+        return self._disease_names.get(disease_id)
+
+    def get_variant(
+        self,
+        variant_key: str,
+    ) -> typing.Optional[Variant]:
+        """
+        Get a variant with the `variant_key`, to describe the variant in the report,
+        or `None` if no cohort member has the variant.
+        """
+        return self._variants.get(variant_key)
+
+    def variant_effect_counts(
+        self,
+        tx_id: str,
+    ) -> typing.Mapping[str, int]:
+        """
+        Get a mapping from the variant effect name to the count of the distinct variants
+        with the effect on the transcript `tx_id` (see :meth:`~gpsea.model.Cohort.variant_effect_count_by_tx`).
+        """
+        return self._effect_counts_by_tx.get(tx_id, Counter())
+
+    def disease_variant_counts(
+        self,
+        disease_id: str,
+    ) -> typing.Mapping[str, int]:
+        """
+        Get a mapping from the variant key to the count of the individuals diagnosed with `disease_id`
+        who have the variant.
+        """
+        return self._disease_variant_counts.get(disease_id, Counter())
+
+    def disease_effect_counts(
+        self,
+        disease_id: str,
+        tx_id: typing.Optional[str],
+    ) -> typing.Mapping[str, int]:
+        """
+        Get a mapping from the variant effect name to the count of the variant effects on the transcript `tx_id`
+        in the individuals diagnosed with `disease_id`.
+        """
+        counts = Counter()
+        for (effect_tx_id, effect), count in self._disease_effect_counts.get(disease_id, Counter()).items():
+            if effect_tx_id == tx_id:
+                counts[effect] += count
+        return counts
+
+    def __len__(self) -> int:
+        return self._n_individuals
@@ -1,8 +1,8 @@
 import typing
 from collections import defaultdict
 from matplotlib import pyplot as plt
+from matplotlib.collections import LineCollection, PatchCollection
 from matplotlib.patches import Rectangle
-from matplotlib.lines import Line2D
 from gpsea.model import Variant, TranscriptCoordinates, ProteinMetadata
 
 
@@ -42,6 +42,7 @@ class VariantTranscriptVisualizer:
         #rect = Rectangle((prot_start, BOTTOM_MARGIN), prot_width, protein_height)
         rect = Rectangle((50, 30), prot_width, 40, edgecolor='black', facecolor='white', alpha=0.5)
         ax.add_patch(rect)
+        stems = []
         for variant in variants:
             tx_annot_list = [txa for txa in variant.tx_annotations if txa.transcript_id == tx.identifier]
             if len(tx_annot_list) == 0:
@@ -75,30 +76,27 @@ class VariantTranscriptVisualizer:
             ybase = BOTTOM_MARGIN + protein_height
             ytop = ybase + 10
             y = [ybase, ytop]
-            line = Line2D(x, y)
-            ax.add_line(line)
-            # TODO show one box per mutation or otherwise represent frequency
-            color_list = ['red', 'blue', 'green', 'orange', 'brown', 'yellow', 'purple']
-            feature_to_color_index_d = defaultdict(int) # default is red
-            for feature in protein_domains:
-                name = feature.name
-                if name not in feature_to_color_index_d:
-                    new_idx = len(feature_to_color_index_d) % len(color_list)
-                    feature_to_color_index_d[name] = new_idx
-                color_idx = feature_to_color_index_d.get(name)
-                box_color = color_list[color_idx]
-                start = feature.start
-                end = feature.end
-                #print(name, start, end, box_color)
-                _box_height = 10/amino_acid_len
-                prot_width = prot_end - prot_start + 1
-                protein_height = prot_width/20
-                #rect = Rectangle((prot_start, BOTTOM_MARGIN), prot_width, protein_height)
-                box_start = get_interpolated_location_in_protein(start,  amino_acid_len)
-                box_end = get_interpolated_location_in_protein(end, amino_acid_len)
-                box_width = box_end - box_start
-                rect = Rectangle((box_start, 30), box_width, 40, edgecolor='black', facecolor=box_color, alpha=0.5)
-                ax.add_patch(rect)
+            stems.append(list(zip(x, y)))
+        # Draw the stems of all variants as a single collection.
+        ax.add_collection(LineCollection(stems))
+
+        # TODO show one box per mutation or otherwise represent frequency
+        color_list = ['red', 'blue', 'green', 'orange', 'brown', 'yellow', 'purple']
+        feature_to_color_index_d = defaultdict(int) # default is red
+        boxes = []
+        box_colors = []
+        for feature in protein_domains:
+            name = feature.name
+            if name not in feature_to_color_index_d:
+                new_idx = len(feature_to_color_index_d) % len(color_list)
+                feature_to_color_index_d[name] = new_idx
+            color_idx = feature_to_color_index_d.get(name)
+            box_colors.append(color_list[color_idx])
+            box_start = get_interpolated_location_in_protein(feature.start, amino_acid_len)
+            box_end = get_interpolated_location_in_protein(feature.end, amino_acid_len)
+            boxes.append(Rectangle((box_start, 30), box_end - box_start, 40))
+        # Draw each domain box once, as a single collection.
+        ax.add_collection(PatchCollection(boxes, edgecolors='black', facecolors=box_colors, alpha=0.5))
         ax.set_title(title, loc='left', fontsize='x-large')
         ax.set_xlabel('X Label', labelpad=12, fontsize=14.5)
         ax.set_ylabel('Y label', labelpad=12, fontsize=14.5)
@@ -8,6 +8,7 @@ from gpsea.model import Cohort, Variant, VariantEffect, ProteinMetadata
 from gpsea.analysis.pcats import HpoTermAnalysisResult
 from ._base import BaseViewer, GpseaReport, HtmlGpseaReport
 from ._formatter import VariantFormatter
+from ._summary import CohortSummary
 
 
 ToDisplay = namedtuple("ToDisplay", ["hgvs_cdna", "hgvsp", "variant_effects"])
@@ -48,6 +49,7 @@ class CohortViewer(BaseViewer):
         self,
         cohort: Cohort,
         transcript_id: str,
+        summary: typing.Optional[CohortSummary] = None,
     ) -> GpseaReport:
         """
         Generate the report for a given `cohort`.
@@ -57,31 +59,45 @@ class CohortViewer(BaseViewer):
         Args:
             cohort (Cohort): the cohort to visualize
             transcript_id (str): the accession of the target transcript (e.g. `NM_123456.7`)
+            summary (Optional[CohortSummary]): the summary of the `cohort` to share with other viewers
+              or `None` if the summary should be computed.
 
         Returns:
             GpseaReport: a report that can be stored to a path or displayed in
                 interactive environment such as Jupyter notebook.
         """
-        context = self._prepare_context(cohort, transcript_id=transcript_id)
+        _, context = self._prepare_report(cohort, transcript_id, summary=summary)
         report = self._cohort_template.render(context)
         return HtmlGpseaReport(html=report)
 
-    def _prepare_context(
+    def _prepare_report(
         self,
         cohort: Cohort,
+        transcript_id: str,
+        summary: typing.Optional[CohortSummary] = None,
+    ) -> typing.Tuple[str, typing.Mapping[str, typing.Any]]:
+        if summary is None:
+            summary = CohortSummary.summarize(cohort)
+        return self._cohort_template.name, self._prepare_context(summary, transcript_id=transcript_id)
+
+    def _prepare_context(
+        self,
+        summary: CohortSummary,
         transcript_id: typing.Optional[str],
     ) -> typing.Mapping[str, typing.Any]:
-        hpo_counts = self._summarize_hpo_counts(cohort)
+        hpo_counts = self._summarize_hpo_counts(summary)
 
-        measurement_counts = self._summarize_measurement_counts(cohort)
+        measurement_counts = self._summarize_measurement_counts(summary)
 
-        disease_counts = self._summarize_disease_counts(cohort)
+        disease_counts = self._summarize_disease_counts(summary)
 
         variant_counts = list()
+        top_variants = summary.list_all_variants(top=self._top_variant_count)
         variant_to_display_d = CohortViewer._get_variant_description(
-            cohort, transcript_id
+            (summary.get_variant(variant_key) for variant_key, _ in top_variants),
+            transcript_id,
         )
-        for variant_key, count in cohort.list_all_variants(top=self._top_variant_count):
+        for variant_key, count in top_variants:
             # get HGVS or human readable variant
             if variant_key in variant_to_display_d:
                 display = variant_to_display_d[variant_key]
@@ -110,17 +126,10 @@ class CohortViewer(BaseViewer):
         variant_effects = list()
         has_transcript = transcript_id is not None
         if has_transcript:
-            var_effects_d = dict()
-            for tx_id, counter in cohort.variant_effect_count_by_tx(
-                tx_id=transcript_id
-            ).items():
-                # e.g., data structure
-                #   -- {'effect}': 'FRAMESHIFT_VARIANT', 'count': 175},
-                #   -- {'effect}': 'STOP_GAINED', 'count': 67},
-                if tx_id == transcript_id:
-                    for effect, count in counter.items():
-                        var_effects_d[effect] = count
-                    break
+            # e.g., data structure
+            #   -- {'effect}': 'FRAMESHIFT_VARIANT', 'count': 175},
+            #   -- {'effect}': 'STOP_GAINED', 'count': 67},
+            var_effects_d = summary.variant_effect_counts(transcript_id)
             total = sum(var_effects_d.values())
             # Sort in descending order based on counts
             for effect, count in sorted(
@@ -136,42 +145,9 @@ class CohortViewer(BaseViewer):
         else:
             transcript_id = "MANE transcript ID"
 
-        n_has_disease_onset = 0
-        hpo_id_to_has_cnset_count_d = defaultdict(int)
-        for pat in cohort.all_patients:
-            diseases = pat.diseases
-            for d in diseases:
-                if d.onset is not None:
-                    n_has_disease_onset += 1
-                    break  # for now, do this for any diseases. All of our current phenopackets habve but one disease
-            terms_and_ancestors_with_onset_information = set()
-            for pf in pat.present_phenotypes():
-                if pf.onset is not None:
-                    ancs = self._hpo.graph.get_ancestors(
-                        pf.identifier, include_source=True
-                    )
-                    terms_and_ancestors_with_onset_information.update(ancs)
-            for hpo_id in terms_and_ancestors_with_onset_information:
-                hpo_id_to_has_cnset_count_d[hpo_id] += 1
-
-        # When we get here, we want to present the counts of HPO terms that have onset information
-        # onset_threshold = int(0.2 * len(cohort))  # only show terms with a decent amount of information
-        # has_onset_information = list()
-        # for hpo_id, count in hpo_id_to_has_cnset_count_d.items():
-        #     if count < onset_threshold:
-        #         continue
-        #     label = self._hpo.get_term_name(hpo_id)
-        #     if label is not None:
-        #         display_label = f"{label} ({hpo_id})"
-        #     else:
-        #         display_label = hpo_id
-        #     has_onset_information.append(
-        #         {"HPO": display_label, "count": count})
-        # n_has_onset_info = len(has_onset_information)
-
         # The following dictionary is used by the Jinja2 HTML template
         return {
-            "cohort": cohort,
+            "summary": summary,
             "transcript_id": transcript_id,
             "has_transcript": has_transcript,
             "top_phenotype_count": self._top_phenotype_count,
@@ -185,10 +161,10 @@ class CohortViewer(BaseViewer):
 
     def _summarize_hpo_counts(
         self,
-        cohort: Cohort,
+        summary: CohortSummary,
     ) -> typing.Sequence[IdentifiedCount]:
         counts = list()
-        for term_id, count in cohort.list_present_phenotypes(
+        for term_id, count in summary.list_present_phenotypes(
             top=self._top_phenotype_count,
         ):
             label = self._hpo.get_term_name(term_id)
@@ -207,50 +183,44 @@ class CohortViewer(BaseViewer):
 
     def _summarize_measurement_counts(
         self,
-        cohort: Cohort,
+        summary: CohortSummary,
     ) -> typing.Sequence[IdentifiedCount]:
-        measurement2label = {
-            m.identifier.value: m.name for m in cohort.all_measurements()
-        }
-
         return [
             IdentifiedCount(
                 term_id=measurement_id,
-                label=measurement2label.get(measurement_id, "N/A"),
+                label=summary.get_measurement_name(measurement_id) or "N/A",
                 count=count,
             )
-            for measurement_id, count in cohort.list_measurements(
+            for measurement_id, count in summary.list_measurements(
                 top=self._top_phenotype_count,
             )
         ]
 
     def _summarize_disease_counts(
         self,
-        cohort: Cohort,
+        summary: CohortSummary,
     ) -> typing.Sequence[IdentifiedCount]:
-        disease2label = {m.identifier.value: m.name for m in cohort.all_diseases()}
-
         return [
             IdentifiedCount(
                 term_id=disease_id,
-                label=disease2label.get(disease_id, "N/A"),
+                label=summary.get_disease_name(disease_id) or "N/A",
                 count=count,
             )
-            for disease_id, count in cohort.list_all_diseases(
+            for disease_id, count in summary.list_all_diseases(
                 top=self._top_phenotype_count,
             )
         ]
 
     @staticmethod
     def _get_variant_description(
-        cohort: Cohort,
+        variants: typing.Iterable[Variant],
         transcript_id: typing.Optional[str],
         only_hgvs: bool = True,
     ) -> typing.Mapping[str, ToDisplay]:
         """
         Get user-friendly strings (e.g., HGVS for our target transcript) to match to the chromosomal strings
         Args:
-            cohort (Cohort): The cohort being analyzed in the current Notebook
+            variants (Iterable[Variant]): The variants to describe
             transcript_id (str): the transcript that we map variants onto
             only_hgvs (bool): do not show the transcript ID part of the HGVS annotation, just the annotation.
 
@@ -262,7 +232,7 @@ class CohortViewer(BaseViewer):
         chrom_to_display = dict()
         var_formatter = VariantFormatter(transcript_id)
 
-        for var in cohort.all_variants():
+        for var in variants:
             variant_key = var.variant_info.variant_key
             display = var_formatter.format_as_string(var)
             if transcript_id is None:
@@ -312,52 +282,41 @@ class DiseaseViewer(BaseViewer):
     def process(
         self,
         cohort: Cohort,
+        summary: typing.Optional[CohortSummary] = None,
     ) -> GpseaReport:
-        context = self._prepare_context(cohort)
+        _, context = self._prepare_report(cohort, summary=summary)
         html = self._cohort_template.render(context)
         return HtmlGpseaReport(html=html)
 
-    def _prepare_context(
+    def _prepare_report(
         self,
         cohort: Cohort,
+        summary: typing.Optional[CohortSummary] = None,
+    ) -> typing.Tuple[str, typing.Mapping[str, typing.Any]]:
+        if summary is None:
+            summary = CohortSummary.summarize(cohort)
+        return self._cohort_template.name, self._prepare_context(summary)
+
+    def _prepare_context(
+        self,
+        summary: CohortSummary,
     ) -> typing.Mapping[str, typing.Any]:
-        diseases = cohort.list_all_diseases()
+        diseases = summary.list_all_diseases()
         n_diseases = len(diseases)
         disease_counts = list()
-        disease_variants_counts = defaultdict(Counter)
+        disease_variants_counts = {}
         disease_effects_counts = {}
         for curie, count in diseases:
-            disease_name = "Unknown"
-            disease_variants_counts[curie] = Counter()
-            disease_effects_counts[curie] = Counter()
-
-            for dis in cohort.all_diseases():
-                if dis.identifier.value == curie:
-                    disease_name = dis.name
-                    break
-
+            disease_name = summary.get_disease_name(curie)
             disease_counts.append(
                 {
                     "disease_id": curie,
-                    "disease_name": disease_name,
+                    "disease_name": "Unknown" if disease_name is None else disease_name,
                     "count": count,
                 }
             )
-
-            for pat in cohort.all_patients:
-                for disease in pat.diseases:
-                    variant_key_count = disease_variants_counts[
-                        disease.identifier.value
-                    ]
-                    variant_key_count.update(
-                        variant.variant_info.variant_key for variant in pat.variants
-                    )
-                    for variant in pat.variants:
-                        for txa in variant.tx_annotations:
-                            if self._tx_id == txa.transcript_id:
-                                disease_effects_counts[curie].update(
-                                    eff.name for eff in txa.variant_effects
-                                )
+            disease_variants_counts[curie] = summary.disease_variant_counts(curie)
+            disease_effects_counts[curie] = summary.disease_effect_counts(curie, self._tx_id)
 
         return {
             "n_diseases": n_diseases,
@@ -388,39 +347,47 @@ class CohortVariantViewer(BaseViewer):
             print(f"[WARNING] Non-RefSeq transcript id: {tx_id}")
         self._transcript_id = tx_id
 
-    def process(self, cohort: Cohort, only_hgvs: bool = True) -> GpseaReport:
+    def process(
+        self,
+        cohort: Cohort,
+        only_hgvs: bool = True,
+        summary: typing.Optional[CohortSummary] = None,
+    ) -> GpseaReport:
         """
         Generate the variant report.
 
         Args:
             cohort (Cohort): The cohort being analyzed in the current notebook.
             only_hgvs (bool): Do not show the transcript ID part of the HGVS annotation, just the annotation.
+            summary (Optional[CohortSummary]): the summary of the `cohort` to share with other viewers
+              or `None` if the summary should be computed.
 
         Returns:
             GpseaReport: a report that can be stored to a path or displayed in
                 interactive environment such as Jupyter notebook.
         """
-        context = self._prepare_context(cohort, only_hgvs=only_hgvs)
+        _, context = self._prepare_report(cohort, only_hgvs=only_hgvs, summary=summary)
         html = self._cohort_template.render(context)
         return HtmlGpseaReport(html=html)
 
-    def _prepare_context(
+    def _prepare_report(
         self,
         cohort: Cohort,
+        only_hgvs: bool = True,
+        summary: typing.Optional[CohortSummary] = None,
+    ) -> typing.Tuple[str, typing.Mapping[str, typing.Any]]:
+        if summary is None:
+            summary = CohortSummary.summarize(cohort)
+        return self._cohort_template.name, self._prepare_context(summary, only_hgvs=only_hgvs)
+
+    def _prepare_context(
+        self,
+        summary: CohortSummary,
         only_hgvs: bool,
     ) -> typing.Mapping[str, typing.Any]:
-        variant_count_dictionary = Counter()
-        variant_key_to_variant = dict()
-
-        for var in cohort.all_variants():
-            var_key = var.variant_info.variant_key
-            vdata = self._get_variant_data(var, only_hgvs)
-            variant_key_to_variant[var_key] = vdata
-            variant_count_dictionary[var_key] += 1
-
         variant_counts = list()
-        for var_key, count in variant_count_dictionary.items():
-            var_data = variant_key_to_variant[var_key]
+        for var_key, count in summary.list_distinct_variants():
+            var_data = self._get_variant_data(summary.get_variant(var_key), only_hgvs)
             variant_counts.append(
                 {
                     "count": count,
@@ -540,10 +507,16 @@ class ProteinVariantViewer(BaseViewer):
             GpseaReport: a report that can be stored to a path or displayed in
                 interactive environment such as Jupyter notebook.
         """
-        context = self._prepare_context(cohort)
+        _, context = self._prepare_report(cohort)
         html = self._cohort_template.render(context)
         return HtmlGpseaReport(html=html)
 
+    def _prepare_report(
+        self,
+        cohort: Cohort,
+    ) -> typing.Tuple[str, typing.Mapping[str, typing.Any]]:
+        return self._cohort_template.name, self._prepare_context(cohort)
+
     def _prepare_context(self, cohort: Cohort) -> typing.Mapping[str, typing.Any]:
         protein_id = self._protein_meta.protein_id
         protein_label = self._protein_meta.label
@@ -553,9 +526,8 @@ class ProteinVariantViewer(BaseViewer):
 
         # collect variants that are located in the protein features as well as other variants that are located
         # "in-between" the features
-        feature_to_variants = defaultdict(list)
-        non_feature_count = 0
-        n_variants_in_features = 0
+        hgvs_ps = []
+        target_regions = []
 
         # This iterates over variants as recorded in individuals,
         # not over *unique* `VariantInfo`s
@@ -581,13 +553,19 @@ class ProteinVariantViewer(BaseViewer):
             if target_region is None:
                 # can happen for certain variant classes such as splice variant. Not an error
                 continue
-            found_overlap = False
-            for feature in protein_features:
-                if feature.info.region.overlaps_with(target_region):
-                    found_overlap = True
-                    feature_to_variants[feature].append(hgvs_p)
+            hgvs_ps.append(hgvs_p)
+            target_regions.append(target_region)
+
+        # Find the overlapping features of all variants at once.
+        feature_to_variants = defaultdict(list)
+        non_feature_count = 0
+        n_variants_in_features = 0
+        overlaps = self._protein_meta.feature_index.overlapping_each(target_regions)
+        for hgvs_p, features in zip(hgvs_ps, overlaps):
+            for feature in features:
+                feature_to_variants[feature].append(hgvs_p)
 
-            if found_overlap:
+            if len(features) > 0:
                 n_variants_in_features += 1
             else:
                 non_feature_count += 1
@@ -640,11 +618,17 @@ class MtcStatsViewer(BaseViewer):
             GpseaReport: a report that can be stored to a path or displayed in
                 interactive environment such as Jupyter notebook.
         """
-        assert isinstance(result, HpoTermAnalysisResult)
-        context = self._prepare_context(result)
+        _, context = self._prepare_report(result)
         html = self._cohort_template.render(context)
         return HtmlGpseaReport(html=html)
 
+    def _prepare_report(
+        self,
+        result: HpoTermAnalysisResult,
+    ) -> typing.Tuple[str, typing.Mapping[str, typing.Any]]:
+        assert isinstance(result, HpoTermAnalysisResult)
+        return self._cohort_template.name, self._prepare_context(result)
+
     @staticmethod
     def _prepare_context(
         report: HpoTermAnalysisResult,
@@ -2,14 +2,15 @@ import typing
 
 import hpotk
 import numpy as np
+import pandas as pd
 import pytest
 
 from gpsea.model import Cohort
 
 from gpsea.analysis.mtc_filter import PhenotypeMtcFilter, IfHpoFilter
-from gpsea.analysis.pcats import HpoTermAnalysis
+from gpsea.analysis.pcats import HpoTermAnalysis, HpoTermAnalysisResult, IncrementalHpoTermAnalysis
 from gpsea.analysis.pcats.stats import CountStatistic, FisherExactTest
-from gpsea.analysis.clf import GenotypeClassifier, PhenotypeClassifier
+from gpsea.analysis.clf import GenotypeClassifier, PhenotypeClassifier, sex_classifier
 
 
 class TestHpoTermAnalysis:
@@ -97,3 +98,137 @@ class TestHpoTermAnalysis:
         ), "No tests should have been done due to MTC filtering"
         assert np.all(np.isnan(result.pvals)), "All p values should be NaN"
         assert result.corrected_pvals is None
+
+    @pytest.mark.parametrize("n_workers", [1, 2])
+    def test_compare_genotypes_vs_phenotypes(
+        self,
+        analysis: HpoTermAnalysis,
+        suox_cohort: Cohort,
+        suox_gt_clf: GenotypeClassifier,
+        suox_pheno_clfs: typing.Sequence[PhenotypeClassifier[hpotk.TermId]],
+        n_workers: int,
+    ):
+        gt_clfs = (suox_gt_clf, sex_classifier())
+
+        results = analysis.compare_genotypes_vs_phenotypes(
+            cohort=suox_cohort.all_patients,
+            gt_clfs=gt_clfs,
+            pheno_clfs=suox_pheno_clfs,
+            n_workers=n_workers,
+        )
+
+        assert len(results) == len(gt_clfs)
+        for gt_clf, result in zip(gt_clfs, results):
+            expected = analysis.compare_genotype_vs_phenotypes(
+                cohort=suox_cohort.all_patients,
+                gt_clf=gt_clf,
+                pheno_clfs=suox_pheno_clfs,
+            )
+            assert result == expected
+
+
+class TestIncrementalHpoTermAnalysis:
+
+    @pytest.fixture(scope="class")
+    def analysis(
+        self,
+        hpo: hpotk.MinimalOntology,
+    ) -> HpoTermAnalysis:
+        return HpoTermAnalysis(
+            count_statistic=FisherExactTest(),
+            mtc_filter=IfHpoFilter.default_filter(hpo=hpo, annotation_frequency_threshold=0.25),
+            mtc_correction="fdr_bh",
+            mtc_alpha=0.05,
+        )
+
+    def test_result_matches_full_analysis(
+        self,
+        analysis: HpoTermAnalysis,
+        suox_cohort: Cohort,
+        suox_gt_clf: GenotypeClassifier,
+        suox_pheno_clfs: typing.Sequence[PhenotypeClassifier[hpotk.TermId]],
+    ):
+        patients = sorted(suox_cohort.all_patients, key=lambda p: p.patient_id)
+        initial, added = patients[:-5], patients[-5:]
+        removed = initial[:3]
+
+        incremental = IncrementalHpoTermAnalysis(
+            analysis=analysis,
+            gt_clf=suox_gt_clf,
+            pheno_clfs=suox_pheno_clfs,
+            individuals=initial,
+        )
+        TestIncrementalHpoTermAnalysis.assert_same_results(
+            incremental.result(),
+            analysis.compare_genotype_vs_phenotypes(
+                cohort=initial,
+                gt_clf=suox_gt_clf,
+                pheno_clfs=suox_pheno_clfs,
+            ),
+        )
+
+        incremental.add_patients(added)
+        incremental.remove_patients(removed)
+
+        expected = analysis.compare_genotype_vs_phenotypes(
+            cohort=patients[3:],
+            gt_clf=suox_gt_clf,
+            pheno_clfs=suox_pheno_clfs,
+        )
+        assert len(incremental.individuals) == len(patients) - 3
+        TestIncrementalHpoTermAnalysis.assert_same_results(incremental.result(), expected)
+
+    def test_result_has_trace(
+        self,
+        analysis: HpoTermAnalysis,
+        suox_cohort: Cohort,
+        suox_gt_clf: GenotypeClassifier,
+        suox_pheno_clfs: typing.Sequence[PhenotypeClassifier[hpotk.TermId]],
+    ):
+        incremental = IncrementalHpoTermAnalysis(
+            analysis=analysis,
+            gt_clf=suox_gt_clf,
+            pheno_clfs=suox_pheno_clfs,
+            individuals=suox_cohort.all_patients,
+        )
+        first = incremental.result()
+        second = incremental.result()
+
+        assert first.trace is not None
+        assert first.trace.analysis == "IncrementalHpoTermAnalysis"
+        assert [stage.name for stage in first.trace.stages][:2] == ["count", "mtc_filter"]
+        assert first.trace.stage("count").n_items == len({clf.phenotype for clf in suox_pheno_clfs})
+        # No table changed between the results.
+        assert second.trace.stage("count").n_items == 0
+
+    @staticmethod
+    def assert_same_results(
+        actual: HpoTermAnalysisResult,
+        expected: HpoTermAnalysisResult,
+    ):
+        assert actual == expected
+        assert actual.n_usable == expected.n_usable
+        for a, e in zip(actual.all_counts, expected.all_counts):
+            pd.testing.assert_frame_equal(a, e)
+        assert actual.pvals == pytest.approx(expected.pvals, nan_ok=True)
+        assert actual.corrected_pvals == pytest.approx(expected.corrected_pvals, nan_ok=True)
+
+    def test_patients_are_checked(
+        self,
+        analysis: HpoTermAnalysis,
+        suox_cohort: Cohort,
+        suox_gt_clf: GenotypeClassifier,
+        suox_pheno_clfs: typing.Sequence[PhenotypeClassifier[hpotk.TermId]],
+    ):
+        patients = sorted(suox_cohort.all_patients, key=lambda p: p.patient_id)
+        incremental = IncrementalHpoTermAnalysis(
+            analysis=analysis,
+            gt_clf=suox_gt_clf,
+            pheno_clfs=suox_pheno_clfs,
+            individuals=patients[1:],
+        )
+
+        with pytest.raises(ValueError, match="is already included"):
+            incremental.add_patients(patients[1:2])
+        with pytest.raises(ValueError, match="is not included"):
+            incremental.remove_patients(patients[:1])
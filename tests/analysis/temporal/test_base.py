@@ -1,6 +1,9 @@
+import math
+
+import numpy as np
 import pytest
 
-from gpsea.analysis.temporal import Survival
+from gpsea.analysis.temporal import Survival, SurvivalArray
 
 
 class TestSurvival:
@@ -31,3 +34,73 @@ class TestSurvival:
         s = Survival(value=123, is_censored=True)
 
         assert hash(s) == -1172739046759774526
+
+
+class TestSurvivalArray:
+
+    @pytest.fixture
+    def survivals(self) -> SurvivalArray:
+        return SurvivalArray(
+            times=[12.0, math.nan, 5.0, 30.0],
+            is_censored=[False, False, True, False],
+        )
+
+    def test_properties(
+        self,
+        survivals: SurvivalArray,
+    ):
+        assert len(survivals) == 4
+        assert survivals.times.dtype == np.float64
+        assert survivals.is_censored.dtype == bool
+        assert survivals.is_available.tolist() == [True, False, True, True]
+
+    def test_arrays_are_read_only(
+        self,
+        survivals: SurvivalArray,
+    ):
+        with pytest.raises(ValueError):
+            survivals.times[0] = 1.0
+
+    def test_take(
+        self,
+        survivals: SurvivalArray,
+    ):
+        sample = survivals.take(np.array([2, 2, 0]))
+
+        assert sample.times.tolist() == [5.0, 5.0, 12.0]
+        assert sample.is_censored.tolist() == [True, True, False]
+
+    def test_available(
+        self,
+        survivals: SurvivalArray,
+    ):
+        available = survivals.available()
+
+        assert available == SurvivalArray(times=[12.0, 5.0, 30.0], is_censored=[False, True, False])
+
+    def test_round_trip(
+        self,
+        survivals: SurvivalArray,
+    ):
+        values = survivals.to_survivals()
+
+        assert values == (
+            Survival(value=12.0, is_censored=False),
+            None,
+            Survival(value=5.0, is_censored=True),
+            Survival(value=30.0, is_censored=False),
+        )
+        assert SurvivalArray.from_survivals(values) == survivals
+
+    def test_to_censored_data(
+        self,
+        survivals: SurvivalArray,
+    ):
+        data = survivals.to_censored_data()
+
+        assert data.num_censored() == 1
+        assert len(data) == 3
+
+    def test_shapes_must_match(self):
+        with pytest.raises(ValueError):
+            SurvivalArray(times=[1.0, 2.0], is_censored=[False])
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from gpsea.analysis.temporal import KaplanMeierBootstrap, SurvivalArray
+
+
+@pytest.fixture(scope="module")
+def survivals() -> SurvivalArray:
+    return SurvivalArray(
+        times=[1.0, 10.0, 10.0, 13.0, 16.0, np.nan, 4.0, 4.2, 6.0, 3.0],
+        is_censored=[True, True, False, False, True, False, True, False, False, True],
+    )
+
+
+class TestKaplanMeierBootstrap:
+
+    def test_estimate_matches_scipy(
+        self,
+        survivals: SurvivalArray,
+    ):
+        from scipy.stats import ecdf
+
+        bootstrap = KaplanMeierBootstrap(n_resamples=50, seed=42)
+
+        band = bootstrap.compute_band(survivals)
+
+        expected = ecdf(survivals.to_censored_data()).sf.evaluate(band.times)
+        assert band.times.tolist() == [1.0, 3.0, 4.0, 4.2, 6.0, 10.0, 13.0, 16.0]
+        assert band.estimate == pytest.approx(expected)
+
+    def test_band_encloses_the_estimate(
+        self,
+        survivals: SurvivalArray,
+    ):
+        bootstrap = KaplanMeierBootstrap(n_resamples=500, confidence_level=0.9, block_size=64, seed=42)
+
+        band = bootstrap.compute_band(survivals, times=np.array([0.0, 5.0, 12.0]))
+
+        assert band.times.tolist() == [0.0, 5.0, 12.0]
+        assert band.confidence_level == pytest.approx(0.9)
+        assert band.estimate[0] == pytest.approx(1.0)
+        assert (band.lower <= band.estimate).all()
+        assert (band.estimate <= band.upper).all()
+        assert ((0.0 <= band.lower) & (band.upper <= 1.0)).all()
+
+    def test_band_does_not_depend_on_the_number_of_workers(
+        self,
+        survivals: SurvivalArray,
+    ):
+        one = KaplanMeierBootstrap(n_resamples=200, block_size=50, n_workers=1, seed=7)
+        two = KaplanMeierBootstrap(n_resamples=200, block_size=50, n_workers=2, seed=7)
+
+        band_one = one.compute_band(survivals)
+        band_two = two.compute_band(survivals)
+
+        assert band_one.lower.tolist() == band_two.lower.tolist()
+        assert band_one.upper.tolist() == band_two.upper.tolist()
+
+    def test_requires_survivals(self):
+        bootstrap = KaplanMeierBootstrap(n_resamples=10)
+
+        with pytest.raises(ValueError):
+            bootstrap.compute_band(SurvivalArray(times=[np.nan], is_censored=[False]))
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"n_resamples": 0},
+            {"confidence_level": 1.0},
+            {"block_size": 0},
+            {"n_workers": 0},
+        ],
+    )
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            KaplanMeierBootstrap(**kwargs)
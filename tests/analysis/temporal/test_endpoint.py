@@ -1,4 +1,5 @@
 import hpotk
+import numpy as np
 
 
 import pytest
@@ -70,6 +71,23 @@ class TestDeath:
 
         assert survival is None
 
+    def test_compute_survivals(
+        self,
+        alive: Patient,
+        deceased: Patient,
+        patient_no_data: Patient,
+    ):
+        endpoint = death(timeline="postnatal")
+
+        survivals = endpoint.compute_survivals((alive, patient_no_data, deceased))
+
+        assert survivals.times[[0, 2]].tolist() == [40.0, 60.0]
+        assert np.isnan(survivals.times[1])
+        assert survivals.is_censored.tolist() == [True, False, False]
+        assert survivals.to_survivals() == tuple(
+            endpoint.compute_survival(p) for p in (alive, patient_no_data, deceased)
+        )
+
     def test_summarize(self):
         endpoint = death(timeline="postnatal")
 
@@ -195,6 +213,19 @@ class TestPhenotypeOnset:
         assert not survival.is_censored
         assert survival.value == pytest.approx(20.)  # Focal-onset seizure has the earliest onset
 
+    def test_compute_survivals(
+        self,
+        hpo: hpotk.MinimalOntology,
+        alive: Patient,
+        phenotyped: Patient,
+    ):
+        endpoint = hpo_onset(hpo, term_id="HP:0001250")  # Seizure
+
+        survivals = endpoint.compute_survivals((phenotyped, alive))
+
+        assert survivals.times.tolist() == [20.0, 40.0]
+        assert survivals.is_censored.tolist() == [False, True]
+
     def test_summarize(
         self,
         hpo: hpotk.MinimalOntology,
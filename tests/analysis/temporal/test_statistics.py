@@ -1,8 +1,11 @@
 import math
+
+import numpy as np
 import pytest
 
-from gpsea.analysis.temporal import Survival
+from gpsea.analysis.temporal import Survival, SurvivalArray
 from gpsea.analysis.temporal.stats import LogRankTest
+from gpsea.analysis.temporal.stats._impl import logrank_per_group
 
 
 class TestLogRankTest:
@@ -35,6 +38,24 @@ class TestLogRankTest:
 
         assert result.pval == pytest.approx(0.013383101)
 
+    def test_compute_pval_for_survival_arrays(
+        self,
+        statistic: LogRankTest,
+    ):
+        values = (
+            SurvivalArray(
+                times=[1.0, 10.0, 10.0, 13.0, 16.0, math.nan],
+                is_censored=[True, True, False, False, True, False],
+            ),
+            SurvivalArray(
+                times=[1.0, 4.0, 4.2, 6.0, 3.0],
+                is_censored=[False, True, False, False, True],
+            ),
+        )
+        result = statistic.compute_pval(values)
+
+        assert result.pval == pytest.approx(0.013383101)
+
     def test_compute_pval_for_weird_dataset(
         self,
         statistic: LogRankTest,
@@ -56,3 +77,35 @@ class TestLogRankTest:
         assert result.statistic is not None
         assert math.isnan(result.statistic)
         assert math.isnan(result.pval)
+
+
+def test_logrank_per_group():
+    # The first group is the dataset of `test_compute_pval`, the second group is the weird dataset,
+    # and the third group has no `y` survivals.
+    group_ids = np.array([0] * 10 + [1] * 6 + [2] * 2)
+    times = np.array(
+        [1.0, 10.0, 10.0, 13.0, 16.0, 1.0, 4.0, 4.2, 6.0, 3.0]
+        + [0.0] * 6
+        + [5.0, 7.0]
+    )
+    is_censored = np.array(
+        [True, True, False, False, True, False, True, False, False, True]
+        + [False] * 6
+        + [False, True]
+    )
+    in_x = np.array([True] * 5 + [False] * 5 + [True] * 4 + [False] * 2 + [True] * 2)
+
+    # Shuffle the survivals to check that the order does not matter.
+    order = np.random.default_rng(seed=42).permutation(group_ids.size)
+
+    statistic, pval = logrank_per_group(
+        group_ids=group_ids[order],
+        times=times[order],
+        is_censored=is_censored[order],
+        in_x=in_x[order],
+        n_groups=4,
+    )
+
+    assert pval[0] == pytest.approx(0.013383101)
+    assert np.isnan(statistic[1:]).all()
+    assert np.isnan(pval[1:]).all()
@@ -1,4 +1,5 @@
 import json
+import math
 import os
 
 import hpotk
@@ -13,7 +14,12 @@ from gpsea.io import GpseaJSONDecoder
 from gpsea.analysis import StatisticResult
 from gpsea.analysis.clf import GenotypeClassifier, diagnosis_classifier, monoallelic_classifier
 from gpsea.analysis.predicate import exon
-from gpsea.analysis.temporal import SurvivalAnalysis, SurvivalAnalysisResult, Survival
+from gpsea.analysis.temporal import (
+    MultiEndpointSurvivalAnalysis,
+    SurvivalAnalysis,
+    SurvivalAnalysisResult,
+    Survival,
+)
 from gpsea.analysis.temporal.endpoint import hpo_onset, death
 from gpsea.analysis.temporal.stats import LogRankTest
 
@@ -99,6 +105,81 @@ class TestSurvivalAnalysis:
         )
 
 
+class TestMultiEndpointSurvivalAnalysis:
+    @pytest.fixture(scope="class")
+    def analysis(self) -> MultiEndpointSurvivalAnalysis:
+        return MultiEndpointSurvivalAnalysis()
+
+    def test_compare_genotype_vs_onsets(
+        self,
+        analysis: MultiEndpointSurvivalAnalysis,
+        hpo: hpotk.MinimalOntology,
+        umod_cohort: Cohort,
+        umod_gt_clf: GenotypeClassifier,
+    ):
+        term_ids = ("HP:0003774", "HP:0000118")
+
+        result = analysis.compare_genotype_vs_onsets(
+            cohort=umod_cohort,
+            gt_clf=umod_gt_clf,
+            hpo=hpo,
+            term_ids=term_ids,
+        )
+
+        assert result.endpoints == tuple(hpo_onset(hpo=hpo, term_id=term_id) for term_id in term_ids)
+        assert result.mtc_correction == "fdr_bh"
+        assert len(result.corrected_pvals) == 2
+        # Stage 5 chronic kidney disease
+        assert result.pvals[0] == pytest.approx(0.062004258)
+
+    def test_agrees_with_survival_analysis(
+        self,
+        analysis: MultiEndpointSurvivalAnalysis,
+        hpo: hpotk.MinimalOntology,
+        umod_cohort: Cohort,
+        umod_gt_clf: GenotypeClassifier,
+    ):
+        result = analysis.compare_genotype_vs_onsets(
+            cohort=umod_cohort,
+            gt_clf=umod_gt_clf,
+            hpo=hpo,
+        )
+
+        assert len(result.endpoints) > 0
+        survival_analysis = SurvivalAnalysis(statistic=LogRankTest())
+        for endpoint, statistic_result in zip(result.endpoints, result.statistic_results):
+            try:
+                expected = survival_analysis.compare_genotype_vs_survival(
+                    cohort=umod_cohort,
+                    gt_clf=umod_gt_clf,
+                    endpoint=endpoint,
+                ).pval
+            except AnalysisException:
+                expected = None
+
+            if statistic_result is None or math.isnan(statistic_result.pval):
+                assert expected is None or math.isnan(expected)
+            else:
+                assert statistic_result.pval == pytest.approx(expected)
+
+    def test_requires_two_genotype_groups(
+        self,
+        analysis: MultiEndpointSurvivalAnalysis,
+        hpo: hpotk.MinimalOntology,
+        umod_cohort: Cohort,
+    ):
+        gt_clf = diagnosis_classifier(
+            diagnoses=("OMIM:100000", "OMIM:200000", "OMIM:300000"),
+        )
+
+        with pytest.raises(ValueError):
+            analysis.compare_genotype_vs_onsets(
+                cohort=umod_cohort,
+                gt_clf=gt_clf,
+                hpo=hpo,
+            )
+
+
 class TestSurvivalAnalysisResult:
     @pytest.fixture(scope="class")
     def result(
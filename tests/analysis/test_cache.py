@@ -0,0 +1,135 @@
+import pathlib
+import typing
+
+import hpotk
+import pandas as pd
+import pytest
+
+from gpsea.analysis import AnalysisResultCache, configure_analysis_result_cache, fingerprint
+from gpsea.analysis.clf import GenotypeClassifier, PhenotypeClassifier, sex_classifier
+from gpsea.analysis.mtc_filter import TaroneMtcFilter
+from gpsea.analysis.pcats import HpoTermAnalysis, configure_hpo_term_analysis
+from gpsea.analysis.pcats.stats import FisherExactTest
+from gpsea.model import Cohort
+
+
+class TestFingerprint:
+
+    def test_same_configuration_has_same_fingerprint(
+        self,
+        hpo: hpotk.MinimalOntology,
+        suox_pheno_clfs: typing.Sequence[PhenotypeClassifier[hpotk.TermId]],
+    ):
+        assert fingerprint(configure_hpo_term_analysis(hpo), suox_pheno_clfs) == fingerprint(
+            configure_hpo_term_analysis(hpo), suox_pheno_clfs
+        )
+
+    @pytest.mark.parametrize(
+        "left, right",
+        [
+            (("fdr_bh", 0.05), ("fdr_bh", 0.01)),
+            (("fdr_bh", 0.05), ("bonferroni", 0.05)),
+        ],
+    )
+    def test_different_configuration_has_different_fingerprint(
+        self,
+        hpo: hpotk.MinimalOntology,
+        left: typing.Tuple[str, float],
+        right: typing.Tuple[str, float],
+    ):
+        a = configure_hpo_term_analysis(hpo, mtc_correction=left[0], mtc_alpha=left[1])
+        b = configure_hpo_term_analysis(hpo, mtc_correction=right[0], mtc_alpha=right[1])
+
+        assert fingerprint(a) != fingerprint(b)
+
+    def test_memoized_values_are_ignored(self):
+        mtc_filter = TaroneMtcFilter(count_statistic=FisherExactTest())
+        before = fingerprint(mtc_filter)
+
+        mtc_filter.min_attainable_pval(pd.DataFrame([[3, 0], [0, 4]]))
+
+        assert fingerprint(mtc_filter) == before
+
+    def test_set_order_does_not_matter(self):
+        assert fingerprint({"a", "b", "c"}) == fingerprint({"c", "b", "a"})
+        assert fingerprint(("a", "b")) != fingerprint(("b", "a"))
+
+    def test_functions_are_fingerprinted_by_name(self):
+        assert fingerprint(sex_classifier) == fingerprint(sex_classifier)
+        assert fingerprint(sex_classifier) != fingerprint(configure_hpo_term_analysis)
+        assert fingerprint(FisherExactTest) != fingerprint(TaroneMtcFilter)
+
+    def test_ambiguous_callables_cannot_be_fingerprinted(self):
+        def make_threshold(value: float):
+            def is_above(x: float) -> bool:
+                return x > value
+
+            return is_above
+
+        # The callables share the qualified name with callables that behave differently.
+        with pytest.raises(ValueError):
+            fingerprint(lambda x: x > 1.0)
+        with pytest.raises(ValueError):
+            fingerprint(make_threshold(1.0))
+        with pytest.raises(ValueError):
+            fingerprint(FisherExactTest().compute_pval)
+
+
+class TestAnalysisResultCache:
+
+    @pytest.fixture
+    def result_cache(
+        self,
+        tmp_path: pathlib.Path,
+    ) -> AnalysisResultCache:
+        return configure_analysis_result_cache(cache_dir=str(tmp_path))
+
+    @pytest.fixture
+    def analysis(
+        self,
+        hpo: hpotk.MinimalOntology,
+        result_cache: AnalysisResultCache,
+    ) -> HpoTermAnalysis:
+        return configure_hpo_term_analysis(hpo, result_cache=result_cache)
+
+    def test_result_is_reused(
+        self,
+        hpo: hpotk.MinimalOntology,
+        analysis: HpoTermAnalysis,
+        result_cache: AnalysisResultCache,
+        suox_cohort: Cohort,
+        suox_gt_clf: GenotypeClassifier,
+        suox_pheno_clfs: typing.Sequence[PhenotypeClassifier[hpotk.TermId]],
+    ):
+        first = analysis.compare_genotype_vs_phenotypes(suox_cohort, suox_gt_clf, suox_pheno_clfs)
+        assert len(list(pathlib.Path(result_cache.cache_dir).glob("*.pickle"))) == 1
+
+        # A freshly configured analysis loads the stored result.
+        second = configure_hpo_term_analysis(
+            hpo, result_cache=result_cache
+        ).compare_genotype_vs_phenotypes(suox_cohort, suox_gt_clf, suox_pheno_clfs)
+
+        assert second is not first
+        assert second == first
+        assert second.n_usable == first.n_usable
+        assert second.pvals == pytest.approx(first.pvals, nan_ok=True)
+        assert second.corrected_pvals == pytest.approx(first.corrected_pvals, nan_ok=True)
+        # The ontology is not stored with the result, but it is taken from the classifiers.
+        assert second.pheno_clfs[0]._hpo is hpo
+
+    def test_different_cohort_is_not_reused(
+        self,
+        analysis: HpoTermAnalysis,
+        result_cache: AnalysisResultCache,
+        suox_cohort: Cohort,
+        suox_gt_clf: GenotypeClassifier,
+        suox_pheno_clfs: typing.Sequence[PhenotypeClassifier[hpotk.TermId]],
+    ):
+        analysis.compare_genotypes_vs_phenotypes(
+            suox_cohort, (suox_gt_clf, sex_classifier()), suox_pheno_clfs
+        )
+        analysis.compare_genotype_vs_phenotypes(
+            suox_cohort.all_patients[1:], suox_gt_clf, suox_pheno_clfs
+        )
+
+        assert len(list(pathlib.Path(result_cache.cache_dir).glob("*.pickle"))) == 3
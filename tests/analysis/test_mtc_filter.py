@@ -5,9 +5,10 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from gpsea.analysis.mtc_filter import IfHpoFilter, SpecifiedTermsMtcFilter
+from gpsea.analysis.mtc_filter import IfHpoFilter, SpecifiedTermsMtcFilter, TaroneMtcFilter
 from gpsea.analysis.clf import GenotypeClassifier, PhenotypeClassifier, HpoClassifier
 from gpsea.analysis.pcats import apply_classifiers_on_individuals
+from gpsea.analysis.pcats.stats import FisherExactTest
 from gpsea.model import Cohort
 
 
@@ -124,6 +125,48 @@ class TestIfHpoFilter:
             None,
         ]
 
+    @pytest.mark.parametrize(
+        "seizure_counts, children, expected",
+        [
+            # Seizure has a single child with the same counts.
+            ((10, 5, 2, 8), ("HP:0007359",), "HMF03"),
+            # Seizure has a single child with different counts.
+            ((11, 5, 2, 8), ("HP:0007359",), None),
+            # Seizure has more than one child.
+            ((10, 5, 2, 8), ("HP:0007359", "HP:0002197"), None),
+        ],
+    )
+    def test_filter_only_child(
+        self,
+        hpo: hpotk.MinimalOntology,
+        mtc_filter: IfHpoFilter,
+        gt_clf: GenotypeClassifier,
+        ph_predicate: PhenotypeClassifier[hpotk.TermId],
+        seizure_counts: typing.Sequence[int],
+        children: typing.Sequence[str],
+        expected: typing.Optional[str],
+    ):
+        terms = ("HP:0001250",) + children
+        pheno_clfs = [
+            HpoClassifier(hpo=hpo, query=hpotk.TermId.from_curie(curie))
+            for curie in terms
+        ]
+        counts = [TestIfHpoFilter.prepare_counts_df(seizure_counts, gt_clf, ph_predicate)]
+        counts.extend(
+            TestIfHpoFilter.prepare_counts_df((10, 5, 2, 8), gt_clf, ph_predicate)
+            for _ in children
+        )
+
+        mtc_report = mtc_filter.filter(
+            gt_clf=gt_clf,
+            pheno_clfs=pheno_clfs,
+            counts=counts,
+            cohort_size=30,
+        )
+
+        codes = [None if r.mtc_issue is None else r.mtc_issue.code for r in mtc_report]
+        assert codes == [expected] + [None for _ in children]
+
     def test_mtc_filter_annotation_frequency_threshold_raises(
         self,
         hpo: hpotk.MinimalOntology,
@@ -196,3 +239,70 @@ class TestSpecifyTermsMtcFilter:
                 terms_to_test=(val,),
             )
         assert e.value.args == (msg,)
+
+
+class TestTaroneMtcFilter:
+
+    @pytest.fixture
+    def mtc_filter(self) -> TaroneMtcFilter:
+        return TaroneMtcFilter(
+            count_statistic=FisherExactTest(),
+            alpha=0.05,
+        )
+
+    def test_filter(
+        self,
+        mtc_filter: TaroneMtcFilter,
+        suox_gt_clf: GenotypeClassifier,
+        suox_pheno_clfs: typing.Sequence[PhenotypeClassifier[hpotk.TermId]],
+        patient_counts: typing.Sequence[pd.DataFrame],
+        suox_cohort: Cohort,
+    ):
+        mtc_report = mtc_filter.filter(
+            gt_clf=suox_gt_clf,
+            pheno_clfs=suox_pheno_clfs,
+            counts=patient_counts,
+            cohort_size=len(suox_cohort),
+        )
+
+        assert len(mtc_report) == len(patient_counts)
+
+        # Only the tables that attain the Tarone threshold can be tested.
+        min_pvals = [mtc_filter.min_attainable_pval(counts) for counts in patient_counts]
+        n_passed = sum(r.is_passed() for r in mtc_report)
+        assert n_passed > 0
+        for min_pval, result in zip(min_pvals, mtc_report):
+            assert result.is_passed() == (min_pval <= mtc_filter.alpha / n_passed)
+
+    @pytest.mark.parametrize(
+        "tables, expected",
+        [
+            # The 2nd table can never be significant.
+            (([[10, 0], [0, 10]], [[1, 2], [2, 1]]), [True, False]),
+            # The 1st table attains p <= alpha / 2 and the 2nd attains p <= alpha but not alpha / 2.
+            (([[10, 0], [0, 10]], [[3, 0], [0, 4]]), [True, False]),
+            # Both tables can attain p <= alpha / 2.
+            (([[10, 0], [0, 10]], [[8, 0], [0, 8]]), [True, True]),
+        ],
+    )
+    def test_filter_tables(
+        self,
+        mtc_filter: TaroneMtcFilter,
+        suox_gt_clf: GenotypeClassifier,
+        suox_pheno_clfs: typing.Sequence[PhenotypeClassifier[hpotk.TermId]],
+        tables,
+        expected,
+    ):
+        counts = [pd.DataFrame(np.array(table)) for table in tables]
+
+        mtc_report = mtc_filter.filter(
+            gt_clf=suox_gt_clf,
+            pheno_clfs=suox_pheno_clfs[: len(counts)],
+            counts=counts,
+            cohort_size=20,
+        )
+
+        assert [r.is_passed() for r in mtc_report] == expected
+        for r in mtc_report:
+            if r.is_filtered_out():
+                assert r == TaroneMtcFilter.UNTESTABLE_TERM
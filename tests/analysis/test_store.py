@@ -0,0 +1,157 @@
+import json
+import os
+import pathlib
+import typing
+
+import hpotk
+import numpy as np
+import pandas as pd
+import pytest
+
+from gpsea.analysis import StoredAnalysisResult, open_analysis_result, write_analysis_result
+from gpsea.analysis.clf import GenotypeClassifier, PhenotypeClassifier, monoallelic_classifier
+from gpsea.analysis.pcats import HpoTermAnalysis, HpoTermAnalysisResult, configure_hpo_term_analysis
+from gpsea.analysis.predicate import exon
+from gpsea.analysis.pscore import PhenotypeScoreAnalysis, PhenotypeScorer
+from gpsea.analysis.pscore.stats import MannWhitneyStatistic
+from gpsea.analysis.temporal import SurvivalAnalysis
+from gpsea.analysis.temporal.endpoint import hpo_onset
+from gpsea.analysis.temporal.stats import LogRankTest
+from gpsea.io import GpseaJSONDecoder
+from gpsea.model import Cohort
+
+
+class TestHpoTermAnalysisResultStore:
+
+    @pytest.fixture(scope="class")
+    def analysis(
+        self,
+        hpo: hpotk.MinimalOntology,
+    ) -> HpoTermAnalysis:
+        return configure_hpo_term_analysis(hpo)
+
+    @pytest.fixture(scope="class")
+    def result(
+        self,
+        analysis: HpoTermAnalysis,
+        suox_cohort: Cohort,
+        suox_gt_clf: GenotypeClassifier,
+        suox_pheno_clfs: typing.Sequence[PhenotypeClassifier[hpotk.TermId]],
+    ) -> HpoTermAnalysisResult:
+        return analysis.compare_genotype_vs_phenotypes(suox_cohort, suox_gt_clf, suox_pheno_clfs)
+
+    @pytest.fixture
+    def stored(
+        self,
+        tmp_path: pathlib.Path,
+        result: HpoTermAnalysisResult,
+    ) -> StoredAnalysisResult:
+        path = str(tmp_path.joinpath("result.npz"))
+        write_analysis_result(result, path)
+        return open_analysis_result(path)
+
+    def test_arrays(
+        self,
+        result: HpoTermAnalysisResult,
+        stored: StoredAnalysisResult,
+    ):
+        assert stored.kind == "hpo_term_analysis"
+        assert stored.metadata["n_phenotypes"] == len(result.pheno_clfs)
+        assert stored.metadata["gt_clf"]["name"] == result.gt_clf.name
+        assert stored.phenotypes.tolist() == [p.value for p in result.phenotypes]
+        assert stored.counts.shape == (len(result.pheno_clfs), 2, 2)
+        assert stored.counts[0].tolist() == result.all_counts[0].to_numpy().tolist()
+        np.testing.assert_array_equal(stored.pvals, result.pvals)
+        assert result.corrected_pvals is not None
+        np.testing.assert_array_equal(stored.corrected_pvals, result.corrected_pvals)
+
+    def test_load(
+        self,
+        result: HpoTermAnalysisResult,
+        stored: StoredAnalysisResult,
+    ):
+        loaded = stored.load()
+
+        assert isinstance(loaded, HpoTermAnalysisResult)
+        assert loaded.phenotypes == result.phenotypes
+        assert loaded.n_usable == result.n_usable
+        assert loaded.statistic == result.statistic
+        assert loaded.statistic_results == result.statistic_results
+        assert loaded.corrected_pvals == pytest.approx(result.corrected_pvals, nan_ok=True)
+        assert loaded.mtc_correction == result.mtc_correction
+        assert loaded.mtc_filter_name == result.mtc_filter_name
+        assert loaded.mtc_filter_results == result.mtc_filter_results
+        assert tuple(loaded.gt_clf.get_categories()) == tuple(result.gt_clf.get_categories())
+        for actual, expected in zip(loaded.pheno_clfs, result.pheno_clfs):
+            assert actual.name == expected.name
+            assert actual.present_phenotype_category == expected.present_phenotype_category
+        for actual, expected in zip(loaded.all_counts, result.all_counts):
+            pd.testing.assert_frame_equal(actual, expected, check_index_type=False, check_column_type=False)
+
+    def test_restored_classifier_cannot_classify(
+        self,
+        suox_cohort: Cohort,
+        stored: StoredAnalysisResult,
+    ):
+        loaded = stored.load()
+
+        with pytest.raises(ValueError, match="cannot process the individuals"):
+            loaded.gt_clf.test(suox_cohort.all_patients[0])
+
+
+class TestMonoPhenotypeAnalysisResultStore:
+
+    def test_phenotype_score_analysis_result(
+        self,
+        tmp_path: pathlib.Path,
+        suox_cohort: Cohort,
+        suox_gt_clf: GenotypeClassifier,
+    ):
+        scorer = PhenotypeScorer.wrap_scoring_function(
+            func=lambda patient: float(sum(1 for _ in patient.present_phenotypes())),
+            name="Number of present phenotypes",
+        )
+        result = PhenotypeScoreAnalysis(
+            score_statistic=MannWhitneyStatistic(),
+        ).compare_genotype_vs_phenotype_score(suox_cohort, suox_gt_clf, scorer)
+        path = str(tmp_path.joinpath("result.npz"))
+        write_analysis_result(result, path)
+
+        loaded = open_analysis_result(path).load()
+
+        assert loaded.pval == result.pval
+        assert loaded.phenotype.name == scorer.name
+        assert loaded.data.index.tolist() == result.data.index.tolist()
+        assert loaded.data["genotype"].tolist() == result.data["genotype"].tolist()
+        assert loaded.data["phenotype"].tolist() == pytest.approx(result.data["phenotype"].tolist(), nan_ok=True)
+
+    def test_survival_analysis_result(
+        self,
+        tmp_path: pathlib.Path,
+        fpath_cohort_data_dir: str,
+        hpo: hpotk.MinimalOntology,
+    ):
+        with open(os.path.join(fpath_cohort_data_dir, "UMOD.0.1.20.json")) as fh:
+            cohort = json.load(fh, cls=GpseaJSONDecoder)
+        in_exon_3 = exon(3, tx_id="NM_003361.4")
+        gt_clf = monoallelic_classifier(
+            a_predicate=in_exon_3,
+            b_predicate=~in_exon_3,
+            a_label="Exon 3",
+            b_label="Other exon",
+        )
+        result = SurvivalAnalysis(statistic=LogRankTest()).compare_genotype_vs_survival(
+            cohort=cohort,
+            gt_clf=gt_clf,
+            endpoint=hpo_onset(hpo=hpo, term_id="HP:0003774"),
+        )
+        path = str(tmp_path.joinpath("result.npz"))
+        write_analysis_result(result, path)
+
+        stored = open_analysis_result(path)
+        loaded = stored.load()
+
+        assert stored.kind == "survival_analysis"
+        assert loaded.pval == result.pval
+        assert loaded.statistic == result.statistic
+        assert loaded.data.equals(result.data)
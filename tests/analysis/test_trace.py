@@ -0,0 +1,184 @@
+import io
+import pathlib
+import typing
+
+import hpotk
+import pytest
+
+from gpsea.analysis import (
+    AnalysisTrace,
+    AnalysisTracer,
+    ProfilingTracer,
+    StageStats,
+    configure_analysis_result_cache,
+    fingerprint,
+)
+from gpsea.analysis.clf import GenotypeClassifier, PhenotypeClassifier
+from gpsea.analysis.pcats import configure_hpo_term_analysis
+from gpsea.analysis.pscore import PhenotypeScoreAnalysis, PhenotypeScorer
+from gpsea.analysis.pscore.stats import MannWhitneyStatistic
+from gpsea.model import Cohort
+
+
+class RecordingTracer(AnalysisTracer):
+
+    def __init__(self):
+        self.events: typing.List[str] = []
+
+    def on_run_start(self, analysis: str):
+        self.events.append(f"start:{analysis}")
+
+    def on_stage_start(self, name: str):
+        self.events.append(f"stage_start:{name}")
+
+    def on_stage_end(self, stage: StageStats):
+        self.events.append(f"stage_end:{stage.name}")
+
+    def on_run_end(self, trace: AnalysisTrace):
+        self.events.append(f"end:{trace.analysis}")
+
+
+class TestAnalysisTrace:
+
+    def test_summarize(self):
+        trace = AnalysisTrace(
+            analysis="HpoTermAnalysis",
+            stages=(
+                StageStats(name="classify", wall_time=0.75, n_items=35),
+                StageStats(name="statistic", wall_time=0.25, n_items=10, cache_hits=4),
+            ),
+        )
+
+        buf = io.StringIO()
+        trace.summarize(buf)
+
+        assert trace.total_time == pytest.approx(1.0)
+        assert trace.stage("statistic") == StageStats(name="statistic", wall_time=0.25, n_items=10, cache_hits=4)
+        assert trace.stage("count") is None
+        assert buf.getvalue() == (
+            "HpoTermAnalysis took 1.000s\n"
+            "  classify: 0.750s (75.0%), 35 items\n"
+            "  statistic: 0.250s (25.0%), 10 items, 4 cache hits\n"
+        )
+
+
+class TestHpoTermAnalysisTrace:
+
+    def test_result_has_trace(
+        self,
+        hpo: hpotk.MinimalOntology,
+        suox_cohort: Cohort,
+        suox_gt_clf: GenotypeClassifier,
+        suox_pheno_clfs: typing.Sequence[PhenotypeClassifier[hpotk.TermId]],
+    ):
+        result = configure_hpo_term_analysis(hpo).compare_genotype_vs_phenotypes(
+            suox_cohort, suox_gt_clf, suox_pheno_clfs,
+        )
+
+        trace = result.trace
+        assert trace is not None
+        assert trace.analysis == "HpoTermAnalysis"
+        assert [stage.name for stage in trace.stages] == [
+            "classify", "count", "mtc_filter", "statistic", "mtc_correction",
+        ]
+        assert trace.stage("classify").n_items == len(suox_cohort)
+        assert trace.stage("count").n_items == len(suox_pheno_clfs)
+        assert trace.profile is None
+
+    def test_tracer_is_notified(
+        self,
+        hpo: hpotk.MinimalOntology,
+        suox_cohort: Cohort,
+        suox_gt_clf: GenotypeClassifier,
+        suox_pheno_clfs: typing.Sequence[PhenotypeClassifier[hpotk.TermId]],
+    ):
+        tracer = RecordingTracer()
+        analysis = configure_hpo_term_analysis(hpo, tracer=tracer)
+
+        analysis.compare_genotypes_vs_phenotypes(suox_cohort, (suox_gt_clf, suox_gt_clf), suox_pheno_clfs)
+
+        assert tracer.events[:3] == ["start:HpoTermAnalysis", "stage_start:classify", "stage_end:classify"]
+        assert tracer.events.count("stage_end:statistic") == 2
+        assert tracer.events.count("end:HpoTermAnalysis") == 2
+
+    def test_cached_results_are_traced(
+        self,
+        tmp_path: pathlib.Path,
+        hpo: hpotk.MinimalOntology,
+        suox_cohort: Cohort,
+        suox_gt_clf: GenotypeClassifier,
+        suox_pheno_clfs: typing.Sequence[PhenotypeClassifier[hpotk.TermId]],
+    ):
+        cache = configure_analysis_result_cache(str(tmp_path))
+        analysis = configure_hpo_term_analysis(hpo, result_cache=cache)
+        analysis.compare_genotype_vs_phenotypes(suox_cohort, suox_gt_clf, suox_pheno_clfs)
+
+        result = analysis.compare_genotype_vs_phenotypes(suox_cohort, suox_gt_clf, suox_pheno_clfs)
+
+        assert [stage.name for stage in result.trace.stages] == ["load_results"]
+        assert result.trace.stage("load_results").cache_hits == 1
+
+    def test_tracer_does_not_change_fingerprint(
+        self,
+        hpo: hpotk.MinimalOntology,
+    ):
+        assert fingerprint(configure_hpo_term_analysis(hpo)) == fingerprint(
+            configure_hpo_term_analysis(hpo, tracer=RecordingTracer())
+        )
+
+    def test_profiling_tracer(
+        self,
+        hpo: hpotk.MinimalOntology,
+        suox_cohort: Cohort,
+        suox_gt_clf: GenotypeClassifier,
+        suox_pheno_clfs: typing.Sequence[PhenotypeClassifier[hpotk.TermId]],
+    ):
+        analysis = configure_hpo_term_analysis(hpo, tracer=ProfilingTracer(n_lines=5))
+
+        result = analysis.compare_genotype_vs_phenotypes(suox_cohort, suox_gt_clf, suox_pheno_clfs)
+
+        assert result.trace.profile is not None
+        assert "function calls" in result.trace.profile
+
+    def test_unknown_profiler(self):
+        with pytest.raises(ValueError):
+            ProfilingTracer(profiler="perf")  # type: ignore
+
+
+class TestPhenotypeScoreAnalysisTrace:
+
+    def test_result_has_trace(
+        self,
+        suox_cohort: Cohort,
+        suox_gt_clf: GenotypeClassifier,
+    ):
+        scorer = PhenotypeScorer.wrap_scoring_function(
+            func=lambda patient: float(sum(1 for _ in patient.present_phenotypes())),
+            name="Number of present phenotypes",
+        )
+        tracer = RecordingTracer()
+        analysis = PhenotypeScoreAnalysis(score_statistic=MannWhitneyStatistic(), tracer=tracer)
+
+        result = analysis.compare_genotype_vs_phenotype_score(suox_cohort, suox_gt_clf, scorer)
+
+        assert [stage.name for stage in result.trace.stages] == ["classify", "statistic"]
+        assert result.trace.stage("classify").n_items == len(suox_cohort)
+        assert tracer.events[0] == "start:PhenotypeScoreAnalysis"
+        assert tracer.events[-1] == "end:PhenotypeScoreAnalysis"
+
+    def test_profiler_is_stopped_when_run_fails(
+        self,
+        suox_cohort: Cohort,
+        suox_gt_clf: GenotypeClassifier,
+    ):
+        def fail(patient) -> float:
+            raise ValueError("Cannot score")
+
+        scorer = PhenotypeScorer.wrap_scoring_function(func=fail, name="Failing score")
+        tracer = ProfilingTracer()
+        analysis = PhenotypeScoreAnalysis(score_statistic=MannWhitneyStatistic(), tracer=tracer)
+
+        with pytest.raises(ValueError, match="Cannot score"):
+            analysis.compare_genotype_vs_phenotype_score(suox_cohort, suox_gt_clf, scorer)
+
+        assert tracer._profiler is None
@@ -1,4 +1,9 @@
-from gpsea.model import Cohort
+import pickle
+
+import hpotk
+import pytest
+
+from gpsea.model import Cohort, Disease, Patient, Phenotype
 
 
 class TestCohort:
@@ -45,3 +50,81 @@ class TestCohort:
         assert len(counts) == 1, 'The counts should only have one item'
 
         assert counts[suox_mane] == {'MISSENSE_VARIANT': 29, 'STOP_GAINED': 10, 'FRAMESHIFT_VARIANT': 9}
+
+    def test_fingerprint(
+        self,
+        suox_cohort: Cohort,
+    ):
+        copy = Cohort(members=suox_cohort.all_patients, excluded_member_count=suox_cohort.get_excluded_count())
+        subset = Cohort(members=suox_cohort.all_patients[1:], excluded_member_count=0)
+
+        assert len(suox_cohort.fingerprint) == 64
+        assert copy.fingerprint == suox_cohort.fingerprint
+        assert subset.fingerprint != suox_cohort.fingerprint
+
+
+class TestPatient:
+
+    @pytest.fixture
+    def patient(self) -> Patient:
+        return Patient.from_raw_parts(
+            labels="A",
+            phenotypes=(
+                Phenotype.from_raw_parts("HP:0001250", is_observed=True),
+                Phenotype.from_raw_parts("HP:0001166", is_observed=False),
+                Phenotype.from_raw_parts("HP:0001250", is_observed=False),
+            ),
+            diseases=(
+                Disease.from_raw_parts("OMIM:100000", name="One", is_observed=True),
+                Disease.from_raw_parts("OMIM:200000", name="Two", is_observed=False),
+            ),
+        )
+
+    def test_phenotype_by_id(
+        self,
+        patient: Patient,
+    ):
+        seizure = patient.phenotype_by_id("HP:0001250")
+
+        # The first phenotype with the ID is returned.
+        assert seizure is not None and seizure.is_present
+        assert patient.phenotype_by_id(hpotk.TermId.from_curie("HP:0001166")) is not None
+        assert patient.phenotype_by_id("HP:0000118") is None
+
+    def test_disease_by_id(
+        self,
+        patient: Patient,
+    ):
+        disease = patient.disease_by_id("OMIM:200000")
+
+        assert disease is not None and disease.name == "Two"
+        assert patient.disease_by_id("OMIM:300000") is None
+
+    def test_present_and_excluded_phenotypes(
+        self,
+        patient: Patient,
+    ):
+        assert [p.identifier.value for p in patient.present_phenotypes()] == ["HP:0001250"]
+        assert [p.identifier.value for p in patient.excluded_phenotypes()] == ["HP:0001166", "HP:0001250"]
+        # The iterators can be consumed repeatedly.
+        assert len(list(patient.present_phenotypes())) == 1
+
+        assert patient.present_phenotype_ids() == {hpotk.TermId.from_curie("HP:0001250")}
+        assert patient.excluded_phenotype_ids() == {
+            hpotk.TermId.from_curie("HP:0001166"),
+            hpotk.TermId.from_curie("HP:0001250"),
+        }
+        assert patient.present_disease_ids() == {hpotk.TermId.from_curie("OMIM:100000")}
+
+    def test_indexes_are_not_pickled(
+        self,
+        patient: Patient,
+    ):
+        patient.phenotype_by_id("HP:0001250")
+
+        state = patient.__getstate__()
+        copy = pickle.loads(pickle.dumps(patient))
+
+        assert not any(index in state for index in Patient._INDEXES)
+        assert copy == patient
+        assert copy.phenotype_by_id("HP:0001250") == patient.phenotype_by_id("HP:0001250")
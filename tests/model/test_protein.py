@@ -0,0 +1,96 @@
+import pickle
+
+import pytest
+
+from gpsea.model import FeatureInfo, ProteinFeature, ProteinFeatureIndex, ProteinMetadata
+from gpsea.model.genome import Region
+
+
+def make_feature(name: str, start: int, end: int) -> ProteinFeature:
+    return ProteinFeature.create(
+        info=FeatureInfo(name=name, region=Region(start=start, end=end)),
+        feature_type="REGION",
+    )
+
+
+class TestProteinFeatureIndex:
+
+    @pytest.fixture(scope="class")
+    def index(self) -> ProteinFeatureIndex:
+        return ProteinFeatureIndex(
+            (
+                make_feature("C", 50, 60),
+                make_feature("A", 0, 100),
+                make_feature("B", 10, 20),
+                make_feature("Empty", 30, 30),
+                make_feature("D", 70, 75),
+            )
+        )
+
+    @pytest.mark.parametrize(
+        "start, end, expected",
+        [
+            (0, 5, ("A",)),
+            (15, 55, ("C", "A", "B", "Empty")),
+            (20, 50, ("A", "Empty")),
+            (30, 30, ("A", "Empty")),
+            (29, 31, ("A", "Empty")),
+            (60, 70, ("A",)),
+            (74, 200, ("A", "D")),
+            (100, 120, ()),
+        ],
+    )
+    def test_overlapping(
+        self,
+        index: ProteinFeatureIndex,
+        start: int,
+        end: int,
+        expected: tuple,
+    ):
+        region = Region(start=start, end=end)
+
+        features = index.overlapping(region)
+
+        assert tuple(f.info.name for f in features) == expected
+        # The index agrees with checking all features.
+        assert features == tuple(f for f in index.features if f.info.region.overlaps_with(region))
+
+    def test_overlapping_each(
+        self,
+        index: ProteinFeatureIndex,
+    ):
+        regions = (Region(0, 5), Region(100, 120), Region(72, 73))
+
+        overlaps = index.overlapping_each(regions)
+
+        assert [[f.info.name for f in features] for features in overlaps] == [["A"], [], ["A", "D"]]
+
+    def test_agrees_with_scanning_the_features(
+        self,
+        suox_protein_metadata: ProteinMetadata,
+    ):
+        index = suox_protein_metadata.feature_index
+
+        for start in range(0, suox_protein_metadata.protein_length, 7):
+            for length in (0, 1, 15):
+                region = Region(start=start, end=start + length)
+                expected = tuple(
+                    f for f in suox_protein_metadata.protein_features if f.info.region.overlaps_with(region)
+                )
+                assert index.overlapping(region) == expected
+
+
+class TestProteinMetadata:
+
+    def test_feature_index_is_not_pickled(
+        self,
+        suox_protein_metadata: ProteinMetadata,
+    ):
+        index = suox_protein_metadata.feature_index
+
+        copy = pickle.loads(pickle.dumps(suox_protein_metadata))
+
+        assert suox_protein_metadata.feature_index is index
+        assert copy == suox_protein_metadata
+        assert copy._feature_index_cache is None
+        assert copy.feature_index.features == index.features
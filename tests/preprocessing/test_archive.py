@@ -0,0 +1,109 @@
+import os
+import pathlib
+import time
+import zipfile
+
+import pytest
+
+from google.protobuf.json_format import Parse
+from phenopackets.schema.v2.phenopackets_pb2 import Phenopacket
+
+from gpsea.preprocessing import iter_phenopacket_store_archive
+from gpsea.preprocessing import _pp_json
+
+
+class TestIterPhenopacketStoreArchive:
+
+    @pytest.fixture
+    def archive(
+        self,
+        fpath_phenopacket_dir: str,
+        fpath_preprocessing_data_dir: str,
+        tmp_path: pathlib.Path,
+    ) -> str:
+        """
+        Mimic the layout of Phenopacket Store release: `<release>/<cohort>/<phenopacket>.json`.
+        """
+        fpath_archive = str(tmp_path.joinpath("0.1.0.zip"))
+        dup_id_dir = os.path.join(fpath_preprocessing_data_dir, "dup_id_test_data")
+        with zipfile.ZipFile(fpath_archive, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("0.1.0/", "")
+            zf.writestr("0.1.0/CYP21A2/", "")
+            zf.write(
+                os.path.join(fpath_phenopacket_dir, "PMID_30968594_individual_1.json"),
+                "0.1.0/CYP21A2/PMID_30968594_individual_1.json",
+            )
+            zf.writestr("0.1.0/ITGA2B/", "")
+            for name in sorted(os.listdir(dup_id_dir)):
+                zf.write(os.path.join(dup_id_dir, name), f"0.1.0/ITGA2B/{name}")
+            zf.writestr("0.1.0/ITGA2B/README.md", "Not a phenopacket")
+
+        return fpath_archive
+
+    def test_all_phenopackets(
+        self,
+        archive: str,
+    ):
+        with zipfile.ZipFile(archive) as zf:
+            expected = [
+                Parse(zf.read(name), Phenopacket())
+                for name in zf.namelist()
+                if name.endswith(".json")
+            ]
+
+        actual = list(iter_phenopacket_store_archive(archive, n_workers=3, prefetch=2))
+
+        assert actual == expected
+
+    def test_first_phenopackets_are_parsed_by_several_workers(
+        self,
+        archive: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        with zipfile.ZipFile(archive) as zf:
+            expected = [
+                Parse(zf.read(name), Phenopacket())
+                for name in zf.namelist()
+                if name.endswith(".json")
+            ]
+
+        # Start with a parser that has not compiled any plan yet, and slow the compilation down,
+        # so that the workers parse their first phenopackets while the plans are being compiled.
+        compile_plan = _pp_json._MessagePlan.compile
+
+        def slow_compile(plan, parser):
+            time.sleep(0.01)
+            compile_plan(plan, parser)
+
+        monkeypatch.setattr(_pp_json._MessagePlan, "compile", slow_compile)
+        monkeypatch.setattr(_pp_json, "_PHENOPACKET_PARSER", _pp_json.ProtobufJsonParser(Phenopacket))
+
+        actual = list(iter_phenopacket_store_archive(archive, n_workers=4, prefetch=8))
+
+        assert actual == expected
+
+    def test_cohort_filter(
+        self,
+        archive: str,
+    ):
+        phenopackets = list(iter_phenopacket_store_archive(archive, cohorts=("CYP21A2",)))
+
+        assert [pp.id for pp in phenopackets] == ["PMID_30968594_individual_1"]
+
+    def test_early_stop(
+        self,
+        archive: str,
+    ):
+        phenopackets = iter_phenopacket_store_archive(archive, prefetch=1)
+
+        first = next(phenopackets)
+        phenopackets.close()
+
+        assert first.id == "PMID_30968594_individual_1"
+
+    def test_missing_archive(
+        self,
+        tmp_path: pathlib.Path,
+    ):
+        with pytest.raises(ValueError):
+            next(iter_phenopacket_store_archive(tmp_path.joinpath("missing.zip")))
@@ -0,0 +1,156 @@
+import os
+import pathlib
+
+import hpotk
+import pytest
+
+from gpsea.preprocessing import HpoSnapshotStore, configure_hpo_snapshot_store
+
+
+class TestHpoSnapshotStore:
+
+    @pytest.fixture(scope="class")
+    def fpath_hpo(
+        self,
+        fpath_test_data_dir: str,
+    ) -> str:
+        return os.path.join(fpath_test_data_dir, "hp.v2024-04-26.json.gz")
+
+    @pytest.fixture(scope="class")
+    def store(
+        self,
+        tmp_path_factory: pytest.TempPathFactory,
+    ) -> HpoSnapshotStore:
+        return self._make_store(tmp_path_factory.mktemp("hpo-snapshots"))
+
+    @staticmethod
+    def _make_store(
+        cache_dir: pathlib.Path,
+    ) -> HpoSnapshotStore:
+        hpotk_dir = cache_dir.joinpath("hpotk")
+        hpotk_dir.mkdir()
+        return configure_hpo_snapshot_store(
+            cache_dir=str(cache_dir),
+            ontology_store=hpotk.configure_ontology_store(store_dir=str(hpotk_dir)),
+        )
+
+    @pytest.fixture(scope="class")
+    def snapshot_hpo(
+        self,
+        store: HpoSnapshotStore,
+        fpath_hpo: str,
+    ) -> hpotk.MinimalOntology:
+        # Prepare the snapshot and then load HPO from the snapshot.
+        store.load_minimal_hpo(release="v2024-04-26", fpath_hpo=fpath_hpo)
+        return store.load_minimal_hpo(release="v2024-04-26", fpath_hpo="there/is/no/such/file.json")
+
+    def test_snapshot_is_stored_under_version(
+        self,
+        store: HpoSnapshotStore,
+        snapshot_hpo: hpotk.MinimalOntology,
+    ):
+        assert os.path.isfile(store.snapshot_path("2024-04-26"))
+        assert store.snapshot_path("v2024-04-26") == store.snapshot_path("2024-04-26")
+
+    def test_terms(
+        self,
+        hpo: hpotk.MinimalOntology,
+        snapshot_hpo: hpotk.MinimalOntology,
+    ):
+        assert snapshot_hpo.version == hpo.version
+        assert len(snapshot_hpo) == len(hpo)
+        assert list(snapshot_hpo.term_ids) == list(hpo.term_ids)
+
+        for expected in hpo.terms:
+            actual = snapshot_hpo.get_term(expected.identifier)
+            assert actual is not None
+            assert actual.identifier == expected.identifier
+            assert actual.name == expected.name
+            assert actual.alt_term_ids == expected.alt_term_ids
+
+    @pytest.mark.parametrize(
+        "obsolete, primary",
+        [
+            ("HP:0002564", "HP:0030680"),  # Malformation of the heart and great vessels
+            ("HP:0001388", "HP:0001382"),  # Joint hypermobility
+        ],
+    )
+    def test_alternate_term_ids(
+        self,
+        hpo: hpotk.MinimalOntology,
+        snapshot_hpo: hpotk.MinimalOntology,
+        obsolete: str,
+        primary: str,
+    ):
+        assert hpo.get_term(obsolete).identifier.value == primary
+        assert snapshot_hpo.get_term(obsolete).identifier.value == primary
+
+    def test_graph(
+        self,
+        hpo: hpotk.MinimalOntology,
+        snapshot_hpo: hpotk.MinimalOntology,
+    ):
+        expected = hpo.graph
+        actual = snapshot_hpo.graph
+
+        assert actual.root == expected.root
+        assert list(actual) == list(expected)
+        for term_id in expected:
+            assert list(actual.get_parents(term_id)) == list(expected.get_parents(term_id))
+            assert list(actual.get_children(term_id)) == list(expected.get_children(term_id))
+            assert list(actual.get_ancestors(term_id)) == list(expected.get_ancestors(term_id))
+
+        assert list(actual.get_descendants("HP:0000118")) == list(expected.get_descendants("HP:0000118"))
+
+    @pytest.mark.parametrize(
+        "sub, obj, expected",
+        [
+            ("HP:0000118", "HP:0001250", True),  # Phenotypic abnormality, Seizure
+            ("HP:0001250", "HP:0000118", False),
+            ("HP:0001250", "HP:0001250", False),
+            ("HP:0000707", "HP:0001250", True),  # Abnormality of the nervous system
+            ("HP:0000152", "HP:0001250", False),  # Abnormality of head or neck
+        ],
+    )
+    def test_is_ancestor_of(
+        self,
+        snapshot_hpo: hpotk.MinimalOntology,
+        sub: str,
+        obj: str,
+        expected: bool,
+    ):
+        assert snapshot_hpo.graph.is_ancestor_of(sub, obj) == expected
+        assert snapshot_hpo.graph.is_descendant_of(obj, sub) == expected
+
+    def test_unreadable_snapshot_is_rebuilt(
+        self,
+        tmp_path: pathlib.Path,
+        fpath_hpo: str,
+    ):
+        store = self._make_store(tmp_path)
+        path = store.snapshot_path("2024-04-26")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as fh:
+            fh.write(b"Not a snapshot")
+
+        hpo = store.load_minimal_hpo(release="v2024-04-26", fpath_hpo=fpath_hpo)
+
+        assert hpo.version == "2024-04-26"
+        assert store.load_minimal_hpo(release="v2024-04-26").version == "2024-04-26"
+
+    def test_truncated_snapshot_is_rebuilt(
+        self,
+        tmp_path: pathlib.Path,
+        fpath_hpo: str,
+    ):
+        store = self._make_store(tmp_path)
+        store.load_minimal_hpo(release="v2024-04-26", fpath_hpo=fpath_hpo)
+        path = store.snapshot_path("2024-04-26")
+        # Simulate a partially written snapshot, e.g. after the disk got full.
+        with open(path, "r+b") as fh:
+            fh.truncate(os.path.getsize(path) // 2)
+
+        hpo = store.load_minimal_hpo(release="v2024-04-26", fpath_hpo=fpath_hpo)
+
+        assert hpo.version == "2024-04-26"
+        assert store.load_minimal_hpo(release="v2024-04-26").version == "2024-04-26"
@@ -0,0 +1,119 @@
+import io
+import os
+import pathlib
+import shutil
+import typing
+
+import pytest
+
+from phenopackets.schema.v2.phenopackets_pb2 import Phenopacket
+from stairval.notepad import Notepad
+
+from gpsea.model import Patient, Phenotype, SampleLabels
+from gpsea.preprocessing import (
+    CohortCreator,
+    PatientCreator,
+    load_phenopacket_folder,
+    load_phenopacket_folder_incrementally,
+)
+
+
+class CountingPatientCreator(PatientCreator[Phenopacket]):
+    """
+    A simple patient creator that keeps track of the processed phenopackets.
+    """
+
+    def __init__(self):
+        self.processed: typing.List[str] = []
+
+    def process(
+        self,
+        item: Phenopacket,
+        notepad: Notepad,
+    ) -> typing.Optional[Patient]:
+        self.processed.append(item.id)
+        pfs = notepad.add_subsection("phenotype-features")
+        phenotypes = []
+        for i, pf in enumerate(item.phenotypic_features):
+            phenotypes.append(Phenotype.from_raw_parts(pf.type.id, not pf.excluded))
+            pfs.add_subsection(f"#{i}").add_warning(f"Seen {pf.type.id}", "Nothing to do")
+
+        return Patient.from_raw_parts(
+            labels=SampleLabels(label=item.subject.id, meta_label=item.id),
+            phenotypes=phenotypes,
+        )
+
+
+class TestLoadPhenopacketFolderIncrementally:
+
+    @pytest.fixture
+    def pp_dir(
+        self,
+        fpath_preprocessing_data_dir: str,
+        tmp_path: pathlib.Path,
+    ) -> str:
+        source = os.path.join(fpath_preprocessing_data_dir, "dup_id_test_data")
+        target = tmp_path.joinpath("phenopackets")
+        shutil.copytree(source, target)
+        return str(target)
+
+    @pytest.fixture
+    def cache_dir(
+        self,
+        tmp_path: pathlib.Path,
+    ) -> str:
+        return str(tmp_path.joinpath("cache"))
+
+    @staticmethod
+    def _summarize(results) -> str:
+        buf = io.StringIO()
+        results.summarize(buf)
+        return buf.getvalue()
+
+    def test_reprocesses_only_changed_files(
+        self,
+        pp_dir: str,
+        cache_dir: str,
+    ):
+        pc = CountingPatientCreator()
+        cohort_creator = CohortCreator(pc)
+
+        first, first_results = load_phenopacket_folder_incrementally(pp_dir, cohort_creator, cache_dir=cache_dir)
+        # The folder includes two pairs of identical phenopackets,
+        # and the second file of each pair is served from the cache.
+        assert sorted(pc.processed) == ["PMID_12345", "PMID_67890"]
+        assert len(first) == 4
+
+        pc.processed.clear()
+        second, second_results = load_phenopacket_folder_incrementally(pp_dir, cohort_creator, cache_dir=cache_dir)
+
+        assert pc.processed == []
+        assert first == second
+        assert self._summarize(first_results) == self._summarize(second_results)
+
+        # Update one phenopacket.
+        fpath_pp = os.path.join(pp_dir, "pp1.json")
+        with open(fpath_pp) as fh:
+            payload = fh.read()
+        with open(fpath_pp, "w") as fh:
+            fh.write(payload.replace("HP:5200338", "HP:0001250"))
+
+        third, _ = load_phenopacket_folder_incrementally(pp_dir, cohort_creator, cache_dir=cache_dir)
+
+        assert pc.processed == ["PMID_12345"]
+        assert any(p.phenotype_by_id("HP:0001250") is not None for p in third.all_patients)
+
+    def test_results_match_non_incremental_loading(
+        self,
+        pp_dir: str,
+        cache_dir: str,
+    ):
+        cohort_creator = CohortCreator(CountingPatientCreator())
+
+        expected, expected_results = load_phenopacket_folder(pp_dir, cohort_creator)
+        # Fill the cache first, then load from the cache.
+        load_phenopacket_folder_incrementally(pp_dir, cohort_creator, cache_dir=cache_dir)
+        actual, actual_results = load_phenopacket_folder_incrementally(pp_dir, cohort_creator, cache_dir=cache_dir)
+
+        assert expected == actual
+        assert self._summarize(expected_results) == self._summarize(actual_results)
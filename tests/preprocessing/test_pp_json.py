@@ -0,0 +1,124 @@
+import concurrent.futures
+import os
+import json
+import threading
+import time
+
+import pytest
+
+from google.protobuf.json_format import Parse, ParseError
+from phenopackets.schema.v2.core.interpretation_pb2 import GenomicInterpretation
+from phenopackets.schema.v2.phenopackets_pb2 import Phenopacket
+
+from gpsea.preprocessing._pp_json import ProtobufJsonParser, _MessagePlan, parse_phenopacket
+
+
+def _list_json_files(folder: str):
+    return sorted(
+        os.path.join(folder, name) for name in os.listdir(folder) if name.endswith(".json")
+    )
+
+
+class TestProtobufJsonParser:
+
+    def test_phenopackets_are_equivalent(
+        self,
+        fpath_phenopacket_dir: str,
+        fpath_preprocessing_data_dir: str,
+    ):
+        paths = _list_json_files(fpath_phenopacket_dir)
+        paths.extend(_list_json_files(os.path.join(fpath_preprocessing_data_dir, "dup_id_test_data")))
+        assert len(paths) > 0
+
+        for path in paths:
+            with open(path) as fh:
+                payload = fh.read()
+
+            expected = Parse(payload, Phenopacket())
+            actual = parse_phenopacket(payload)
+
+            assert actual == expected, path
+
+    def test_genomic_interpretations_are_equivalent(
+        self,
+        fpath_preprocessing_data_dir: str,
+    ):
+        parser = ProtobufJsonParser(GenomicInterpretation)
+        folder = os.path.join(fpath_preprocessing_data_dir, "pp_genomic_interpretations")
+
+        for path in _list_json_files(folder):
+            with open(path) as fh:
+                payload = fh.read()
+
+            assert parser.parse(payload) == Parse(payload, GenomicInterpretation()), path
+
+    def test_well_known_types_and_snake_case(self):
+        payload = json.dumps(
+            {
+                "id": "example",
+                "subject": {
+                    "id": "A",
+                    "date_of_birth": "2000-01-01T00:00:00Z",
+                    "sex": "FEMALE",
+                },
+                "metaData": {
+                    "created": "2021-08-11T08:33:38.567Z",
+                    "phenopacketSchemaVersion": "2.0",
+                },
+            }
+        )
+
+        assert parse_phenopacket(payload) == Parse(payload, Phenopacket())
+
+    def test_parser_is_shared_by_threads(
+        self,
+        fpath_phenopacket_dir: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        path = _list_json_files(fpath_phenopacket_dir)[0]
+        with open(path) as fh:
+            payload = fh.read()
+        expected = Parse(payload, Phenopacket())
+
+        # Slow the compilation down, so that the threads parse the first message
+        # while its plan (and the plans of the nested messages) are being compiled.
+        compile_plan = _MessagePlan.compile
+
+        def slow_compile(plan: _MessagePlan, parser: ProtobufJsonParser):
+            time.sleep(0.01)
+            compile_plan(plan, parser)
+
+        monkeypatch.setattr(_MessagePlan, "compile", slow_compile)
+
+        n_threads = 8
+        parser = ProtobufJsonParser(Phenopacket)
+        barrier = threading.Barrier(n_threads)
+
+        def parse(_):
+            barrier.wait()
+            return parser.parse(payload)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=n_threads) as executor:
+            results = list(executor.map(parse, range(n_threads)))
+
+        assert all(result == expected for result in results)
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            '{"id": "example", "unknownField": 1}',
+            '{"subject": {"sex": "NOT_A_SEX"}}',
+            '{"phenotypicFeatures": {"type": {"id": "HP:0001250"}}}',
+            '{"subject": {"id": 1}}',
+            '{"id": "example"',
+        ],
+    )
+    def test_invalid_input(
+        self,
+        payload: str,
+    ):
+        with pytest.raises(ParseError):
+            Parse(payload, Phenopacket())
+
+        with pytest.raises(ParseError):
+            parse_phenopacket(payload)
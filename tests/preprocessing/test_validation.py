@@ -0,0 +1,85 @@
+import typing
+
+import hpotk
+import pytest
+
+from hpotk.validate import ValidationRunner
+
+from gpsea.model import Cohort, Phenotype
+from gpsea.preprocessing import CachingValidationRunner
+
+
+def _summarize(results) -> typing.Sequence[typing.Tuple[str, str, str]]:
+    return [(r.level.name, r.category, r.message) for r in results.results]
+
+
+class TestCachingValidationRunner:
+
+    @pytest.fixture(scope="class")
+    def runner(
+        self,
+        hpo: hpotk.MinimalOntology,
+    ) -> CachingValidationRunner:
+        return CachingValidationRunner(hpo)
+
+    def test_matches_hpotk_on_cohort(
+        self,
+        suox_cohort: Cohort,
+        runner: CachingValidationRunner,
+        validation_runner: ValidationRunner,
+    ):
+        for patient in suox_cohort.all_patients:
+            expected = validation_runner.validate_all(patient.phenotypes)
+            actual = runner.validate_all(patient.phenotypes)
+
+            assert _summarize(actual) == _summarize(expected)
+
+    @pytest.mark.parametrize(
+        "terms",
+        [
+            # Present term and its present ancestor:
+            # Seizure, Abnormal nervous system physiology
+            (("HP:0001250", True), ("HP:0012638", True)),
+            # Present term and its excluded ancestor
+            (("HP:0001250", True), ("HP:0012638", False)),
+            # Excluded term and its excluded ancestor
+            (("HP:0001250", False), ("HP:0012638", False)),
+            # Excluded term and its present ancestor is OK.
+            (("HP:0001250", False), ("HP:0012638", True)),
+            # Obsolete term ID of Multicystic kidney dysplasia
+            (("HP:0004715", True), ("HP:0001250", True)),
+            # Not a phenotypic abnormality: Phenotypic abnormality, Autosomal recessive inheritance
+            (("HP:0000118", True), ("HP:0000007", True)),
+            # Repeated term and its present ancestor, reported once for each repetition like hpotk does
+            (("HP:0001250", True), ("HP:0001250", True), ("HP:0012638", True)),
+        ],
+    )
+    def test_matches_hpotk(
+        self,
+        terms: typing.Sequence[typing.Tuple[str, bool]],
+        runner: CachingValidationRunner,
+        validation_runner: ValidationRunner,
+    ):
+        phenotypes = [
+            Phenotype.from_raw_parts(term_id=curie, is_observed=is_observed)
+            for curie, is_observed in terms
+        ]
+
+        expected = validation_runner.validate_all(phenotypes)
+        actual = runner.validate_all(phenotypes)
+
+        assert _summarize(actual) == _summarize(expected)
+
+    def test_results_are_memoized(
+        self,
+        hpo: hpotk.MinimalOntology,
+    ):
+        runner = CachingValidationRunner(hpo)
+        first = [Phenotype.from_raw_parts("HP:0001250", True)]
+        second = [Phenotype.from_raw_parts("HP:0001250", True)]
+
+        assert runner.validate_all(first) is runner.validate_all(second)
+        assert runner.cache_size == 1
+
+        runner.validate_all([Phenotype.from_raw_parts("HP:0001250", False)])
+        assert runner.cache_size == 2
@@ -0,0 +1,199 @@
+import json
+import os
+import pathlib
+import pickle
+
+import hpotk
+import pytest
+
+from gpsea.batch import BatchJob, BatchRunner, load_batch_manifest
+from gpsea.model import Cohort
+from gpsea.preprocessing import configure_hpo_snapshot_store
+
+
+def count_patients(
+    cohort: Cohort,
+    hpo: hpotk.MinimalOntology,
+    offset: int = 0,
+) -> int:
+    return len(cohort.all_patients) + offset
+
+
+def describe_cohort(
+    cohort: Cohort,
+    hpo: hpotk.MinimalOntology,
+    *,
+    gene_symbol: str,
+) -> str:
+    return f"{gene_symbol}: {len(cohort.all_patients)} individuals"
+
+
+def fail(
+    cohort: Cohort,
+    hpo: hpotk.MinimalOntology,
+):
+    raise ValueError("Something went wrong")
+
+
+class TestBatchRunner:
+
+    @pytest.fixture
+    def cache_dir(
+        self,
+        tmp_path: pathlib.Path,
+        hpo: hpotk.MinimalOntology,
+    ) -> str:
+        # Prepare the HPO snapshot to spare parsing HPO in the test.
+        cache_dir = tmp_path.joinpath("cache")
+        hpotk_dir = cache_dir.joinpath("hpotk")
+        hpotk_dir.mkdir(parents=True)
+        store = configure_hpo_snapshot_store(
+            cache_dir=str(cache_dir),
+            ontology_store=hpotk.configure_ontology_store(store_dir=str(hpotk_dir)),
+        )
+        store.save(hpo)
+        return str(cache_dir)
+
+    @pytest.fixture
+    def runner(
+        self,
+        tmp_path: pathlib.Path,
+        cache_dir: str,
+    ) -> BatchRunner:
+        return BatchRunner(
+            output_dir=str(tmp_path.joinpath("results")),
+            release="v2024-04-26",
+            n_workers=2,
+            cache_dir=cache_dir,
+        )
+
+    def test_run(
+        self,
+        runner: BatchRunner,
+        fpath_suox_cohort: str,
+    ):
+        jobs = [
+            BatchJob(name="a", task=f"{__name__}:count_patients", cohort=fpath_suox_cohort),
+            BatchJob(name="b", task=f"{__name__}:count_patients", cohort=fpath_suox_cohort, params={"offset": 10}),
+        ]
+
+        outcomes = runner.run(jobs)
+
+        assert [o.name for o in outcomes] == ["a", "b"]
+        assert all(o.status == "completed" for o in outcomes)
+        results = []
+        for outcome in outcomes:
+            with open(outcome.output_path, "rb") as fh:
+                results.append(pickle.load(fh))
+        assert results == [35, 45]
+
+    def test_params_are_passed_as_keyword_arguments(
+        self,
+        runner: BatchRunner,
+        fpath_suox_cohort: str,
+    ):
+        jobs = [
+            BatchJob(
+                name="a", task=f"{__name__}:describe_cohort", cohort=fpath_suox_cohort, params={"gene_symbol": "SUOX"},
+            ),
+            BatchJob(name="b", task=f"{__name__}:describe_cohort", cohort=fpath_suox_cohort),
+        ]
+
+        a, b = runner.run(jobs)
+
+        assert a.status == "completed"
+        with open(a.output_path, "rb") as fh:
+            assert pickle.load(fh) == "SUOX: 35 individuals"
+        # The keyword-only argument is missing.
+        assert b.status == "failed"
+        assert b.error is not None and "gene_symbol" in b.error
+
+    def test_completed_jobs_are_skipped(
+        self,
+        runner: BatchRunner,
+        fpath_suox_cohort: str,
+    ):
+        a = BatchJob(name="a", task=f"{__name__}:count_patients", cohort=fpath_suox_cohort)
+        b = BatchJob(name="b", task=f"{__name__}:count_patients", cohort=fpath_suox_cohort)
+        runner.run([a])
+
+        outcomes = runner.run([a, b])
+
+        assert [o.status for o in outcomes] == ["skipped", "completed"]
+
+    def test_failed_job_is_reported(
+        self,
+        runner: BatchRunner,
+        fpath_suox_cohort: str,
+    ):
+        jobs = [
+            BatchJob(name="a", task=f"{__name__}:fail", cohort=fpath_suox_cohort),
+            BatchJob(name="b", task=f"{__name__}:count_patients", cohort=fpath_suox_cohort),
+        ]
+
+        a, b = runner.run(jobs)
+
+        assert a.status == "failed"
+        assert a.error is not None and "Something went wrong" in a.error
+        assert not os.path.exists(a.output_path)
+        assert b.status == "completed"
+
+        # The failed job is rerun in the next run.
+        a, b = runner.run(jobs)
+        assert a.status == "failed"
+        assert b.status == "skipped"
+
+    def test_job_names_must_be_unique(
+        self,
+        runner: BatchRunner,
+        fpath_suox_cohort: str,
+    ):
+        job = BatchJob(name="a", task=f"{__name__}:count_patients", cohort=fpath_suox_cohort)
+
+        with pytest.raises(ValueError, match="Job names must be unique"):
+            runner.run([job, job])
+
+
+class TestBatchJob:
+
+    @pytest.mark.parametrize(
+        "kwargs, message",
+        [
+            (dict(name="", task="a:b", cohort="x.json"), "Job name must be a non-empty file name"),
+            (dict(name="a/b", task="a:b", cohort="x.json"), "Job name must be a non-empty file name"),
+            (dict(name="a", task="a.b", cohort="x.json"), "Task must be a `module:function` path"),
+            (dict(name="a", task="a:b"), "must have either `phenopackets` or `cohort`"),
+            (dict(name="a", task="a:b", cohort="x.json", phenopackets="pp"), "must have either"),
+        ],
+    )
+    def test_invalid_job(
+        self,
+        kwargs: dict,
+        message: str,
+    ):
+        with pytest.raises(ValueError, match=message):
+            BatchJob(**kwargs)
+
+    def test_load_batch_manifest(
+        self,
+        tmp_path: pathlib.Path,
+    ):
+        fpath_manifest = tmp_path.joinpath("manifest.json")
+        with open(fpath_manifest, "w") as fh:
+            json.dump(
+                {
+                    "jobs": [
+                        {"name": "SUOX", "task": "tasks:run", "phenopackets": "pp/SUOX", "params": {"x": 1}},
+                        {"name": "FBN1", "task": "tasks:run", "cohort": "/data/FBN1.json"},
+                    ]
+                },
+                fh,
+            )
+
+        suox, fbn1 = load_batch_manifest(str(fpath_manifest))
+
+        assert suox.phenopackets == os.path.join(str(tmp_path), "pp/SUOX")
+        assert suox.cohort is None
+        assert suox.params == {"x": 1}
+        assert fbn1.cohort == "/data/FBN1.json"
+        assert fbn1.phenopackets is None
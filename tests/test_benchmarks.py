@@ -0,0 +1,39 @@
+import importlib
+import inspect
+import pkgutil
+
+import pytest
+
+import benchmarks
+
+
+def iter_benchmark_classes():
+    for module_info in pkgutil.iter_modules(benchmarks.__path__):
+        if module_info.name.startswith("bench_"):
+            module = importlib.import_module(f"{benchmarks.__name__}.{module_info.name}")
+            for _, cls in inspect.getmembers(module, inspect.isclass):
+                if cls.__module__ == module.__name__:
+                    yield cls
+
+
+@pytest.mark.parametrize(
+    "benchmark",
+    list(iter_benchmark_classes()),
+    ids=lambda cls: cls.__name__,
+)
+def test_benchmark_runs(benchmark):
+    # Run the benchmark once with the first (smallest) value of each parameter
+    # to keep the suite working between the benchmark runs.
+    params = benchmark.params
+    if isinstance(params[0], (list, tuple)):
+        args = tuple(values[0] for values in params)
+    else:
+        args = (params[0],)
+
+    instance = benchmark()
+    instance.setup(*args)
+    methods = [name for name in dir(instance) if name.startswith(("time_", "track_"))]
+
+    assert len(methods) != 0
+    for name in methods:
+        getattr(instance, name)(*args)
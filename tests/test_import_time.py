@@ -0,0 +1,81 @@
+import subprocess
+import sys
+import typing
+
+import pytest
+
+import gpsea.analysis
+import gpsea.view
+
+HEAVY_MODULES = ("scipy", "statsmodels", "matplotlib", "pandas", "requests", "phenopackets")
+
+# Importing the packages takes ~0.2s on a developer laptop,
+# and loading `scipy` and `statsmodels` alone takes more than 1s.
+IMPORT_TIME_BUDGET_US = 1_000_000
+
+
+def profile_import(
+    statement: str,
+) -> typing.Mapping[str, int]:
+    """
+    Run the import `statement` in a fresh interpreter and get a mapping
+    from the imported module name to its cumulative import time in microseconds.
+    """
+    cp = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in cp.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestImportTime:
+
+    def test_packages_are_imported_within_budget(self):
+        times = profile_import("import gpsea.model, gpsea.analysis, gpsea.view, gpsea.preprocessing")
+
+        total = sum(time for name, time in times.items() if name.split(".")[0] == "gpsea" and name.count(".") <= 1)
+        assert total < IMPORT_TIME_BUDGET_US
+        assert not any(name.split(".")[0] in HEAVY_MODULES for name in times)
+
+    @pytest.mark.parametrize(
+        "statement, forbidden",
+        [
+            ("from gpsea.analysis.clf import HpoClassifier", HEAVY_MODULES),
+            ("from gpsea.io import GpseaJSONDecoder", HEAVY_MODULES),
+            ("from gpsea.analysis.pcats import configure_hpo_term_analysis", ("scipy", "statsmodels", "matplotlib")),
+            ("from gpsea.analysis.temporal import SurvivalAnalysis", ("scipy", "statsmodels", "matplotlib")),
+            ("from gpsea.view import CohortViewer", ("scipy", "statsmodels", "matplotlib", "requests")),
+        ],
+    )
+    def test_heavy_dependencies_are_loaded_on_first_use(
+        self,
+        statement: str,
+        forbidden: typing.Sequence[str],
+    ):
+        times = profile_import(statement)
+
+        assert not any(name.split(".")[0] in forbidden for name in times)
+
+
+class TestLazyPackage:
+
+    def test_dir_includes_lazy_members(self):
+        assert set(gpsea.view.__all__) <= set(dir(gpsea.view))
+        assert "pcats" in dir(gpsea.analysis)
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError):
+            gpsea.analysis.NotAMember  # type: ignore
+
+    def test_member_is_loaded_from_its_module(self):
+        from gpsea.analysis._trace import AnalysisTrace
+
+        assert gpsea.analysis.AnalysisTrace is AnalysisTrace
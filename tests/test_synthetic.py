@@ -0,0 +1,147 @@
+import hpotk
+import pytest
+
+from hpotk.validate import (
+    ValidationRunner,
+    ValidationLevel,
+    ObsoleteTermIdsValidator,
+    AnnotationPropagationValidator,
+    PhenotypicAbnormalityValidator,
+)
+
+from gpsea.analysis.clf import HpoClassifier, monoallelic_classifier
+from gpsea.analysis.pcats import configure_hpo_term_analysis
+from gpsea.analysis.predicate import variant_effect
+from gpsea.model import Cohort, VariantEffect
+from gpsea.synthetic import SyntheticCohortGenerator
+
+
+class TestSyntheticCohortGenerator:
+
+    @pytest.fixture(scope="class")
+    def generator(
+        self,
+        hpo: hpotk.MinimalOntology,
+    ) -> SyntheticCohortGenerator:
+        return SyntheticCohortGenerator(hpo, seed=42)
+
+    @pytest.fixture(scope="class")
+    def cohort(
+        self,
+        generator: SyntheticCohortGenerator,
+    ) -> Cohort:
+        return generator.generate_cohort(n_individuals=100)
+
+    def test_generate_cohort(
+        self,
+        cohort: Cohort,
+    ):
+        assert len(cohort) == 100
+        assert len(cohort.all_patients) == 100
+
+    def test_is_deterministic(
+        self,
+        hpo: hpotk.MinimalOntology,
+        cohort: Cohort,
+    ):
+        other = SyntheticCohortGenerator(hpo, seed=42).generate_cohort(n_individuals=100)
+
+        assert other.fingerprint == cohort.fingerprint
+
+    def test_seed_changes_the_cohort(
+        self,
+        hpo: hpotk.MinimalOntology,
+        cohort: Cohort,
+    ):
+        other = SyntheticCohortGenerator(hpo, seed=43).generate_cohort(n_individuals=100)
+
+        assert other.fingerprint != cohort.fingerprint
+
+    def test_generate_patients_yields_the_same_prefix(
+        self,
+        generator: SyntheticCohortGenerator,
+    ):
+        short = tuple(generator.generate_patients(10))
+        long = tuple(generator.generate_patients(20))
+
+        assert short == long[:10]
+
+    def test_patients(
+        self,
+        hpo: hpotk.MinimalOntology,
+        cohort: Cohort,
+    ):
+        for patient in cohort:
+            assert 1 <= len(patient.variants) <= 2
+            for variant in patient.variants:
+                tx_anno = variant.get_preferred_tx_annotation()
+                assert tx_anno is not None
+                assert tx_anno.transcript_id == "NM_999999.1"
+                assert tx_anno.hgvs_cdna.startswith("NM_999999.1:c.")
+                assert len(tx_anno.variant_effects) == 1
+                assert variant.genotype_for_sample(patient.labels) is not None
+
+            assert patient.age is not None
+            assert patient.vital_status is not None
+            assert len(patient.diseases) == 1
+
+            present = set(p.identifier for p in patient.present_phenotypes())
+            assert len(present) != 0
+            for phenotype in patient.excluded_phenotypes():
+                assert not any(
+                    hpo.graph.is_ancestor_of_or_equal_to(phenotype.identifier, term_id) for term_id in present
+                )
+            for phenotype in patient.present_phenotypes():
+                if phenotype.onset is not None:
+                    assert phenotype.onset <= patient.age
+
+    def test_patients_pass_hpo_validation(
+        self,
+        hpo: hpotk.MinimalOntology,
+        cohort: Cohort,
+    ):
+        runner = ValidationRunner(
+            (
+                ObsoleteTermIdsValidator(hpo),
+                AnnotationPropagationValidator(hpo),
+                PhenotypicAbnormalityValidator(hpo),
+            )
+        )
+
+        for patient in cohort:
+            results = runner.validate_all(patient.phenotypes)
+
+            errors = [result for result in results.results if result.level == ValidationLevel.ERROR]
+            assert errors == [], patient.labels.label_summary()
+
+    def test_drives_hpo_term_analysis(
+        self,
+        hpo: hpotk.MinimalOntology,
+        generator: SyntheticCohortGenerator,
+        cohort: Cohort,
+    ):
+        missense = variant_effect(VariantEffect.MISSENSE_VARIANT, tx_id="NM_999999.1")
+        gt_clf = monoallelic_classifier(a_predicate=missense, b_predicate=~missense)
+        pheno_clfs = [HpoClassifier(hpo, query=term_id) for term_id in generator.profile_terms]
+
+        result = configure_hpo_term_analysis(hpo).compare_genotype_vs_phenotypes(cohort, gt_clf, pheno_clfs)
+
+        assert len(result.pvals) == len(generator.profile_terms)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            dict(seed=-1),
+            dict(excluded_rate=1.5),
+            dict(mean_extra_terms=-1.0),
+            dict(n_variants=0),
+            dict(protein_length=10, n_exons=12),
+        ],
+    )
+    def test_invalid_parameters(
+        self,
+        hpo: hpotk.MinimalOntology,
+        kwargs,
+    ):
+        with pytest.raises(ValueError):
+            SyntheticCohortGenerator(hpo, **kwargs)
@@ -16,3 +16,39 @@ def test_summarize_hpo_analysis(
     )
 
     print(df)
+
+
+class TestSummarizeHpoAnalysis:
+
+    def test_formatted(
+        self,
+        hpo: hpotk.MinimalOntology,
+        hpo_term_analysis_result: HpoTermAnalysisResult,
+    ):
+        df = summarize_hpo_analysis(hpo=hpo, result=hpo_term_analysis_result)
+
+        first, second = (cat.name for cat in hpo_term_analysis_result.gt_clf.get_categories())
+        # Arachnodactyly was not tested.
+        assert df.index.tolist() == ["Seizure [HP:0001250]"]
+        assert df.columns.tolist() == [first, second, "Corrected p values", "p values"]
+        assert df.columns.name == hpo_term_analysis_result.gt_clf.variable_name
+        assert df.loc["Seizure [HP:0001250]", first] == "5/10 (50%)"
+        assert df.loc["Seizure [HP:0001250]", second] == "0/10 (0%)"
+        assert df.loc["Seizure [HP:0001250]", "p values"] == pytest.approx(0.01)
+
+    def test_numeric(
+        self,
+        hpo: hpotk.MinimalOntology,
+        hpo_term_analysis_result: HpoTermAnalysisResult,
+    ):
+        df = summarize_hpo_analysis(hpo=hpo, result=hpo_term_analysis_result, numeric=True)
+
+        first, second = (cat.name for cat in hpo_term_analysis_result.gt_clf.get_categories())
+        assert df.index.tolist() == ["Seizure [HP:0001250]"]
+        row = df.loc["Seizure [HP:0001250]"]
+        assert row[(first, "count")] == 5
+        assert row[(first, "total")] == 10
+        assert row[(second, "count")] == 0
+        assert row[(second, "total")] == 10
+        assert row[("Corrected p values", "")] == pytest.approx(0.01)
+        assert row[("p values", "")] == pytest.approx(0.01)
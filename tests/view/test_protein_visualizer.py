@@ -29,6 +29,27 @@ class TestProteinVisualizer:
 
         fig.savefig("protein.png")
 
+    def test_variants_are_drawn_as_collections(
+        self,
+        visualizer: BaseProteinVisualizer,
+        suox_cohort: Cohort,
+        suox_protein_metadata: ProteinMetadata,
+    ):
+        fig, ax = plt.subplots(figsize=(20, 20))
+        visualizer.draw_protein(
+            cohort=suox_cohort,
+            protein_metadata=suox_protein_metadata,
+            ax=ax,
+        )
+
+        # The variant stems, the variant heads, and the protein features.
+        assert len(ax.collections) == 3
+        stems, heads, features = ax.collections
+        assert len(stems.get_paths()) == len(heads.get_paths())
+        assert len(features.get_paths()) == len(suox_protein_metadata.protein_features)
+
+        plt.close(fig)
+
     def test_drawing_with_empty_cohort(
         self,
         visualizer: BaseProteinVisualizer,
@@ -0,0 +1,46 @@
+import os
+
+import pytest
+
+from gpsea.analysis.pcats import HpoTermAnalysisResult
+from gpsea.view import HtmlReportBatch, MtcStatsViewer
+from gpsea.view._base import get_template_environment
+
+
+class TestHtmlReportBatch:
+
+    @pytest.fixture
+    def viewer(self) -> MtcStatsViewer:
+        return MtcStatsViewer()
+
+    @pytest.mark.parametrize("n_workers", [1, 2])
+    def test_write(
+        self,
+        n_workers: int,
+        viewer: MtcStatsViewer,
+        hpo_term_analysis_result: HpoTermAnalysisResult,
+        tmp_path,
+    ):
+        batch = HtmlReportBatch(n_workers=n_workers, cache_dir=str(tmp_path))
+        expected = [str(tmp_path / f"report.{i}.html") for i in range(3)]
+        for path in expected:
+            batch.add(viewer, path, hpo_term_analysis_result)
+        assert len(batch) == 3
+
+        paths = batch.write()
+
+        assert tuple(paths) == tuple(expected)
+        assert len(batch) == 0
+        html = viewer.process(hpo_term_analysis_result).html  # type: ignore
+        for path in paths:
+            with open(path) as fh:
+                assert fh.read() == html
+        assert os.listdir(tmp_path / "templates")
+
+    def test_invalid_n_workers(self):
+        with pytest.raises(ValueError):
+            HtmlReportBatch(n_workers=0)
+
+    def test_viewers_share_the_environment(self):
+        assert MtcStatsViewer()._environment is MtcStatsViewer()._environment
+        assert get_template_environment() is get_template_environment()
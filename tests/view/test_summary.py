@@ -0,0 +1,95 @@
+import io
+
+import hpotk
+import pytest
+
+from gpsea.model import Cohort
+from gpsea.view import CohortSummary, CohortVariantViewer, CohortViewer, DiseaseViewer
+
+
+class TestCohortSummary:
+
+    @pytest.fixture(scope="class")
+    def summary(
+        self,
+        suox_cohort: Cohort,
+    ) -> CohortSummary:
+        return CohortSummary.summarize(suox_cohort)
+
+    def test_counts_match_cohort(
+        self,
+        summary: CohortSummary,
+        suox_cohort: Cohort,
+    ):
+        assert len(summary) == len(suox_cohort)
+        for name in (
+            "count_males",
+            "count_females",
+            "count_unknown_sex",
+            "count_alive",
+            "count_deceased",
+            "count_unknown_vital_status",
+            "count_with_age_of_last_encounter",
+            "count_with_disease_onset",
+            "get_excluded_count",
+            "count_distinct_hpo_terms",
+            "count_distinct_measurements",
+            "count_distinct_diseases",
+        ):
+            assert getattr(summary, name)() == getattr(suox_cohort, name)(), name
+
+        assert summary.count_distinct_variants() == len(suox_cohort.all_variant_infos())
+
+    def test_lists_match_cohort(
+        self,
+        summary: CohortSummary,
+        suox_cohort: Cohort,
+    ):
+        assert summary.list_present_phenotypes(top=10) == suox_cohort.list_present_phenotypes(top=10)
+        assert summary.list_measurements() == suox_cohort.list_measurements()
+        assert summary.list_all_diseases() == suox_cohort.list_all_diseases()
+        assert summary.list_all_variants() == suox_cohort.list_all_variants()
+
+    def test_variant_effect_counts(
+        self,
+        summary: CohortSummary,
+        suox_cohort: Cohort,
+        suox_mane_tx_id: str,
+    ):
+        expected = suox_cohort.variant_effect_count_by_tx(tx_id=suox_mane_tx_id)[suox_mane_tx_id]
+
+        assert summary.variant_effect_counts(suox_mane_tx_id) == expected
+        assert summary.variant_effect_counts("NM_000000.0") == {}
+
+    def test_disease_counts(
+        self,
+        summary: CohortSummary,
+        suox_cohort: Cohort,
+        suox_mane_tx_id: str,
+    ):
+        (disease_id, count), = summary.list_all_diseases()
+        variant_counts = summary.disease_variant_counts(disease_id)
+
+        assert count == len(suox_cohort)
+        assert sum(variant_counts.values()) == sum(len(patient.variants) for patient in suox_cohort)
+        assert summary.disease_effect_counts(disease_id, suox_mane_tx_id) == summary.variant_effect_counts(
+            suox_mane_tx_id
+        )
+
+    def test_summary_is_shared_by_viewers(
+        self,
+        hpo: hpotk.MinimalOntology,
+        summary: CohortSummary,
+        suox_cohort: Cohort,
+        suox_mane_tx_id: str,
+    ):
+        reports = (
+            CohortViewer(hpo).process(suox_cohort, suox_mane_tx_id, summary=summary),
+            CohortVariantViewer(suox_mane_tx_id).process(suox_cohort, summary=summary),
+            DiseaseViewer(hpo, suox_mane_tx_id).process(suox_cohort, summary=summary),
+        )
+
+        for report in reports:
+            buf = io.StringIO()
+            report.write(buf)
+            assert "12_56004039_56004039_G_A" in buf.getvalue()